@@ -1,5 +1,7 @@
 """Shared adapter utilities."""
 
+import http.client
+import json
 import os
 from pathlib import Path
 from urllib.parse import urlparse
@@ -48,3 +50,156 @@ def normalize_sparkd_base_url(raw_url: str, *, allow_remote: bool = False) -> st
             "remote sparkd host blocked by default; pass --allow-remote to override"
         )
     return text.rstrip("/")
+
+
+DEFAULT_INGEST_BATCH = int(os.environ.get("SPARKD_INGEST_BATCH", "200") or 200)
+_RETRYABLE_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError, http.client.CannotSendRequest)
+
+
+class SparkdError(RuntimeError):
+    """Non-2xx response from sparkd."""
+
+    def __init__(self, status: int, detail: str = ""):
+        super().__init__(f"sparkd HTTP {status}: {detail}"[:300])
+        self.status = int(status)
+
+
+class KeepAliveClient:
+    """Stdlib HTTP/1.1 client that reuses one connection to a local daemon.
+
+    If a reused connection turns out to have been closed by the server (idle
+    timeout, restart), the request is retried once on a fresh connection.
+    """
+
+    def __init__(self, base_url: str, *, timeout: float = 5.0, headers: dict | None = None):
+        parsed = urlparse(base_url)
+        self.scheme = parsed.scheme or "http"
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port
+        self.base_path = (parsed.path or "").rstrip("/")
+        self.timeout = float(timeout)
+        self.headers = dict(headers or {})
+        self.connects = 0
+        self.requests = 0
+        self._conn = None
+        self._served = 0
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        self._conn = cls(self.host, self.port, timeout=self.timeout)
+        self._served = 0
+        self.connects += 1
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+
+    def request(self, method: str, path: str, body: bytes | None = None, headers: dict | None = None):
+        """Return (status, body bytes)."""
+        merged = {**self.headers, **(headers or {})}
+        for attempt in (0, 1):
+            conn = self._conn or self._connect()
+            reused = self._served > 0
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=merged)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except _RETRYABLE_ERRORS:
+                self.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                self.close()
+                raise
+            self._served += 1
+            self.requests += 1
+            if resp.will_close:
+                self.close()
+            return resp.status, raw
+        raise ConnectionError("unreachable")  # pragma: no cover
+
+
+class SparkdClient:
+    """sparkd ingest client: keep-alive connection + /ingest/batch coalescing.
+
+    Falls back to one /ingest call per event (same connection) when the
+    daemon predates the batch endpoint.
+    """
+
+    def __init__(self, base_url: str, token: str | None = None, *, timeout: float = 5.0,
+                 batch_size: int = DEFAULT_INGEST_BATCH):
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        self.http = KeepAliveClient(base_url, timeout=timeout, headers=headers)
+        self.batch_size = max(1, int(batch_size))
+        self.batch_supported = True
+        self.last_error: Exception | None = None
+        self.rejected = 0
+
+    def close(self) -> None:
+        self.http.close()
+
+    def post_json(self, path: str, payload) -> dict:
+        status, raw = self.http.request("POST", path, json.dumps(payload).encode("utf-8"))
+        try:
+            data = json.loads(raw.decode("utf-8") or "{}")
+        except Exception:
+            data = {}
+        if status >= 400:
+            raise SparkdError(status, str(data.get("error") if isinstance(data, dict) else "") or raw[:120].decode("utf-8", "replace"))
+        return data if isinstance(data, dict) else {}
+
+    def send_event(self, event: dict) -> dict:
+        return self.post_json("/ingest", event)
+
+    def send_events(self, events: list) -> int:
+        """Send events in order and return how many leading events were delivered.
+
+        Events sparkd rejects as invalid count as delivered (it quarantines
+        them); a transport/server error stops the run and is kept in last_error.
+        """
+        self.last_error = None
+        delivered = 0
+        size = self.batch_size
+        while delivered < len(events):
+            chunk = events[delivered:delivered + size]
+            try:
+                if not self.batch_supported:
+                    self.send_event(chunk[0])
+                    delivered += 1
+                    continue
+                result = self.post_json("/ingest/batch", {"events": chunk})
+                self.rejected += len(result.get("rejected") or [])
+                delivered += len(chunk)
+            except SparkdError as e:
+                if e.status == 404 and self.batch_supported:
+                    self.batch_supported = False
+                    continue
+                if e.status == 413 and size > 1:
+                    size = max(1, size // 2)
+                    continue
+                self.last_error = e
+                break
+            except Exception as e:
+                self.last_error = e
+                break
+        return delivered
+
+    def send_line_groups(self, groups: list) -> int:
+        """Send per-source-line event groups; return how many leading lines fully landed."""
+        flat = [evt for group in groups for evt in group]
+        remaining = self.send_events(flat) if flat else 0
+        lines = 0
+        for group in groups:
+            if len(group) > remaining:
+                break
+            remaining -= len(group)
+            lines += 1
+        return lines
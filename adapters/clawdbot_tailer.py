@@ -19,10 +19,10 @@ import os
 import time
 import hashlib
 from pathlib import Path
-from urllib.request import Request, urlopen
 
 from adapters._common import (
     DEFAULT_SPARKD,
+    SparkdClient,
     resolve_token as _resolve_token,
     normalize_sparkd_base_url as _normalize_sparkd_base_url,
 )
@@ -31,16 +31,6 @@ from adapters._common import (
 STATE_DIR = Path.home() / ".spark" / "adapters"
 
 
-def _post_json(url: str, payload: dict, token: str = None):
-    data = json.dumps(payload).encode("utf-8")
-    headers = {"Content-Type": "application/json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    req = Request(url, data=data, headers=headers, method="POST")
-    with urlopen(req, timeout=5) as resp:
-        resp.read()
-
-
 def _event(trace_id: str, session_id: str, source: str, kind: str, ts: float, payload: dict):
     return {
         "v": 1,
@@ -71,6 +61,8 @@ def main():
 
     token = _resolve_token(args.token)
     sparkd_base = _normalize_sparkd_base_url(args.sparkd, allow_remote=args.allow_remote)
+    # One keep-alive connection; each tick's events go out as a single batch.
+    client = SparkdClient(sparkd_base, token)
 
     agent_dir = Path.home() / ".clawdbot" / "agents" / args.agent / "sessions"
     sessions_json = agent_dir / "sessions.json"
@@ -140,7 +132,7 @@ def main():
             batch_size = max(1, int(args.max_per_tick))
             batch = new_lines[:batch_size]
 
-            sent = 0
+            pending = []
             for line in batch:
                 trace_id = _hash(line)
                 try:
@@ -241,11 +233,13 @@ def main():
                         }
 
                 evt = _event(trace_id, session_id=session_key, source="clawdbot", kind=kind, ts=ts, payload=payload)
-                _post_json(sparkd_base + "/ingest", evt, token=token)
-                sent += 1
+                pending.append(evt)
 
+            sent = client.send_events(pending)
             state["offset"] = off + sent
             save_state()
+            if client.last_error is not None and args.verbose:
+                print(f"[clawdbot_tailer] POST error: {client.last_error}", flush=True)
 
             if args.verbose and sent:
                 remaining = max(0, len(new_lines) - sent)
@@ -5,6 +5,10 @@ This adapter is designed for a staged rollout:
 1) shadow mode (default): parse/map only and write stability telemetry
 2) observe mode: forward mapped events into hooks/observe.py
 
+In observe mode events go to the resident observe_server over one keep-alive
+HTTP connection when it is listening, and fall back to spawning
+hooks/observe.py per event otherwise.
+
 It intentionally does not require Codex-native hooks.
 """
 
@@ -24,6 +28,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapters._common import KeepAliveClient  # noqa: E402
 
 STATE_DIR = Path.home() / ".spark" / "adapters"
 DEFAULT_STATE_FILE = STATE_DIR / "codex_hook_bridge_state.json"
@@ -33,6 +40,8 @@ DEFAULT_CODEX_SESSIONS_ROOT = Path.home() / ".codex" / "sessions"
 DEFAULT_OBSERVE_PATH = Path(__file__).resolve().parent.parent / "hooks" / "observe.py"
 DEFAULT_WORKFLOW_REPORT_DIR = Path.home() / ".spark" / "workflow_reports" / "codex"
 TOOL_RESULT_REF_DIR = Path.home() / ".spark" / "workflow_refs" / "codex_tool_results"
+OBSERVE_HOOK_HEADER = "X-Spark-Hook"
+OBSERVE_SERVER_RETRY_S = 30.0
 
 
 def _env_int(name: str, default: int, lo: int, hi: int) -> int:
@@ -488,6 +497,7 @@ class BridgeMetrics:
     observe_calls: int = 0
     observe_success: int = 0
     observe_failures: int = 0
+    observe_server_calls: int = 0
     pre_input_truncated: int = 0
     post_output_truncated: int = 0
     row_type_counts: Counter = field(default_factory=Counter)
@@ -534,6 +544,7 @@ class BridgeMetrics:
             "observe_calls": self.observe_calls,
             "observe_success": self.observe_success,
             "observe_failures": self.observe_failures,
+            "observe_server_calls": self.observe_server_calls,
             "pre_input_truncated": self.pre_input_truncated,
             "post_output_truncated": self.post_output_truncated,
             "coverage_ratio": self.coverage_ratio(),
@@ -836,6 +847,66 @@ def _invoke_observe(observe_path: Path, event: Dict[str, Any], timeout_s: float
     return False, elapsed_ms, f"rc={proc.returncode} stderr={proc.stderr.strip()}"
 
 
+class ObserveForwarder:
+    """Deliver mapped hook events to observe_server, else to a spawned observe.py.
+
+    The server path reuses one keep-alive connection. A refused connection or a
+    non-200 reply means the event was not processed, so it falls back to the
+    subprocess and re-probes the server after OBSERVE_SERVER_RETRY_S. Errors
+    after the request was sent are reported, not retried, so an event is never
+    processed twice.
+    """
+
+    def __init__(self, observe_path: Path, *, timeout_s: float = 8.0, use_server: bool = True):
+        self.observe_path = observe_path
+        self.timeout_s = float(timeout_s)
+        port = _env_int("SPARK_OBSERVE_PORT", 8789, 1, 65535)
+        self.use_server = bool(use_server) and _env_bool("SPARK_OBSERVE_SERVER", True)
+        self.client = KeepAliveClient(
+            f"http://127.0.0.1:{port}",
+            timeout=self.timeout_s,
+            headers={"Content-Type": "application/json", OBSERVE_HOOK_HEADER: "1"},
+        )
+        self._server_down_until = 0.0
+
+    def close(self) -> None:
+        self.client.close()
+
+    def _via_server(self, event: Dict[str, Any]) -> Optional[tuple[bool, float, str]]:
+        started = time.perf_counter()
+        body = json.dumps(event, ensure_ascii=False).encode("utf-8")
+        try:
+            status, raw = self.client.request("POST", "/hook", body)
+        except (ConnectionRefusedError, FileNotFoundError):
+            self._server_down_until = time.time() + OBSERVE_SERVER_RETRY_S
+            return None
+        except Exception as exc:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            return False, elapsed_ms, f"server_error:{type(exc).__name__}:{exc}"
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if status != 200:
+            self._server_down_until = time.time() + OBSERVE_SERVER_RETRY_S
+            return None
+        try:
+            result = json.loads(raw.decode("utf-8", errors="replace") or "{}")
+        except Exception:
+            result = {}
+        exit_code = int((result or {}).get("exit_code") or 0)
+        stderr = str((result or {}).get("stderr") or "").strip()
+        if exit_code == 0:
+            return True, elapsed_ms, stderr
+        return False, elapsed_ms, f"rc={exit_code} stderr={stderr}"
+
+    def forward(self, event: Dict[str, Any], metrics: Optional[BridgeMetrics] = None) -> tuple[bool, float, str]:
+        if self.use_server and time.time() >= self._server_down_until:
+            outcome = self._via_server(event)
+            if outcome is not None:
+                if metrics is not None:
+                    metrics.observe_server_calls += 1
+                return outcome
+        return _invoke_observe(self.observe_path, event, timeout_s=self.timeout_s)
+
+
 def _write_telemetry_snapshot(
     *,
     telemetry_file: Path,
@@ -887,6 +958,11 @@ def run_bridge(args: argparse.Namespace) -> int:
         10, min(86400, int(args.workflow_summary_min_interval_s or WORKFLOW_SUMMARY_MIN_INTERVAL_S))
     )
     workflow_last_emit_ts: Dict[str, float] = {}
+    forwarder = ObserveForwarder(
+        observe_path,
+        timeout_s=float(args.observe_timeout_s),
+        use_server=not bool(getattr(args, "no_observe_server", False)),
+    )
 
     _acquire_singleton_lock(lock_file, mode=mode)
     try:
@@ -970,7 +1046,7 @@ def run_bridge(args: argparse.Namespace) -> int:
                     if mode == "observe":
                         for event in events:
                             runtime.metrics.observe_calls += 1
-                            ok, elapsed_ms, err = _invoke_observe(observe_path, event, timeout_s=float(args.observe_timeout_s))
+                            ok, elapsed_ms, err = forwarder.forward(event, runtime.metrics)
                             runtime.metrics.observe_latency_ms.append(elapsed_ms)
                             if ok:
                                 runtime.metrics.observe_success += 1
@@ -1017,6 +1093,7 @@ def run_bridge(args: argparse.Namespace) -> int:
 
             time.sleep(max(0.25, float(args.poll)))
     finally:
+        forwarder.close()
         _release_singleton_lock(lock_file)
 
 
@@ -1028,6 +1105,7 @@ def build_arg_parser() -> argparse.ArgumentParser:
     ap.add_argument("--telemetry-file", default=str(DEFAULT_TELEMETRY_FILE), help="Telemetry JSONL output")
     ap.add_argument("--observe-path", default=str(DEFAULT_OBSERVE_PATH), help="Path to hooks/observe.py")
     ap.add_argument("--observe-timeout-s", type=float, default=8.0, help="observe.py timeout per event")
+    ap.add_argument("--no-observe-server", action="store_true", help="Always spawn observe.py instead of using the resident observe_server")
     ap.add_argument("--unknown-exit-policy", default="success", choices=["success", "failure", "skip"], help="How to classify outputs when exit code is unknown")
     ap.add_argument("--workflow-report-dir", default=str(DEFAULT_WORKFLOW_REPORT_DIR), help="Directory for codex workflow summary reports")
     ap.add_argument("--workflow-summary-min-interval-s", type=int, default=WORKFLOW_SUMMARY_MIN_INTERVAL_S, help="Min seconds between workflow summary emissions per session")
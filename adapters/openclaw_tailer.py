@@ -25,13 +25,14 @@ import hashlib
 import os
 import time
 from pathlib import Path
-from urllib.request import Request, urlopen
+from urllib.parse import urlparse
 
 from lib.config_authority import resolve_section, env_bool, env_int
 
 from adapters._common import (
     DEFAULT_SPARKD,
     TOKEN_FILE,
+    SparkdClient,
     resolve_token as _resolve_token,
     normalize_sparkd_base_url as _normalize_sparkd_base_url,
 )
@@ -252,14 +253,29 @@ def _write_fidelity_snapshot(
     _append_jsonl(telemetry_path, row)
 
 
+_SPARKD_CLIENTS: dict = {}
+
+
+def _sparkd_client(sparkd_url: str, token: str = None) -> SparkdClient:
+    """Shared keep-alive client per (sparkd base URL, token)."""
+    key = (sparkd_url.rstrip("/"), token or "")
+    client = _SPARKD_CLIENTS.get(key)
+    if client is None:
+        client = SparkdClient(key[0], token)
+        _SPARKD_CLIENTS[key] = client
+    return client
+
+
 def _post_json(url: str, payload: dict, token: str = None):
-    data = json.dumps(payload).encode("utf-8")
-    headers = {"Content-Type": "application/json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    req = Request(url, data=data, headers=headers, method="POST")
-    with urlopen(req, timeout=5) as resp:
-        resp.read()
+    parsed = urlparse(url)
+    client = _sparkd_client(f"{parsed.scheme}://{parsed.netloc}", token)
+    client.post_json(parsed.path or "/ingest", payload)
+
+
+def _post_line_groups(sparkd_url: str, groups: list, token: str = None):
+    """Send per-line event groups in batches; return (lines delivered, error or None)."""
+    client = _sparkd_client(sparkd_url, token)
+    return client.send_line_groups(groups), client.last_error
 
 
 def _event(trace_id: str, session_id: str, source: str, kind: str, ts: float, payload: dict):
@@ -960,7 +976,7 @@ def _scan_hook_events(
 
     batch_size = max(1, int(max_per_tick))
     batch = new_lines[:batch_size]
-    sent = 0
+    groups = []
     for line in batch:
         if isinstance(telemetry, dict):
             telemetry["hook_rows_seen"] = int(telemetry.get("hook_rows_seen", 0)) + 1
@@ -971,26 +987,25 @@ def _scan_hook_events(
                 telemetry["hook_json_decode_errors"] = int(
                     telemetry.get("hook_json_decode_errors", 0)
                 ) + 1
-            sent += 1
+            groups.append([])
             continue
 
         evt = _parse_hook_event_row(row)
         if evt is None:
             if isinstance(telemetry, dict):
                 telemetry["hook_rows_ignored"] = int(telemetry.get("hook_rows_ignored", 0)) + 1
-            sent += 1
+            groups.append([])
             continue
+        groups.append([evt])
 
-        try:
-            _post_json(sparkd_url.rstrip("/") + "/ingest", evt, token=token)
-        except Exception as e:
-            if verbose:
-                print(f"[openclaw_tailer] hook POST error: {e}", flush=True)
-            break
-        if isinstance(telemetry, dict):
-            telemetry["hook_events_posted"] = int(telemetry.get("hook_events_posted", 0)) + 1
-            _track_posted_event(telemetry, evt)
-        sent += 1
+    sent, err = _post_line_groups(sparkd_url, groups, token=token)
+    if err is not None and verbose:
+        print(f"[openclaw_tailer] hook POST error: {err}", flush=True)
+    if isinstance(telemetry, dict):
+        for group in groups[:sent]:
+            for evt in group:
+                telemetry["hook_events_posted"] = int(telemetry.get("hook_events_posted", 0)) + 1
+                _track_posted_event(telemetry, evt)
 
     state.set_offset(file_key, off + sent)
     if sent and verbose:
@@ -1179,7 +1194,10 @@ def main():
                 batch = new_lines[:batch_size]
                 workflow_summary = _new_workflow_summary(session_key, session_file)
 
-                sent = 0
+                # Coalesce the tick: one event group per source line, sent as
+                # /ingest/batch requests; the offset advances past whole lines only.
+                groups = []
+                summarize = []
                 for line in batch:
                     fidelity_metrics["rows_seen"] = int(fidelity_metrics.get("rows_seen", 0)) + 1
                     try:
@@ -1188,29 +1206,23 @@ def main():
                         fidelity_metrics["json_decode_errors"] = int(
                             fidelity_metrics.get("json_decode_errors", 0)
                         ) + 1
-                        evt = _event(
+                        groups.append([_event(
                             trace_id=_hash(line),
                             session_id=session_key,
                             source="openclaw",
                             kind="system",
                             ts=time.time(),
                             payload={"raw": line},
-                        )
-                        try:
-                            _post_json(sparkd_url.rstrip("/") + "/ingest", evt, token=token)
-                            _track_posted_event(fidelity_metrics, evt)
-                        except Exception as post_err:
-                            if args.verbose:
-                                print(f"[openclaw_tailer] POST error: {post_err}", flush=True)
-                            break
-                        sent += 1
+                        )])
+                        summarize.append(False)
                         continue
 
                     if _should_skip_event(obj):
                         fidelity_metrics["rows_skipped_filter"] = int(
                             fidelity_metrics.get("rows_skipped_filter", 0)
                         ) + 1
-                        sent += 1
+                        groups.append([])
+                        summarize.append(False)
                         continue
 
                     events = parse_openclaw_line(obj, session_key)
@@ -1224,21 +1236,17 @@ def main():
                             payload={"raw": obj},
                         )]
 
-                    post_ok = True
+                    groups.append(events)
+                    summarize.append(True)
+
+                sent, post_err = _post_line_groups(sparkd_url, groups, token=token)
+                if post_err is not None and args.verbose:
+                    print(f"[openclaw_tailer] POST error: {post_err}", flush=True)
+                for events, add_to_summary in zip(groups[:sent], summarize[:sent]):
                     for evt in events:
-                        try:
-                            _post_json(sparkd_url.rstrip("/") + "/ingest", evt, token=token)
-                            _track_posted_event(fidelity_metrics, evt)
-                        except Exception as post_err:
-                            if args.verbose:
-                                print(f"[openclaw_tailer] POST error: {post_err}", flush=True)
-                            post_ok = False
-                            break
-
-                    if not post_ok:
-                        break
-                    _accumulate_workflow_summary(workflow_summary, events)
-                    sent += 1
+                        _track_posted_event(fidelity_metrics, evt)
+                    if add_to_summary:
+                        _accumulate_workflow_summary(workflow_summary, events)
 
                 state.set_offset(file_key, off + sent)
 
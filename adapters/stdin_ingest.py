@@ -6,6 +6,9 @@ Reads newline-delimited SparkEventV1 JSON objects from stdin and POSTs them to s
 This is a compatibility escape hatch: any environment that can run a shell command can
 feed Spark, without writing a bespoke adapter.
 
+Events are coalesced into /ingest/batch requests over one keep-alive connection
+(falling back to per-event /ingest on older sparkd builds).
+
 Usage:
   python3 adapters/stdin_ingest.py --sparkd http://127.0.0.1:<sparkd-port> < events.ndjson
 
@@ -15,69 +18,88 @@ Auth:
 
 import argparse
 import json
-import os
 import sys
-from pathlib import Path
-from urllib.request import Request, urlopen
 
 from adapters._common import (
+    DEFAULT_INGEST_BATCH,
     DEFAULT_SPARKD,
+    SparkdClient,
     resolve_token as _resolve_token,
     normalize_sparkd_base_url as _normalize_sparkd_base_url,
 )
 
 
 def post(url: str, obj: dict, token: str = None):
-    data = json.dumps(obj).encode("utf-8")
-    headers = {"Content-Type": "application/json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    req = Request(url, data=data, headers=headers, method="POST")
-    with urlopen(req, timeout=10) as resp:
-        resp.read()
+    """POST a single event to a full /ingest URL (one-off helper)."""
+    client = SparkdClient(url.rsplit("/ingest", 1)[0], token)
+    try:
+        client.send_event(obj)
+    finally:
+        client.close()
+
+
+def _flush(client: SparkdClient, pending: list) -> tuple[int, int, Exception | None]:
+    """Send pending events; return (sent, failed, error)."""
+    if not pending:
+        return 0, 0, None
+    rejected_before = client.rejected
+    delivered = client.send_events(pending)
+    rejected = client.rejected - rejected_before
+    failed = len(pending) - delivered
+    if client.last_error is not None:
+        sys.stderr.write(
+            f"[stdin_ingest] post failed: {type(client.last_error).__name__}: {client.last_error} "
+            f"(unsent={failed})\n"
+        )
+    if rejected:
+        sys.stderr.write(f"[stdin_ingest] sparkd rejected {rejected} invalid event(s)\n")
+    return delivered - rejected, failed + rejected, client.last_error
+
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--sparkd", default=DEFAULT_SPARKD, help="sparkd base URL")
     ap.add_argument("--token", default=None, help="sparkd token (or set SPARKD_TOKEN env, or use ~/.spark/sparkd.token)")
     ap.add_argument("--allow-remote", action="store_true", help="allow non-local sparkd URL (disabled by default)")
+    ap.add_argument("--batch-size", type=int, default=DEFAULT_INGEST_BATCH, help="events per /ingest/batch request")
     args = ap.parse_args()
 
     token = _resolve_token(args.token)
     sparkd_base = _normalize_sparkd_base_url(args.sparkd, allow_remote=args.allow_remote)
-    ingest_url = sparkd_base + "/ingest"
+    client = SparkdClient(sparkd_base, token, timeout=10, batch_size=args.batch_size)
 
     ok = 0
     bad = 0
     first_error = None
+    pending = []
     for line in sys.stdin:
         line = line.strip()
         if not line:
             continue
         try:
-            obj = json.loads(line)
-            post(ingest_url, obj, token=token)
-            ok += 1
+            pending.append(json.loads(line))
         except Exception as e:
             bad += 1
             if first_error is None:
                 first_error = e
-            try:
-                meta = {}
-                if isinstance(obj, dict):
-                    for k in ("source", "kind", "session_id", "trace_id"):
-                        if obj.get(k) is not None:
-                            meta[k] = obj.get(k)
-                meta_str = f" meta={meta}" if meta else ""
-                sys.stderr.write(f"[stdin_ingest] post failed: {type(e).__name__}: {e}{meta_str}\n")
-            except Exception:
-                pass
+            sys.stderr.write(f"[stdin_ingest] bad JSON line: {type(e).__name__}: {e}\n")
+            continue
+        if len(pending) >= client.batch_size:
+            sent, failed, err = _flush(client, pending)
+            ok, bad = ok + sent, bad + failed
+            first_error = first_error or err
+            pending = []
+    sent, failed, err = _flush(client, pending)
+    ok, bad = ok + sent, bad + failed
+    first_error = first_error or err
+    client.close()
 
     # Counts are useful when running manually; errors go to stderr.
     if sys.stdout.isatty():
         print(f"sent={ok} bad={bad}")
     if bad and not sys.stderr.isatty():
-        sys.stderr.write(f"[stdin_ingest] errors: {bad} (first: {type(first_error).__name__}: {first_error})\n")
+        first = f" (first: {type(first_error).__name__}: {first_error})" if first_error is not None else ""
+        sys.stderr.write(f"[stdin_ingest] errors: {bad}{first}\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Pre-tool "emitted recently?" checks: JSONL tail scans vs the emission index.
+
+Seeds an isolated HOME with a full global dedupe log, a recent_advice.jsonl and
+an outcome_tracking.json of realistic size, then replays pre-tool calls. Each
+call runs the lookups advisory_engine.on_pre_tool makes before emitting:
+
+- advice_id dedupe for every candidate (pre-gate)
+- text-signature dedupe for each emitted item (post-gate)
+- repeat-identity cooldown against recent deliveries
+- latest outcome per insight key / advice id
+
+and then appends one dedupe row, as an emission would.
+
+- legacy: the pre-index implementation (tail-parse 400 dedupe rows, 600
+  delivery rows and the whole outcome file on every call)
+- indexed: advisory_engine's sidecar index lookups (plus the post-append sync)
+
+The append itself (_append_jsonl_capped) is the same code in both modes.
+"hits" can be higher for indexed: the legacy scan only saw the last 400
+dedupe rows, so older emissions still inside the cooldown were missed.
+
+Usage:
+    python benchmarks/advisory_pre_tool_latency.py
+    python benchmarks/advisory_pre_tool_latency.py --calls 500 --dedupe-rows 5000 --outcomes 3000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CANDIDATES = 8
+EMITTED = 3
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "p50_ms": round(_percentile(samples, 50), 3),
+        "p90_ms": round(_percentile(samples, 90), 3),
+        "max_ms": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+def _seed(engine, advisor, dedupe_rows: int, deliveries: int, outcomes: int, advice_pool: int) -> None:
+    now = time.time()
+    engine.GLOBAL_DEDUPE_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with engine.GLOBAL_DEDUPE_LOG.open("w", encoding="utf-8") as f:
+        for i in range(dedupe_rows):
+            aid = f"adv-{i % advice_pool}"
+            f.write(json.dumps({
+                "ts": now - (dedupe_rows - i) * 2.0, "tool": "Edit", "advice_id": aid,
+                "authority": "note", "trace_id": f"t{i}", "route": "live", "scope_key": "",
+                "session_kind": "main", "text_sig": engine._text_fingerprint(f"Advice text {aid}"),
+            }) + "\n")
+    advisor.RECENT_ADVICE_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with advisor.RECENT_ADVICE_LOG.open("w", encoding="utf-8") as f:
+        for i in range(deliveries):
+            ids = [f"adv-{(i * 4 + k) % advice_pool}" for k in range(4)]
+            f.write(json.dumps({
+                "ts": now - (deliveries - i) * 5.0, "tool": "Edit", "trace_id": f"t{i}",
+                "advice_ids": ids, "advice_texts": [f"Advice text {a}" for a in ids],
+                "insight_keys": [f"insight:{a}" for a in ids], "sources": ["cognitive"] * 4,
+                "delivered": True, "route": "live",
+            }) + "\n")
+    records = []
+    for i in range(outcomes):
+        aid = f"adv-{i % advice_pool}"
+        records.append({
+            "learning_id": aid, "learning_content": f"Advice text {aid}", "source": "cognitive",
+            "retrieved_at": datetime.fromtimestamp(now - (outcomes - i) * 7.0).isoformat(),
+            "acted_on": True, "outcome": random.choice(["good", "bad", "neutral"]),
+            "outcome_at": datetime.fromtimestamp(now - (outcomes - i) * 6.0).isoformat(),
+            "insight_key": f"insight:{aid}", "trace_id": f"t{i}",
+        })
+    engine.OUTCOME_TRACKING_FILE.parent.mkdir(parents=True, exist_ok=True)
+    engine.OUTCOME_TRACKING_FILE.write_text(json.dumps({"records": records}), encoding="utf-8")
+
+
+def _legacy_checks(engine, advisor, candidates: List[str], now: float, cooldown: float) -> int:
+    """The pre-index lookups, as on_pre_tool ran them."""
+    hits = 0
+    recent: Dict[str, float] = {}
+    for row in reversed(engine._tail_jsonl(engine.GLOBAL_DEDUPE_LOG, 400)):
+        aid = str(row.get("advice_id") or "")
+        age_s = now - float(row.get("ts") or 0.0)
+        if aid and 0 <= age_s < cooldown and aid not in recent:
+            recent[aid] = age_s
+    hits += sum(1 for aid in candidates if aid in recent)
+    for aid in candidates[:EMITTED]:
+        sig = engine._text_fingerprint(f"Advice text {aid}")
+        for row in reversed(engine._tail_jsonl(engine.GLOBAL_DEDUPE_LOG, 400)):
+            if str(row.get("text_sig") or "") != sig:
+                continue
+            hits += int(0 <= now - float(row.get("ts") or 0.0) <= cooldown)
+            break
+    latest: Dict[str, float] = {}
+    for row in engine._tail_jsonl(advisor.RECENT_ADVICE_LOG, 600):
+        for kind, identity, _, ts in engine._delivery_index_rows(row):
+            latest[identity] = max(ts, latest.get(identity, 0.0))
+    hits += sum(1 for aid in candidates[:EMITTED] if f"insight:insight:{aid}" in latest)
+    outcome_keys = {(kind, key) for kind, key, _, _ in engine._outcome_index_rows_from_file(engine.OUTCOME_TRACKING_FILE, 900)}
+    for aid in candidates[:EMITTED]:
+        hits += int(("outcome_insight", f"insight:{aid}") in outcome_keys)
+        hits += int(("outcome_advice", aid) in outcome_keys)
+    return hits
+
+
+def _indexed_checks(engine, advisor, candidates: List[str], now: float, cooldown: float) -> int:
+    latest = engine._dedupe_index().latest_many("advice", candidates, "")
+    hits = sum(1 for aid in candidates if 0 <= now - latest.get(aid, 0.0) < cooldown)
+    for aid in candidates[:EMITTED]:
+        sig = engine._text_fingerprint(f"Advice text {aid}")
+        hits += int(engine._global_recently_emitted_text_sig(text_sig=sig, now_ts=now, cooldown_s=cooldown) is not None)
+    identities = [f"insight:insight:{aid}" for aid in candidates[:EMITTED]]
+    latest_identity = engine._recent_delivery_identity_ts(identities)
+    hits += sum(1 for identity in identities if identity in latest_identity)
+    by_insight, by_advice = engine._recent_outcome_update_ts(
+        [f"insight:{aid}" for aid in candidates[:EMITTED]], candidates[:EMITTED]
+    )
+    for aid in candidates[:EMITTED]:
+        hits += int(f"insight:{aid}" in by_insight) + int(aid in by_advice)
+    return hits
+
+
+def run_mode(mode: str, calls: int, advice_pool: int, cooldown: float) -> Dict:
+    import lib.advisor as advisor
+    import lib.advisory_engine as engine
+
+    checks = _legacy_checks if mode == "legacy" else _indexed_checks
+    rng = random.Random(7)
+    check_ms: List[float] = []
+    write_ms: List[float] = []
+    hits = 0
+    for i in range(calls):
+        candidates = [f"adv-{rng.randrange(advice_pool)}" for _ in range(CANDIDATES)]
+        now = time.time()
+        t0 = time.perf_counter()
+        hits += checks(engine, advisor, candidates, now, cooldown)
+        t1 = time.perf_counter()
+        engine._append_jsonl_capped(
+            engine.GLOBAL_DEDUPE_LOG,
+            {"ts": now, "tool": "Read", "advice_id": candidates[0], "scope_key": "",
+             "text_sig": engine._text_fingerprint(f"Advice text {candidates[0]}")},
+            max_lines=int(engine.GLOBAL_DEDUPE_LOG_MAX),
+        )
+        if mode == "indexed":
+            engine._dedupe_index()
+        t2 = time.perf_counter()
+        check_ms.append((t1 - t0) * 1000.0)
+        write_ms.append((t2 - t1) * 1000.0)
+    return {
+        "mode": mode,
+        "checks": _summarize(check_ms),
+        "emit_write": _summarize(write_ms),
+        "total": _summarize([a + b for a, b in zip(check_ms, write_ms)]),
+        "hits": hits,
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--calls", type=int, default=300, help="Simulated pre-tool calls per mode")
+    ap.add_argument("--dedupe-rows", type=int, default=5000, help="Rows in the global dedupe log")
+    ap.add_argument("--deliveries", type=int, default=1000, help="Rows in recent_advice.jsonl")
+    ap.add_argument("--outcomes", type=int, default=3000, help="Records in outcome_tracking.json")
+    ap.add_argument("--advice-pool", type=int, default=400, help="Distinct advice ids")
+    ap.add_argument("--cooldown-s", type=float, default=600.0)
+    ap.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = ap.parse_args()
+
+    results = []
+    # One HOME for the whole run: spark modules bind their paths at import time.
+    with tempfile.TemporaryDirectory(prefix="spark_pre_tool_latency_") as home:
+        os.environ["HOME"] = home
+        os.environ["USERPROFILE"] = home
+        sys.path.insert(0, str(ROOT))
+        import lib.advisor as advisor
+        import lib.advisory_engine as engine
+
+        for mode in ("legacy", "indexed"):
+            random.seed(11)
+            _seed(engine, advisor, max(1, args.dedupe_rows), max(1, args.deliveries),
+                  max(1, args.outcomes), max(CANDIDATES, args.advice_pool))
+            results.append(run_mode(mode, max(1, args.calls), max(CANDIDATES, args.advice_pool), args.cooldown_s))
+
+    legacy, indexed = results
+    report = {
+        "calls": args.calls,
+        "dedupe_rows": args.dedupe_rows,
+        "deliveries": args.deliveries,
+        "outcomes": args.outcomes,
+        "results": results,
+        "speedup_checks_p50": round(legacy["checks"]["p50_ms"] / max(indexed["checks"]["p50_ms"], 1e-9), 1),
+        "speedup_total_p50": round(legacy["total"]["p50_ms"] / max(indexed["total"]["p50_ms"], 1e-9), 1),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{'mode':>8}  {'checks p50':>10}  {'checks p90':>10}  {'write p50':>9}  {'total p50':>9}  {'total p90':>9}  {'hits':>6}")
+    for row in results:
+        print(
+            f"{row['mode']:>8}  {row['checks']['p50_ms']:>10.3f}  {row['checks']['p90_ms']:>10.3f}  "
+            f"{row['emit_write']['p50_ms']:>9.3f}  {row['total']['p50_ms']:>9.3f}  "
+            f"{row['total']['p90_ms']:>9.3f}  {row['hits']:>6}"
+        )
+    print(f"\nchecks {report['speedup_checks_p50']}x faster at p50, whole call {report['speedup_total_p50']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
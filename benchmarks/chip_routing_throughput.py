@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Chip routing throughput: compiled trigger automaton vs per-trigger regex.
+
+Builds synthetic chips (observers + chip-level patterns), routes a stream of
+synthetic hook events through ChipRouter with the compiled automaton and with
+the legacy per-trigger path (use_automaton=False), and reports events/sec
+plus any routing mismatches between the two.
+
+Usage:
+    python benchmarks/chip_routing_throughput.py
+    python benchmarks/chip_routing_throughput.py --chips 10,40,120 --events 300 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+_SYLLABLES = ["ka", "lo", "mi", "ren", "tas", "vo", "qui", "zel", "dra", "pon", "sut", "bex", "nor", "fi"]
+_WORDS = [
+    "health", "damage", "physics", "deploy", "rollback", "schema", "migration", "latency", "token",
+    "cache", "retry", "queue", "render", "shader", "auth", "session", "webhook", "pipeline", "sprite",
+]
+
+
+def _term(rng: random.Random) -> str:
+    if rng.random() < 0.3:
+        return rng.choice(_WORDS)
+    word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+    return word if rng.random() < 0.8 else f"{word} {rng.choice(_WORDS)}"
+
+
+def _chips(rng: random.Random, n: int, observers: int, triggers: int):
+    from lib.chips.loader import Chip, ChipObserver
+
+    out = []
+    for i in range(n):
+        patterns = [_term(rng) for _ in range(triggers)]
+        out.append(Chip(
+            id=f"bench_chip_{i}",
+            name=f"Bench chip {i}",
+            version="1.0.0",
+            description="synthetic",
+            domains=[],
+            triggers=list(patterns),
+            observers=[
+                ChipObserver(name=f"obs_{j}", description="", triggers=[_term(rng) for _ in range(triggers)])
+                for j in range(observers)
+            ],
+            learners=[],
+            outcomes_positive=[],
+            outcomes_negative=[],
+            outcomes_neutral=[],
+            questions=[],
+            trigger_patterns=patterns,
+            trigger_tools=[{"name": "Bash", "context_contains": [_term(rng)]}],
+        ))
+    return out
+
+
+def _events(rng: random.Random, n: int, size: int) -> List[Dict]:
+    out = []
+    for _ in range(n):
+        words = [_term(rng) for _ in range(size)]
+        tool = rng.choice(["Edit", "Write", "Bash", "Read"])
+        key = "command" if tool == "Bash" else "new_string"
+        out.append({"event_type": "post_tool", "tool_name": tool, "input": {key: " ".join(words)}})
+    return out
+
+
+def _throughput(router, events, chips) -> Dict[str, float]:
+    start = time.perf_counter()
+    routed = [router.route_event(e, chips) for e in events]
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    return {
+        "events_per_s": round(len(events) / elapsed, 1),
+        "ms_per_event": round(elapsed * 1000.0 / len(events), 3),
+        "matches": sum(len(r) for r in routed),
+        "_routed": routed,
+    }
+
+
+def _signature(matches):
+    return [(m.chip.id, m.observer.name if m.observer else None, m.trigger, m.confidence, m.content_snippet) for m in matches]
+
+
+def run(chip_counts: List[int], events: int, observers: int, triggers: int, words: int, seed: int) -> Dict:
+    from lib.chips.router import ChipRouter
+
+    results = []
+    for n in chip_counts:
+        rng = random.Random(seed)
+        chips = _chips(rng, n, observers, triggers)
+        stream = _events(rng, events, words)
+
+        compiled_router = ChipRouter()
+        t0 = time.perf_counter()
+        compiled_router.route_event(stream[0], chips)
+        build_ms = (time.perf_counter() - t0) * 1000.0
+
+        compiled = _throughput(compiled_router, stream, chips)
+        legacy = _throughput(ChipRouter(use_automaton=False), stream, chips)
+        mismatches = sum(
+            int(_signature(a) != _signature(b)) for a, b in zip(compiled.pop("_routed"), legacy.pop("_routed"))
+        )
+        automaton = compiled_router._compiled.automaton
+        results.append({
+            "chips": n,
+            "patterns": automaton.patterns,
+            "states": automaton.states,
+            "build_ms": round(build_ms, 2),
+            "compiled": compiled,
+            "legacy": legacy,
+            "speedup": round(compiled["events_per_s"] / max(legacy["events_per_s"], 1e-9), 1),
+            "mismatches": mismatches,
+        })
+    return {"events": events, "words_per_event": words, "seed": seed, "results": results}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--chips", default="10,40,120", help="Comma-separated chip counts")
+    ap.add_argument("--events", type=int, default=200)
+    ap.add_argument("--observers", type=int, default=3, help="Observers per chip")
+    ap.add_argument("--triggers", type=int, default=6, help="Triggers per observer / chip pattern list")
+    ap.add_argument("--words", type=int, default=120, help="Terms per synthetic event")
+    ap.add_argument("--seed", type=int, default=11)
+    ap.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = ap.parse_args()
+    counts = [int(c) for c in args.chips.split(",") if c.strip()]
+
+    report = run(counts, max(1, args.events), args.observers, args.triggers, args.words, args.seed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{'chips':>6}  {'patterns':>8}  {'build ms':>8}  {'compiled ev/s':>13}  {'legacy ev/s':>11}  {'x':>6}  mism")
+    for row in report["results"]:
+        print(
+            f"{row['chips']:>6}  {row['patterns']:>8}  {row['build_ms']:>8.1f}  "
+            f"{row['compiled']['events_per_s']:>13.1f}  {row['legacy']['events_per_s']:>11.1f}  "
+            f"{row['speedup']:>6.1f}  {row['mismatches']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Cognitive context retrieval: term index vs full scan.
+
+Times CognitiveLearner.get_insights_for_context over synthetic insight sets
+(1k/10k/50k by default) with the in-process term index and with the full
+scan (SPARK_COGNITIVE_TERM_INDEX=0 behaviour). Runs use an isolated HOME so
+the user's ~/.spark state is never touched.
+
+Usage:
+    python benchmarks/cognitive_context_retrieval.py
+    python benchmarks/cognitive_context_retrieval.py --sizes 1000,10000 --queries 50 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_TOPICS = [
+    "deploy", "migration", "caching", "testing", "logging", "auth", "queue", "schema", "retry",
+    "timeout", "webhook", "docker", "kubernetes", "terraform", "postgres", "redis", "pytest",
+    "typescript", "react", "graphql", "oauth", "latency", "memory", "profiling", "rollback",
+]
+_VERBS = [
+    "validate", "document", "benchmark", "isolate", "monitor", "review", "pin", "cache",
+    "batch", "stream", "shard", "retry", "measure", "trace", "version", "audit",
+]
+_FILLER = [
+    "before", "changes", "production", "staging", "releases", "incidents", "regressions",
+    "requests", "configuration", "dependencies", "pipelines", "failures", "workers", "handlers",
+]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "p50_ms": round(_percentile(samples, 50), 3),
+        "p90_ms": round(_percentile(samples, 90), 3),
+        "max_ms": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+def _text(rng: random.Random, i: int) -> str:
+    topic = rng.choice(_TOPICS)
+    words = [rng.choice(_VERBS), "the", topic] + rng.sample(_FILLER, 4) + [rng.choice(_TOPICS), f"case{i}"]
+    return "Always " + " ".join(words)
+
+
+def _queries(rng: random.Random, n: int) -> List[str]:
+    out = []
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.4:
+            out.append(f"Edit {rng.choice(_TOPICS)}_{rng.choice(_TOPICS)}.py")
+        elif kind < 0.8:
+            out.append(f"{rng.choice(_VERBS)} {rng.choice(_TOPICS)} {rng.choice(_FILLER)}")
+        else:
+            out.append(rng.choice(["Bash", "Read", "Write", "Grep"]))
+    return out
+
+
+def run(sizes: List[int], queries: int, seed: int) -> Dict[str, object]:
+    from lib.cognitive_learner import CognitiveCategory, CognitiveInsight, CognitiveLearner
+
+    results = []
+    for size in sizes:
+        rng = random.Random(seed)
+        learner = CognitiveLearner()
+        for i in range(size):
+            learner.insights[f"wisdom:bench_{i}"] = CognitiveInsight(
+                category=CognitiveCategory.WISDOM,
+                insight=_text(rng, i),
+                evidence=[],
+                confidence=rng.uniform(0.4, 0.95),
+                context=f"{rng.choice(_TOPICS)} work" if rng.random() < 0.5 else "",
+                times_validated=rng.randint(0, 5),
+            )
+        qs = _queries(rng, queries)
+
+        start = time.perf_counter()
+        learner.get_insights_for_context(qs[0], limit=30)
+        build_ms = (time.perf_counter() - start) * 1000.0
+
+        indexed, scanned = [], []
+        mismatches = 0
+        for q in qs:
+            t0 = time.perf_counter()
+            a = learner.get_insights_for_context(q, limit=30, with_keys=True)
+            indexed.append((time.perf_counter() - t0) * 1000.0)
+            learner.TERM_INDEX_ENABLED = False
+            t0 = time.perf_counter()
+            b = learner.get_insights_for_context(q, limit=30, with_keys=True)
+            scanned.append((time.perf_counter() - t0) * 1000.0)
+            del learner.TERM_INDEX_ENABLED
+            mismatches += int([k for k, _ in a] != [k for k, _ in b])
+
+        row = {
+            "insights": size,
+            "index_build_ms": round(build_ms, 2),
+            "indexed": _summarize(indexed),
+            "scan": _summarize(scanned),
+            "speedup_p50": round(_percentile(scanned, 50) / max(_percentile(indexed, 50), 1e-6), 1),
+            "result_mismatches": mismatches,
+            "index": learner.term_index_stats(),
+        }
+        results.append(row)
+    return {"queries": queries, "seed": seed, "results": results}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="1000,10000,50000", help="Comma-separated insight counts")
+    ap.add_argument("--queries", type=int, default=30)
+    ap.add_argument("--seed", type=int, default=13)
+    ap.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = ap.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    with tempfile.TemporaryDirectory(prefix="spark_ctx_bench_") as home:
+        os.environ["HOME"] = home
+        os.environ["USERPROFILE"] = home
+        sys.path.insert(0, str(ROOT))
+        report = run(sizes, max(1, args.queries), args.seed)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{'insights':>9}  {'build ms':>9}  {'index p50':>9}  {'index p90':>9}  {'scan p50':>9}  {'scan p90':>9}  {'x':>6}  mism")
+    for row in report["results"]:
+        print(
+            f"{row['insights']:>9}  {row['index_build_ms']:>9.1f}  {row['indexed']['p50_ms']:>9.3f}  "
+            f"{row['indexed']['p90_ms']:>9.3f}  {row['scan']['p50_ms']:>9.2f}  {row['scan']['p90_ms']:>9.2f}  "
+            f"{row['speedup_p50']:>6.1f}  {row['result_mismatches']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""EIDOS store write throughput and reader/writer contention, multi-process.
+
+Spawns --writers processes saving steps into one eidos.db while --readers
+processes poll it with the queries the hook and observatory make
+(get_recent_steps, get_distillations_by_trigger). Reports write throughput,
+reader latency and "database is locked" errors for:
+
+- legacy: a fresh sqlite3 connection per call, rollback journal, steps saved
+  one call at a time (how EidosStore worked before the connection manager)
+- pooled: per-thread cached WAL connections (ConnectionManager); writers use
+  save_steps in batches of --batch
+
+Runs inside an isolated HOME; every mode gets its own database file.
+
+Usage:
+    python benchmarks/eidos_store_contention.py
+    python benchmarks/eidos_store_contention.py --writers 4 --readers 4 --steps 2000 --batch 25 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "p50_ms": round(_percentile(samples, 50), 3),
+        "p99_ms": round(_percentile(samples, 99), 3),
+        "max_ms": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+def _open_store(mode: str, db_path: str):
+    sys.path.insert(0, str(ROOT))
+    from lib.eidos.connection import ConnectionManager
+    from lib.eidos.store import EidosStore
+
+    if mode == "pooled":
+        return EidosStore(db_path)
+
+    class _PerCallConnections(ConnectionManager):
+        """The pre-manager behaviour: connect per call, default journal."""
+
+        def connection(self) -> sqlite3.Connection:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            return conn
+
+        @contextmanager
+        def read(self):
+            conn = self.connection()
+            try:
+                yield conn
+            finally:
+                conn.close()
+
+        @contextmanager
+        def write(self):
+            conn = self.connection()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    store = EidosStore.__new__(EidosStore)
+    store.db_path = db_path
+    store._db = _PerCallConnections(db_path)
+    store._init_db()
+    return store
+
+
+def _writer(mode: str, db_path: str, worker: int, steps: int, batch: int, out) -> None:
+    from lib.eidos.models import Step
+
+    store = _open_store(mode, db_path)
+    errors = 0
+    start = time.perf_counter()
+    pending = []
+    for i in range(steps):
+        pending.append(Step(
+            step_id=f"w{worker}-{i}", episode_id=f"ep-{worker}", trace_id=f"t{worker}-{i}",
+            intent=f"Run deploy check {i}", decision="Execute the focused test suite",
+            result="ok", lesson="Run tests before deploy",
+        ))
+        if len(pending) < batch and i < steps - 1:
+            continue
+        try:
+            if mode == "pooled":
+                store.save_steps(pending)
+            else:
+                for step in pending:
+                    store.save_step(step)
+        except sqlite3.OperationalError:
+            errors += 1
+        pending = []
+    out.put({"role": "writer", "seconds": time.perf_counter() - start, "errors": errors})
+
+
+def _reader(mode: str, db_path: str, stop, out) -> None:
+    store = _open_store(mode, db_path)
+    latencies: List[float] = []
+    errors = 0
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        try:
+            store.get_recent_steps(limit=20)
+            store.get_distillations_by_trigger("deploy", limit=10)
+        except sqlite3.OperationalError:
+            errors += 1
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+    out.put({"role": "reader", "latencies": latencies, "errors": errors})
+
+
+def run_mode(mode: str, workdir: Path, writers: int, readers: int, steps: int, batch: int) -> Dict:
+    ctx = mp.get_context("spawn")
+    db_path = str(workdir / f"eidos_{mode}.db")
+    store = _open_store(mode, db_path)
+    from lib.eidos.models import Distillation, DistillationType
+
+    for i in range(200):
+        store.save_distillation(Distillation(
+            distillation_id=f"d{i}", type=DistillationType.HEURISTIC,
+            statement=f"When deploying service {i}, run the smoke tests first",
+            triggers=["deploy", f"service-{i}"], confidence=0.5 + (i % 50) / 100.0,
+        ))
+
+    out = ctx.Queue()
+    stop = ctx.Event()
+    reader_procs = [ctx.Process(target=_reader, args=(mode, db_path, stop, out)) for _ in range(readers)]
+    writer_procs = [
+        ctx.Process(target=_writer, args=(mode, db_path, w, steps, batch, out)) for w in range(writers)
+    ]
+    for p in reader_procs:
+        p.start()
+    time.sleep(1.0)  # let readers import and start polling
+    start = time.perf_counter()
+    for p in writer_procs:
+        p.start()
+    results = [out.get() for _ in writer_procs]
+    wall = time.perf_counter() - start
+    stop.set()
+    results += [out.get() for _ in reader_procs]
+    for p in reader_procs + writer_procs:
+        p.join(30)
+
+    writer_rows = [r for r in results if r["role"] == "writer"]
+    reader_rows = [r for r in results if r["role"] == "reader"]
+    latencies = [ms for r in reader_rows for ms in r["latencies"]]
+    total_steps = writers * steps
+    return {
+        "mode": mode,
+        "steps_written": total_steps,
+        "wall_s": round(wall, 3),
+        "steps_per_s": round(total_steps / max(wall, 1e-9), 1),
+        "writer_lock_errors": sum(r["errors"] for r in writer_rows),
+        "reader_queries": _summarize(latencies),
+        "reader_lock_errors": sum(r["errors"] for r in reader_rows),
+        "stored_steps": int(store.get_stats()["steps"]),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--mode", choices=["legacy", "pooled", "both"], default="both")
+    ap.add_argument("--writers", type=int, default=4)
+    ap.add_argument("--readers", type=int, default=4)
+    ap.add_argument("--steps", type=int, default=500, help="Steps saved per writer")
+    ap.add_argument("--batch", type=int, default=20, help="Steps per save_steps call (pooled mode)")
+    ap.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = ap.parse_args()
+    modes = ["legacy", "pooled"] if args.mode == "both" else [args.mode]
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="spark_eidos_contention_") as home:
+        os.environ["HOME"] = home
+        os.environ["USERPROFILE"] = home
+        sys.path.insert(0, str(ROOT))
+        for mode in modes:
+            results.append(run_mode(
+                mode, Path(home), max(1, args.writers), max(0, args.readers), max(1, args.steps), max(1, args.batch)
+            ))
+
+    report = {
+        "writers": args.writers, "readers": args.readers, "steps": args.steps, "batch": args.batch,
+        "results": results,
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{'mode':>7}  {'steps/s':>8}  {'wall s':>7}  {'w-err':>5}  {'read p50':>8}  {'read p99':>8}  {'read max':>8}  {'reads':>6}  {'r-err':>5}")
+    for row in results:
+        rq = row["reader_queries"]
+        print(
+            f"{row['mode']:>7}  {row['steps_per_s']:>8.1f}  {row['wall_s']:>7.2f}  {row['writer_lock_errors']:>5}  "
+            f"{rq['p50_ms']:>8.2f}  {rq['p99_ms']:>8.2f}  {rq['max_ms']:>8.1f}  {rq['n']:>6}  {row['reader_lock_errors']:>5}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""Generate hook events and chip definitions for the hermetic benchmark suites."""
+import random
+
+from .advisory_queries import generate_queries
+from .useful_memories import DOMAINS, generate_useful
+
+_PROMPT_STARTS = [
+    "Can you", "Please", "I need to", "Let's", "Help me",
+]
+
+
+def _tool_input(tool, query):
+    target = query["input"]
+    if tool == "Bash":
+        return {"command": f"pytest -q {target.split()[-1]}  # {query['context']}"}
+    if tool in ("Edit", "Write"):
+        return {"file_path": target.split()[-1], "new_string": f"{target} ({query['context']})"}
+    return {"file_path": target.split()[-1]}
+
+
+def generate_hook_events(n=400, seed=42):
+    """Return n queue events (quick_capture kwargs without the EventType enum).
+
+    Mix: ~20% user prompts (useful-memory texts), the rest pre/post tool pairs
+    built from the advisory queries. ``event_type`` is the EventType value.
+    """
+    rng = random.Random(seed)
+    queries = generate_queries(seed)
+    prompts = [m["text"] for m in generate_useful(seed)]
+    events = []
+    i = 0
+    while len(events) < n:
+        session_id = f"bench-session-{i % 7}"
+        if rng.random() < 0.2:
+            events.append({
+                "event_type": "user_prompt",
+                "session_id": session_id,
+                "data": {"payload": {"role": "user", "text": f"{rng.choice(_PROMPT_STARTS)} {rng.choice(prompts)}"}},
+                "trace_id": f"bench-trace-{i}",
+            })
+        else:
+            q = queries[i % len(queries)]
+            tool = q["tool"]
+            tool_input = _tool_input(tool, q)
+            failed = rng.random() < 0.1
+            for kind in ("pre_tool", "post_tool_failure" if failed else "post_tool"):
+                events.append({
+                    "event_type": kind,
+                    "session_id": session_id,
+                    "data": {"cwd": "/work/bench", "domain": q["domain"]},
+                    "tool_name": tool,
+                    "tool_input": tool_input,
+                    "error": "Command failed with exit code 1" if kind == "post_tool_failure" else None,
+                    "trace_id": f"bench-trace-{i}",
+                })
+        i += 1
+    return events[:n]
+
+
+def generate_chip_specs(n=40, seed=42, observers=4, triggers=6):
+    """Return n chip specs (dicts of Chip/ChipObserver fields) over the memory domains.
+
+    Triggers are domain words plus words lifted from the advisory queries, so
+    routed hook events produce a realistic share of matches.
+    """
+    rng = random.Random(seed)
+    vocab = sorted({
+        w.strip(".,()").lower()
+        for q in generate_queries(seed)
+        for w in f"{q['input']} {q['context']}".split()
+        if len(w.strip(".,()")) >= 4 and "/" not in w
+    })
+    specs = []
+    for i in range(n):
+        domain = DOMAINS[i % len(DOMAINS)]
+        patterns = [domain.replace("_", " ")] + rng.sample(vocab, triggers - 1)
+        specs.append({
+            "id": f"bench_{domain}_{i}",
+            "name": f"Bench {domain} {i}",
+            "domains": [domain],
+            "triggers": patterns,
+            "observers": [
+                {"name": f"obs_{j}", "triggers": rng.sample(vocab, triggers)}
+                for j in range(observers)
+            ],
+            "trigger_tools": [{"name": "Bash", "context_contains": [rng.choice(vocab)]}],
+        })
+    return specs
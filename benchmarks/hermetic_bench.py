@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""Hermetic benchmark runner: named suites, isolated Spark home, JSON reports.
+
+Every suite runs in its own Python process whose HOME (and USERPROFILE) is
+a fresh temp directory, so ~/.spark is a clean per-run Spark home. Spark
+modules bind their paths at import time, so a process per suite is the only
+reliable isolation. SPARK_* variables from the caller's environment are
+dropped, PYTHONHASHSEED is pinned and a runtime tuneables.json turns off
+OpenClaw notify and Mind sync. The child stubs the bridge cycle's LLM
+calls (advisory synthesis, EIDOS distillation), which shell out to the
+claude CLI, so nothing leaves the sandbox. The child seeds its home
+deterministically from benchmarks/generators (--seed), runs the suite and
+reports timing distributions.
+
+Suites:
+- ingest:          quick_capture per event and quick_capture_many batches
+- pipeline_cycle:  run_bridge_cycle over a seeded queue
+- advisory_pre_tool: advisory_engine.on_pre_tool with seeded insights
+- retrieval:       CognitiveLearner.get_insights_for_context over seeded insights
+- chip_routing:    ChipRouter.route_event over generated chips and hook events
+
+The report (stdout with --json, or --out PATH) has per-suite metrics
+{n, mean_ms, p50_ms, p90_ms, p99_ms, max_ms} plus counters. --compare checks
+each metric's p50/p90 against a baseline report. The default baseline is
+benchmarks/results/hermetic_baseline.json. A metric regresses when it is
+more than --threshold slower and more than --min-delta-ms slower in
+absolute terms; the exit status is then 1. Metrics with fewer than
+MIN_GATED_SAMPLES samples (cold first calls) are shown but never gate. --save-baseline writes the
+current run as the new baseline. Baselines are machine-specific; the report
+records the platform so mismatched comparisons are called out.
+
+Usage:
+    python benchmarks/hermetic_bench.py
+    python benchmarks/hermetic_bench.py --suites ingest,retrieval --scale 2 --json
+    python benchmarks/hermetic_bench.py --compare
+    python benchmarks/hermetic_bench.py --save-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+DEFAULT_BASELINE = RESULTS_DIR / "hermetic_baseline.json"
+REPORT_SCHEMA = 1
+COMPARED_STATS = ("p50_ms", "p90_ms")
+# Metrics with fewer samples (cold first calls) are reported but never gate.
+MIN_GATED_SAMPLES = 5
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "mean_ms": round(sum(samples) / len(samples), 4) if samples else 0.0,
+        "p50_ms": round(_percentile(samples, 50), 4),
+        "p90_ms": round(_percentile(samples, 90), 4),
+        "p99_ms": round(_percentile(samples, 99), 4),
+        "max_ms": round(max(samples), 4) if samples else 0.0,
+    }
+
+
+def _timed(fn: Callable[[], object], samples: List[float]) -> object:
+    t0 = time.perf_counter()
+    out = fn()
+    samples.append((time.perf_counter() - t0) * 1000.0)
+    return out
+
+
+# ==================== Seeding (runs inside the isolated home) ====================
+
+def _capture_kwargs(events: List[Dict]) -> List[Dict]:
+    from lib.queue import EventType
+
+    return [{**e, "event_type": EventType(e["event_type"])} for e in events]
+
+
+def _seed_insights(learner, seed: int, count: int) -> int:
+    from benchmarks.generators.garbage_memories import generate_garbage
+    from benchmarks.generators.useful_memories import generate_useful
+    from lib.cognitive_learner import CognitiveCategory, CognitiveInsight
+
+    rng = random.Random(seed)
+    memories = generate_useful(seed) + generate_garbage(seed)
+    rng.shuffle(memories)
+    for i, mem in enumerate(memories[:count]):
+        learner.insights[f"wisdom:bench_{i}"] = CognitiveInsight(
+            category=CognitiveCategory.WISDOM,
+            insight=mem["text"],
+            evidence=[],
+            confidence=round(rng.uniform(0.5, 0.95), 3),
+            context=str(mem.get("domain") or ""),
+            times_validated=rng.randint(0, 6),
+        )
+    learner._dirty = True
+    learner.flush()
+    return min(count, len(memories))
+
+
+def _query_text(q: Dict) -> str:
+    return f"{q['tool']} {q['input']} {q['context']}"
+
+
+# ==================== Suites ====================
+
+def suite_ingest(seed: int, scale: float) -> Dict:
+    from benchmarks.generators.hook_events import generate_hook_events
+    from lib.queue import count_events, quick_capture, quick_capture_many
+
+    n = max(50, int(400 * scale))
+    events = _capture_kwargs(generate_hook_events(n, seed))
+    single: List[float] = []
+    for kwargs in events:
+        _timed(lambda: quick_capture(**kwargs), single)
+    batch = 50
+    batches: List[float] = []
+    for i in range(0, len(events), batch):
+        chunk = events[i:i + batch]
+        _timed(lambda: quick_capture_many(chunk), batches)
+    per_event = [ms / batch for ms in batches]
+    return {
+        "metrics": {"quick_capture": _summarize(single), "quick_capture_many_per_event": _summarize(per_event)},
+        "counts": {"events": n * 2, "queued": int(count_events())},
+    }
+
+
+def suite_pipeline_cycle(seed: int, scale: float) -> Dict:
+    from benchmarks.generators.hook_events import generate_hook_events
+    from lib.bridge_cycle import run_bridge_cycle
+    from lib.queue import count_events, quick_capture_many
+
+    cycles = max(MIN_GATED_SAMPLES, int(8 * scale))
+    per_cycle = 60
+    quick_capture_many(_capture_kwargs(generate_hook_events(per_cycle * cycles, seed)))
+    queued = int(count_events())
+    samples: List[float] = []
+    processed = 0
+    for _ in range(cycles):
+        stats = _timed(lambda: run_bridge_cycle(), samples) or {}
+        processed += int((stats.get("pattern_processed") or 0) if isinstance(stats, dict) else 0)
+    return {
+        "metrics": {"bridge_cycle": _summarize(samples)},
+        "counts": {"queued": queued, "cycles": cycles, "pattern_processed": processed},
+    }
+
+
+def suite_advisory_pre_tool(seed: int, scale: float) -> Dict:
+    from benchmarks.generators.advisory_queries import generate_queries
+    from benchmarks.generators.hook_events import _tool_input
+    from lib.cognitive_learner import get_cognitive_learner
+    import lib.advisory_engine as engine
+
+    seeded = _seed_insights(get_cognitive_learner(), seed, max(200, int(1500 * scale)))
+    queries = generate_queries(seed)[: max(30, int(150 * scale))]
+    samples: List[float] = []
+    emitted = 0
+    for i, q in enumerate(queries):
+        out = _timed(
+            lambda: engine.on_pre_tool(f"bench-session-{i % 5}", q["tool"], _tool_input(q["tool"], q),
+                                       trace_id=f"bench-trace-{i}"),
+            samples,
+        )
+        emitted += int(bool(out))
+    return {
+        "metrics": {"on_pre_tool": _summarize(samples[1:] or samples), "first_call": _summarize(samples[:1])},
+        "counts": {"insights": seeded, "calls": len(queries), "emitted": emitted},
+    }
+
+
+def suite_retrieval(seed: int, scale: float) -> Dict:
+    from benchmarks.generators.advisory_queries import generate_queries
+    from lib.cognitive_learner import get_cognitive_learner
+
+    learner = get_cognitive_learner()
+    seeded = _seed_insights(learner, seed, max(500, int(5000 * scale)))
+    queries = [_query_text(q) for q in generate_queries(seed)[: max(50, int(200 * scale))]]
+    build: List[float] = []
+    _timed(lambda: learner.get_insights_for_context(queries[0], limit=10), build)
+    samples: List[float] = []
+    hits = 0
+    for text in queries:
+        hits += len(_timed(lambda: learner.get_insights_for_context(text, limit=10), samples) or [])
+    return {
+        "metrics": {"get_insights_for_context": _summarize(samples), "first_query": _summarize(build)},
+        "counts": {"insights": seeded, "queries": len(queries), "results": hits},
+    }
+
+
+def suite_chip_routing(seed: int, scale: float) -> Dict:
+    from benchmarks.generators.hook_events import generate_chip_specs, generate_hook_events
+    from lib.chips.loader import Chip, ChipObserver
+    from lib.chips.router import ChipRouter
+
+    chips = [
+        Chip(
+            id=s["id"], name=s["name"], version="1.0.0", description="hermetic bench",
+            domains=s["domains"], triggers=list(s["triggers"]),
+            observers=[ChipObserver(name=o["name"], description="", triggers=o["triggers"]) for o in s["observers"]],
+            learners=[], outcomes_positive=[], outcomes_negative=[], outcomes_neutral=[], questions=[],
+            trigger_patterns=list(s["triggers"]), trigger_tools=s["trigger_tools"],
+        )
+        for s in generate_chip_specs(max(10, int(40 * scale)), seed)
+    ]
+    events = generate_hook_events(max(100, int(600 * scale)), seed)
+    router = ChipRouter()
+    build: List[float] = []
+    _timed(lambda: router.route_event(events[0], chips), build)
+    samples: List[float] = []
+    matches = 0
+    for event in events:
+        matches += len(_timed(lambda: router.route_event(event, chips), samples))
+    return {
+        "metrics": {"route_event": _summarize(samples), "first_event": _summarize(build)},
+        "counts": {"chips": len(chips), "events": len(events), "matches": matches},
+    }
+
+
+SUITES: Dict[str, Callable[[int, float], Dict]] = {
+    "ingest": suite_ingest,
+    "pipeline_cycle": suite_pipeline_cycle,
+    "advisory_pre_tool": suite_advisory_pre_tool,
+    "retrieval": suite_retrieval,
+    "chip_routing": suite_chip_routing,
+}
+
+
+# Canned synthesizer output: the bridge cycle still prunes and writes an
+# advisory, but never waits on the claude CLI.
+STUB_ADVISORY = "- Run the focused tests after each edit to the bridge cycle."
+
+
+def _stub_llm() -> None:
+    """Replace the bridge cycle's LLM entry points inside the isolated home."""
+    import lib.llm as llm
+
+    llm.synthesize_advisory = lambda *_a, **_kw: STUB_ADVISORY
+    llm.distill_eidos = lambda *_a, **_kw: None
+
+
+def _run_worker(name: str, seed: int, scale: float) -> int:
+    """Child side: run one suite and print its result as the last stdout line."""
+    sys.path.insert(0, str(ROOT))
+    random.seed(seed)
+    _stub_llm()
+    noise = io.StringIO()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(noise):
+        result = SUITES[name](seed, scale)
+    result["wall_s"] = round(time.perf_counter() - t0, 3)
+    spark_dir = Path.home() / ".spark"
+    result["home_files"] = sum(1 for p in spark_dir.rglob("*") if p.is_file()) if spark_dir.exists() else 0
+    print(json.dumps(result))
+    return 0
+
+
+# ==================== Parent: provisioning, reports, comparison ====================
+
+def _hermetic_env(home: Path) -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("SPARK_")}
+    env.update({
+        "HOME": str(home),
+        "USERPROFILE": str(home),
+        "PYTHONHASHSEED": "0",
+        "PYTHONDONTWRITEBYTECODE": "1",
+        "SPARK_EMBED_BACKEND": "tfidf",
+    })
+    return env
+
+
+# Runtime tuneables written into every fresh home: no OpenClaw workspace or
+# Mind calls, so timings stay comparable (LLM calls are stubbed in the child).
+HERMETIC_TUNEABLES = {
+    "bridge_worker": {
+        "openclaw_notify": False,
+        "mind_sync_enabled": False,
+        "mind_sync_drain_queue": False,
+    },
+}
+
+
+def run_suite(name: str, seed: int, scale: float, timeout_s: float) -> Dict:
+    with tempfile.TemporaryDirectory(prefix=f"spark_bench_{name}_") as home:
+        spark_dir = Path(home) / ".spark"
+        spark_dir.mkdir()
+        (spark_dir / "tuneables.json").write_text(json.dumps(HERMETIC_TUNEABLES, indent=2), encoding="utf-8")
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--worker", name,
+             "--seed", str(seed), "--scale", str(scale)],
+            cwd=str(ROOT), env=_hermetic_env(Path(home)), capture_output=True, text=True, timeout=timeout_s,
+        )
+    lines = [ln for ln in proc.stdout.splitlines() if ln.strip()]
+    if proc.returncode != 0 or not lines:
+        return {"error": (proc.stderr or proc.stdout).strip().splitlines()[-5:], "returncode": proc.returncode}
+    try:
+        return json.loads(lines[-1])
+    except json.JSONDecodeError:
+        return {"error": lines[-5:], "returncode": proc.returncode}
+
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(ROOT),
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip()
+    except Exception:
+        return ""
+
+
+def _environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": str(os.cpu_count() or ""),
+        "git_rev": _git_rev(),
+    }
+
+
+def compare_reports(current: Dict, baseline: Dict, threshold: float, min_delta_ms: float) -> Dict:
+    """Per-metric deltas of current vs baseline; ``regressions`` lists the failures."""
+    rows, regressions = [], []
+    for suite, result in (current.get("suites") or {}).items():
+        base_metrics = ((baseline.get("suites") or {}).get(suite) or {}).get("metrics") or {}
+        for metric, stats in (result.get("metrics") or {}).items():
+            base = base_metrics.get(metric)
+            if not base:
+                continue
+            gated = min(int(stats.get("n", 0)), int(base.get("n", 0))) >= MIN_GATED_SAMPLES
+            for stat in COMPARED_STATS:
+                new_v, old_v = float(stats.get(stat, 0.0)), float(base.get(stat, 0.0))
+                ratio = new_v / old_v if old_v > 0 else 1.0
+                row = {"suite": suite, "metric": metric, "stat": stat,
+                       "baseline": old_v, "current": new_v, "ratio": round(ratio, 3), "gated": gated}
+                row["regressed"] = gated and ratio > 1.0 + threshold and (new_v - old_v) > min_delta_ms
+                rows.append(row)
+                if row["regressed"]:
+                    regressions.append(row)
+    env_a, env_b = current.get("environment") or {}, baseline.get("environment") or {}
+    mismatched = [k for k in ("platform", "machine", "python") if env_a.get(k) != env_b.get(k)]
+    return {"rows": rows, "regressions": regressions, "environment_mismatch": mismatched,
+            "seed_or_scale_mismatch": (current.get("seed"), current.get("scale")) != (baseline.get("seed"), baseline.get("scale"))}
+
+
+def _print_report(report: Dict, comparison: Optional[Dict]) -> None:
+    print(f"{'suite':>18}  {'metric':>30}  {'n':>5}  {'p50 ms':>9}  {'p90 ms':>9}  {'p99 ms':>9}  {'wall s':>7}")
+    for suite, result in report["suites"].items():
+        if "error" in result:
+            print(f"{suite:>18}  ERROR: {' | '.join(result['error'])}")
+            continue
+        for metric, st in result["metrics"].items():
+            print(f"{suite:>18}  {metric:>30}  {st['n']:>5}  {st['p50_ms']:>9.3f}  {st['p90_ms']:>9.3f}  "
+                  f"{st['p99_ms']:>9.3f}  {result['wall_s']:>7.2f}")
+    if comparison is None:
+        return
+    print()
+    if comparison["environment_mismatch"]:
+        print(f"note: baseline was recorded on a different {', '.join(comparison['environment_mismatch'])}")
+    if comparison["seed_or_scale_mismatch"]:
+        print("note: baseline used a different --seed/--scale")
+    for row in comparison["rows"]:
+        flag = "REGRESSION" if row["regressed"] else ("" if row["gated"] else "(not gated)")
+        print(f"{row['suite']:>18}  {row['metric']:>30}  {row['stat']:>6}  {row['baseline']:>9.3f} -> "
+              f"{row['current']:>9.3f}  x{row['ratio']:<6}  {flag}")
+    print(f"\n{len(comparison['regressions'])} regression(s)")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--suites", default=",".join(SUITES), help="Comma-separated suites to run")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--scale", type=float, default=1.0, help="Multiplies seeded data and iteration counts")
+    ap.add_argument("--timeout-s", type=float, default=900.0, help="Per-suite timeout")
+    ap.add_argument("--out", default="", help="Write the JSON report to this path")
+    ap.add_argument("--compare", nargs="?", const=str(DEFAULT_BASELINE), default="",
+                    help="Compare against a baseline report (default: benchmarks/results/hermetic_baseline.json)")
+    ap.add_argument("--threshold", type=float, default=0.5, help="Relative slowdown that counts as a regression")
+    ap.add_argument("--min-delta-ms", type=float, default=0.5, help="Ignore slowdowns smaller than this")
+    ap.add_argument("--save-baseline", nargs="?", const=str(DEFAULT_BASELINE), default="",
+                    help="Write this run as the baseline")
+    ap.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    ap.add_argument("--worker", default="", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.worker:
+        return _run_worker(args.worker, args.seed, args.scale)
+
+    names = [s.strip() for s in args.suites.split(",") if s.strip()]
+    unknown = [s for s in names if s not in SUITES]
+    if unknown:
+        ap.error(f"unknown suite(s): {', '.join(unknown)} (choose from {', '.join(SUITES)})")
+
+    report = {
+        "schema": REPORT_SCHEMA,
+        "generated_at": datetime.now().strftime("%Y%m%d_%H%M%S"),
+        "seed": args.seed,
+        "scale": args.scale,
+        "environment": _environment(),
+        "suites": {name: run_suite(name, args.seed, args.scale, args.timeout_s) for name in names},
+    }
+
+    comparison = None
+    if args.compare:
+        baseline_path = Path(args.compare)
+        if not baseline_path.exists():
+            print(f"baseline not found: {baseline_path}", file=sys.stderr)
+            return 2
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        comparison = compare_reports(report, baseline, args.threshold, args.min_delta_ms)
+        report["comparison"] = {"baseline": str(baseline_path), **comparison}
+
+    payload = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.out).write_text(payload + "\n", encoding="utf-8")
+    if args.save_baseline:
+        saved = {k: v for k, v in report.items() if k != "comparison"}
+        Path(args.save_baseline).write_text(json.dumps(saved, indent=2) + "\n", encoding="utf-8")
+    if args.json:
+        print(payload)
+    else:
+        _print_report(report, comparison)
+
+    failed = any("error" in r for r in report["suites"].values())
+    regressed = bool(comparison and comparison["regressions"])
+    return 1 if (failed or regressed) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
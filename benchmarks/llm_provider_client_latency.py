@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""LLM provider call latency: fresh httpx client per call vs pooled clients.
+
+Starts a local stub HTTP server that emulates the Ollama (/api/chat) and
+OpenAI (/v1/chat/completions) endpoints with a fixed --delay-ms of "model"
+time, points advisory_synthesizer at it and measures:
+
+- sequential: per-call latency with a fresh httpx.Client per call (the old
+  provider code) vs the pooled keep-alive client (_query_provider)
+- concurrent: --threads callers at once, serialized through one lock while
+  swapping the module timeout (the old llm_dispatch path) vs pooled calls with
+  a per-call timeout
+
+Usage:
+    python benchmarks/llm_provider_client_latency.py
+    python benchmarks/llm_provider_client_latency.py --calls 200 --delay-ms 20 --threads 8 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "p50_ms": round(_percentile(samples, 50), 3),
+        "p90_ms": round(_percentile(samples, 90), 3),
+        "max_ms": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+def _stub_server(delay_s: float) -> ThreadingHTTPServer:
+    class _Stub(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, fmt, *args):
+            return
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", "0") or 0))
+            if delay_s:
+                time.sleep(delay_s)
+            if self.path == "/api/chat":
+                payload = {"message": {"role": "assistant", "content": "Run the focused test first."}}
+            else:
+                payload = {"choices": [{"message": {"role": "assistant", "content": "Run the focused test first."}}]}
+            raw = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _fresh_client_call(synth, provider: str, prompt: str, timeout_s: float) -> str:
+    """The pre-pool provider code path: build and tear down a client per call."""
+    import httpx
+
+    with httpx.Client(timeout=timeout_s) as client:
+        if provider == "ollama":
+            resp = client.post(f"{synth.OLLAMA_API}/api/chat", json={
+                "model": synth.OLLAMA_MODEL, "messages": [{"role": "user", "content": prompt}], "stream": False,
+            })
+            return resp.json()["message"]["content"]
+        resp = client.post(
+            f"{synth.OPENAI_BASE_URL}/chat/completions",
+            headers={"Authorization": f"Bearer {synth.OPENAI_API_KEY}"},
+            json={"model": synth.OPENAI_MODEL, "messages": [{"role": "user", "content": prompt}]},
+        )
+        return resp.json()["choices"][0]["message"]["content"]
+
+
+def _timed(fn: Callable[[], object], calls: int) -> List[float]:
+    out = []
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        if not fn():
+            raise RuntimeError("empty provider response")
+        out.append((time.perf_counter() - t0) * 1000.0)
+    return out
+
+
+def run(calls: int, delay_ms: float, threads: int) -> Dict:
+    import lib.advisory_synthesizer as synth
+
+    server = _stub_server(delay_ms / 1000.0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    synth.OLLAMA_API = base
+    synth.OPENAI_BASE_URL = f"{base}/v1"
+    synth.OPENAI_API_KEY = "sk-bench"
+    timeout_s = 5.0
+    prompt = "Synthesize: run tests before deploy; pin migrations."
+
+    try:
+        sequential = {}
+        for provider in ("ollama", "openai"):
+            synth.close_provider_clients()
+            fresh = _timed(lambda: _fresh_client_call(synth, provider, prompt, timeout_s), calls)
+            pooled = _timed(lambda: synth._query_provider(provider, prompt, timeout_s=timeout_s), calls)
+            sequential[provider] = {
+                "fresh": _summarize(fresh),
+                "pooled": _summarize(pooled),
+                "speedup_p50": round(_percentile(fresh, 50) / max(_percentile(pooled, 50), 1e-9), 2),
+            }
+
+        lock = threading.Lock()
+
+        def _legacy_dispatch(_):
+            with lock:
+                original = synth.AI_TIMEOUT_S
+                synth.AI_TIMEOUT_S = timeout_s
+                try:
+                    return _fresh_client_call(synth, "ollama", prompt, synth.AI_TIMEOUT_S)
+                finally:
+                    synth.AI_TIMEOUT_S = original
+
+        def _pooled_dispatch(_):
+            return synth._query_provider("ollama", prompt, timeout_s=timeout_s)
+
+        concurrent = {}
+        for name, fn in (("locked_fresh", _legacy_dispatch), ("pooled", _pooled_dispatch)):
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                results = list(pool.map(fn, range(calls)))
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            concurrent[name] = {
+                "wall_s": round(elapsed, 3),
+                "calls_per_s": round(calls / elapsed, 1),
+                "ok": sum(1 for r in results if r),
+            }
+        concurrent["speedup"] = round(
+            concurrent["pooled"]["calls_per_s"] / max(concurrent["locked_fresh"]["calls_per_s"], 1e-9), 1
+        )
+    finally:
+        synth.close_provider_clients()
+        server.shutdown()
+        server.server_close()
+    return {"calls": calls, "delay_ms": delay_ms, "threads": threads, "sequential": sequential, "concurrent": concurrent}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--calls", type=int, default=100)
+    ap.add_argument("--delay-ms", type=float, default=10.0, help="Simulated model latency per request")
+    ap.add_argument("--threads", type=int, default=4, help="Concurrent callers for the dispatch comparison")
+    ap.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = ap.parse_args()
+
+    report = run(max(1, args.calls), max(0.0, args.delay_ms), max(1, args.threads))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{'provider':>9}  {'fresh p50':>9}  {'fresh p90':>9}  {'pooled p50':>10}  {'pooled p90':>10}  {'x':>5}")
+    for provider, row in report["sequential"].items():
+        print(
+            f"{provider:>9}  {row['fresh']['p50_ms']:>9.2f}  {row['fresh']['p90_ms']:>9.2f}  "
+            f"{row['pooled']['p50_ms']:>10.2f}  {row['pooled']['p90_ms']:>10.2f}  {row['speedup_p50']:>5.2f}"
+        )
+    conc = report["concurrent"]
+    print(
+        f"\n{report['threads']} concurrent callers, {report['calls']} calls: "
+        f"locked+fresh {conc['locked_fresh']['calls_per_s']:.1f} calls/s, "
+        f"pooled {conc['pooled']['calls_per_s']:.1f} calls/s ({conc['speedup']:.1f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
-"""Standalone memory retrieval A/B helpers used by unit tests."""
+"""Standalone memory retrieval A/B helpers used by unit tests.
+
+`--ann-recall` benchmarks the memory_store IVF index (recall@k vs latency):
+    python benchmarks/memory_retrieval_ab.py --ann-recall --vectors 20000
+"""
 
 from __future__ import annotations
 
+import argparse
+import json
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
 
@@ -329,5 +342,134 @@ def retrieve_hybrid(
     return scored[:top_k]
 
 
+def _synthetic_vectors(count: int, dim: int, clusters: int, seed: int) -> List[List[float]]:
+    rng = random.Random(seed)
+    centers = [[rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(clusters)]
+    return [
+        [x + rng.gauss(0.0, 0.6) for x in centers[rng.randrange(clusters)]]
+        for _ in range(count)
+    ]
+
+
+def _latency_summary(samples_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples_ms) or [0.0]
+
+    def pick(pct: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+    return {"p50_ms": round(pick(0.50), 3), "p95_ms": round(pick(0.95), 3)}
+
+
+def run_ann_recall_benchmark(
+    *,
+    vectors: int = 20000,
+    queries: int = 200,
+    dim: int = 256,
+    clusters: int = 64,
+    top_k: int = 10,
+    nprobes: Iterable[int] = (1, 2, 4, 8, 16, 32),
+    seed: int = 13,
+) -> Dict[str, Any]:
+    """Recall@k vs latency of the memory_store IVF index against exact cosine.
+
+    Builds a throwaway memory_store database of synthetic clustered vectors,
+    so the user's ~/.spark/memory_store.sqlite is never touched.
+    """
+    root = Path(__file__).resolve().parent.parent
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    from lib import memory_ann, memory_store
+
+    tmp = Path(tempfile.mkdtemp(prefix="spark_ann_bench_"))
+    conn = sqlite3.connect(tmp / "memory_store.sqlite")
+    conn.row_factory = sqlite3.Row
+    try:
+        memory_store._ensure_schema(conn)
+        data = _synthetic_vectors(vectors, dim, clusters, seed)
+        conn.executemany(
+            "INSERT INTO memories (memory_id, content, scope, project_key, category, created_at, source, meta) "
+            "VALUES (?, ?, 'global', NULL, 'context', 0, 'bench', '{}')",
+            [(f"m{i}", f"synthetic memory {i}") for i in range(vectors)],
+        )
+        conn.executemany(
+            "INSERT INTO memories_vec (memory_id, dim, vector) VALUES (?, ?, ?)",
+            [(f"m{i}", dim, memory_store._vector_to_blob(vec)) for i, vec in enumerate(data)],
+        )
+        start = time.perf_counter()
+        build = memory_ann.build(conn)
+        build_ms = (time.perf_counter() - start) * 1000.0
+        conn.commit()
+
+        qvecs = _synthetic_vectors(queries, dim, clusters, seed + 1)
+        truth: List[set] = []
+        exact_ms: List[float] = []
+        for q in qvecs:
+            start = time.perf_counter()
+            hits = memory_ann.exact_search(conn, q, k=top_k)
+            exact_ms.append((time.perf_counter() - start) * 1000.0)
+            truth.append({mid for mid, _ in hits})
+
+        rows = []
+        for nprobe in nprobes:
+            lat: List[float] = []
+            found = 0
+            for q, expected in zip(qvecs, truth):
+                start = time.perf_counter()
+                hits = memory_ann.search(conn, q, k=top_k, nprobe=nprobe)
+                lat.append((time.perf_counter() - start) * 1000.0)
+                found += len(expected & {mid for mid, _ in hits})
+            rows.append({
+                "nprobe": int(nprobe),
+                f"recall@{top_k}": round(found / max(1, top_k * len(qvecs)), 4),
+                **_latency_summary(lat),
+            })
+        return {
+            "vectors": vectors,
+            "queries": queries,
+            "dim": dim,
+            "top_k": top_k,
+            "index": build,
+            "build_ms": round(build_ms, 1),
+            "exact": _latency_summary(exact_ms),
+            "ann": rows,
+        }
+    finally:
+        conn.close()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
 def main() -> int:
-    raise SystemExit(0)
+    parser = argparse.ArgumentParser(description="Memory retrieval benchmarks")
+    parser.add_argument("--ann-recall", action="store_true", help="Measure IVF recall@k vs latency against exact search")
+    parser.add_argument("--vectors", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nprobe", default="1,2,4,8,16,32", help="Comma-separated nprobe values")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args, _unknown = parser.parse_known_args()
+    if not args.ann_recall:
+        raise SystemExit(0)
+
+    report = run_ann_recall_benchmark(
+        vectors=max(1, args.vectors),
+        queries=max(1, args.queries),
+        dim=max(2, args.dim),
+        top_k=max(1, args.top_k),
+        nprobes=[int(x) for x in str(args.nprobe).split(",") if x.strip()],
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    k = report["top_k"]
+    print(f"IVF recall@{k} vs latency ({report['vectors']} vectors, dim={report['dim']}, "
+          f"nlist={report['index'].get('nlist')}, build {report['build_ms']}ms)")
+    print(f"  exact        recall=1.0000  p50={report['exact']['p50_ms']:>8.3f}ms  p95={report['exact']['p95_ms']:>8.3f}ms")
+    for row in report["ann"]:
+        print(f"  nprobe={row['nprobe']:<5} recall={row[f'recall@{k}']:.4f}  "
+              f"p50={row['p50_ms']:>8.3f}ms  p95={row['p95_ms']:>8.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Hook latency benchmark: cold in-process observe hook vs resident observe_server.
+
+Each sample spawns `python hooks/observe.py` exactly as Claude Code does and
+measures wall time until the process exits. Runs use an isolated HOME so the
+user's ~/.spark state is never touched.
+
+Usage:
+    python benchmarks/observe_hook_latency.py --samples 40
+    python benchmarks/observe_hook_latency.py --samples 40 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+from urllib import request
+
+ROOT = Path(__file__).resolve().parent.parent
+HOOK = ROOT / "hooks" / "observe.py"
+SERVER = ROOT / "hooks" / "observe_server.py"
+
+_EVENTS = ("PreToolUse", "PostToolUse")
+_TOOLS = (
+    ("Read", {"file_path": "/tmp/example/app.py"}),
+    ("Bash", {"command": "git status"}),
+    ("Edit", {"file_path": "/tmp/example/app.py", "old_string": "a", "new_string": "b"}),
+)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "p50_ms": round(_percentile(samples, 50), 2),
+        "p90_ms": round(_percentile(samples, 90), 2),
+        "p99_ms": round(_percentile(samples, 99), 2),
+        "max_ms": round(max(samples), 2) if samples else 0.0,
+    }
+
+
+def _free_port() -> int:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def _payload(i: int) -> bytes:
+    tool_name, tool_input = _TOOLS[i % len(_TOOLS)]
+    return json.dumps({
+        "session_id": "bench-observe",
+        "hook_event_name": _EVENTS[i % len(_EVENTS)],
+        "tool_name": tool_name,
+        "tool_input": tool_input,
+        "cwd": str(ROOT),
+    }).encode("utf-8")
+
+
+def _run_samples(env: Dict[str, str], samples: int) -> List[float]:
+    out: List[float] = []
+    for i in range(samples):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(HOOK)],
+            input=_payload(i),
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        out.append((time.perf_counter() - start) * 1000.0)
+    return out
+
+
+def _wait_healthy(port: int, timeout_s: float = 60.0) -> bool:
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        try:
+            with request.urlopen(f"http://127.0.0.1:{port}/health", timeout=0.5) as resp:
+                if resp.status == 200:
+                    return True
+        except Exception:
+            time.sleep(0.2)
+    return False
+
+
+def run_benchmark(samples: int = 40, warmup: int = 3) -> Dict[str, object]:
+    home = Path(tempfile.mkdtemp(prefix="spark_observe_bench_"))
+    port = _free_port()
+    env = dict(os.environ)
+    env.update({
+        "HOME": str(home),
+        "USERPROFILE": str(home),
+        "SPARK_OBSERVE_PORT": str(port),
+        "SPARK_OBSERVE_SOCKET": str(home / ".spark" / "observe.sock"),
+        "SPARK_OBSERVE_TELEMETRY": "0",
+    })
+
+    cold_env = dict(env, SPARK_OBSERVE_SERVER="0")
+    _run_samples(cold_env, warmup)
+    cold = _run_samples(cold_env, samples)
+
+    server = subprocess.Popen(
+        [sys.executable, str(SERVER)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        if not _wait_healthy(port):
+            raise RuntimeError("observe_server did not become healthy")
+        _run_samples(env, warmup)
+        warm_unix = _run_samples(env, samples)
+        http_env = dict(env, SPARK_OBSERVE_SOCKET=str(home / "no-such.sock"))
+        warm_http = _run_samples(http_env, samples)
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except Exception:
+            server.kill()
+
+    cold_s = _summarize(cold)
+    unix_s = _summarize(warm_unix)
+    return {
+        "samples": samples,
+        "spark_home": str(home),
+        "in_process": cold_s,
+        "server_unix": unix_s,
+        "server_http": _summarize(warm_http),
+        "p50_speedup": round(cold_s["p50_ms"] / unix_s["p50_ms"], 2) if unix_s["p50_ms"] else None,
+        "p99_speedup": round(cold_s["p99_ms"] / unix_s["p99_ms"], 2) if unix_s["p99_ms"] else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Observe hook latency: in-process vs resident server")
+    parser.add_argument("--samples", type=int, default=40, help="Hook invocations per mode")
+    parser.add_argument("--warmup", type=int, default=3, help="Unmeasured invocations per mode")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    report = run_benchmark(samples=max(1, args.samples), warmup=max(0, args.warmup))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"Observe hook latency ({report['samples']} samples per mode)")
+    for label, key in (("in-process", "in_process"), ("server/unix", "server_unix"), ("server/http", "server_http")):
+        row = report[key]
+        print(f"  {label:<12} p50={row['p50_ms']:>8.1f}ms  p90={row['p90_ms']:>8.1f}ms  p99={row['p99_ms']:>8.1f}ms")
+    print(f"  speedup      p50 x{report['p50_speedup']}  p99 x{report['p99_speedup']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""sparkd ingest latency while a bridge cycle is running.
+
+Starts sparkd's handler on an ephemeral local port inside an isolated HOME
+(so ~/.spark is never touched), seeds the queue with synthetic events so the
+bridge cycle has real work, triggers POST /process and, for as long as the
+cycle runs, drives /ingest and /health from several client threads. Reports
+p50/p99/max ingest latency for an idle baseline and during the cycle.
+
+Server modes:
+
+- pooled: PooledHTTPServer; /process is queued as a job (202 + job id)
+- legacy: single-threaded HTTPServer; /process?wait=1 runs the cycle inline,
+          which is how sparkd served it before jobs existed
+
+Every request opens its own connection (Connection: close) so both modes see
+the same client behaviour.
+
+Usage:
+    python benchmarks/sparkd_bridge_load.py
+    python benchmarks/sparkd_bridge_load.py --mode pooled --seed-events 500 --clients 8 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+TOKEN = "bench-token"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round((pct / 100.0) * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "p50_ms": round(_percentile(samples, 50), 2),
+        "p99_ms": round(_percentile(samples, 99), 2),
+        "max_ms": round(max(samples), 2) if samples else 0.0,
+    }
+
+
+def _request(port: int, method: str, path: str, payload=None, timeout: float = 600.0):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+    try:
+        conn.request(method, path, body=body, headers={
+            "Authorization": f"Bearer {TOKEN}",
+            "Content-Type": "application/json",
+            "Connection": "close",
+        })
+        resp = conn.getresponse()
+        return resp.status, resp.read()
+    finally:
+        conn.close()
+
+
+def _event(tag: str, i: int) -> Dict:
+    return {
+        "v": 1, "source": "bench", "kind": "message", "ts": time.time(),
+        "session_id": f"bench-{tag}", "trace_id": f"{tag}-{i}",
+        "payload": {"role": "user", "text": f"Remember: always run the tests before deploy ({tag} {i})"},
+    }
+
+
+def _seed_queue(n: int) -> None:
+    from lib.queue import EventType, quick_capture_many
+
+    topics = ["deploy", "schema migration", "cache invalidation", "retry policy", "auth tokens"]
+    events = []
+    for i in range(n):
+        topic = topics[i % len(topics)]
+        events.append({
+            "event_type": EventType.USER_PROMPT, "session_id": f"seed-{i % 7}",
+            "data": {"payload": {"role": "user", "text": f"I prefer checking {topic} before shipping, case {i}"}},
+        })
+        events.append({
+            "event_type": EventType.POST_TOOL, "session_id": f"seed-{i % 7}", "tool_name": "Bash",
+            "data": {"tool_input": {"command": f"pytest -q tests/test_{topic.replace(' ', '_')}.py -k {i}"}},
+        })
+    quick_capture_many(events)
+
+
+def _drive(port: int, tag: str, clients: int, stop: threading.Event, min_requests: int) -> Dict[str, List[float]]:
+    ingest: List[float] = []
+    health: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def _worker(w: int) -> None:
+        i = 0
+        while not stop.is_set() or i < min_requests:
+            t0 = time.perf_counter()
+            status, _ = _request(port, "POST", "/ingest", _event(f"{tag}{w}", i))
+            t1 = time.perf_counter()
+            hstatus, _ = _request(port, "GET", "/health")
+            t2 = time.perf_counter()
+            with lock:
+                ingest.append((t1 - t0) * 1000.0)
+                health.append((t2 - t1) * 1000.0)
+                if status != 200 or hstatus != 200:
+                    errors.append(f"{status}/{hstatus}")
+            i += 1
+            time.sleep(0.005)
+
+    threads = [threading.Thread(target=_worker, args=(w,), daemon=True) for w in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return {"ingest": ingest, "health": health, "errors": errors}
+
+
+def run_mode(mode: str, seed_events: int, clients: int) -> Dict:
+    from http.server import HTTPServer
+
+    import sparkd
+    from lib.http_service import JobRunner, PooledHTTPServer
+
+    sparkd.TOKEN = TOKEN
+    sparkd.RATE_LIMIT_PER_MIN = 0
+    sparkd.EVENT_RATE_LIMIT_PER_MIN = 0
+    sparkd._JOBS = JobRunner(max_workers=1, thread_name_prefix="bench-job")
+    if mode == "pooled":
+        server = PooledHTTPServer(("127.0.0.1", 0), sparkd.Handler, max_workers=16)
+    else:
+        server = HTTPServer(("127.0.0.1", 0), sparkd.Handler)
+    port = server.server_address[1]
+    sparkd._ALLOWED_POST_HOSTS = {f"127.0.0.1:{port}"}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        idle_stop = threading.Event()
+        idle_stop.set()
+        idle = _drive(port, "idle", clients, idle_stop, min_requests=25)
+
+        _seed_queue(seed_events)
+        stop = threading.Event()
+        cycle: Dict[str, float] = {}
+
+        def _cycle() -> None:
+            start = time.perf_counter()
+            if mode == "pooled":
+                _, body = _request(port, "POST", "/process")
+                job_id = json.loads(body)["job_id"]
+                sparkd._JOBS.wait(job_id)
+            else:
+                _request(port, "POST", "/process?wait=1")
+            cycle["seconds"] = time.perf_counter() - start
+            stop.set()
+
+        cycle_thread = threading.Thread(target=_cycle, daemon=True)
+        cycle_thread.start()
+        time.sleep(0.05)  # let /process reach the server first
+        busy = _drive(port, "busy", clients, stop, min_requests=1)
+        cycle_thread.join()
+    finally:
+        server.shutdown()
+        server.server_close()
+        sparkd._JOBS.shutdown()
+
+    return {
+        "mode": mode,
+        "cycle_s": round(cycle.get("seconds", 0.0), 2),
+        "idle_ingest": _summarize(idle["ingest"]),
+        "busy_ingest": _summarize(busy["ingest"]),
+        "busy_health": _summarize(busy["health"]),
+        "errors": len(idle["errors"]) + len(busy["errors"]),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--mode", choices=["pooled", "legacy", "both"], default="both")
+    ap.add_argument("--seed-events", type=int, default=100, help="Prompt/tool event pairs queued before the cycle")
+    ap.add_argument("--clients", type=int, default=4, help="Concurrent ingest clients")
+    ap.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = ap.parse_args()
+    modes = ["pooled", "legacy"] if args.mode == "both" else [args.mode]
+
+    results = []
+    # One HOME for the whole run: spark modules bind their paths at import time.
+    with tempfile.TemporaryDirectory(prefix="spark_bridge_load_") as home:
+        os.environ["HOME"] = home
+        os.environ["USERPROFILE"] = home
+        sys.path.insert(0, str(ROOT))
+        for mode in modes:
+            results.append(run_mode(mode, max(1, args.seed_events), max(1, args.clients)))
+
+    report = {"seed_events": args.seed_events, "clients": args.clients, "results": results}
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{'mode':>7}  {'cycle s':>7}  {'idle p99':>8}  {'busy p50':>8}  {'busy p99':>8}  {'busy max':>9}  {'health p99':>10}  {'n':>5}  err")
+    for row in results:
+        print(
+            f"{row['mode']:>7}  {row['cycle_s']:>7.2f}  {row['idle_ingest']['p99_ms']:>8.2f}  "
+            f"{row['busy_ingest']['p50_ms']:>8.2f}  {row['busy_ingest']['p99_ms']:>8.2f}  "
+            f"{row['busy_ingest']['max_ms']:>9.1f}  {row['busy_health']['p99_ms']:>10.2f}  "
+            f"{row['busy_ingest']['n']:>5}  {row['errors']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
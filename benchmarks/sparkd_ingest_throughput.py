@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""sparkd ingest throughput: per-event urlopen vs keep-alive vs /ingest/batch.
+
+Starts sparkd's handler on an ephemeral local port inside an isolated HOME
+(so ~/.spark is never touched) and pushes synthetic SparkEventV1 events
+through three client paths:
+
+- urlopen:   one new connection + one /ingest request per event (old adapters)
+- keepalive: one reused HTTP/1.1 connection, one /ingest request per event
+- batch:     one reused connection, /ingest/batch with --batch events per call
+
+Reports events/sec and checks every event landed in the queue.
+
+Usage:
+    python benchmarks/sparkd_ingest_throughput.py
+    python benchmarks/sparkd_ingest_throughput.py --events 5000 --batch 200 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+TOKEN = "bench-token"
+
+
+def _events(n: int, tag: str) -> List[Dict]:
+    now = time.time()
+    out = []
+    for i in range(n):
+        if i % 3 == 0:
+            kind, payload = "message", {"role": "user", "text": f"{tag} prompt {i} about deploy caching"}
+        else:
+            kind, payload = "tool", {"tool_name": "Bash", "tool_input": {"command": f"pytest -k case_{i}"}}
+        out.append({
+            "v": 1, "source": "bench", "kind": kind, "ts": now + i * 1e-3,
+            "session_id": f"bench-{tag}", "payload": payload, "trace_id": f"{tag}-{i}",
+        })
+    return out
+
+
+def _run_urlopen(base: str, events: List[Dict]) -> None:
+    from urllib.request import Request, urlopen
+
+    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {TOKEN}"}
+    for evt in events:
+        req = Request(base + "/ingest", data=json.dumps(evt).encode("utf-8"), headers=headers, method="POST")
+        with urlopen(req, timeout=5) as resp:
+            resp.read()
+
+
+def _run_keepalive(base: str, events: List[Dict]) -> None:
+    from adapters._common import SparkdClient
+
+    client = SparkdClient(base, TOKEN)
+    try:
+        for evt in events:
+            client.send_event(evt)
+    finally:
+        client.close()
+
+
+def _run_batch(base: str, events: List[Dict], batch: int) -> None:
+    from adapters._common import SparkdClient
+
+    client = SparkdClient(base, TOKEN, batch_size=batch)
+    try:
+        if client.send_events(events) != len(events):
+            raise RuntimeError(f"batch send failed: {client.last_error}")
+    finally:
+        client.close()
+
+
+def run(n_events: int, batch: int) -> Dict:
+    import lib.queue as queue
+    import sparkd
+    from lib.http_service import PooledHTTPServer
+
+    sparkd.TOKEN = TOKEN
+    sparkd.RATE_LIMIT_PER_MIN = 0
+    sparkd.EVENT_RATE_LIMIT_PER_MIN = 0
+    server = PooledHTTPServer(("127.0.0.1", 0), sparkd.Handler)
+    port = server.server_address[1]
+    sparkd._ALLOWED_POST_HOSTS = {f"127.0.0.1:{port}"}
+    # Keep the queue from rotating mid-run so landed counts are exact.
+    queue.MAX_EVENTS = 10 ** 9
+    queue.MAX_QUEUE_BYTES = 10 ** 12
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{port}"
+
+    modes = [
+        ("urlopen", lambda evts: _run_urlopen(base, evts)),
+        ("keepalive", lambda evts: _run_keepalive(base, evts)),
+        ("batch", lambda evts: _run_batch(base, evts, batch)),
+    ]
+    results = {}
+    try:
+        for name, fn in modes:
+            events = _events(n_events, name)
+            before = queue.count_events(use_cache=False)
+            start = time.perf_counter()
+            fn(events)
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            landed = queue.count_events(use_cache=False) - before
+            results[name] = {
+                "events_per_s": round(n_events / elapsed, 1),
+                "ms_per_event": round(elapsed * 1000.0 / n_events, 4),
+                "landed": landed,
+            }
+    finally:
+        server.shutdown()
+        server.server_close()
+    base_rate = max(results["urlopen"]["events_per_s"], 1e-9)
+    for row in results.values():
+        row["speedup"] = round(row["events_per_s"] / base_rate, 1)
+    return {"events": n_events, "batch": batch, "results": results}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--events", type=int, default=2000)
+    ap.add_argument("--batch", type=int, default=200, help="Events per /ingest/batch request")
+    ap.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="spark_ingest_bench_") as home:
+        os.environ["HOME"] = home
+        os.environ["USERPROFILE"] = home
+        sys.path.insert(0, str(ROOT))
+        report = run(max(1, args.events), max(1, args.batch))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{'mode':>10}  {'events/s':>10}  {'ms/event':>9}  {'x':>6}  landed")
+    for name, row in report["results"].items():
+        print(f"{name:>10}  {row['events_per_s']:>10.1f}  {row['ms_per_event']:>9.4f}  {row['speedup']:>6.1f}  {row['landed']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""observe_server - resident runtime for the Spark observation hook.
+
+Claude Code spawns `hooks/observe.py` for every hook event. Without this
+server each spawn re-imports the queue, cognitive learner (loading the whole
+insight store), EIDOS integration and config authority before it
+can capture anything. This process keeps `hooks/observe_runtime.py` warm and
+runs hook payloads on behalf of the thin client.
+
+Transports:
+  Unix domain socket  ~/.spark/observe.sock   (POSIX; raw JSON in, JSON out)
+  HTTP fallback       GET  /health, GET /status
+                      POST /hook   (requires X-Spark-Hook header)
+
+Hook payloads are processed one at a time: the runtime was written for a
+single-threaded process and captures stdout/stderr per call. Hook settings
+(observe_hook tuneables, forwarded SPARK_* env) are resolved per call, so
+they follow the calling session without a server restart.
+"""
+
+import atexit
+import json
+import os
+import socketserver
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock, Thread
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hooks.observe import (  # noqa: E402
+    ENVELOPE_ENV_KEY,
+    ENVELOPE_HOOK_KEY,
+    FORWARDED_ENV_VARS,
+    OBSERVE_HOOK_HEADER,
+    OBSERVE_PORT,
+    OBSERVE_SOCKET_PATH,
+)
+
+PORT = OBSERVE_PORT
+SOCKET_PATH = OBSERVE_SOCKET_PATH
+MAX_BODY_BYTES = int(os.environ.get("SPARK_OBSERVE_MAX_BODY_BYTES", str(8 * 1024 * 1024)))
+_ALLOWED_HOSTS = {
+    f"127.0.0.1:{PORT}",
+    f"localhost:{PORT}",
+    f"[::1]:{PORT}",
+}
+
+_HOOK_LOCK = Lock()
+_STATS_LOCK = Lock()
+_STATS = {
+    "started_at": time.time(),
+    "requests": 0,
+    "errors": 0,
+    "learner_refreshes": 0,
+    "last_ms": 0.0,
+    "total_ms": 0.0,
+}
+
+
+def _refresh_learner() -> None:
+    """Pull insight rows other processes wrote or deleted since the last hook.
+
+    The bridge worker and other hooks write the cognitive insight store too;
+    the resident learner must not serve a stale view indefinitely.
+    """
+    import lib.cognitive_learner as cl
+
+    learner = cl._cognitive_learner
+    if learner is None:
+        return
+    if learner.refresh():
+        with _STATS_LOCK:
+            _STATS["learner_refreshes"] += 1
+
+
+def warm_up() -> None:
+    """Import the heavy hook dependencies once, before serving."""
+    from hooks import observe_runtime  # noqa: F401
+    from lib.cognitive_learner import get_cognitive_learner
+
+    get_cognitive_learner()
+    try:
+        from lib import advisory_engine  # noqa: F401
+    except Exception:
+        pass
+    try:
+        from lib.eidos.store import get_store
+
+        get_store()
+    except Exception:
+        pass
+
+
+def process_payload(body: bytes) -> dict:
+    """Decode a hook payload and run it through the warm runtime."""
+    try:
+        input_data = json.loads(body.decode("utf-8", errors="replace") or "{}")
+    except Exception:
+        return {"stdout": "", "stderr": "", "exit_code": 0}
+    if not isinstance(input_data, dict):
+        return {"stdout": "", "stderr": "", "exit_code": 0}
+    env = None
+    if ENVELOPE_HOOK_KEY in input_data:
+        # hooks/observe.py wraps the payload with the session's hook env;
+        # raw payloads (e.g. codex_hook_bridge) run with the server's env.
+        forwarded = input_data.get(ENVELOPE_ENV_KEY)
+        forwarded = forwarded if isinstance(forwarded, dict) else {}
+        env = {k: str(v) for k, v in forwarded.items() if k in FORWARDED_ENV_VARS}
+        input_data = input_data.get(ENVELOPE_HOOK_KEY)
+        if not isinstance(input_data, dict):
+            return {"stdout": "", "stderr": "", "exit_code": 0}
+
+    from hooks.observe_runtime import run_hook_event
+
+    start = time.perf_counter()
+    with _HOOK_LOCK:
+        try:
+            _refresh_learner()
+        except Exception:
+            pass
+        result = run_hook_event(input_data, env=env)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    with _STATS_LOCK:
+        _STATS["requests"] += 1
+        _STATS["last_ms"] = round(elapsed_ms, 3)
+        _STATS["total_ms"] += elapsed_ms
+    return result
+
+
+def get_stats() -> dict:
+    with _STATS_LOCK:
+        stats = dict(_STATS)
+    n = stats["requests"]
+    stats["avg_ms"] = round(stats.pop("total_ms") / n, 3) if n else 0.0
+    stats["uptime_s"] = round(time.time() - stats["started_at"], 1)
+    return stats
+
+
+def _note_error() -> None:
+    with _STATS_LOCK:
+        _STATS["errors"] += 1
+
+
+class UnixHookHandler(socketserver.StreamRequestHandler):
+    """Read a raw JSON payload until the client half-closes, reply with JSON."""
+
+    def handle(self):
+        try:
+            body = self.rfile.read(MAX_BODY_BYTES + 1)
+            if len(body) > MAX_BODY_BYTES:
+                result = {"stdout": "", "stderr": "", "exit_code": 0}
+            else:
+                result = process_payload(body)
+            self.wfile.write(json.dumps(result).encode("utf-8"))
+        except Exception:
+            _note_error()
+
+
+def _json(handler: BaseHTTPRequestHandler, code: int, payload) -> None:
+    raw = json.dumps(payload).encode("utf-8")
+    handler.send_response(code)
+    handler.send_header("Content-Type", "application/json")
+    handler.send_header("Content-Length", str(len(raw)))
+    handler.end_headers()
+    handler.wfile.write(raw)
+
+
+class HTTPHookHandler(BaseHTTPRequestHandler):
+    # Keep-alive so forwarders (e.g. codex_hook_bridge) can reuse one socket.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+    # Headers and body go out as separate writes; without TCP_NODELAY a reused
+    # connection stalls on delayed ACKs (~40ms per request).
+    disable_nagle_algorithm = True
+
+    def log_message(self, fmt, *args):
+        return
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            raw = b"ok"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+            return
+        if path == "/status":
+            return _json(self, 200, {"ok": True, "port": PORT, "socket": str(SOCKET_PATH), **get_stats()})
+        return _json(self, 404, {"ok": False, "error": "not found"})
+
+    def do_POST(self):
+        self._body_read = False
+        try:
+            return self._handle_post()
+        finally:
+            # Replying without draining the body would desync a keep-alive connection.
+            if not self._body_read and int(self.headers.get("Content-Length", "0") or 0) > 0:
+                self.close_connection = True
+
+    def _handle_post(self):
+        path = urlparse(self.path).path
+        if path != "/hook":
+            return _json(self, 404, {"ok": False, "error": "not found"})
+        remote = str(self.client_address[0]) if getattr(self, "client_address", None) else ""
+        if remote not in {"127.0.0.1", "::1"}:
+            return _json(self, 403, {"ok": False, "error": "remote POST forbidden"})
+        if (self.headers.get("Host") or "").strip() not in _ALLOWED_HOSTS:
+            return _json(self, 403, {"ok": False, "error": "host not allowed"})
+        if not self.headers.get(OBSERVE_HOOK_HEADER):
+            return _json(self, 403, {"ok": False, "error": "missing hook header"})
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        if length > MAX_BODY_BYTES:
+            return _json(self, 413, {"ok": False, "error": "payload_too_large"})
+        body = self.rfile.read(length) if length else b"{}"
+        self._body_read = True
+        try:
+            result = process_payload(body)
+        except Exception as e:
+            _note_error()
+            result = {"stdout": "", "stderr": "", "exit_code": 0, "error": str(e)[:200]}
+        return _json(self, 200, result)
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+else:  # pragma: no cover - Windows
+    _UnixServer = None
+
+
+def _pid_is_alive(pid: int) -> bool:
+    try:
+        os.kill(int(pid), 0)
+        return True
+    except PermissionError:
+        return True
+    except Exception:
+        return False
+
+
+def _acquire_single_instance_lock(name: str) -> Path | None:
+    lock_dir = Path.home() / ".spark" / "pids"
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    lock_file = lock_dir / f"{name}.lock"
+    pid = os.getpid()
+
+    if lock_file.exists():
+        try:
+            existing_pid = int(lock_file.read_text(encoding="utf-8").strip())
+            if existing_pid != pid and _pid_is_alive(existing_pid):
+                print(f"[SPARK] {name} already running with pid {existing_pid}; exiting duplicate instance")
+                return None
+        except Exception:
+            pass
+
+    lock_file.write_text(str(pid), encoding="utf-8")
+
+    def _cleanup_lock() -> None:
+        try:
+            if lock_file.exists() and lock_file.read_text(encoding="utf-8").strip() == str(pid):
+                lock_file.unlink(missing_ok=True)
+        except Exception:
+            pass
+
+    atexit.register(_cleanup_lock)
+    return lock_file
+
+
+def _bind_unix_server():
+    if _UnixServer is None:
+        return None
+    try:
+        SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+        if SOCKET_PATH.exists():
+            SOCKET_PATH.unlink()
+        server = _UnixServer(str(SOCKET_PATH), UnixHookHandler)
+        try:
+            os.chmod(SOCKET_PATH, 0o600)
+        except Exception:
+            pass
+        return server
+    except Exception as e:
+        print(f"[SPARK] observe_server: unix socket unavailable ({e}); HTTP only")
+        return None
+
+
+def main():
+    try:
+        from lib.diagnostics import setup_component_logging
+
+        setup_component_logging("observe_server")
+    except Exception:
+        pass
+    lock_file = _acquire_single_instance_lock("observe_server")
+    if lock_file is None:
+        return
+
+    warm_up()
+
+    http_server = ThreadingHTTPServer(("127.0.0.1", PORT), HTTPHookHandler)
+    http_server.daemon_threads = True
+    unix_server = _bind_unix_server()
+    servers = [s for s in (unix_server, http_server) if s is not None]
+
+    print(f"observe_server listening on http://127.0.0.1:{PORT}" + (f" and {SOCKET_PATH}" if unix_server else ""))
+    stop_event = False
+
+    def _shutdown(signum=None, frame=None):
+        nonlocal stop_event
+        if stop_event:
+            return
+        stop_event = True
+        print("\n[SPARK] observe_server shutting down...")
+        for s in servers:
+            Thread(target=s.shutdown, daemon=True).start()
+
+    try:
+        import signal
+        signal.signal(signal.SIGINT, _shutdown)
+        signal.signal(signal.SIGTERM, _shutdown)
+    except Exception:
+        pass
+
+    threads = [Thread(target=s.serve_forever, daemon=True) for s in servers[1:]]
+    for t in threads:
+        t.start()
+    try:
+        servers[0].serve_forever()
+    finally:
+        for s in servers[1:]:
+            s.shutdown()
+        for s in servers:
+            s.server_close()
+        if unix_server is not None:
+            try:
+                SOCKET_PATH.unlink()
+            except Exception:
+                pass
+        try:
+            import lib.cognitive_learner as cl
+
+            if cl._cognitive_learner is not None:
+                cl._cognitive_learner.export_json()
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .append_log import AppendLog
+
 FEEDBACK_FILE = Path.home() / ".spark" / "advice_feedback.jsonl"
 REPORTS_DIR = Path.home() / ".openclaw" / "workspace" / "spark_reports"
 OUTCOMES_FILE = Path.home() / ".spark" / "outcomes.jsonl"
@@ -56,6 +58,18 @@ def _read_jsonl(path: Path) -> List[tuple[int, Dict[str, Any]]]:
     return rows
 
 
+def _read_log(path: Path) -> List[tuple[int, Dict[str, Any]]]:
+    """Rows of a segmented log with their line number across all segments."""
+    rows: List[tuple[int, Dict[str, Any]]] = []
+    for idx, line in enumerate(AppendLog(path).iter_lines(), start=1):
+        try:
+            row = json.loads(line)
+        except Exception:
+            continue
+        rows.append((idx, row))
+    return rows
+
+
 def _load_reports(path: Path) -> List[tuple[str, Dict[str, Any]]]:
     if not path.exists():
         return []
@@ -227,7 +241,7 @@ def match_actions(
 ) -> List[Dict[str, Any]]:
     feedback_rows = _read_jsonl(feedback_file)
     report_rows = _load_reports(reports_dir)
-    outcome_rows = _read_jsonl(outcomes_file)
+    outcome_rows = _read_log(outcomes_file)
 
     matches: List[Dict[str, Any]] = []
     for advisory in advisories:
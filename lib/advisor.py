@@ -26,12 +26,14 @@ import re
 import sys
 import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from .advisory_quarantine import record_quarantine_item
+from .append_log import AppendLog
 
 # Import existing Spark components
 from .cognitive_learner import get_cognitive_learner
@@ -39,6 +41,7 @@ from .distillation_transformer import transform_for_advisory as _transform_disti
 from .memory_banks import infer_project_key
 from .memory_banks import retrieve as bank_retrieve
 from .mind_bridge import HAS_REQUESTS, get_mind_bridge
+from .noise_classifier import classify, contains, is_noise, pattern, prefixes, register
 
 # EIDOS integration for distillation retrieval
 try:
@@ -86,6 +89,89 @@ _TRANSCRIPT_ARTIFACT_PATTERNS = (
     re.compile(r"^\s*user wanted[:\s]", re.I),
     re.compile(r"^\s*#\s*spark\s", re.I),
 )
+_INVENTORY_MARKERS = (
+    "learned insights (from past sessions):",
+    "you are spark intelligence, observing a live coding session",
+    "system inventory (what actually exists",
+    "system inventory (what actually exists — do not reference anything outside this list)",
+    "\n- services:",
+    "cycle summary:",
+    "service inventory",
+    "services:",
+    "<task-notification",
+    "<task-id>",
+    "<status>",
+    "<summary>",
+)
+_STRUGGLE_NOISY_TOKENS = (
+    "_error",
+    "mcp__",
+    "command_not_found",
+    "permission_denied",
+    "file_not_found",
+    "syntax_error",
+    "fails with other",
+)
+_METADATA_ACTION_VERBS = (
+    "use", "avoid", "check", "verify", "ensure", "always",
+    "never", "remember", "don't", "prefer", "try", "run",
+)
+
+
+def _advice_fields(text: str) -> Dict[str, str]:
+    t = text.strip()
+    return {"t": t, "tl": t.lower()}
+
+
+def _advice_body_fields(text: str) -> Dict[str, str]:
+    """Adds ``body``: the lower-cased text without a leading "[source]" tag."""
+    fields = _advice_fields(text)
+    fields["body"] = re.sub(r"^\[[^\]]+\]\s*", "", fields["tl"])
+    return fields
+
+
+_ADVICE_INVENTORY_RULES = (contains("inventory_style", _INVENTORY_MARKERS),)
+_ADVICE_STRUGGLE_RULES = (
+    *(pattern("low_signal_struggle", rx, field="body") for rx in _LOW_SIGNAL_STRUGGLE_PATTERNS),
+    contains(
+        "low_signal_struggle",
+        _STRUGGLE_NOISY_TOKENS,
+        field="body",
+        when=lambda f: "i struggle with" in f["body"],
+    ),
+)
+_ADVICE_TRANSCRIPT_RULES = (
+    *(pattern("transcript_artifact", rx, field="t") for rx in _TRANSCRIPT_ARTIFACT_PATTERNS),
+    prefixes("transcript_artifact", ("from lib.",), when=lambda f: " import " in f["tl"]),
+)
+_ADVICE_METADATA_RULES = (
+    # Key-value metadata "X: Y = Z", e.g. "User communication style: detail_level = concise"
+    pattern("metadata_pattern", r"^[A-Za-z\s]+:\s*[a-z_]+\s*=\s*.+$", field="t"),
+    # "Label: value" metadata without action verbs, e.g. "Principle: it is according to..."
+    pattern(
+        "metadata_pattern",
+        r"^(Principle|Style|Setting|Config|Meta|Mode|Level|Type):\s*",
+        field="t",
+        flags=re.I,
+        when=lambda f: not any(v in f["tl"] for v in _METADATA_ACTION_VERBS),
+    ),
+    # Underscore-style metadata keys, e.g. "detail_level", "code_style"
+    pattern("metadata_pattern", r"^[a-z_]+\s*[:=]\s*.+$", field="t"),
+    # Very short fragments (likely metadata, not advice)
+    contains("metadata_pattern", (":",), field="t", when=lambda f: len(f["t"]) < 15),
+    # Incomplete sentences ending with conjunctions/prepositions
+    pattern("metadata_pattern", r"(?: that| the| a| an| of| to| for| with| and| or| but| in| on| we)\Z"),
+)
+register("advice_inventory", _ADVICE_INVENTORY_RULES, prepare=_advice_fields)
+register("advice_struggle", _ADVICE_STRUGGLE_RULES, prepare=_advice_body_fields)
+register("advice_transcript", _ADVICE_TRANSCRIPT_RULES, prepare=_advice_fields)
+register("advice_metadata", _ADVICE_METADATA_RULES, prepare=_advice_fields)
+# _should_drop_advice: one pass, reasons in the order the drop checks apply.
+register(
+    "advice",
+    _ADVICE_INVENTORY_RULES + _ADVICE_STRUGGLE_RULES + _ADVICE_TRANSCRIPT_RULES + _ADVICE_METADATA_RULES,
+    prepare=_advice_body_fields,
+)
 RECENT_OUTCOMES_MAX = 5000
 # Defaults — overridden by config-authority resolution in _load_advisor_config().
 REPLAY_ADVISORY_ENABLED = True
@@ -115,6 +201,12 @@ MIND_RESERVE_SLOTS: int = 1
 MIND_RESERVE_MIN_RANK: float = 0.45
 RETRIEVAL_ROUTE_LOG = ADVISOR_DIR / "retrieval_router.jsonl"
 RETRIEVAL_ROUTE_LOG_MAX = 800
+# Source fan-out — overridden by config-authority resolution in _load_advisor_config().
+# Each advice source gets a time budget (ms from submission); 0 waits without a deadline.
+SOURCE_FANOUT_ENABLED = True
+SOURCE_FANOUT_WORKERS = 8
+SOURCE_BUDGET_MS = 1500
+SOURCE_BUDGETS_MS: Dict[str, int] = {}
 
 DEFAULT_RETRIEVAL_PROFILES: Dict[str, Dict[str, Any]] = {
     "1": {
@@ -655,6 +747,7 @@ def _load_advisor_config() -> None:
     global REPLAY_ADVISORY_ENABLED, REPLAY_MIN_STRICT_SAMPLES, REPLAY_MIN_IMPROVEMENT_DELTA
     global REPLAY_MAX_RECORDS, REPLAY_MAX_AGE_S, REPLAY_STRICT_WINDOW_S, REPLAY_MIN_CONTEXT_MATCH
     global REPLAY_MODE, GUIDANCE_STYLE
+    global SOURCE_FANOUT_ENABLED, SOURCE_FANOUT_WORKERS, SOURCE_BUDGET_MS, SOURCE_BUDGETS_MS
     AUTO_TUNER_SOURCE_BOOSTS = {}
     try:
         # Tests should be deterministic and not depend on user-local ~/.spark state.
@@ -694,6 +787,8 @@ def _load_advisor_config() -> None:
                 "mind_min_salience": env_float("SPARK_ADVISOR_MIND_MIN_SALIENCE"),
                 "mind_reserve_slots": env_int("SPARK_ADVISOR_MIND_RESERVE_SLOTS"),
                 "mind_reserve_min_rank": env_float("SPARK_ADVISOR_MIND_RESERVE_MIN_RANK"),
+                "source_fanout": env_bool("SPARK_ADVISOR_SOURCE_FANOUT"),
+                "source_budget_ms": env_int("SPARK_ADVISOR_SOURCE_BUDGET_MS"),
             },
         ).data
         if not isinstance(cfg, dict):
@@ -743,6 +838,26 @@ def _load_advisor_config() -> None:
         if "mind_reserve_min_rank" in cfg:
             MIND_RESERVE_MIN_RANK = max(0.0, min(1.0, float(cfg.get("mind_reserve_min_rank") or 0.0)))
 
+        if "source_fanout" in cfg:
+            SOURCE_FANOUT_ENABLED = _parse_bool(cfg.get("source_fanout"), SOURCE_FANOUT_ENABLED)
+        if "source_workers" in cfg:
+            SOURCE_FANOUT_WORKERS = max(2, min(32, int(cfg.get("source_workers") or 2)))
+        if "source_budget_ms" in cfg:
+            SOURCE_BUDGET_MS = max(0, int(cfg.get("source_budget_ms") or 0))
+        if "source_budgets_ms" in cfg:
+            raw_budgets = cfg.get("source_budgets_ms")
+            parsed_budgets: Dict[str, int] = {}
+            if isinstance(raw_budgets, dict):
+                for raw_name, raw_ms in raw_budgets.items():
+                    name = str(raw_name or "").strip().lower()
+                    if not name:
+                        continue
+                    try:
+                        parsed_budgets[name] = max(0, int(raw_ms))
+                    except Exception:
+                        continue
+            SOURCE_BUDGETS_MS = parsed_budgets
+
         if "replay_mode" in cfg:
             mode = str(cfg.get("replay_mode") or "").strip().lower()
             if mode in {"off", "standard", "replay"}:
@@ -839,6 +954,35 @@ except ImportError:
     pass
 
 
+# Advice sources that stay on the calling thread. Both read shared
+# CognitiveLearner/SparkAdvisor state (the learner's insight maps, the
+# semantic retriever and its caches), so running them concurrently with the
+# learner's own writers would race. Every other source is I/O-bound (Mind's
+# HTTP retrieval, the EIDOS store, bank/chip/workflow files, tracker state
+# files, MetaRalph's outcome records) and runs on the shared source pool.
+_INLINE_SOURCES = frozenset({"cognitive", "tool"})
+
+# Shared pool for advice-source fan-out, sized by source_workers. Timeouts
+# are soft: a queued source that overruns its budget is cancelled, but one
+# already running cannot be interrupted. It is dropped from the result and
+# not resubmitted until it finishes.
+_SOURCE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SOURCE_EXECUTOR_LOCK = threading.Lock()
+
+
+def _source_executor() -> ThreadPoolExecutor:
+    """Return the shared advice-source pool, creating it on first use."""
+    global _SOURCE_EXECUTOR
+    with _SOURCE_EXECUTOR_LOCK:
+        if _SOURCE_EXECUTOR is None:
+            # Sized once; source_workers changes apply on the next process start.
+            _SOURCE_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max(1, int(SOURCE_FANOUT_WORKERS)),
+                thread_name_prefix="spark_advice_src",
+            )
+        return _SOURCE_EXECUTOR
+
+
 def reload_advisor_config() -> Dict[str, Any]:
     """Reload advisor tuneables and return the effective replay/user preference subset."""
     _load_advisor_config()
@@ -856,6 +1000,9 @@ def reload_advisor_config() -> Dict[str, Any]:
         "max_items": int(MAX_ADVICE_ITEMS),
         "min_rank_score": float(MIN_RANK_SCORE),
         "source_boosts": dict(AUTO_TUNER_SOURCE_BOOSTS),
+        "source_fanout": bool(SOURCE_FANOUT_ENABLED),
+        "source_budget_ms": int(SOURCE_BUDGET_MS),
+        "source_budgets_ms": dict(SOURCE_BUDGETS_MS),
     }
 
 
@@ -912,80 +1059,21 @@ def _maybe_warn_deprecated_advisor_retrieval_policy(
 
 
 def _tail_jsonl(path: Path, count: int) -> List[str]:
-    """Tail-read JSONL lines without loading entire file in memory."""
-    if count <= 0 or not path.exists():
-        return []
-    chunk_size = 64 * 1024
-    try:
-        with path.open("rb") as f:
-            f.seek(0, os.SEEK_END)
-            pos = f.tell()
-            buffer = b""
-            lines: List[bytes] = []
-            while pos > 0 and len(lines) <= count:
-                read_size = min(chunk_size, pos)
-                pos -= read_size
-                f.seek(pos)
-                data = f.read(read_size)
-                buffer = data + buffer
-                if b"\n" in buffer:
-                    parts = buffer.split(b"\n")
-                    buffer = parts[0]
-                    lines = parts[1:] + lines
-            if buffer:
-                lines = [buffer] + lines
-        out = [
-            ln.decode("utf-8", errors="replace").rstrip("\r")
-            for ln in lines
-            if ln != b""
-        ]
-        return out[-count:]
-    except Exception:
-        return []
-
+    """Tail-read JSONL lines via the segment index (no full-file read)."""
+    return AppendLog(path).tail_lines(count)
 
-# Avoid doing a read+rewrite of the entire bounded file on every append.
-# We compact at most once per TTL per path.
-_COMPACT_TTL_S = 30.0
-_LAST_COMPACT_TS: Dict[str, float] = {}
-_COMPACT_LOCK = threading.Lock()
 
 _advisor_log = logging.getLogger("spark.advisor")
 
 
 def _append_jsonl_capped(path: Path, entry: Dict[str, Any], max_lines: int) -> None:
-    """Append JSONL entry and keep file bounded.
+    """Append JSONL entry and keep the log bounded.
 
-    Optimized for the hot path:
-    - Always append-only
-    - Only compact (rewrite to last N lines) when needed AND rate-limited
+    The log is segmented (see lib/append_log.py): appends never rewrite the
+    file, and the cap is enforced by dropping whole sealed segments.
     """
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
-
-        if max_lines <= 0:
-            return
-
-        now = time.time()
-        key = str(path)
-        with _COMPACT_LOCK:
-            last = float(_LAST_COMPACT_TS.get(key, 0.0) or 0.0)
-            if (now - last) < _COMPACT_TTL_S:
-                return
-
-            # Only compact when we likely exceeded the cap.
-            probe = _tail_jsonl(path, max_lines + 1)
-            if len(probe) <= max_lines:
-                _LAST_COMPACT_TS[key] = now
-                return
-
-            # Rewrite to the last max_lines.
-            path.write_text("\n".join(probe[-max_lines:]) + "\n", encoding="utf-8")
-            _LAST_COMPACT_TS[key] = now
-    except Exception as e:
-        _advisor_log.debug("JSONL append/compact failed for %s: %s", path, e)
+    if not AppendLog(path, max_lines=max_lines).append(entry):
+        _advisor_log.debug("JSONL append failed for %s", path)
 
 
 def record_recent_delivery(
@@ -1139,6 +1227,8 @@ class SparkAdvisor:
         self._memory_emotion_cfg_cache: Dict[str, Any] = dict(MEMORY_EMOTION_DEFAULTS)
         self._memory_emotion_cfg_mtime: Optional[float] = None
         self._last_minimax_rerank_ts: float = 0.0
+        # Source name -> future of a fan-out call that overran its budget.
+        self._source_inflight: Dict[str, Future] = {}
         # Legacy benchmark/profile tooling mutates this map directly.
         self._SOURCE_BOOST: Dict[str, float] = _compose_source_quality_with_boosts(self._SOURCE_QUALITY)
 
@@ -2548,79 +2638,16 @@ class SparkAdvisor:
                     pass
             return cached
 
-        advice_list: List[Advice] = []
-
-        # 1. Query memory banks (fast local)
-        advice_list.extend(self._get_bank_advice(context))
-
-        # 2. Query cognitive insights (semantic + keyword fallback)
-        try:
-            cognitive_advice = self._get_cognitive_advice(
-                tool_name,
-                context,
-                semantic_context,
-                trace_id=trace_id,
-            )
-        except TypeError as exc:
-            msg = str(exc)
-            if "unexpected keyword argument 'trace_id'" in msg or "positional arguments but" in msg:
-                # Backward-compatible call shape for tests/overrides that still
-                # implement the pre-trace_id signature.
-                cognitive_advice = self._get_cognitive_advice(tool_name, context, semantic_context)
-            else:
-                raise
-        advice_list.extend(cognitive_advice)
-
-        # 2.5. Query chip insights (domain-specific intelligence).
-        advice_list.extend(self._get_chip_advice(context))
-
-        # 3. Query Mind if available
-        if self._mind_retrieval_allowed(include_mind=include_mind, pre_mind_count=len(advice_list)):
-            advice_list.extend(self._get_mind_advice(context))
-
-        # 4. Get tool-specific learnings
-        advice_list.extend(self._get_tool_specific_advice(tool_name))
-
-        # 5. Get opportunity-scanner prompts (Socratic opportunity lens)
-        advice_list.extend(
-            self._get_opportunity_advice(
-                tool_name=tool_name,
-                context_raw=context_raw,
-                task_context=task_context,
-            )
-        )
-
-        # 6. Get surprise-based cautions
-        advice_list.extend(self._get_surprise_advice(tool_name, context))
-
-        # 7. Get skill-based hints
-        advice_list.extend(self._get_skill_advice(context))
-
-        # 8. Get EIDOS distillations (extracted rules from patterns)
-        if HAS_EIDOS:
-            advice_list.extend(self._get_eidos_advice(tool_name, context))
-
-        # 9. Get conversation intelligence advice (ConvoIQ)
-        advice_list.extend(self._get_convo_advice(tool_name, context))
-
-        # 10. Get engagement pulse advice
-        advice_list.extend(self._get_engagement_advice(tool_name, context))
-
-        # 11. Get niche intelligence advice
-        advice_list.extend(self._get_niche_advice(tool_name, context))
-
-        # 12. Replay counterfactual advisory (past outcome-backed alternatives)
-        advice_list.extend(
-            self._get_replay_counterfactual_advice(
-                tool_name=tool_name,
-                context_raw=context_raw,
-                existing_advice=advice_list,
-            )
+        advice_list = self._collect_source_advice(
+            tool_name=tool_name,
+            context=context,
+            context_raw=context_raw,
+            semantic_context=semantic_context,
+            task_context=task_context,
+            include_mind=include_mind,
+            trace_id=trace_id,
         )
 
-        # 13. Workflow evidence (tool failure/recovery from workflow summaries)
-        advice_list.extend(self._get_workflow_advice(tool_name, context))
-
         # Global domain guard: do not let X-social specific learnings leak
         # into non-social tasks from non-semantic sources (chip/mind/cognitive/etc.).
         advice_list = self._filter_cross_domain_advice(advice_list, context)
@@ -2728,6 +2755,192 @@ class SparkAdvisor:
 
         return advice_list
 
+    # Assembly order of advice sources; ranking ties keep this order.
+    _ADVICE_SOURCE_ORDER = (
+        "banks", "cognitive", "chips", "mind", "tool", "opportunity", "surprise", "skills",
+        "eidos", "convo", "engagement", "niche", "replay", "workflow",
+    )
+
+    def _collect_source_advice(
+        self,
+        *,
+        tool_name: str,
+        context: str,
+        context_raw: str,
+        semantic_context: str,
+        task_context: str,
+        include_mind: bool,
+        trace_id: Optional[str] = None,
+    ) -> List[Advice]:
+        """Query every advice source and concatenate results in source order.
+
+        With source fan-out enabled, every source except _INLINE_SOURCES
+        (cognitive, tool) runs on the shared source pool under its own time
+        budget, overlapping the inline ones. A pooled source that overruns its
+        budget (or raises) contributes nothing to this call. Mind waits for
+        banks/cognitive/chips (its freshness gate counts their results);
+        replay waits for everything before it (it reads existing advice).
+        Per-source latency and status go to the retrieval-route log.
+        """
+        parallel = bool(SOURCE_FANOUT_ENABLED)
+        inflight = getattr(self, "_source_inflight", None)
+        if inflight is None:
+            inflight = self._source_inflight = {}
+        results: Dict[str, List[Advice]] = {}
+        report: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[str, Tuple[Future, float, Optional[float]]] = {}
+        started = time.perf_counter()
+
+        def _finish(name: str, status: str, items: Optional[List[Advice]], elapsed_s: float) -> None:
+            results[name] = list(items or [])
+            report[name] = {
+                "ms": round(elapsed_s * 1000.0, 2),
+                "status": status,
+                "items": len(results[name]),
+            }
+
+        def _submit(name: str, fn) -> None:
+            if not parallel or name in _INLINE_SOURCES:
+                t0 = time.perf_counter()
+                try:
+                    items = fn()
+                    status = "ok"
+                except Exception as e:
+                    _advisor_log.debug("advice source %s failed: %s", name, e)
+                    items, status = [], "error"
+                _finish(name, status, items, time.perf_counter() - t0)
+                return
+            prev = inflight.get(name)
+            if prev is not None:
+                if not prev.done():
+                    _finish(name, "busy", [], 0.0)
+                    return
+                inflight.pop(name, None)
+            budget_ms = SOURCE_BUDGETS_MS.get(name, SOURCE_BUDGET_MS)
+            t0 = time.perf_counter()
+            deadline = (t0 + budget_ms / 1000.0) if budget_ms > 0 else None
+            try:
+                future = _source_executor().submit(fn)
+            except RuntimeError:
+                # Pool already shut down (interpreter exit).
+                _finish(name, "busy", [], 0.0)
+                return
+            pending[name] = (future, t0, deadline)
+
+        def _settle(names) -> None:
+            """Wait for the named pooled sources, each until its own deadline."""
+            waiting = {name: pending.pop(name) for name in names if name in pending}
+            while waiting:
+                now = time.perf_counter()
+                for name, (future, t0, deadline) in list(waiting.items()):
+                    if future.done():
+                        del waiting[name]
+                        try:
+                            _finish(name, "ok", future.result(), now - t0)
+                        except Exception as e:
+                            _advisor_log.debug("advice source %s failed: %s", name, e)
+                            _finish(name, "error", [], now - t0)
+                    elif deadline is not None and now >= deadline:
+                        del waiting[name]
+                        if not future.cancel():
+                            inflight[name] = future
+                        _finish(name, "timeout", [], now - t0)
+                if not waiting:
+                    return
+                deadlines = [d for _f, _t, d in waiting.values() if d is not None]
+                wait(
+                    [f for f, _t, _d in waiting.values()],
+                    timeout=max(0.0, min(deadlines) - now) if deadlines else None,
+                    return_when=FIRST_COMPLETED,
+                )
+
+        def _cognitive() -> List[Advice]:
+            try:
+                return self._get_cognitive_advice(
+                    tool_name,
+                    context,
+                    semantic_context,
+                    trace_id=trace_id,
+                )
+            except TypeError as exc:
+                msg = str(exc)
+                if "unexpected keyword argument 'trace_id'" in msg or "positional arguments but" in msg:
+                    # Backward-compatible call shape for tests/overrides that still
+                    # implement the pre-trace_id signature.
+                    return self._get_cognitive_advice(tool_name, context, semantic_context)
+                raise
+
+        # Pooled sources with no dependencies go out first so they overlap
+        # the inline ones.
+        if HAS_EIDOS:
+            _submit("eidos", lambda: self._get_eidos_advice(tool_name, context))
+        _submit("banks", lambda: self._get_bank_advice(context))
+        _submit("chips", lambda: self._get_chip_advice(context))
+        _submit(
+            "opportunity",
+            lambda: self._get_opportunity_advice(
+                tool_name=tool_name,
+                context_raw=context_raw,
+                task_context=task_context,
+            ),
+        )
+        _submit("surprise", lambda: self._get_surprise_advice(tool_name, context))
+        _submit("skills", lambda: self._get_skill_advice(context))
+        _submit("convo", lambda: self._get_convo_advice(tool_name, context))
+        _submit("engagement", lambda: self._get_engagement_advice(tool_name, context))
+        _submit("niche", lambda: self._get_niche_advice(tool_name, context))
+        _submit("workflow", lambda: self._get_workflow_advice(tool_name, context))
+        _submit("cognitive", _cognitive)
+
+        # Mind's freshness gate falls back on whether local sources found anything.
+        _settle(("banks", "chips"))
+        pre_mind_count = sum(len(results.get(name, [])) for name in ("banks", "cognitive", "chips"))
+
+        def _mind() -> List[Advice]:
+            if not self._mind_retrieval_allowed(include_mind=include_mind, pre_mind_count=pre_mind_count):
+                return []
+            return self._get_mind_advice(context)
+
+        _submit("mind", _mind)
+        _submit("tool", lambda: self._get_tool_specific_advice(tool_name))
+
+        # Replay counterfactuals compare against everything gathered so far.
+        before_replay = self._ADVICE_SOURCE_ORDER[: self._ADVICE_SOURCE_ORDER.index("replay")]
+        _settle(before_replay)
+        existing: List[Advice] = []
+        for name in before_replay:
+            existing.extend(results.get(name, []))
+        _submit(
+            "replay",
+            lambda: self._get_replay_counterfactual_advice(
+                tool_name=tool_name,
+                context_raw=context_raw,
+                existing_advice=existing,
+            ),
+        )
+
+        _settle(self._ADVICE_SOURCE_ORDER)
+        advice_list: List[Advice] = []
+        for name in self._ADVICE_SOURCE_ORDER:
+            advice_list.extend(results.get(name, []))
+
+        try:
+            self._log_retrieval_route(
+                {
+                    "tool": tool_name,
+                    "trace_id": str(trace_id or "").strip(),
+                    "route": "source_fanout",
+                    "mode": "parallel" if parallel else "serial",
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 2),
+                    "advice_count": len(advice_list),
+                    "skipped": sorted(n for n, r in report.items() if r["status"] != "ok"),
+                    "sources": {n: report[n] for n in self._ADVICE_SOURCE_ORDER if n in report},
+                }
+            )
+        except Exception:
+            pass
+        return advice_list
+
     def _get_cognitive_advice(
         self,
         tool_name: str,
@@ -4579,40 +4792,7 @@ class SparkAdvisor:
         - "X: Y = Z" key-value metadata
         - Incomplete sentence fragments
         """
-        import re
-
-        text_stripped = text.strip()
-
-        # Pattern 1: Key-value metadata "X: Y = Z" or "X: Y"
-        # e.g., "User communication style: detail_level = concise"
-        if re.match(r'^[A-Za-z\s]+:\s*[a-z_]+\s*=\s*.+$', text_stripped):
-            return True
-
-        # Pattern 2: Simple "Label: value" metadata without actionable content
-        # e.g., "Principle: it is according to..."
-        if re.match(r'^(Principle|Style|Setting|Config|Meta|Mode|Level|Type):\s*', text_stripped, re.I):
-            # Only filter if it doesn't contain action verbs
-            action_verbs = ['use', 'avoid', 'check', 'verify', 'ensure', 'always',
-                           'never', 'remember', "don't", 'prefer', 'try', 'run']
-            if not any(v in text_stripped.lower() for v in action_verbs):
-                return True
-
-        # Pattern 3: Underscore-style metadata keys
-        # e.g., "detail_level", "code_style", "response_format"
-        if re.match(r'^[a-z_]+\s*[:=]\s*.+$', text_stripped):
-            return True
-
-        # Pattern 4: Very short fragments (likely metadata, not advice)
-        if len(text_stripped) < 15 and ':' in text_stripped:
-            return True
-
-        # Pattern 5: Incomplete sentences ending with conjunctions/prepositions
-        incomplete_endings = [' that', ' the', ' a', ' an', ' of', ' to', ' for',
-                             ' with', ' and', ' or', ' but', ' in', ' on', ' we']
-        if any(text_stripped.lower().endswith(e) for e in incomplete_endings):
-            return True
-
-        return False
+        return is_noise(text, "advice_metadata")
 
     def _score_actionability(self, text: str) -> float:
         """Score actionability on 4 dimensions (0.0 to 1.0).
@@ -4707,35 +4887,10 @@ class SparkAdvisor:
         return max(0.05, min(1.0, score))
 
     def _is_low_signal_struggle_text(self, text: str) -> bool:
-        sample = str(text or "").strip().lower()
-        if not sample:
-            return False
-        normalized = re.sub(r"^\[[^\]]+\]\s*", "", sample)
-        if any(rx.search(normalized) for rx in _LOW_SIGNAL_STRUGGLE_PATTERNS):
-            return True
-        if "i struggle with" not in normalized:
-            return False
-        noisy_tokens = (
-            "_error",
-            "mcp__",
-            "command_not_found",
-            "permission_denied",
-            "file_not_found",
-            "syntax_error",
-            "fails with other",
-        )
-        return any(tok in normalized for tok in noisy_tokens)
+        return is_noise(text, "advice_struggle")
 
     def _is_transcript_artifact(self, text: str) -> bool:
-        sample = str(text or "").strip()
-        if not sample:
-            return False
-        lowered = sample.lower()
-        if any(rx.match(sample) for rx in _TRANSCRIPT_ARTIFACT_PATTERNS):
-            return True
-        if lowered.startswith("from lib.") and " import " in lowered:
-            return True
-        return False
+        return is_noise(text, "advice_transcript")
 
     def _should_drop_advice(self, advice: Advice, tool_name: str = "") -> bool:
         text = str(getattr(advice, "text", "") or "").strip()
@@ -4751,7 +4906,8 @@ class SparkAdvisor:
                 extras={"tool_name": tool_name},
             )
             return True
-        if self._is_inventory_style_text(text):
+        verdict = classify(text, "advice")
+        if verdict.reason == "inventory_style":
             record_quarantine_item(
                 source=str(getattr(advice, "source", "unknown")),
                 stage="advisor_should_drop",
@@ -4774,36 +4930,14 @@ class SparkAdvisor:
                 extras={"tool_name": tool_name},
             )
             return True
-        if self._is_low_signal_struggle_text(text):
-            record_quarantine_item(
-                source=str(getattr(advice, "source", "unknown")),
-                stage="advisor_should_drop",
-                reason="low_signal_struggle",
-                text=text,
-                advisory_quality=adv_q if isinstance(adv_q, dict) else None,
-                advisory_readiness=getattr(advice, "advisory_readiness", None),
-                extras={"tool_name": tool_name},
-            )
-            return True
-        if self._is_transcript_artifact(text):
-            record_quarantine_item(
-                source=str(getattr(advice, "source", "unknown")),
-                stage="advisor_should_drop",
-                reason="transcript_artifact",
-                text=text,
-                advisory_quality=adv_q if isinstance(adv_q, dict) else None,
-                advisory_readiness=getattr(advice, "advisory_readiness", None),
-                extras={"tool_name": tool_name},
-            )
-            return True
-        if (
-            advice.source in {"bank", "mind", "cognitive", "semantic", "semantic-hybrid", "semantic-agentic"}
-            and self._is_metadata_pattern(text)
+        if verdict.reason in ("low_signal_struggle", "transcript_artifact") or (
+            verdict.reason == "metadata_pattern"
+            and advice.source in {"bank", "mind", "cognitive", "semantic", "semantic-hybrid", "semantic-agentic"}
         ):
             record_quarantine_item(
                 source=str(getattr(advice, "source", "unknown")),
                 stage="advisor_should_drop",
-                reason="metadata_pattern",
+                reason=verdict.reason,
                 text=text,
                 advisory_quality=adv_q if isinstance(adv_q, dict) else None,
                 advisory_readiness=getattr(advice, "advisory_readiness", None),
@@ -4846,26 +4980,7 @@ class SparkAdvisor:
         return False
 
     def _is_inventory_style_text(self, text: str) -> bool:
-        normalized = str(text or "").strip().lower()
-        if not normalized:
-            return False
-        return any(
-            marker in normalized
-            for marker in (
-                "learned insights (from past sessions):",
-                "you are spark intelligence, observing a live coding session",
-                "system inventory (what actually exists",
-                "system inventory (what actually exists — do not reference anything outside this list)",
-                "\n- services:",
-                "cycle summary:",
-                "service inventory",
-                "services:",
-                "<task-notification",
-                "<task-id>",
-                "<status>",
-                "<summary>",
-            )
-        )
+        return is_noise(text, "advice_inventory")
 
     # Source quality tiers — normalized 0-1 for additive scoring
     _SOURCE_QUALITY = {
@@ -5390,7 +5505,7 @@ Output only JSON with `order` as a list of 0-based indices (descending by releva
         - "Edit" matches "Edit file"
         - "Read" matches "Read code"
         """
-        if not RECENT_ADVICE_LOG.exists():
+        if not AppendLog(RECENT_ADVICE_LOG).exists():
             return None
         try:
             lines = _tail_jsonl(RECENT_ADVICE_LOG, RECENT_ADVICE_MAX_LINES)
@@ -5448,7 +5563,7 @@ Output only JSON with `order` as a list of 0-based indices (descending by releva
 
     def _find_recent_advice_by_id(self, advice_id: str) -> Optional[Dict[str, Any]]:
         """Find recent advice entry containing a specific advice_id."""
-        if not RECENT_ADVICE_LOG.exists() or not advice_id:
+        if not advice_id or not AppendLog(RECENT_ADVICE_LOG).exists():
             return None
         try:
             lines = _tail_jsonl(RECENT_ADVICE_LOG, RECENT_ADVICE_MAX_LINES)
@@ -5569,8 +5684,7 @@ Output only JSON with `order` as a list of 0-based indices (descending by releva
 
 
         # Log outcome
-        with open(ADVICE_LOG, "a", encoding="utf-8") as f:
-            f.write(json.dumps({"outcome": asdict(outcome)}) + "\n")
+        _append_jsonl_capped(ADVICE_LOG, {"outcome": asdict(outcome)}, max_lines=4000)
 
     def report_action_outcome(
         self,
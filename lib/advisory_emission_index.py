@@ -0,0 +1,312 @@
+"""Indexed "last emitted / last outcome" timestamps for advisory cooldowns.
+
+Every pre-tool call asks a handful of "was X emitted (or updated) recently?"
+questions. They used to be answered by tail-parsing the global dedupe log and
+``recent_advice.jsonl`` and by loading the whole ``outcome_tracking.json``.
+This module keeps the answers in a small SQLite (WAL) sidecar next to the
+source file:
+
+- ``emissions``: (kind, key, scope_key) -> latest ts, where kind is e.g.
+  ``advice`` / ``text`` (dedupe log), ``identity`` (delivery log) or
+  ``outcome_insight`` / ``outcome_advice`` (outcome tracking)
+- ``source_cursors``: how far into an append-only JSONL source the sidecar has
+  indexed (inode, byte offset and the bytes just before it, so an in-place
+  compaction is detected and re-synced from the tail window)
+- ``index_meta``: one-time backfill markers
+
+The JSONL logs stay the source of truth. Writers sync right after appending,
+so readers normally only ``stat`` the log and run an indexed lookup; lines
+appended by anything else are picked up incrementally on the next sync. All
+operations are best-effort: callers treat errors as "nothing recent".
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .diagnostics import log_debug
+
+# (kind, key, scope_key, ts)
+EmissionRow = Tuple[str, str, str, float]
+RowExtractor = Callable[[Dict[str, Any]], Iterable[EmissionRow]]
+
+DEFAULT_MAX_AGE_S = 7 * 24 * 3600.0
+# An incremental sync larger than this re-reads the tail window instead.
+MAX_INCREMENTAL_BYTES = 4 * 1024 * 1024
+_TAIL_SIG_BYTES = 64
+
+
+def _tail_lines(path: Path, count: int) -> Tuple[List[bytes], int]:
+    """Last ``count`` complete lines of path plus the offset just past them."""
+    chunk_size = 64 * 1024
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buffer = b""
+        while pos > 0 and buffer.count(b"\n") <= count:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            buffer = f.read(read_size) + buffer
+    cut = buffer.rfind(b"\n")
+    if cut < 0:
+        return [], pos
+    lines = buffer[:cut].split(b"\n")
+    if pos > 0:
+        lines = lines[1:]  # first piece may be a partial line
+    return lines[-count:], pos + cut + 1
+
+
+class EmissionIndex:
+    """Latest-timestamp lookups backed by SQLite; one connection per thread."""
+
+    def __init__(self, path: Path, timeout_s: float = 2.0, max_age_s: float = DEFAULT_MAX_AGE_S):
+        self.path = Path(path)
+        self.timeout_s = float(timeout_s)
+        self.max_age_s = float(max_age_s)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.path), timeout=self.timeout_s, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS emissions (
+                      kind TEXT NOT NULL,
+                      key TEXT NOT NULL,
+                      scope_key TEXT NOT NULL DEFAULT '',
+                      ts REAL NOT NULL,
+                      PRIMARY KEY (kind, key, scope_key)
+                    ) WITHOUT ROWID;
+                    CREATE INDEX IF NOT EXISTS idx_emissions_ts ON emissions(ts);
+                    CREATE TABLE IF NOT EXISTS source_cursors (
+                      source TEXT PRIMARY KEY,
+                      inode INTEGER NOT NULL,
+                      offset INTEGER NOT NULL,
+                      tail_sig BLOB NOT NULL
+                    );
+                    CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                    """
+                )
+                self._schema_ready = True
+        self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                self._local.conn = None
+
+    def _upsert(self, conn: sqlite3.Connection, rows: Iterable[EmissionRow]) -> int:
+        batch = []
+        for kind, key, scope_key, ts in rows:
+            key = str(key or "").strip()
+            ts = float(ts or 0.0)
+            if key and ts > 0:
+                batch.append((str(kind), key, str(scope_key or "").strip(), ts))
+        if not batch:
+            return 0
+        conn.executemany(
+            "INSERT INTO emissions (kind, key, scope_key, ts) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(kind, key, scope_key) DO UPDATE SET ts = MAX(ts, excluded.ts)",
+            batch,
+        )
+        # Age out relative to the newest write, so the index only ever holds
+        # max_age_s worth of history however long it has been idle.
+        cutoff = max(row[3] for row in batch) - self.max_age_s
+        conn.execute("DELETE FROM emissions WHERE ts < ?", (cutoff,))
+        return len(batch)
+
+    def record(self, rows: Iterable[EmissionRow]) -> int:
+        """Write rows directly (keeps the newest ts per key); returns rows written."""
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                written = self._upsert(conn, rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            log_debug("advisory_emission_index", "record failed", e)
+            return 0
+        return written
+
+    def sync_jsonl(self, source: Path, extract: RowExtractor, *, window: int) -> int:
+        """Index lines appended to source since the last sync; returns rows written.
+
+        With no cursor, a replaced file (new inode) or an in-place rewrite, only
+        the last ``window`` lines are (re)indexed, matching the old tail scans.
+        """
+        source = Path(source)
+        try:
+            st = source.stat()
+        except OSError:
+            return 0
+        name = str(source)
+        try:
+            conn = self._conn()
+            cur = conn.execute(
+                "SELECT inode, offset, tail_sig FROM source_cursors WHERE source = ?", (name,)
+            ).fetchone()
+            if cur is not None and int(cur[0]) == st.st_ino and int(cur[1]) == st.st_size:
+                return 0
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                written = self._sync_locked(conn, source, name, extract, window)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            log_debug("advisory_emission_index", f"sync failed for {name}", e)
+            return 0
+        return written
+
+    def _sync_locked(
+        self, conn: sqlite3.Connection, source: Path, name: str, extract: RowExtractor, window: int
+    ) -> int:
+        cur = conn.execute(
+            "SELECT inode, offset, tail_sig FROM source_cursors WHERE source = ?", (name,)
+        ).fetchone()
+        lines: Optional[List[bytes]] = None
+        with source.open("rb") as f:
+            inode = os.fstat(f.fileno()).st_ino
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if cur is not None and int(cur[0]) == inode:
+                offset, tail_sig = int(cur[1]), bytes(cur[2])
+                if offset == size:
+                    return 0
+                if offset < size <= offset + MAX_INCREMENTAL_BYTES:
+                    f.seek(max(0, offset - len(tail_sig)))
+                    if f.read(len(tail_sig)) == tail_sig:
+                        data = f.read(size - offset)
+                        cut = data.rfind(b"\n")
+                        lines = data[:cut].split(b"\n") if cut >= 0 else []
+                        end = offset + cut + 1
+        if lines is None:
+            lines, end = _tail_lines(source, max(1, int(window)))
+        rows: List[EmissionRow] = []
+        for raw in lines:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                row = json.loads(raw.decode("utf-8", errors="ignore"))
+            except Exception:
+                continue
+            if isinstance(row, dict):
+                rows.extend(extract(row))
+        written = self._upsert(conn, rows)
+        with source.open("rb") as f:
+            f.seek(max(0, end - _TAIL_SIG_BYTES))
+            tail_sig = f.read(end - max(0, end - _TAIL_SIG_BYTES))
+        conn.execute(
+            "INSERT OR REPLACE INTO source_cursors (source, inode, offset, tail_sig) VALUES (?, ?, ?, ?)",
+            (name, int(inode), int(end), tail_sig),
+        )
+        return written
+
+    def backfill_once(self, marker: str, load: Callable[[], Iterable[EmissionRow]]) -> bool:
+        """Run load() and index its rows the first time marker is seen."""
+        try:
+            conn = self._conn()
+            if conn.execute("SELECT 1 FROM index_meta WHERE key = ?", (marker,)).fetchone():
+                return False
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if conn.execute("SELECT 1 FROM index_meta WHERE key = ?", (marker,)).fetchone():
+                    conn.execute("ROLLBACK")
+                    return False
+                self._upsert(conn, load())
+                conn.execute(
+                    "INSERT INTO index_meta (key, value) VALUES (?, ?)", (marker, str(time.time()))
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            log_debug("advisory_emission_index", f"backfill {marker} failed", e)
+            return False
+        return True
+
+    def latest_many(
+        self, kind: str, keys: Iterable[str], scope_key: Optional[str] = None
+    ) -> Dict[str, float]:
+        """key -> latest ts for the keys that have one.
+
+        A non-empty scope_key matches rows in that scope or unscoped rows;
+        without one every scope matches.
+        """
+        wanted = sorted({str(k or "").strip() for k in keys} - {""})
+        if not wanted:
+            return {}
+        scope = str(scope_key or "").strip()
+        out: Dict[str, float] = {}
+        try:
+            conn = self._conn()
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start:start + 500]
+                sql = (
+                    "SELECT key, MAX(ts) FROM emissions WHERE kind = ? "
+                    f"AND key IN ({','.join('?' * len(chunk))})"
+                )
+                params: List[Any] = [kind, *chunk]
+                if scope:
+                    sql += " AND scope_key IN ('', ?)"
+                    params.append(scope)
+                for key, ts in conn.execute(sql + " GROUP BY key", params):
+                    out[str(key)] = float(ts)
+        except Exception as e:
+            log_debug("advisory_emission_index", "lookup failed", e)
+            return {}
+        return out
+
+    def latest(self, kind: str, key: str, scope_key: Optional[str] = None) -> float:
+        """Latest ts for one key, or 0.0."""
+        return self.latest_many(kind, [key], scope_key).get(str(key or "").strip(), 0.0)
+
+
+_INDEXES: Dict[str, EmissionIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def index_path_for(source: Path) -> Path:
+    """Sidecar location for a source file: ``foo.jsonl`` -> ``foo.idx.sqlite``."""
+    source = Path(source)
+    return source.with_name(f"{source.stem}.idx.sqlite")
+
+
+def emission_index_for(source: Path) -> EmissionIndex:
+    """Process-wide EmissionIndex for the sidecar of source."""
+    path = index_path_for(source)
+    key = str(path)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = EmissionIndex(path)
+            _INDEXES[key] = index
+        return index
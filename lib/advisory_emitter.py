@@ -25,7 +25,7 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TextIO
 
 from .diagnostics import log_debug
 
@@ -149,11 +149,17 @@ def format_from_gate_result(
 
 # ============= Stdout Emission =============
 
-def emit(text: str, *, metadata: Optional[Dict[str, Any]] = None) -> bool:
+def emit(
+    text: str,
+    *,
+    metadata: Optional[Dict[str, Any]] = None,
+    out: Optional[TextIO] = None,
+) -> bool:
     """
     Write advisory text to stdout so Claude Code reads it.
 
-    This is the critical bridge function.
+    This is the critical bridge function. `out` overrides sys.stdout for
+    callers that capture one hook's output (observe_server).
 
     Returns True if text was emitted, False if suppressed.
     """
@@ -169,9 +175,10 @@ def emit(text: str, *, metadata: Optional[Dict[str, Any]] = None) -> bool:
         output = output[:MAX_EMIT_CHARS - 3] + "..."
 
     # Write to stdout (Claude Code reads this)
+    stream = out if out is not None else sys.stdout
     try:
-        sys.stdout.write(output + "\n")
-        sys.stdout.flush()
+        stream.write(output + "\n")
+        stream.flush()
     except Exception as e:
         log_debug("advisory_emit", "stdout write failed", e)
         return False
@@ -191,6 +198,7 @@ def emit_advisory(
     tool_name: str = "",
     route: str = "",
     task_plane: str = "",
+    out: Optional[TextIO] = None,
 ) -> bool:
     """
     High-level emission: format and emit advisory from gate + synthesis.
@@ -199,6 +207,7 @@ def emit_advisory(
         gate_result: GateResult from advisory_gate
         synthesized_text: Output from advisory_synthesizer
         advice_items: Original advice items (for text lookup)
+        out: Stream to write to instead of sys.stdout
 
     Returns:
         True if anything was emitted
@@ -221,6 +230,7 @@ def emit_advisory(
                 "authority": highest,
                 "phase": getattr(gate_result, "phase", "") or None,
             },
+            out=out,
         )
 
     # Fallback: emit individual items from advice list
@@ -255,6 +265,7 @@ def emit_advisory(
                     "authority": highest,
                     "phase": getattr(gate_result, "phase", "") or None,
                 },
+                out=out,
             )
 
     return False
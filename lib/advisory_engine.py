@@ -12,9 +12,11 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
+from .advisory_emission_index import EmissionIndex, EmissionRow, emission_index_for
 from .advisory_quarantine import record_quarantine_item
+from .append_log import AppendLog
 from .diagnostics import log_debug
 from .error_taxonomy import build_error_fields
 
@@ -131,6 +133,11 @@ except Exception:
     GLOBAL_DEDUPE_COOLDOWN_S = 600.0
 GLOBAL_DEDUPE_LOG = Path.home() / ".spark" / "advisory_global_dedupe.jsonl"
 GLOBAL_DEDUPE_LOG_MAX = 5000
+# Lines (re)indexed from a log tail when its sidecar index has no usable cursor.
+GLOBAL_DEDUPE_SYNC_WINDOW = 400
+RECENT_DELIVERY_SYNC_WINDOW = 600
+OUTCOME_BACKFILL_MAX_RECORDS = 900
+OUTCOME_TRACKING_FILE = Path.home() / ".spark" / "meta_ralph" / "outcome_tracking.json"
 # Dedupe scope:
 # - global: all sessions share one dedupe scope
 # - tree: main + subagents under same agent tree
@@ -192,56 +199,12 @@ except Exception:
 
 
 def _tail_jsonl(path: Path, count: int) -> List[Dict[str, Any]]:
-    if count <= 0 or not path.exists():
-        return []
-    chunk_size = 64 * 1024
-    try:
-        with path.open("rb") as f:
-            f.seek(0, os.SEEK_END)
-            pos = f.tell()
-            buffer = b""
-            lines: List[bytes] = []
-            while pos > 0 and len(lines) <= count:
-                read_size = min(chunk_size, pos)
-                pos -= read_size
-                f.seek(pos)
-                data = f.read(read_size)
-                buffer = data + buffer
-                if b"\n" in buffer:
-                    parts = buffer.split(b"\n")
-                    buffer = parts[0]
-                    lines = parts[1:] + lines
-            if buffer:
-                lines = [buffer] + lines
-        out: List[Dict[str, Any]] = []
-        for ln in lines[-count:]:
-            ln = ln.strip()
-            if not ln:
-                continue
-            try:
-                row = json.loads(ln.decode("utf-8", errors="ignore"))
-            except Exception:
-                continue
-            if isinstance(row, dict):
-                out.append(row)
-        return out
-    except Exception:
-        return []
+    return AppendLog(path).tail(count)
 
 
 def _append_jsonl_capped(path: Path, entry: Dict[str, Any], max_lines: int) -> None:
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
-        if max_lines <= 0:
-            return
-        probe = _tail_jsonl(path, max_lines + 1)
-        if len(probe) <= max_lines:
-            return
-        path.write_text("\n".join(json.dumps(r) for r in probe[-max_lines:]) + "\n", encoding="utf-8")
-    except Exception:
-        return
+    # Segmented log: the cap drops whole sealed segments instead of rewriting the file.
+    AppendLog(path, max_lines=max_lines).append(entry)
 
 
 def _emit_advisory_compat(
@@ -254,19 +217,18 @@ def _emit_advisory_compat(
     tool_name: str,
     route: str,
     task_plane: str,
+    out: Optional[TextIO] = None,
 ) -> bool:
+    kwargs: Dict[str, Any] = {
+        "trace_id": trace_id,
+        "tool_name": tool_name,
+        "route": route,
+        "task_plane": task_plane,
+    }
+    if out is not None:
+        kwargs["out"] = out
     try:
-        return bool(
-            emit_fn(
-                gate_result,
-                synthesized_text,
-                advice_items,
-                trace_id=trace_id,
-                tool_name=tool_name,
-                route=route,
-                task_plane=task_plane,
-            )
-        )
+        return bool(emit_fn(gate_result, synthesized_text, advice_items, **kwargs))
     except TypeError as exc:
         msg = str(exc)
         if "unexpected keyword argument" not in msg and "positional arguments but" not in msg:
@@ -275,6 +237,63 @@ def _emit_advisory_compat(
         return bool(emit_fn(gate_result, synthesized_text, advice_items))
 
 
+def _dedupe_index_rows(row: Dict[str, Any]) -> List[EmissionRow]:
+    try:
+        ts = float(row.get("ts") or 0.0)
+    except Exception:
+        return []
+    scope = str(row.get("scope_key") or "").strip()
+    out: List[EmissionRow] = []
+    aid = str(row.get("advice_id") or "").strip()
+    if aid:
+        out.append(("advice", aid, scope, ts))
+    sig = str(row.get("text_sig") or "").strip()
+    if sig:
+        out.append(("text", sig, scope, ts))
+    return out
+
+
+def _dedupe_index() -> EmissionIndex:
+    """Sidecar index of GLOBAL_DEDUPE_LOG, caught up with any new lines."""
+    index = emission_index_for(GLOBAL_DEDUPE_LOG)
+    index.sync_jsonl(GLOBAL_DEDUPE_LOG, _dedupe_index_rows, window=GLOBAL_DEDUPE_SYNC_WINDOW)
+    return index
+
+
+def _dedupe_log_is_user_default() -> bool:
+    # Keep tests hermetic: don't consult the user's real ~/.spark dedupe logs.
+    # (Allow tests that monkeypatch the log path to still exercise the logic.)
+    if not os.getenv("PYTEST_CURRENT_TEST"):
+        return False
+    try:
+        default_log = (Path.home() / ".spark" / "advisory_global_dedupe.jsonl").resolve()
+        return GLOBAL_DEDUPE_LOG.resolve() == default_log
+    except Exception:
+        return True
+
+
+def _global_recent_hit(
+    kind: str,
+    key: str,
+    *,
+    now_ts: float,
+    cooldown_s: float,
+    scope_key: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    key = str(key or "").strip()
+    if not key or _dedupe_log_is_user_default():
+        return None
+    scope = str(scope_key or "").strip()
+    ts = _dedupe_index().latest(kind, key, scope)
+    if ts <= 0:
+        return None
+    age_s = now_ts - ts
+    if 0 <= age_s <= max(0.0, float(cooldown_s)):
+        field = "advice_id" if kind == "advice" else "text_sig"
+        return {"age_s": age_s, "cooldown_s": cooldown_s, "row": {"ts": ts, field: key, "scope_key": scope}}
+    return None
+
+
 def _global_recently_emitted(
     *,
     tool_name: str,
@@ -283,41 +302,9 @@ def _global_recently_emitted(
     cooldown_s: float,
     scope_key: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
-    # Keep tests hermetic: don't consult the user's real ~/.spark dedupe logs.
-    # (Allow tests that monkeypatch the log path to still exercise the logic.)
-    if os.getenv("PYTEST_CURRENT_TEST"):
-        try:
-            default_log = (Path.home() / ".spark" / "advisory_global_dedupe.jsonl").resolve()
-            if GLOBAL_DEDUPE_LOG.resolve() == default_log:
-                return None
-        except Exception:
-            return None
-    aid = str(advice_id or "").strip()
-    if not aid:
-        return None
-    try:
-        rows = _tail_jsonl(GLOBAL_DEDUPE_LOG, 400)
-    except Exception:
-        return None
-    scope = str(scope_key or "").strip()
-    for row in reversed(rows):
-        try:
-            if str(row.get("advice_id") or "").strip() != aid:
-                continue
-            if scope and str(row.get("scope_key") or "").strip() not in {"", scope}:
-                continue
-            ts = float(row.get("ts") or 0.0)
-        except Exception:
-            continue
-        if ts <= 0:
-            continue
-        age_s = now_ts - ts
-        if age_s < 0:
-            continue
-        if age_s <= max(0.0, float(cooldown_s)):
-            return {"age_s": age_s, "cooldown_s": cooldown_s, "row": row}
-        break
-    return None
+    return _global_recent_hit(
+        "advice", advice_id, now_ts=now_ts, cooldown_s=cooldown_s, scope_key=scope_key
+    )
 
 
 def _global_recently_emitted_text_sig(
@@ -327,41 +314,9 @@ def _global_recently_emitted_text_sig(
     cooldown_s: float,
     scope_key: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
-    # Keep tests hermetic: don't consult the user's real ~/.spark dedupe logs.
-    # (Allow tests that monkeypatch the log path to still exercise the logic.)
-    if os.getenv("PYTEST_CURRENT_TEST"):
-        try:
-            default_log = (Path.home() / ".spark" / "advisory_global_dedupe.jsonl").resolve()
-            if GLOBAL_DEDUPE_LOG.resolve() == default_log:
-                return None
-        except Exception:
-            return None
-    sig = str(text_sig or "").strip()
-    if not sig:
-        return None
-    try:
-        rows = _tail_jsonl(GLOBAL_DEDUPE_LOG, 400)
-    except Exception:
-        return None
-    scope = str(scope_key or "").strip()
-    for row in reversed(rows):
-        try:
-            if str(row.get("text_sig") or "").strip() != sig:
-                continue
-            if scope and str(row.get("scope_key") or "").strip() not in {"", scope}:
-                continue
-            ts = float(row.get("ts") or 0.0)
-        except Exception:
-            continue
-        if ts <= 0:
-            continue
-        age_s = now_ts - ts
-        if age_s < 0:
-            continue
-        if age_s <= max(0.0, float(cooldown_s)):
-            return {"age_s": age_s, "cooldown_s": cooldown_s, "row": row}
-        break
-    return None
+    return _global_recent_hit(
+        "text", text_sig, now_ts=now_ts, cooldown_s=cooldown_s, scope_key=scope_key
+    )
 
 
 def _load_engine_config(path: Optional[Path] = None) -> Dict[str, Any]:
@@ -988,53 +943,62 @@ def _repeat_identity_for_item(item: Any, *, advice_id: str) -> str:
     )
 
 
-def _load_recent_delivery_identity_ts(*, max_rows: int = 500) -> Dict[str, float]:
+def _delivery_index_rows(row: Dict[str, Any]) -> List[EmissionRow]:
+    ts = _parse_timestamp(row.get("ts") if row.get("ts") is not None else row.get("timestamp"))
+    if ts <= 0:
+        return []
+    advice_ids = row.get("advice_ids") or []
+    insight_keys = row.get("insight_keys") or []
+    advice_texts = row.get("advice_texts") or []
+    if not isinstance(advice_ids, list):
+        advice_ids = []
+    if not isinstance(insight_keys, list):
+        insight_keys = []
+    if not isinstance(advice_texts, list):
+        advice_texts = []
+    out: List[EmissionRow] = []
+    max_items = max(len(advice_ids), len(insight_keys), len(advice_texts))
+    for idx in range(max_items):
+        identity = _repeat_identity_from_fields(
+            insight_key=str(insight_keys[idx] if idx < len(insight_keys) else ""),
+            text=str(advice_texts[idx] if idx < len(advice_texts) else ""),
+            advice_id=str(advice_ids[idx] if idx < len(advice_ids) else ""),
+        )
+        if identity:
+            out.append(("identity", identity, "", ts))
+    return out
+
+
+def _delivery_index() -> Optional[EmissionIndex]:
+    """Sidecar index of advisor.RECENT_ADVICE_LOG, caught up with any new lines."""
     try:
         from .advisor import RECENT_ADVICE_LOG
     except Exception:
+        return None
+    index = emission_index_for(RECENT_ADVICE_LOG)
+    index.sync_jsonl(RECENT_ADVICE_LOG, _delivery_index_rows, window=RECENT_DELIVERY_SYNC_WINDOW)
+    return index
+
+
+def _recent_delivery_identity_ts(identities: List[str]) -> Dict[str, float]:
+    """identity -> last delivery ts for the given repeat identities."""
+    index = _delivery_index()
+    if index is None:
         return {}
-    latest: Dict[str, float] = {}
-    for row in _tail_jsonl(RECENT_ADVICE_LOG, max_rows):
-        ts = _parse_timestamp(row.get("ts") if row.get("ts") is not None else row.get("timestamp"))
-        if ts <= 0:
-            continue
-        advice_ids = row.get("advice_ids") or []
-        insight_keys = row.get("insight_keys") or []
-        advice_texts = row.get("advice_texts") or []
-        if not isinstance(advice_ids, list):
-            advice_ids = []
-        if not isinstance(insight_keys, list):
-            insight_keys = []
-        if not isinstance(advice_texts, list):
-            advice_texts = []
-        max_items = max(len(advice_ids), len(insight_keys), len(advice_texts))
-        for idx in range(max_items):
-            identity = _repeat_identity_from_fields(
-                insight_key=str(insight_keys[idx] if idx < len(insight_keys) else ""),
-                text=str(advice_texts[idx] if idx < len(advice_texts) else ""),
-                advice_id=str(advice_ids[idx] if idx < len(advice_ids) else ""),
-            )
-            if not identity:
-                continue
-            prev = float(latest.get(identity, 0.0) or 0.0)
-            if ts > prev:
-                latest[identity] = ts
-    return latest
+    return index.latest_many("identity", identities)
 
 
-def _load_recent_outcome_update_ts(*, max_records: int = 800) -> Tuple[Dict[str, float], Dict[str, float]]:
-    path = Path.home() / ".spark" / "meta_ralph" / "outcome_tracking.json"
+def _outcome_index_rows_from_file(path: Path, max_records: int) -> List[EmissionRow]:
     if not path.exists():
-        return {}, {}
+        return []
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
-        return {}, {}
+        return []
     rows = data.get("records") if isinstance(data, dict) else None
     if not isinstance(rows, list):
-        return {}, {}
-    by_insight: Dict[str, float] = {}
-    by_advice_id: Dict[str, float] = {}
+        return []
+    out: List[EmissionRow] = []
     for rec in rows[-max(1, int(max_records)):]:
         if not isinstance(rec, dict):
             continue
@@ -1048,14 +1012,29 @@ def _load_recent_outcome_update_ts(*, max_records: int = 800) -> Tuple[Dict[str,
             continue
         ik = str(rec.get("insight_key") or "").strip().lower()
         if ik:
-            prev_ik = float(by_insight.get(ik, 0.0) or 0.0)
-            if ts > prev_ik:
-                by_insight[ik] = ts
+            out.append(("outcome_insight", ik, "", ts))
         aid = str(rec.get("learning_id") or "").strip().lower()
         if aid:
-            prev_aid = float(by_advice_id.get(aid, 0.0) or 0.0)
-            if ts > prev_aid:
-                by_advice_id[aid] = ts
+            out.append(("outcome_advice", aid, "", ts))
+    return out
+
+
+def _recent_outcome_update_ts(
+    insight_keys: List[str], advice_ids: List[str]
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """(insight_key -> ts, advice_id -> ts) of the latest recorded outcomes.
+
+    MetaRalph.track_outcome writes these through as outcomes are recorded;
+    records that predate the index are backfilled from the file once.
+    """
+    path = OUTCOME_TRACKING_FILE
+    index = emission_index_for(path)
+    index.backfill_once(
+        "outcome_tracking",
+        lambda: _outcome_index_rows_from_file(path, OUTCOME_BACKFILL_MAX_RECORDS),
+    )
+    by_insight = index.latest_many("outcome_insight", [str(k or "").strip().lower() for k in insight_keys])
+    by_advice_id = index.latest_many("outcome_advice", [str(a or "").strip().lower() for a in advice_ids])
     return by_insight, by_advice_id
 
 
@@ -1663,7 +1642,7 @@ def _decision_ledger_status() -> Dict[str, Any]:
     status: Dict[str, Any] = {
         "enabled": bool(ADVISORY_DECISION_LEDGER_ENABLED),
         "path": str(ADVISORY_DECISION_LEDGER_FILE),
-        "exists": bool(ADVISORY_DECISION_LEDGER_FILE.exists()),
+        "exists": AppendLog(ADVISORY_DECISION_LEDGER_FILE).exists(),
         "total_entries": 0,
         "recent_count": 0,
         "recent_emitted_count": 0,
@@ -1673,20 +1652,9 @@ def _decision_ledger_status() -> Dict[str, Any]:
     if not status["exists"]:
         return status
 
-    try:
-        lines = ADVISORY_DECISION_LEDGER_FILE.read_text(encoding="utf-8").splitlines()
-    except Exception:
-        return status
-
-    parsed: List[Dict[str, Any]] = []
-    status["total_entries"] = int(len(lines))
-    for line in lines[-120:]:
-        try:
-            row = json.loads(line)
-        except Exception:
-            continue
-        if isinstance(row, dict):
-            parsed.append(row)
+    ledger = AppendLog(ADVISORY_DECISION_LEDGER_FILE)
+    parsed = ledger.tail(120)
+    status["total_entries"] = ledger.count()
 
     status["recent_count"] = int(len(parsed))
     status["recent_emitted_count"] = int(sum(1 for row in parsed if str(row.get("outcome", "")).strip().lower() == "emitted"))
@@ -1798,6 +1766,7 @@ def on_pre_tool(
     tool_name: str,
     tool_input: Optional[dict] = None,
     trace_id: Optional[str] = None,
+    out: Optional[TextIO] = None,
 ) -> Optional[str]:
     if not ENGINE_ENABLED:
         return None
@@ -2026,8 +1995,8 @@ def on_pre_tool(
             _record_rejection("no_advice")
             return None
 
-        # Pre-read global dedupe log once so the gate can absorb advice_id dedupe
-        # (avoids per-item I/O in the post-gate dedupe pass).
+        # Look up recent global emissions once so the gate can absorb advice_id
+        # dedupe (avoids per-item lookups in the post-gate dedupe pass).
         recent_global_emissions: Dict[str, float] = {}
         if (
             GLOBAL_DEDUPE_ENABLED
@@ -2041,26 +2010,17 @@ def on_pre_tool(
                     intent_family=intent_family,
                     task_phase=str(getattr(state, "task_phase", "") or ""),
                 )
-                for row in reversed(_tail_jsonl(GLOBAL_DEDUPE_LOG, 400)):
-                    try:
-                        aid = str(row.get("advice_id") or "").strip()
-                        if not aid:
-                            continue
-                        ts = float(row.get("ts") or 0.0)
-                        if ts <= 0:
-                            continue
-                        age_s = _dedupe_now - ts
-                        if age_s < 0 or age_s >= _dedupe_cooldown:
-                            continue
-                        scope = str(row.get("scope_key") or "").strip()
-                        if _dedupe_scope and scope and scope != _dedupe_scope:
-                            continue
-                        if aid not in recent_global_emissions:
-                            recent_global_emissions[aid] = age_s
-                    except Exception:
-                        continue
+                latest_by_aid = _dedupe_index().latest_many(
+                    "advice",
+                    [str(getattr(item, "advice_id", "") or "") for item in advice_items],
+                    _dedupe_scope,
+                )
+                for aid, ts in latest_by_aid.items():
+                    age_s = _dedupe_now - ts
+                    if 0 <= age_s < _dedupe_cooldown:
+                        recent_global_emissions[aid] = age_s
             except Exception as exc:
-                log_debug("advisory_engine", f"global dedupe log scan failed: {exc}", None)
+                log_debug("advisory_engine", f"global dedupe lookup failed: {exc}", None)
 
         t_gate = time.time() * 1000.0
         gate_result = evaluate(
@@ -2319,6 +2279,7 @@ def on_pre_tool(
                     tool_name=tool_name,
                     route=route,
                     task_plane=task_plane,
+                    out=out,
                 )
                 if fallback_emitted:
                     state.last_advisory_packet_id = ""
@@ -2509,9 +2470,14 @@ def on_pre_tool(
         try:
             if gate_result.emitted:
                 now_ts = time.time()
-                recent_identity_ts = _load_recent_delivery_identity_ts(max_rows=600)
-                outcome_ts_by_insight, outcome_ts_by_advice_id = _load_recent_outcome_update_ts(
-                    max_records=900
+                candidate_ids = [str(getattr(d, "advice_id", "") or "").strip() for d in gate_result.emitted]
+                candidate_items = [(aid, advice_by_id.get(aid)) for aid in candidate_ids]
+                recent_identity_ts = _recent_delivery_identity_ts(
+                    [_repeat_identity_for_item(item, advice_id=aid) for aid, item in candidate_items if item is not None]
+                )
+                outcome_ts_by_insight, outcome_ts_by_advice_id = _recent_outcome_update_ts(
+                    [str(getattr(item, "insight_key", "") or "") for _, item in candidate_items if item is not None],
+                    candidate_ids,
                 )
                 kept, suppressed = _apply_emission_quality_filters(
                     list(gate_result.emitted or []),
@@ -2779,6 +2745,7 @@ def on_pre_tool(
             tool_name=tool_name,
             route=route,
             task_plane=task_plane,
+            out=out,
         )
         _mark("emit", t_emit)
         effective_text = str(synth_text or "").strip()
@@ -2849,6 +2816,7 @@ def on_pre_tool(
                     for q in [getattr(adv, "advisory_quality", None) for adv in list(emitted_advice or [])[:4]]
                 ],
             )
+            _delivery_index()
         except Exception as exc:
             log_debug("advisory_engine", f"recent advice write failed: {exc}", None)
 
@@ -2885,6 +2853,7 @@ def on_pre_tool(
                         },
                         max_lines=int(GLOBAL_DEDUPE_LOG_MAX),
                     )
+                _dedupe_index()
         except Exception as exc:
             log_debug("advisory_engine", f"dedupe log append failed: {exc}", None)
 
@@ -3461,7 +3430,6 @@ def _log_engine_event(
 ) -> None:
     try:
         elapsed_ms = (time.time() * 1000.0) - start_ms
-        ENGINE_LOG.parent.mkdir(parents=True, exist_ok=True)
         entry = {
             "ts": time.time(),
             "event": event,
@@ -3472,25 +3440,11 @@ def _log_engine_event(
         }
         if extra:
             entry.update(extra)
-        with open(ENGINE_LOG, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
-        _rotate_engine_log()
+        _append_jsonl_capped(ENGINE_LOG, entry, max_lines=ENGINE_LOG_MAX)
     except Exception as exc:
         log_debug("advisory_engine", f"engine log write failed: {exc}", None)
 
 
-def _rotate_engine_log() -> None:
-    try:
-        if not ENGINE_LOG.exists():
-            return
-        lines = ENGINE_LOG.read_text(encoding="utf-8").splitlines()
-        if len(lines) > ENGINE_LOG_MAX:
-            keep = lines[-ENGINE_LOG_MAX:]
-            ENGINE_LOG.write_text("\n".join(keep) + "\n", encoding="utf-8")
-    except Exception as exc:
-        log_debug("advisory_engine", f"engine log rotation failed: {exc}", None)
-
-
 def get_engine_status() -> Dict[str, Any]:
     status = {
         "enabled": ENGINE_ENABLED,
@@ -3529,19 +3483,12 @@ def get_engine_status() -> Dict[str, Any]:
     status["decision_ledger"] = _decision_ledger_status()
 
     try:
-        if ENGINE_LOG.exists():
-            lines = ENGINE_LOG.read_text(encoding="utf-8").splitlines()
-            parsed_tail: List[Dict[str, Any]] = []
-            for line in lines[-100:]:
-                try:
-                    row = json.loads(line)
-                    if isinstance(row, dict):
-                        parsed_tail.append(row)
-                except Exception:
-                    continue
+        engine_log = AppendLog(ENGINE_LOG)
+        if engine_log.exists():
+            parsed_tail = engine_log.tail(100)
             recent = parsed_tail[-10:]
             status["recent_events"] = recent
-            status["total_events"] = len(lines)
+            status["total_events"] = engine_log.count()
             emitted = sum(1 for row in parsed_tail if row.get("event") == "emitted")
             total = len(parsed_tail)
             status["emission_rate"] = round(emitted / max(total, 1), 3)
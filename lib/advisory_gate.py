@@ -22,6 +22,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .noise_classifier import check, is_noise, pattern, register
+
 # ============= Authority Levels =============
 
 class AuthorityLevel:
@@ -887,36 +889,39 @@ def _infer_category(insight_key: str, source: str) -> str:
     return source or "unknown"
 
 
+register("advisory_primitive", (
+    # Very short text is almost always noise
+    check("too_short", lambda f: len(f["tl"]) < 15),
+    # Pure tool-name / telemetry patterns
+    pattern(
+        "tool_chain",
+        r"^(?:bash|edit|read|write|task|tool)\s*→?\s*(?:bash|edit|read|write|task|tool)(?:\s*→?\s*(?:bash|edit|read|write|task|tool))*$",
+    ),
+    pattern("call_count", r"^\d+\s*(?:calls?|invocations?|runs?|times?)\b"),
+    pattern("acknowledgement", r"^(?:okay|ok|got it|sure|yes|no|fine|done|thanks)\.?$"),
+    pattern("metric", r"^(?:success|error|failure)\s*(?:rate|count|ratio)\b"),
+    pattern("tool_error", r"\btool[_\s-]*\d+[_\s-]*error\b"),
+    pattern("generic_tool_advice", r"^for\s+\w+\s+tasks?,?\s*use\s+standard\s+approach"),
+    pattern("cycle_summary", r"^cycle\s+summary:"),
+    # Timing observation noise: "took 4.2s", "operation took 350ms"
+    pattern("timing", r"\btook\s+\d[\d.]*\s*(?:ms|s|sec|second|minute)"),
+    pattern("timing", r"^(?:total\s+)?(?:operation|execution|processing|run)\s+t(?:ime|ook)"),
+    # Generic platitudes with no actionable specifics
+    pattern("platitude", r"^always\s+consider\s+the\s+trade"),
+    pattern(
+        "platitude",
+        r"^(?:it'?s?\s+)?(?:important|essential|crucial|key|critical)\s+to\s+(?:always\s+)?(?:consider|remember|keep)\b",
+    ),
+), empty="too_short")
+
+
 def _is_primitive_noise(text: str) -> bool:
     """Detect primitive/noisy insights that should stay SILENT even with relaxed thresholds.
 
     These are low-information insights that add no actionable value:
     generic tool labels, operational metrics, or content-free statements.
     """
-    tl = text.lower().strip()
-    # Very short text is almost always noise
-    if len(tl) < 15:
-        return True
-    # Pure tool-name / telemetry patterns
-    _NOISE_PATTERNS = [
-        r"^(?:bash|edit|read|write|task|tool)\s*→?\s*(?:bash|edit|read|write|task|tool)(?:\s*→?\s*(?:bash|edit|read|write|task|tool))*$",
-        r"^\d+\s*(?:calls?|invocations?|runs?|times?)\b",
-        r"^(?:okay|ok|got it|sure|yes|no|fine|done|thanks)\.?$",
-        r"^(?:success|error|failure)\s*(?:rate|count|ratio)\b",
-        r"\btool[_\s-]*\d+[_\s-]*error\b",
-        r"^for\s+\w+\s+tasks?,?\s*use\s+standard\s+approach",
-        r"^cycle\s+summary:",
-        # Timing observation noise: "took 4.2s", "operation took 350ms"
-        r"\btook\s+\d[\d.]*\s*(?:ms|s|sec|second|minute)",
-        r"^(?:total\s+)?(?:operation|execution|processing|run)\s+t(?:ime|ook)",
-        # Generic platitudes with no actionable specifics
-        r"^always\s+consider\s+the\s+trade",
-        r"^(?:it'?s?\s+)?(?:important|essential|crucial|key|critical)\s+to\s+(?:always\s+)?(?:consider|remember|keep)\b",
-    ]
-    for pat in _NOISE_PATTERNS:
-        if re.search(pat, tl):
-            return True
-    return False
+    return is_noise(text, "advisory_primitive")
 
 
 def _has_actionable_content(text: str) -> bool:
@@ -0,0 +1,334 @@
+"""SQLite (WAL) backend for the advisory packet store.
+
+The packet store used to keep one pretty-printed JSON file per packet plus an
+``index.json`` holding ``by_exact`` and ``packet_meta``. Every save and alias
+rewrote the whole index and every exact lookup re-read a packet file. This
+backend keeps:
+
+- ``packets``: one row per packet (full packet JSON + packet_meta JSON) with
+  indexed project/tool/intent/plane/freshness columns for relaxed lookup
+- ``exact_keys``: exact-key -> packet_id aliases
+- ``packet_advice``: advice_id -> packet_id, for feedback/outcome routing
+- ``store_meta``: schema version, JSON migration marker and a write sequence
+
+Every write bumps ``seq`` so readers can cache derived views per sequence.
+Normalization and scoring stay in ``advisory_packet_store``; this module only
+moves rows.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCHEMA_VERSION = 3
+
+# (packet_id, packet, meta_row, exact_key or "", advice_ids)
+PacketRow = Tuple[str, Dict[str, Any], Dict[str, Any], str, List[str]]
+
+
+class PacketDB:
+    """Row store for advisory packets; one connection per thread."""
+
+    def __init__(self, path: Path, timeout_s: float = 5.0):
+        self.path = Path(path)
+        self.timeout_s = float(timeout_s)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.path), timeout=self.timeout_s, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._schema_lock:
+            if not self._schema_ready:
+                self._create_schema(conn)
+                self._schema_ready = True
+        self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS packets (
+              packet_id TEXT PRIMARY KEY,
+              project_key TEXT NOT NULL DEFAULT '',
+              session_context_key TEXT NOT NULL DEFAULT '',
+              tool_name TEXT NOT NULL DEFAULT '',
+              intent_family TEXT NOT NULL DEFAULT '',
+              task_plane TEXT NOT NULL DEFAULT '',
+              invalidated INTEGER NOT NULL DEFAULT 0,
+              fresh_until_ts REAL NOT NULL DEFAULT 0,
+              updated_ts REAL NOT NULL DEFAULT 0,
+              meta TEXT NOT NULL,
+              data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_packets_project_fresh
+              ON packets(project_key, invalidated, fresh_until_ts);
+            CREATE INDEX IF NOT EXISTS idx_packets_tool ON packets(project_key, tool_name);
+            CREATE INDEX IF NOT EXISTS idx_packets_intent ON packets(project_key, intent_family);
+            CREATE INDEX IF NOT EXISTS idx_packets_plane ON packets(project_key, task_plane);
+            CREATE INDEX IF NOT EXISTS idx_packets_updated ON packets(updated_ts);
+            CREATE TABLE IF NOT EXISTS exact_keys (
+              exact_key TEXT PRIMARY KEY,
+              packet_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_exact_keys_packet ON exact_keys(packet_id);
+            CREATE TABLE IF NOT EXISTS packet_advice (
+              advice_id TEXT NOT NULL,
+              packet_id TEXT NOT NULL,
+              PRIMARY KEY (advice_id, packet_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_packet_advice_packet ON packet_advice(packet_id);
+            CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT);
+            """
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO store_meta (key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                self._local.conn = None
+
+    # ------------------------------------------------------------------ meta
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str, default: str = "") -> str:
+        row = conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return str(row[0]) if row and row[0] is not None else default
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, values: Dict[str, Any]) -> None:
+        conn.executemany(
+            "INSERT INTO store_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(k, str(v)) for k, v in values.items()],
+        )
+
+    def get_meta(self, key: str, default: str = "") -> str:
+        return self._get_meta(self._conn(), key, default)
+
+    def seq(self) -> int:
+        return int(self.get_meta("seq", "0") or 0)
+
+    def _bump(self, conn: sqlite3.Connection, extra: Optional[Dict[str, Any]] = None) -> None:
+        values = dict(extra or {})
+        values["seq"] = int(self._get_meta(conn, "seq", "0") or 0) + 1
+        self._set_meta(conn, values)
+
+    def _write(self, fn, *args, **kwargs):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(conn, *args, **kwargs)
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    # ----------------------------------------------------------------- reads
+
+    def get_data(self, packet_id: str) -> Optional[str]:
+        row = self._conn().execute("SELECT data FROM packets WHERE packet_id = ?", (packet_id,)).fetchone()
+        return str(row[0]) if row else None
+
+    def packet_for_exact(self, exact_key: str) -> Optional[str]:
+        row = self._conn().execute(
+            "SELECT packet_id FROM exact_keys WHERE exact_key = ?", (exact_key,)
+        ).fetchone()
+        return str(row[0]) if row else None
+
+    def count(self) -> int:
+        return int(self._conn().execute("SELECT COUNT(*) FROM packets").fetchone()[0])
+
+    def relaxed_rows(
+        self,
+        *,
+        project_key: str,
+        now_ts: float,
+        tool_name: str = "",
+        intent_family: str = "",
+        task_plane: str = "",
+        require_dimension: bool = True,
+    ) -> List[Tuple[str, str]]:
+        """(packet_id, meta json) of fresh, valid packets that could match.
+
+        With require_dimension the rows must share the tool (or be a "*"
+        wildcard), intent or plane; each branch is served by an index.
+        """
+        base = (
+            "SELECT packet_id, meta FROM packets "
+            "WHERE project_key = ? AND invalidated = 0 AND fresh_until_ts >= ?"
+        )
+        params: List[Any] = [project_key, float(now_ts)]
+        if require_dimension:
+            clauses = ["tool_name = '*'"]
+            if tool_name:
+                clauses.append("tool_name = ?")
+                params.append(tool_name)
+            if intent_family:
+                clauses.append("intent_family = ?")
+                params.append(intent_family)
+            if task_plane:
+                clauses.append("task_plane = ?")
+                params.append(task_plane)
+            base += " AND (" + " OR ".join(clauses) + ")"
+        return [(str(r[0]), str(r[1])) for r in self._conn().execute(base, params)]
+
+    def packets_for_advice(self, advice_id: str) -> List[str]:
+        """Packet ids containing ``advice_id``, newest first."""
+        rows = self._conn().execute(
+            "SELECT p.packet_id FROM packet_advice a JOIN packets p ON p.packet_id = a.packet_id "
+            "WHERE a.advice_id = ? ORDER BY p.updated_ts DESC",
+            (advice_id,),
+        ).fetchall()
+        return [str(r[0]) for r in rows]
+
+    def load_index(self) -> Tuple[Dict[str, str], Dict[str, str], int]:
+        """(by_exact, {packet_id: meta json}, seq) read in one snapshot."""
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            by_exact = {str(k): str(v) for k, v in conn.execute("SELECT exact_key, packet_id FROM exact_keys")}
+            meta = {
+                str(pid): str(text)
+                for pid, text in conn.execute("SELECT packet_id, meta FROM packets ORDER BY rowid")
+            }
+            seq = int(self._get_meta(conn, "seq", "0") or 0)
+        finally:
+            conn.execute("COMMIT")
+        return by_exact, meta, seq
+
+    # ---------------------------------------------------------------- writes
+
+    @staticmethod
+    def _put_rows(conn: sqlite3.Connection, rows: Iterable[PacketRow]) -> int:
+        n = 0
+        for packet_id, packet, meta_row, exact_key, advice_ids in rows:
+            conn.execute(
+                "INSERT INTO packets (packet_id, project_key, session_context_key, tool_name, intent_family, "
+                "task_plane, invalidated, fresh_until_ts, updated_ts, meta, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(packet_id) DO UPDATE SET project_key = excluded.project_key, "
+                "session_context_key = excluded.session_context_key, tool_name = excluded.tool_name, "
+                "intent_family = excluded.intent_family, task_plane = excluded.task_plane, "
+                "invalidated = excluded.invalidated, fresh_until_ts = excluded.fresh_until_ts, "
+                "updated_ts = excluded.updated_ts, meta = excluded.meta, data = excluded.data",
+                (
+                    packet_id,
+                    str(meta_row.get("project_key") or ""),
+                    str(meta_row.get("session_context_key") or ""),
+                    str(meta_row.get("tool_name") or ""),
+                    str(meta_row.get("intent_family") or ""),
+                    str(meta_row.get("task_plane") or ""),
+                    1 if meta_row.get("invalidated") else 0,
+                    float(meta_row.get("fresh_until_ts") or 0.0),
+                    float(meta_row.get("updated_ts") or 0.0),
+                    json.dumps(meta_row, ensure_ascii=False),
+                    json.dumps(packet, ensure_ascii=False),
+                ),
+            )
+            if exact_key:
+                conn.execute(
+                    "INSERT INTO exact_keys (exact_key, packet_id) VALUES (?, ?) "
+                    "ON CONFLICT(exact_key) DO UPDATE SET packet_id = excluded.packet_id",
+                    (exact_key, packet_id),
+                )
+            conn.execute("DELETE FROM packet_advice WHERE packet_id = ?", (packet_id,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO packet_advice (advice_id, packet_id) VALUES (?, ?)",
+                [(a, packet_id) for a in dict.fromkeys(advice_ids) if a],
+            )
+            n += 1
+        return n
+
+    @staticmethod
+    def _prune(conn: sqlite3.Connection, max_packets: int) -> int:
+        total = int(conn.execute("SELECT COUNT(*) FROM packets").fetchone()[0])
+        excess = total - max(1, int(max_packets))
+        if excess <= 0:
+            return 0
+        doomed = [
+            str(r[0])
+            for r in conn.execute("SELECT packet_id FROM packets ORDER BY updated_ts ASC LIMIT ?", (excess,))
+        ]
+        for start in range(0, len(doomed), 500):
+            chunk = doomed[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            conn.execute(f"DELETE FROM packets WHERE packet_id IN ({marks})", chunk)
+            conn.execute(f"DELETE FROM exact_keys WHERE packet_id IN ({marks})", chunk)
+            conn.execute(f"DELETE FROM packet_advice WHERE packet_id IN ({marks})", chunk)
+        return len(doomed)
+
+    def put(self, row: PacketRow, *, max_packets: int = 0) -> None:
+        """Upsert one packet (and its exact key), pruning the oldest past max_packets."""
+
+        def _tx(conn: sqlite3.Connection) -> None:
+            self._put_rows(conn, [row])
+            if max_packets > 0:
+                self._prune(conn, max_packets)
+            self._bump(conn)
+
+        self._write(_tx)
+
+    def set_alias(self, exact_key: str, packet_id: str) -> bool:
+        def _tx(conn: sqlite3.Connection) -> bool:
+            cur = conn.execute("SELECT packet_id FROM exact_keys WHERE exact_key = ?", (exact_key,)).fetchone()
+            if cur and str(cur[0]) == packet_id:
+                return False
+            conn.execute(
+                "INSERT INTO exact_keys (exact_key, packet_id) VALUES (?, ?) "
+                "ON CONFLICT(exact_key) DO UPDATE SET packet_id = excluded.packet_id",
+                (exact_key, packet_id),
+            )
+            self._bump(conn)
+            return True
+
+        return bool(self._write(_tx))
+
+    # ------------------------------------------------------------- migration
+
+    def migrate_once(self, marker: str, load_rows) -> Optional[Dict[str, Any]]:
+        """Run ``load_rows() -> (rows, by_exact)`` once per database, atomically.
+
+        The marker is checked again inside the write transaction so two
+        processes opening a fresh database cannot both import.
+        """
+        if self.get_meta(marker):
+            return None
+
+        def _tx(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+            if self._get_meta(conn, marker):
+                return None
+            rows, by_exact = load_rows()
+            imported = self._put_rows(conn, rows)
+            known = {r[0] for r in rows}
+            aliases = [(k, v) for k, v in (by_exact or {}).items() if k and v in known]
+            conn.executemany(
+                "INSERT INTO exact_keys (exact_key, packet_id) VALUES (?, ?) "
+                "ON CONFLICT(exact_key) DO UPDATE SET packet_id = excluded.packet_id",
+                aliases,
+            )
+            self._bump(conn, {marker: time.time()})
+            return {"packets": imported, "exact_keys": len(aliases)}
+
+        return self._write(_tx)
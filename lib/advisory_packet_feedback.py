@@ -185,20 +185,14 @@ def record_packet_outcome_for_advice(
     count_effectiveness: bool = True,
 ) -> Dict[str, Any]:
     """Find the newest packet containing advice_id and record an outcome tag."""
-    from .advisory_packet_store import _load_index, get_packet
+    from .advisory_packet_store import _db, get_packet
 
     advice = str(advice_id or "").strip()
     if not advice:
         return {"ok": False, "reason": "missing_advice_id"}
 
-    index = _load_index()
-    meta = index.get("packet_meta") or {}
-    ordered_ids = sorted(
-        meta.keys(),
-        key=lambda pid: float((meta.get(pid) or {}).get("updated_ts", 0.0)),
-        reverse=True,
-    )
-    for packet_id in ordered_ids:
+    # packet_advice index: packets containing advice_id, newest first.
+    for packet_id in _db().packets_for_advice(advice):
         packet = get_packet(packet_id)
         if not packet:
             continue
@@ -229,20 +223,14 @@ def record_packet_feedback_for_advice(
     trace_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Find the newest packet containing advice_id and record feedback."""
-    from .advisory_packet_store import _load_index, get_packet
+    from .advisory_packet_store import _db, get_packet
 
     advice = str(advice_id or "").strip()
     if not advice:
         return {"ok": False, "reason": "missing_advice_id"}
 
-    index = _load_index()
-    meta = index.get("packet_meta") or {}
-    ordered_ids = sorted(
-        meta.keys(),
-        key=lambda pid: float((meta.get(pid) or {}).get("updated_ts", 0.0)),
-        reverse=True,
-    )
-    for packet_id in ordered_ids:
+    # packet_advice index: packets containing advice_id, newest first.
+    for packet_id in _db().packets_for_advice(advice):
         packet = get_packet(packet_id)
         if not packet:
             continue
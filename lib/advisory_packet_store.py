@@ -6,24 +6,31 @@ Phase 1 scope:
 - Exact and relaxed lookup
 - Invalidation helpers
 - Background prefetch queue append
+
+Packets, their index metadata and exact-key aliases live in a WAL SQLite
+database (``advisory_packet_db``) under PACKET_DIR. The legacy layout
+(``pkt_*.json`` files + ``index.json``) is imported once on first open and
+left on disk untouched.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-import os
 import time
 from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .advisory_packet_db import PacketDB
+from .append_log import AppendLog
 from .config_authority import resolve_section
 
 # httpx moved to advisory_packet_llm_reranker.py
 
 PACKET_DIR = Path.home() / ".spark" / "advice_packets"
-INDEX_FILE = PACKET_DIR / "index.json"
+INDEX_FILE = PACKET_DIR / "index.json"  # legacy JSON index; read once by the SQLite migration
+PACKET_DB_NAME = "packets.sqlite"
 PREFETCH_QUEUE_FILE = PACKET_DIR / "prefetch_queue.jsonl"
 OBSIDIAN_EXPORT_DIR = PACKET_DIR / "obsidian"
 OBSIDIAN_PACKETS_DIR = OBSIDIAN_EXPORT_DIR / "packets"
@@ -64,7 +71,8 @@ DEFAULT_OBSIDIAN_EXPORT_ENABLED = False
 DEFAULT_OBSIDIAN_AUTO_EXPORT = False
 DEFAULT_OBSIDIAN_EXPORT_DIR = str(OBSIDIAN_EXPORT_DIR)
 INDEX_SCHEMA_VERSION_KEY = "_schema_version"
-INDEX_SCHEMA_VERSION = 2
+INDEX_SCHEMA_VERSION = 3
+JSON_MIGRATION_MARKER = "json_migrated"
 
 REQUIRED_PACKET_FIELDS = {
     "packet_id",
@@ -96,7 +104,8 @@ REQUIRED_PACKET_FIELDS = {
 REQUIRED_LINEAGE_FIELDS = {"sources", "memory_absent_declared"}
 
 _INDEX_CACHE: Optional[Dict[str, Any]] = None
-_INDEX_CACHE_MTIME_NS: Optional[int] = None
+_INDEX_CACHE_KEY: Optional[Tuple[str, int]] = None
+_PACKET_DBS: Dict[str, PacketDB] = {}
 _ALIASED_EXACT_KEYS: set[str] = set()
 
 _OBSIDIAN_CONFIG_DIR_OVERRIDE: Optional[str] = None
@@ -171,62 +180,23 @@ def _decision_ledger_enabled() -> bool:
 
 
 def _read_advisory_decision_ledger(limit: int = 120) -> List[Dict[str, Any]]:
-    if not ADVISORY_DECISION_LEDGER_FILE.exists():
-        return []
     try:
         limit_count = int(limit)
     except Exception:
         limit_count = 120
-    if limit_count <= 0:
-        limit_count = 0
-
-    try:
-        raw = ADVISORY_DECISION_LEDGER_FILE.read_text(encoding="utf-8").splitlines()
-    except Exception:
-        return []
-    if not raw:
-        return []
-
-    if limit_count > 0:
-        raw = raw[-limit_count:]
-
-    out: List[Dict[str, Any]] = []
-    for line in raw:
-        try:
-            row = json.loads(line)
-        except Exception:
-            continue
-        if isinstance(row, dict):
-            out.append(row)
-    return out
+    return _read_jsonl_lines(ADVISORY_DECISION_LEDGER_FILE, limit=max(0, limit_count))
 
 
 def _read_jsonl_lines(path: Path, limit: int = 1200) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
+    """Last ``limit`` rows (all when 0), including sealed segments of segmented logs."""
     try:
         limit_count = max(0, int(limit or 0))
     except Exception:
         limit_count = 0
-
-    try:
-        raw = path.read_text(encoding="utf-8").splitlines()
-    except Exception:
-        return []
-    if not raw:
-        return []
+    log = AppendLog(path)
     if limit_count > 0:
-        raw = raw[-limit_count:]
-
-    out: List[Dict[str, Any]] = []
-    for line in raw:
-        try:
-            row = json.loads(line)
-        except Exception:
-            continue
-        if isinstance(row, dict):
-            out.append(row)
-    return out
+        return log.tail(limit_count)
+    return list(log.iter_rows())
 
 
 def _decision_ledger_meta() -> Dict[str, Any]:
@@ -235,14 +205,11 @@ def _decision_ledger_meta() -> Dict[str, Any]:
         "enabled": bool(_decision_ledger_enabled()),
         "exists": False,
     }
-    if not ADVISORY_DECISION_LEDGER_FILE.exists():
-        return meta
-    try:
-        raw = ADVISORY_DECISION_LEDGER_FILE.read_text(encoding="utf-8").splitlines()
-    except Exception:
+    ledger = AppendLog(ADVISORY_DECISION_LEDGER_FILE)
+    if not ledger.exists():
         return meta
 
-    total = len([ln for ln in raw if ln.strip()])
+    total = ledger.count()
     recent = _read_advisory_decision_ledger(limit=20)
     emitted_recent = sum(1 for row in recent if str(row.get("outcome", "")).strip().lower() == "emitted")
     meta.update(
@@ -417,7 +384,7 @@ def _packet_trace_history_events(
             normalized["trace_system"] = "advisory_global_dedupe"
             events.append(normalized)
 
-    if ADVISOR_ADVICE_LOG_FILE.exists():
+    if AppendLog(ADVISOR_ADVICE_LOG_FILE).exists():
         for row in _read_jsonl_lines(ADVISOR_ADVICE_LOG_FILE, limit=limit * 2):
             if not isinstance(row, dict):
                 continue
@@ -473,7 +440,7 @@ def _packet_trace_history_events(
             normalized["trace_system"] = "advice_feedback"
             events.append(normalized)
 
-    if OUTCOMES_FILE.exists():
+    if AppendLog(OUTCOMES_FILE).exists():
         for row in _read_jsonl_lines(OUTCOMES_FILE, limit=limit * 2):
             if not isinstance(row, dict):
                 continue
@@ -519,7 +486,7 @@ def _packet_trace_history_events(
                 normalized["ts"] = outcome_ts_by_id.get(row_outcome_id, 0.0)
             events.append(normalized)
 
-    if OUTCOME_LINKS_FILE.exists():
+    if AppendLog(OUTCOME_LINKS_FILE).exists():
         for row in _read_jsonl_lines(OUTCOME_LINKS_FILE, limit=limit * 2):
             if not isinstance(row, dict):
                 continue
@@ -730,13 +697,6 @@ def _ensure_dirs() -> None:
     PACKET_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _atomic_write_json(path: Path, payload: Dict[str, Any]) -> None:
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-    # os.replace is atomic even on Windows (no unlink+rename race)
-    os.replace(str(tmp), str(path))
-
-
 def _read_json(path: Path, default: Dict[str, Any]) -> Dict[str, Any]:
     try:
         if path.exists():
@@ -1901,7 +1861,7 @@ def _sync_obsidian_catalog() -> Optional[str]:
             include_invalid=True,
             limit=max(1, OBSIDIAN_EXPORT_MAX_PACKETS),
         )
-        if not catalog and not ADVISORY_DECISION_LEDGER_FILE.exists():
+        if not catalog and not AppendLog(ADVISORY_DECISION_LEDGER_FILE).exists():
             _record_obsidian_status("skipped", message="no obsidian catalog data or advisory events")
             return None
 
@@ -1996,10 +1956,6 @@ def export_packet_packet(packet_id: str) -> Optional[str]:
             pass
 
 
-def _packet_path(packet_id: str) -> Path:
-    return PACKET_DIR / f"{packet_id}.json"
-
-
 def _obsidian_dir_override(raw: Any) -> None:
     global _OBSIDIAN_CONFIG_DIR_OVERRIDE
     if raw is None:
@@ -2147,49 +2103,80 @@ def _migrate_packet_index_schema(index: Dict[str, Any]) -> bool:
     return True
 
 
-def _load_index() -> Dict[str, Any]:
-    _ensure_dirs()
-    default = {"by_exact": {}, "packet_meta": {}}
-    global _INDEX_CACHE, _INDEX_CACHE_MTIME_NS
+def _packet_db_path() -> Path:
+    return PACKET_DIR / PACKET_DB_NAME
 
+
+def _legacy_json_rows() -> Tuple[List[Any], Dict[str, str]]:
+    """Read the pre-SQLite layout: pkt_*.json files plus index.json meta/aliases."""
+    index = _read_json(INDEX_FILE, {"by_exact": {}, "packet_meta": {}})
+    _migrate_packet_index_schema(index)
+    _normalize_packet_meta(index)
+    legacy_meta = index.get("packet_meta") or {}
+    rows: List[Any] = []
+    for path in sorted(PACKET_DIR.glob("pkt_*.json")):
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        if not isinstance(raw, dict):
+            continue
+        packet = _normalize_packet(raw)
+        if not validate_packet(packet)[0]:
+            continue
+        packet_id = str(packet.get("packet_id"))
+        meta_row = legacy_meta.get(packet_id) or _packet_meta_row(packet)
+        meta_row["invalidated"] = bool(packet.get("invalidated", meta_row.get("invalidated", False)))
+        rows.append((packet_id, packet, meta_row, "", _packet_advice_ids(packet)))
+    by_exact = {str(k): str(v) for k, v in (index.get("by_exact") or {}).items() if k and v}
+    return rows, by_exact
+
+
+def _db() -> PacketDB:
+    """PacketDB for the current PACKET_DIR, importing the JSON layout on first open."""
+    path = _packet_db_path()
+    key = str(path)
+    db = _PACKET_DBS.get(key)
+    if db is not None:
+        return db
+    _ensure_dirs()
+    db = PacketDB(path)
     try:
-        mtime_ns = int(INDEX_FILE.stat().st_mtime_ns) if INDEX_FILE.exists() else None
+        db.migrate_once(JSON_MIGRATION_MARKER, _legacy_json_rows)
     except Exception:
-        mtime_ns = None
+        pass
+    _PACKET_DBS[key] = db
+    return db
 
-    # Hot-path optimization: lookups happen on pre-tool advisory. Avoid re-parsing
-    # the index JSON unless the file changed.
-    if _INDEX_CACHE is not None and mtime_ns is not None and _INDEX_CACHE_MTIME_NS == mtime_ns:
-        return _INDEX_CACHE
 
-    data = _read_json(INDEX_FILE, default)
-    data.setdefault("by_exact", {})
-    data.setdefault("packet_meta", {})
+def _load_index() -> Dict[str, Any]:
+    """Dict view of the packet index ({by_exact, packet_meta}), cached per DB write seq.
 
-    migrated = _migrate_packet_index_schema(data)
-    meta_changed = _normalize_packet_meta(data)
-    if migrated or meta_changed:
+    Callers must treat the view as read-only; writes go through the DB.
+    """
+    global _INDEX_CACHE, _INDEX_CACHE_KEY
+    db = _db()
+    cache_key = (str(db.path), db.seq())
+    # Hot-path optimization: catalog/status scans share one decoded view until
+    # some process writes the store again.
+    if _INDEX_CACHE is not None and _INDEX_CACHE_KEY == cache_key:
+        return _INDEX_CACHE
+    by_exact, meta_json, seq = db.load_index()
+    meta: Dict[str, Any] = {}
+    for packet_id, text in meta_json.items():
         try:
-            _save_index(data)
-            mtime_ns = int(INDEX_FILE.stat().st_mtime_ns) if INDEX_FILE.exists() else mtime_ns
+            row = json.loads(text)
         except Exception:
-            pass
-
-    _INDEX_CACHE = data
-    _INDEX_CACHE_MTIME_NS = mtime_ns
-    return data
-
-
-def _save_index(index: Dict[str, Any]) -> None:
-    _ensure_dirs()
-    _atomic_write_json(INDEX_FILE, index)
-    # Keep cache coherent for subsequent reads in this process.
-    global _INDEX_CACHE, _INDEX_CACHE_MTIME_NS
-    _INDEX_CACHE = index
-    try:
-        _INDEX_CACHE_MTIME_NS = int(INDEX_FILE.stat().st_mtime_ns) if INDEX_FILE.exists() else None
-    except Exception:
-        _INDEX_CACHE_MTIME_NS = None
+            continue
+        if isinstance(row, dict):
+            meta[packet_id] = row
+    _INDEX_CACHE = {
+        "by_exact": by_exact,
+        "packet_meta": meta,
+        INDEX_SCHEMA_VERSION_KEY: INDEX_SCHEMA_VERSION,
+    }
+    _INDEX_CACHE_KEY = (str(db.path), seq)
+    return _INDEX_CACHE
 
 
 def alias_exact_key(
@@ -2214,16 +2201,9 @@ def alias_exact_key(
     exact_key = _make_exact_key(project, session_ctx, tool, intent)
     if exact_key in _ALIASED_EXACT_KEYS:
         return False
-    index = _load_index()
-    by_exact = index.get("by_exact") or {}
-    if by_exact.get(exact_key) == packet_id:
-        _ALIASED_EXACT_KEYS.add(exact_key)
-        return False
-    by_exact[exact_key] = packet_id
-    index["by_exact"] = by_exact
-    _save_index(index)
+    changed = _db().set_alias(exact_key, packet_id)
     _ALIASED_EXACT_KEYS.add(exact_key)
-    return True
+    return changed
 
 
 def build_packet(
@@ -2320,25 +2300,29 @@ def save_packet(packet: Dict[str, Any]) -> str:
     if not ok:
         raise ValueError(f"invalid packet: {reason}")
 
-    _ensure_dirs()
     packet_id = str(packet.get("packet_id"))
     packet["updated_ts"] = _now()
-
-    _packet_path(packet_id).write_text(
-        json.dumps(packet, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-
-    index = _load_index()
     exact_key = _make_exact_key(
         str(packet.get("project_key", "")),
         str(packet.get("session_context_key", "")),
         str(packet.get("tool_name", "")),
         str(packet.get("intent_family", "")),
     )
-    index["by_exact"][exact_key] = packet_id
+    _db().put(
+        (packet_id, packet, _packet_meta_row(packet), exact_key, _packet_advice_ids(packet)),
+        max_packets=MAX_INDEX_PACKETS,
+    )
+    try:
+        _export_packet_to_obsidian(packet)
+    except Exception:
+        pass
+    return packet_id
+
+
+def _packet_meta_row(packet: Dict[str, Any]) -> Dict[str, Any]:
+    """Index metadata row stored next to each packet (no advisory text/items)."""
     flags = _readiness_flags(packet, now_ts=packet.get("updated_ts"))
-    index["packet_meta"][packet_id] = {
+    row = {
         "project_key": packet.get("project_key"),
         "session_context_key": packet.get("session_context_key"),
         "tool_name": packet.get("tool_name"),
@@ -2370,43 +2354,32 @@ def save_packet(packet: Dict[str, Any]) -> str:
         "is_ready": bool(flags.get("ready_for_use", False)),
         "readiness_score": float(flags.get("readiness_score", 0.0)),
     }
-    _prune_index(index)
-    _save_index(index)
-    try:
-        _export_packet_to_obsidian(packet)
-    except Exception:
-        pass
-    return packet_id
+    if packet.get("invalidate_reason"):
+        row["invalidate_reason"] = str(packet.get("invalidate_reason") or "")[:200]
+    return _normalize_packet_meta_row(row) or row
 
 
-def _prune_index(index: Dict[str, Any]) -> None:
-    meta = index.get("packet_meta") or {}
-    if len(meta) <= MAX_INDEX_PACKETS:
-        return
-    ordered = sorted(
-        meta.items(),
-        key=lambda kv: float((kv[1] or {}).get("updated_ts", 0.0)),
-    )
-    remove_count = len(meta) - MAX_INDEX_PACKETS
-    remove_ids = {packet_id for packet_id, _ in ordered[:remove_count]}
-    for packet_id in remove_ids:
-        meta.pop(packet_id, None)
-    by_exact = index.get("by_exact") or {}
-    dead_keys = [k for k, v in by_exact.items() if v in remove_ids]
-    for k in dead_keys:
-        by_exact.pop(k, None)
+def _packet_advice_ids(packet: Dict[str, Any]) -> List[str]:
+    out: List[str] = []
+    for item in packet.get("advice_items") or []:
+        if isinstance(item, dict):
+            advice_id = str(item.get("advice_id") or "").strip()
+            if advice_id:
+                out.append(advice_id)
+    return out
 
 
 def get_packet(packet_id: str) -> Optional[Dict[str, Any]]:
     if not packet_id:
         return None
     try:
-        path = _packet_path(packet_id)
-        if not path.exists():
+        raw = _db().get_data(str(packet_id))
+        if raw is None:
             return None
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(raw)
         if isinstance(data, dict):
-            return _normalize_packet(data)
+            # Rows are normalized on write; no re-normalization on the hot path.
+            return data
     except Exception:
         return None
     return None
@@ -2480,14 +2453,16 @@ def lookup_exact(
     intent_family: str,
     now_ts: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
-    index = _load_index()
     # Mirror build_packet/save_packet sanitization so exact hits work even if caller passes raw values.
     project = _sanitize_token(project_key, "unknown_project")
     session_ctx = _sanitize_token(session_context_key, "default")
     tool = _sanitize_token(tool_name, "*")
     intent = _sanitize_token(intent_family, "emergent_other")
     exact_key = _make_exact_key(project, session_ctx, tool, intent)
-    packet_id = (index.get("by_exact") or {}).get(exact_key)
+    try:
+        packet_id = _db().packet_for_exact(exact_key)
+    except Exception:
+        packet_id = None
     packet = get_packet(str(packet_id or ""))
     if not packet:
         return None
@@ -2628,8 +2603,6 @@ def lookup_relaxed_candidates(
     max_candidates: int = 10,
     context_text: str = "",
 ) -> List[Dict[str, Any]]:
-    index = _load_index()
-    meta = index.get("packet_meta") or {}
     now_value = float(now_ts if now_ts is not None else _now())
     limit = max(1, min(30, int(max_candidates or PACKET_RELAXED_MAX_CANDIDATES or 1)))
     candidates: List[Tuple[float, float, str, Dict[str, Any]]] = []
@@ -2638,8 +2611,24 @@ def lookup_relaxed_candidates(
     intent_family = _sanitize_token(intent_family, "") if intent_family else ""
     task_plane = _sanitize_token(task_plane, "") if task_plane else ""
 
-    for packet_id, item in meta.items():
-        row = item or {}
+    # Indexed prefilter: project + validity + freshness, and (unless the
+    # thresholds allow zero-dimension matches) at least one shared dimension.
+    # _candidate_match_score stays the authority on what qualifies.
+    rows = _db().relaxed_rows(
+        project_key=project,
+        now_ts=now_value,
+        tool_name=tool_name,
+        intent_family=intent_family,
+        task_plane=task_plane,
+        require_dimension=RELAXED_MIN_MATCH_DIMENSIONS > 0 or RELAXED_MIN_MATCH_SCORE > 0,
+    )
+    for packet_id, meta_text in rows:
+        try:
+            row = json.loads(meta_text)
+        except Exception:
+            continue
+        if not isinstance(row, dict):
+            continue
         scored = _candidate_match_score(
             row,
             project=project,
@@ -2801,16 +2790,8 @@ def invalidate_packet(packet_id: str, reason: str = "manual") -> bool:
     packet["invalidated"] = True
     packet["invalidate_reason"] = reason[:200]
     packet["updated_ts"] = _now()
-    _packet_path(packet_id).write_text(
-        json.dumps(packet, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    index = _load_index()
-    if packet_id in (index.get("packet_meta") or {}):
-        index["packet_meta"][packet_id]["invalidated"] = True
-        index["packet_meta"][packet_id]["updated_ts"] = packet["updated_ts"]
-        index["packet_meta"][packet_id]["invalidate_reason"] = reason[:200]
-    _save_index(index)
+    # No exact key: invalidation must not re-point an alias that moved on.
+    _db().put((packet_id, packet, _packet_meta_row(packet), "", _packet_advice_ids(packet)))
     try:
         if _obsidian_enabled():
             _export_packet_to_obsidian(packet, force=True)
@@ -3309,7 +3290,7 @@ def get_store_status() -> Dict[str, Any]:
         "obsidian_watchtower_file": str(_obsidian_watchtower_file()),
         "obsidian_sync_status": _get_obsidian_status(),
         "decision_ledger": _decision_ledger_meta(),
-        "index_file": str(INDEX_FILE),
+        "index_file": str(_packet_db_path()),
     }
 
 
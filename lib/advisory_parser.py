@@ -8,6 +8,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
+from .append_log import AppendLog
 from .openclaw_paths import discover_openclaw_advisory_files
 
 REQUESTS_FILE = Path.home() / ".spark" / "advice_feedback_requests.jsonl"
@@ -54,13 +55,12 @@ def split_atomic_recommendations(text: str) -> List[str]:
 
 
 def _read_jsonl(path: Path, limit: Optional[int] = None) -> List[tuple[int, Dict[str, Any]]]:
-    if not path.exists():
+    log = AppendLog(path)
+    if not log.exists():
         return []
-    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-    if limit and limit > 0:
-        lines = lines[-int(limit) :]
+    lines = log.tail_lines(int(limit)) if limit and limit > 0 else list(log.iter_lines())
     rows: List[tuple[int, Dict[str, Any]]] = []
-    start_line = max(1, len(path.read_text(encoding="utf-8", errors="replace").splitlines()) - len(lines) + 1)
+    start_line = max(1, log.count() - len(lines) + 1)
     for idx, line in enumerate(lines):
         try:
             row = json.loads(line)
@@ -14,10 +14,11 @@ a single coherent advisory block suitable for injection into Claude's context.
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import re
-import time
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -25,6 +26,7 @@ from .config_authority import env_float, env_str, resolve_section
 from .diagnostics import log_debug
 from .soul_upgrade import fetch_soul_state, guidance_preface, soul_kernel_pass
 from .soul_metrics import record_metric
+from .synthesis_cache import SynthesisCache
 
 try:
     import httpx as _httpx
@@ -74,6 +76,7 @@ OLLAMA_MODEL = os.getenv("SPARK_OLLAMA_MODEL", "phi4-mini")  # Default quality-f
 # Cloud fallback (only used if local unavailable and keys present)
 OPENAI_API_KEY = _load_repo_env_value("OPENAI_API_KEY", "CODEX_API_KEY")
 OPENAI_MODEL = os.getenv("SPARK_OPENAI_MODEL", "gpt-4o-mini")  # Cost-efficient
+OPENAI_BASE_URL = os.getenv("SPARK_OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
 
 MINIMAX_API_KEY = _load_repo_env_value("MINIMAX_API_KEY", "SPARK_MINIMAX_API_KEY")
 MINIMAX_BASE_URL = os.getenv("SPARK_MINIMAX_BASE_URL", "https://api.minimax.io/v1").rstrip("/")
@@ -81,9 +84,13 @@ MINIMAX_MODEL = os.getenv("SPARK_MINIMAX_MODEL", "MiniMax-M2.5")
 
 ANTHROPIC_API_KEY = _load_repo_env_value("ANTHROPIC_API_KEY", "CLAUDE_API_KEY")
 ANTHROPIC_MODEL = os.getenv("SPARK_ANTHROPIC_MODEL", "claude-haiku-4-5-20251001")
+ANTHROPIC_BASE_URL = os.getenv("SPARK_ANTHROPIC_BASE_URL", "https://api.anthropic.com/v1").rstrip("/")
 
 GEMINI_API_KEY = _load_repo_env_value("GEMINI_API_KEY", "GOOGLE_API_KEY")
 GEMINI_MODEL = os.getenv("SPARK_GEMINI_MODEL", "gemini-2.0-flash")
+GEMINI_BASE_URL = os.getenv(
+    "SPARK_GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/v1beta"
+).rstrip("/")
 
 # Synthesis mode: "auto" (try AI -> fall back to programmatic), "ai_only", "programmatic"
 SYNTH_MODE = os.getenv("SPARK_SYNTH_MODE", "auto")
@@ -96,8 +103,10 @@ SOUL_UPGRADE_PROMPT_ENABLED = os.getenv("SPARK_SOUL_UPGRADE_PROMPT", "0") in {"1
 AI_TIMEOUT_S = float(os.getenv("SPARK_SYNTH_TIMEOUT", "8.0"))
 PREFERRED_PROVIDER_ENV = os.getenv("SPARK_SYNTH_PREFERRED_PROVIDER", "")
 
-# Cache synthesized results (same inputs -> same output)
-_synth_cache: Dict[str, tuple] = {}  # key -> (result, timestamp)
+# Cache synthesized results (same inputs -> same output). The cache is a shared
+# SQLite file so short-lived hook processes reuse each other's results.
+SYNTH_CACHE_FILE = Path.home() / ".spark" / "synth_cache.sqlite"
+_SYNTH_CACHES: Dict[str, SynthesisCache] = {}
 CACHE_TTL_S = 120
 MAX_CACHE_ENTRIES = 50
 PREFERRED_PROVIDER: Optional[str] = None
@@ -202,9 +211,6 @@ def _apply_synth_config(cfg: Dict[str, Any]) -> Dict[str, List[str]]:
         try:
             MAX_CACHE_ENTRIES = max(1, int(cfg.get("max_cache_entries")))
             applied.append("max_cache_entries")
-            while len(_synth_cache) > MAX_CACHE_ENTRIES:
-                oldest = min(_synth_cache, key=lambda k: _synth_cache[k][1])
-                _synth_cache.pop(oldest, None)
         except Exception:
             warnings.append("invalid_max_cache_entries")
 
@@ -247,6 +253,15 @@ def _load_synth_config(path: Optional[Path] = None) -> dict:
         },
     ).data
 
+def _synth_cache() -> SynthesisCache:
+    """Shared result cache for the current SYNTH_CACHE_FILE."""
+    key = str(SYNTH_CACHE_FILE)
+    cache = _SYNTH_CACHES.get(key)
+    if cache is None:
+        cache = _SYNTH_CACHES.setdefault(key, SynthesisCache(SYNTH_CACHE_FILE))
+    return cache
+
+
 def _refresh_synth_config(force: bool = False) -> None:
     """Reload config from tuneables when file changes."""
     global _CONFIG_MTIME_S
@@ -627,22 +642,78 @@ def _get_provider_chain(preferred: Optional[str] = None) -> List[str]:
     return chain
 
 
-def _query_provider(provider: str, prompt: str) -> Optional[str]:
-    """Query a specific LLM provider. Must be fast (< AI_TIMEOUT_S)."""
+# One keep-alive client per provider, shared across threads. Timeouts are
+# passed per request so concurrent callers with different budgets never
+# touch module state.
+_PROVIDER_CLIENTS: Dict[str, Any] = {}
+_PROVIDER_CLIENTS_LOCK = threading.Lock()
+PROVIDER_MAX_CONNECTIONS = 8
+PROVIDER_KEEPALIVE_EXPIRY_S = 30.0
+
+
+def _provider_client(provider: str):
+    """Return the pooled httpx client for provider (None if httpx is missing)."""
+    if _httpx is None:
+        return None
+    client = _PROVIDER_CLIENTS.get(provider)
+    if client is not None:
+        return client
+    with _PROVIDER_CLIENTS_LOCK:
+        client = _PROVIDER_CLIENTS.get(provider)
+        if client is None:
+            client = _httpx.Client(
+                timeout=AI_TIMEOUT_S,
+                limits=_httpx.Limits(
+                    max_connections=PROVIDER_MAX_CONNECTIONS,
+                    max_keepalive_connections=PROVIDER_MAX_CONNECTIONS,
+                    keepalive_expiry=PROVIDER_KEEPALIVE_EXPIRY_S,
+                ),
+            )
+            _PROVIDER_CLIENTS[provider] = client
+    return client
+
+
+def close_provider_clients() -> None:
+    """Close pooled provider connections (they are re-created on next use)."""
+    with _PROVIDER_CLIENTS_LOCK:
+        clients = list(_PROVIDER_CLIENTS.values())
+        _PROVIDER_CLIENTS.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_provider_clients)
+
+
+def _call_timeout(timeout_s: Optional[float]) -> float:
+    try:
+        timeout = float(timeout_s)
+        if timeout > 0:
+            return timeout
+    except Exception:
+        pass
+    return AI_TIMEOUT_S
+
+
+def _query_provider(provider: str, prompt: str, *, timeout_s: Optional[float] = None) -> Optional[str]:
+    """Query a specific LLM provider. Must be fast (< timeout_s, default AI_TIMEOUT_S)."""
     if provider == "ollama":
-        return _query_ollama(prompt)
+        return _query_ollama(prompt, timeout_s=timeout_s)
     elif provider == "openai":
-        return _query_openai(prompt)
+        return _query_openai(prompt, timeout_s=timeout_s)
     elif provider == "minimax":
-        return _query_minimax(prompt)
+        return _query_minimax(prompt, timeout_s=timeout_s)
     elif provider == "anthropic":
-        return _query_anthropic(prompt)
+        return _query_anthropic(prompt, timeout_s=timeout_s)
     elif provider == "gemini":
-        return _query_gemini(prompt)
+        return _query_gemini(prompt, timeout_s=timeout_s)
     return None
 
 
-def _query_ollama(prompt: str) -> Optional[str]:
+def _query_ollama(prompt: str, *, timeout_s: Optional[float] = None) -> Optional[str]:
     """Query local Ollama instance via chat API.
 
     Uses /api/chat (not /api/generate) because Qwen3 models route all
@@ -650,54 +721,56 @@ def _query_ollama(prompt: str) -> Optional[str]:
     responses.  The chat API with think=False avoids this.
     """
     try:
-        if _httpx is None:
+        client = _provider_client("ollama")
+        if client is None:
             log_debug("advisory_synth", "HTTPX_MISSING_OLLAMA", None)
             return None
-        with _httpx.Client(timeout=AI_TIMEOUT_S) as client:
-            resp = client.post(
-                f"{OLLAMA_API}/api/chat",
-                json={
-                    "model": OLLAMA_MODEL,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "stream": False,
-                    "think": False,  # Disable thinking for Qwen3 models
-                    "options": {
-                        "temperature": 0.3,
-                        "num_predict": 100,  # 1-3 sentences ~ 40-80 tokens
-                    },
+        resp = client.post(
+            f"{OLLAMA_API}/api/chat",
+            json={
+                "model": OLLAMA_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": False,
+                "think": False,  # Disable thinking for Qwen3 models
+                "options": {
+                    "temperature": 0.3,
+                    "num_predict": 100,  # 1-3 sentences ~ 40-80 tokens
                 },
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                msg = data.get("message", {})
-                return msg.get("content", "").strip()
+            },
+            timeout=_call_timeout(timeout_s),
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            msg = data.get("message", {})
+            return msg.get("content", "").strip()
     except Exception as e:
         log_debug("advisory_synth", "Ollama query failed", e)
     return None
 
 
-def _query_openai(prompt: str) -> Optional[str]:
+def _query_openai(prompt: str, *, timeout_s: Optional[float] = None) -> Optional[str]:
     """Query OpenAI API."""
     if not OPENAI_API_KEY:
         return None
     try:
-        if _httpx is None:
+        client = _provider_client("openai")
+        if client is None:
             log_debug("advisory_synth", "HTTPX_MISSING_OPENAI", None)
             return None
-        with _httpx.Client(timeout=AI_TIMEOUT_S) as client:
-            resp = client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
-                json={
-                    "model": OPENAI_MODEL,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": 200,
-                    "temperature": 0.3,
-                },
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                return data["choices"][0]["message"]["content"].strip()
+        resp = client.post(
+            f"{OPENAI_BASE_URL}/chat/completions",
+            headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+            json={
+                "model": OPENAI_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": 200,
+                "temperature": 0.3,
+            },
+            timeout=_call_timeout(timeout_s),
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            return data["choices"][0]["message"]["content"].strip()
     except Exception as e:
         log_debug("advisory_synth", "OpenAI query failed", e)
     return None
@@ -710,106 +783,102 @@ def _query_minimax(
     if not MINIMAX_API_KEY:
         return None
     try:
-        if _httpx is None:
+        client = _provider_client("minimax")
+        if client is None:
             log_debug("advisory_synth", "HTTPX_MISSING_MINIMAX", None)
             return None
         chosen_model = str(model).strip() if str(model or "").strip() else MINIMAX_MODEL
-        try:
-            timeout = float(timeout_s)
-            if timeout <= 0:
-                timeout = AI_TIMEOUT_S
-        except Exception:
-            timeout = AI_TIMEOUT_S
-
-        with _httpx.Client(timeout=timeout) as client:
-            want_json = "return only json" in str(prompt or "").strip().lower()
-            resp = client.post(
-                f"{MINIMAX_BASE_URL}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {MINIMAX_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": chosen_model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    # MiniMax M2.5 uses extended thinking that consumes ~1000 tokens
-                    # before the actual response; budget must accommodate both.
-                    "max_tokens": 2000 if want_json else 1500,
-                    "temperature": 0.2 if want_json else 0.3,
-                    **({"response_format": {"type": "json_object"}} if want_json else {}),
-                },
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                choices = data.get("choices", [])
-                if choices:
-                    msg = choices[0].get("message", {})
-                    content = msg.get("content", "")
-                    if isinstance(content, str):
-                        return content.strip()
+        want_json = "return only json" in str(prompt or "").strip().lower()
+        resp = client.post(
+            f"{MINIMAX_BASE_URL}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {MINIMAX_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": chosen_model,
+                "messages": [{"role": "user", "content": prompt}],
+                # MiniMax M2.5 uses extended thinking that consumes ~1000 tokens
+                # before the actual response; budget must accommodate both.
+                "max_tokens": 2000 if want_json else 1500,
+                "temperature": 0.2 if want_json else 0.3,
+                **({"response_format": {"type": "json_object"}} if want_json else {}),
+            },
+            timeout=_call_timeout(timeout_s),
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            choices = data.get("choices", [])
+            if choices:
+                msg = choices[0].get("message", {})
+                content = msg.get("content", "")
+                if isinstance(content, str):
+                    return content.strip()
     except Exception as e:
         log_debug("advisory_synth", "MiniMax query failed", e)
     return None
 
 
-def _query_anthropic(prompt: str) -> Optional[str]:
+def _query_anthropic(prompt: str, *, timeout_s: Optional[float] = None) -> Optional[str]:
     """Query Anthropic API."""
     if not ANTHROPIC_API_KEY:
         return None
     try:
-        if _httpx is None:
+        client = _provider_client("anthropic")
+        if client is None:
             log_debug("advisory_synth", "HTTPX_MISSING_ANTHROPIC", None)
             return None
-        with _httpx.Client(timeout=AI_TIMEOUT_S) as client:
-            resp = client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": ANTHROPIC_API_KEY,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": ANTHROPIC_MODEL,
-                    "max_tokens": 200,
-                    "messages": [{"role": "user", "content": prompt}],
-                },
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                content = data.get("content", [])
-                if content:
-                    return content[0].get("text", "").strip()
+        resp = client.post(
+            f"{ANTHROPIC_BASE_URL}/messages",
+            headers={
+                "x-api-key": ANTHROPIC_API_KEY,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+            json={
+                "model": ANTHROPIC_MODEL,
+                "max_tokens": 200,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+            timeout=_call_timeout(timeout_s),
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            content = data.get("content", [])
+            if content:
+                return content[0].get("text", "").strip()
     except Exception as e:
         log_debug("advisory_synth", "Anthropic query failed", e)
     return None
 
 
-def _query_gemini(prompt: str) -> Optional[str]:
+def _query_gemini(prompt: str, *, timeout_s: Optional[float] = None) -> Optional[str]:
     """Query Google Gemini API."""
     if not GEMINI_API_KEY:
         return None
     try:
-        if _httpx is None:
+        client = _provider_client("gemini")
+        if client is None:
             log_debug("advisory_synth", "HTTPX_MISSING_GEMINI", None)
             return None
-        with _httpx.Client(timeout=AI_TIMEOUT_S) as client:
-            resp = client.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent?key={GEMINI_API_KEY}",
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "temperature": 0.3,
-                        "maxOutputTokens": 200,
-                    },
+        resp = client.post(
+            f"{GEMINI_BASE_URL}/models/{GEMINI_MODEL}:generateContent?key={GEMINI_API_KEY}",
+            json={
+                "contents": [{"parts": [{"text": prompt}]}],
+                "generationConfig": {
+                    "temperature": 0.3,
+                    "maxOutputTokens": 200,
                 },
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                candidates = data.get("candidates", [])
-                if candidates:
-                    parts = candidates[0].get("content", {}).get("parts", [])
-                    if parts:
-                        return parts[0].get("text", "").strip()
+            },
+            timeout=_call_timeout(timeout_s),
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            candidates = data.get("candidates", [])
+            if candidates:
+                parts = candidates[0].get("content", {}).get("parts", [])
+                if parts:
+                    return parts[0].get("text", "").strip()
     except Exception as e:
         log_debug("advisory_synth", "Gemini query failed", e)
     return None
@@ -849,13 +918,13 @@ def synthesize(
 
     mode = _sanitize_mode(force_mode) if force_mode else SYNTH_MODE
 
-    # Check cache first
-    cache_key = _make_cache_key(advice_items, phase, user_intent, tool_name)
-    cached = _synth_cache.get(cache_key)
-    if cached:
-        result, ts = cached
-        if time.time() - ts < CACHE_TTL_S:
-            return result
+    # Check cache first. Mode is part of the key: processes sharing the cache
+    # may run with different modes (e.g. force_mode="programmatic").
+    cache_key = f"{mode}:{_make_cache_key(advice_items, phase, user_intent, tool_name)}"
+    if CACHE_TTL_S > 0:
+        cached = _synth_cache().get(cache_key, CACHE_TTL_S)
+        if cached:
+            return cached
 
     result = ""
 
@@ -873,13 +942,9 @@ def synthesize(
             # Fall back to programmatic
             result = synthesize_programmatic(advice_items, phase, user_intent, tool_name)
 
-    # Cache result
-    if result:
-        _synth_cache[cache_key] = (result, time.time())
-        # Keep cache bounded
-        if len(_synth_cache) > MAX_CACHE_ENTRIES:
-            oldest = min(_synth_cache, key=lambda k: _synth_cache[k][1])
-            _synth_cache.pop(oldest, None)
+    # Cache result (TTL + LRU bounded by MAX_CACHE_ENTRIES)
+    if result and CACHE_TTL_S > 0:
+        _synth_cache().put(cache_key, result, ttl_s=CACHE_TTL_S, max_entries=MAX_CACHE_ENTRIES)
 
     # Soul-upgrade metrics hook (lightweight, best-effort)
     try:
@@ -924,10 +989,10 @@ def check_ai_available() -> Dict[str, bool]:
 
     # Quick Ollama check
     try:
-        if _httpx is not None:
-            with _httpx.Client(timeout=1.5) as client:
-                resp = client.get(f"{OLLAMA_API}/api/tags")
-                available["ollama"] = resp.status_code == 200
+        client = _provider_client("ollama")
+        if client is not None:
+            resp = client.get(f"{OLLAMA_API}/api/tags", timeout=1.5)
+            available["ollama"] = resp.status_code == 200
     except Exception:
         pass
 
@@ -939,6 +1004,7 @@ def get_synth_status() -> Dict[str, Any]:
     _refresh_synth_config()
     ai = check_ai_available()
     any_ai = any(ai.values())
+    cache_stats = _synth_cache().stats()
     return {
         "mode": SYNTH_MODE,
         "ai_timeout_s": AI_TIMEOUT_S,
@@ -951,7 +1017,8 @@ def get_synth_status() -> Dict[str, Any]:
         "providers": ai,
         "tier": 2 if any_ai else 1,
         "tier_label": "AI-Enhanced" if any_ai else "Programmatic",
-        "cache_size": len(_synth_cache),
+        "cache_size": cache_stats["entries"],
+        "cache": cache_stats,
         "ollama_model": OLLAMA_MODEL if ai.get("ollama") else None,
         "minimax_model": MINIMAX_MODEL,
     }
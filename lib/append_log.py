@@ -0,0 +1,486 @@
+"""Segmented append-only JSONL logs with a sidecar line index.
+
+A log at ``path`` (e.g. ``~/.spark/outcomes.jsonl``) is a chain of segments:
+
+- ``path`` itself is the active segment. Writers append here, and code that
+  opens the file directly keeps working (it sees the newest segment).
+- ``<name>.segments/NNNNNNNN.jsonl`` are sealed older segments, oldest first.
+
+Every segment has a sidecar ``<segment>.idx`` of fixed 16-byte records, one
+per line: the byte offset just past the line and its timestamp (the row's
+``ts_key`` when numeric, else the append time; kept non-decreasing). From the
+index alone:
+
+- exact line counts are index sizes / 16 (one stat per segment, no scan)
+- the last k lines are one seek into the data (O(k))
+- "rows since ts" is a binary search over the records
+- retention drops whole sealed segments instead of rewriting the log
+
+Writers append under the ``<path>.lock`` file lock, index lines that were
+appended to the file directly, and seal the active segment once it reaches
+``segment_bytes`` or ``segment_lines``. Readers never write: lines missing
+from an index (direct appends, legacy files without a sidecar) are counted
+and parsed from the data on the fly. Everything is best-effort: read errors
+yield empty results, write errors are logged and reported as False / 0. Logs
+created with ``fail_open=False`` raise TimeoutError when the lock cannot be
+taken instead of appending unlocked.
+
+``update(fn)`` rewrites matching rows in place, in every segment, under the
+same lock; untouched lines keep their bytes and index timestamps.
+
+Retention keeps at least ``max_lines`` lines (and at most about one extra
+segment), so a capped log never loses rows it was asked to keep.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .diagnostics import log_debug
+from .file_lock import file_lock_for
+
+_RECORD = struct.Struct("<Qd")  # (end offset, ts)
+RECORD_SIZE = _RECORD.size
+
+DEFAULT_SEGMENT_BYTES = 1024 * 1024
+SEGMENT_SUFFIX = ".segments"
+
+
+def _idx_path(segment: Path) -> Path:
+    return segment.with_name(segment.name + ".idx")
+
+
+def _row_ts(row: Any, ts_key: str) -> Optional[float]:
+    if not isinstance(row, dict):
+        return None
+    value = row.get(ts_key)
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+        return float(value)
+    return None
+
+
+def _decode(line: bytes) -> str:
+    return line.decode("utf-8", errors="replace").rstrip("\r")
+
+
+class _Segment:
+    """Read-only view of one segment: indexed records plus lines appended past them."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.idx = _idx_path(path)
+        self.size = 0
+        self.indexed = 0  # records usable from the sidecar
+        self.end = 0  # data offset just past the last indexed line
+        self.last_ts = 0.0
+        try:
+            self.size = path.stat().st_size
+        except OSError:
+            return
+        try:
+            records = self.idx.stat().st_size // RECORD_SIZE
+        except OSError:
+            records = 0
+        if records:
+            end, ts = self.record(records - 1)
+            if 0 < end <= self.size and self._byte_at(end - 1) == b"\n":
+                self.indexed, self.end, self.last_ts = records, end, ts
+            # otherwise the data was rewritten under the index: treat as unindexed
+
+    def _byte_at(self, offset: int) -> bytes:
+        try:
+            with self.path.open("rb") as f:
+                f.seek(offset)
+                return f.read(1)
+        except OSError:
+            return b""
+
+    def record(self, i: int) -> Tuple[int, float]:
+        with self.idx.open("rb") as f:
+            f.seek(i * RECORD_SIZE)
+            return _RECORD.unpack(f.read(RECORD_SIZE))
+
+    def read(self, start: int, stop: int) -> bytes:
+        if stop <= start:
+            return b""
+        with self.path.open("rb") as f:
+            f.seek(start)
+            return f.read(stop - start)
+
+    def unindexed(self) -> List[bytes]:
+        """Complete lines after the indexed region (a trailing partial line is skipped)."""
+        if self.size <= self.end:
+            return []
+        data = self.read(self.end, self.size)
+        cut = data.rfind(b"\n")
+        return data[:cut].split(b"\n") if cut >= 0 else []
+
+    def indexed_lines(self, first: int) -> List[bytes]:
+        """Indexed lines from record ``first`` on."""
+        if first >= self.indexed:
+            return []
+        start = self.record(first - 1)[0] if first > 0 else 0
+        data = self.read(start, self.end)
+        return data[:-1].split(b"\n") if data else []
+
+    def count(self) -> int:
+        if self.size <= self.end:
+            return self.indexed
+        return self.indexed + self.read(self.end, self.size).count(b"\n")
+
+    def first_since(self, ts: float) -> int:
+        """Index of the first record with ts >= ``ts`` (binary search)."""
+        lo, hi = 0, self.indexed
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.record(mid)[1] < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class AppendLog:
+    """A segmented JSONL log at ``path``; cheap to construct (no I/O until used)."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_lines: int = 0,
+        max_bytes: int = 0,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        segment_lines: Optional[int] = None,
+        ts_key: str = "ts",
+        ensure_ascii: bool = True,
+        fail_open: bool = True,
+    ):
+        self.path = Path(path)
+        self.max_lines = max(0, int(max_lines or 0))
+        self.max_bytes = max(0, int(max_bytes or 0))
+        self.segment_bytes = max(1, int(segment_bytes))
+        if segment_lines is None:
+            segment_lines = max(1, self.max_lines // 4) if self.max_lines else 0
+        self.segment_lines = max(0, int(segment_lines))
+        self.ts_key = ts_key
+        self.ensure_ascii = ensure_ascii
+        self.fail_open = fail_open
+        self.segment_dir = self.path.with_name(self.path.name + SEGMENT_SUFFIX)
+
+    # ---- layout ----
+
+    def _sealed_paths(self) -> List[Path]:
+        try:
+            return sorted(p for p in self.segment_dir.iterdir() if p.suffix == ".jsonl")
+        except OSError:
+            return []
+
+    def segments(self) -> List[Path]:
+        """Segment files oldest first (the active one last, if present)."""
+        out = self._sealed_paths()
+        if self.path.exists():
+            out.append(self.path)
+        return out
+
+    def exists(self) -> bool:
+        return bool(self.segments())
+
+    # ---- reads ----
+
+    def count(self) -> int:
+        """Exact number of lines across all segments."""
+        try:
+            return sum(_Segment(p).count() for p in self.segments())
+        except OSError:
+            return 0
+
+    def size_bytes(self) -> int:
+        total = 0
+        for p in self.segments():
+            try:
+                total += p.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def tail_lines(self, n: int) -> List[str]:
+        """Last ``n`` non-empty lines, oldest first."""
+        if n <= 0:
+            return []
+        out: List[bytes] = []
+        try:
+            for p in reversed(self.segments()):
+                seg = _Segment(p)
+                lines = [ln for ln in seg.unindexed() if ln.strip()]
+                need = n - len(out) - len(lines)
+                if need > 0 and seg.indexed:
+                    first = max(0, seg.indexed - need)
+                    lines = [ln for ln in seg.indexed_lines(first) if ln.strip()] + lines
+                out = lines + out
+                if len(out) >= n:
+                    break
+        except OSError:
+            pass
+        return [_decode(ln) for ln in out[-n:]]
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """Last ``n`` rows (JSON objects), oldest first; bad lines are skipped."""
+        return _parse(self.tail_lines(n))
+
+    def since(self, ts: float, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rows indexed at or after ``ts``, oldest first (newest ``limit`` if given)."""
+        rows: List[Dict[str, Any]] = []
+        try:
+            for p in self.segments():
+                seg = _Segment(p)
+                if seg.indexed and seg.last_ts >= ts:
+                    rows.extend(_parse(seg.indexed_lines(seg.first_since(ts))))
+                for row in _parse(seg.unindexed()):
+                    row_ts = _row_ts(row, self.ts_key)
+                    if row_ts is None or row_ts >= ts:
+                        rows.append(row)
+        except OSError:
+            pass
+        return rows[-limit:] if limit else rows
+
+    def iter_lines(self) -> Iterator[str]:
+        """Every non-empty line, oldest first."""
+        for p in self.segments():
+            try:
+                with p.open("rb") as f:
+                    for raw in f:
+                        if raw.strip() and raw.endswith(b"\n"):
+                            yield _decode(raw[:-1])
+            except OSError:
+                continue
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Every row (JSON object), oldest first."""
+        for line in self.iter_lines():
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(row, dict):
+                yield row
+
+    # ---- writes ----
+
+    def append(self, row: Dict[str, Any]) -> bool:
+        return self.append_many([row]) == 1
+
+    def append_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Append rows as JSON lines; returns rows written."""
+        encoded = []
+        for row in rows:
+            try:
+                encoded.append((json.dumps(row, ensure_ascii=self.ensure_ascii).encode("utf-8") + b"\n", _row_ts(row, self.ts_key)))
+            except (TypeError, ValueError) as e:
+                log_debug("append_log", f"unserializable row for {self.path.name}", e)
+        if not encoded:
+            return 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with file_lock_for(self.path, fail_open=self.fail_open):
+                seg = self._sync_index()
+                self._write(seg, encoded)
+                self._maybe_seal()
+            return len(encoded)
+        except TimeoutError:
+            raise  # only fail-closed logs get here
+        except Exception as e:
+            log_debug("append_log", f"append to {self.path} failed", e)
+            return 0
+
+    def update(self, fn: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]) -> int:
+        """Replace rows in place: ``fn(row)`` returns the new row, or None to keep it.
+
+        Every segment is scanned under the log lock and only segments with a
+        changed row are rewritten. Returns rows replaced.
+        """
+        try:
+            with file_lock_for(self.path, fail_open=self.fail_open):
+                return sum(self._rewrite_segment(p, fn) for p in self.segments())
+        except TimeoutError:
+            raise  # only fail-closed logs get here
+        except Exception as e:
+            log_debug("append_log", f"update of {self.path} failed", e)
+            return 0
+
+    def _rewrite_segment(self, path: Path, fn: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]) -> int:
+        """Apply ``fn`` to one segment and swap in new data + index (caller holds the lock)."""
+        seg = _Segment(path)
+        data = seg.read(0, seg.size)
+        cut = data.rfind(b"\n") + 1
+        lines, rest = data[:cut].split(b"\n")[:-1], data[cut:]  # keep a torn tail as-is
+        changed = 0
+        out: List[bytes] = []
+        for line in lines:
+            try:
+                row = json.loads(line)
+                new = fn(row) if isinstance(row, dict) else None
+            except Exception:
+                new = None
+            if new is not None:
+                line = json.dumps(new, ensure_ascii=self.ensure_ascii).encode("utf-8")
+                changed += 1
+            out.append(line)
+        if not changed:
+            return 0
+        try:
+            mtime = path.stat().st_mtime
+            old = [ts for _, ts in _RECORD.iter_unpack(seg.idx.read_bytes()[: seg.indexed * RECORD_SIZE])]
+        except OSError:
+            mtime, old = time.time(), []
+        offset, last_ts, records = 0, 0.0, []
+        for i, line in enumerate(out):
+            offset += len(line) + 1
+            if i < len(old):
+                ts = old[i]
+            else:
+                try:
+                    ts = _row_ts(json.loads(line), self.ts_key)
+                except Exception:
+                    ts = None
+            last_ts = max(last_ts, ts if ts is not None else mtime)
+            records.append(_RECORD.pack(offset, last_ts))
+        tmp = path.with_name(path.name + ".tmp")
+        tmp_idx = _idx_path(tmp)
+        tmp.write_bytes(b"".join(line + b"\n" for line in out) + rest)
+        tmp_idx.write_bytes(b"".join(records))
+        # Drop the old index first: between the swaps readers parse the data unindexed.
+        try:
+            seg.idx.unlink()
+        except FileNotFoundError:
+            pass
+        os.replace(str(tmp), str(path))
+        os.replace(str(tmp_idx), str(seg.idx))
+        return changed
+
+    def _write(self, seg: _Segment, encoded: List[Tuple[bytes, Optional[float]]]) -> None:
+        offset = seg.size
+        payload = b"".join(line for line, _ in encoded)
+        now = time.time()
+        last_ts = seg.last_ts
+        records = []
+        if offset > seg.end:
+            # A crashed writer left a partial line: terminate it as its own line.
+            payload = b"\n" + payload
+            offset += 1
+            records.append(_RECORD.pack(offset, last_ts))
+        with self.path.open("ab") as f:
+            f.write(payload)
+        for line, ts in encoded:
+            offset += len(line)
+            last_ts = max(last_ts, ts if ts is not None else now)
+            records.append(_RECORD.pack(offset, last_ts))
+        with seg.idx.open("ab") as f:
+            f.write(b"".join(records))
+
+    def _sync_index(self) -> _Segment:
+        """Bring the active index up to date with the data (caller holds the lock)."""
+        seg = _Segment(self.path)
+        try:
+            idx_size = seg.idx.stat().st_size
+        except OSError:
+            idx_size = 0
+        if idx_size != seg.indexed * RECORD_SIZE:
+            # Stale (data rewritten underneath) or torn index: rebuild from the data.
+            seg.idx.write_bytes(b"")
+            seg.indexed, seg.end, seg.last_ts = 0, 0, 0.0
+        if seg.size > seg.end:
+            data = seg.read(seg.end, seg.size)
+            cut = data.rfind(b"\n")
+            if cut >= 0:
+                try:
+                    mtime = self.path.stat().st_mtime
+                except OSError:
+                    mtime = time.time()
+                offset, last_ts, records_out = seg.end, seg.last_ts, []
+                for line in data[:cut].split(b"\n"):
+                    offset += len(line) + 1
+                    try:
+                        ts = _row_ts(json.loads(line), self.ts_key)
+                    except Exception:
+                        ts = None
+                    last_ts = max(last_ts, ts if ts is not None else mtime)
+                    records_out.append(_RECORD.pack(offset, last_ts))
+                with seg.idx.open("ab") as f:
+                    f.write(b"".join(records_out))
+                seg.indexed += len(records_out)
+                seg.end, seg.last_ts = offset, last_ts
+        return seg
+
+    def _maybe_seal(self) -> None:
+        seg = _Segment(self.path)
+        full = seg.size >= self.segment_bytes or (self.segment_lines and seg.indexed >= self.segment_lines)
+        if not full or seg.size != seg.end:
+            return
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        sealed = self._sealed_paths()
+        seq = int(sealed[-1].stem) + 1 if sealed else 1
+        target = self.segment_dir / f"{seq:08d}.jsonl"
+        os.replace(str(seg.idx), str(_idx_path(target)))
+        os.replace(str(self.path), str(target))
+        self._enforce_retention()
+
+    def _enforce_retention(self) -> None:
+        if not self.max_lines and not self.max_bytes:
+            return
+        sealed = [(p, _Segment(p)) for p in self._sealed_paths()]
+        total_lines = sum(s.count() for _, s in sealed)
+        total_bytes = sum(s.size for _, s in sealed)
+        active = _Segment(self.path)
+        total_lines += active.count()
+        total_bytes += active.size
+        # Always keep the newest data: the last sealed segment stays while the active one is empty.
+        for p, seg in (sealed if active.size else sealed[:-1]):
+            lines, size = seg.count(), seg.size
+            over_lines = self.max_lines and total_lines - lines >= self.max_lines
+            over_bytes = self.max_bytes and total_bytes - size >= self.max_bytes
+            if not (over_lines or over_bytes):
+                break
+            for target in (p, _idx_path(p)):
+                try:
+                    target.unlink()
+                except FileNotFoundError:
+                    pass
+            total_lines -= lines
+            total_bytes -= size
+
+    def clear(self) -> None:
+        """Delete every segment and index."""
+        with file_lock_for(self.path):
+            for p in self.segments():
+                for target in (p, _idx_path(p)):
+                    try:
+                        target.unlink()
+                    except FileNotFoundError:
+                        pass
+
+
+def _parse(lines: Iterable[Any]) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for line in lines:
+        try:
+            row = json.loads(line)
+        except Exception:
+            continue
+        if isinstance(row, dict):
+            out.append(row)
+    return out
+
+
+def count_lines(path: Path) -> int:
+    """Exact line count of a (possibly segmented) JSONL log."""
+    return AppendLog(path).count()
+
+
+def tail_rows(path: Path, n: int) -> List[Dict[str, Any]]:
+    """Last ``n`` rows of a (possibly segmented) JSONL log, oldest first."""
+    return AppendLog(path).tail(n)
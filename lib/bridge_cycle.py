@@ -27,17 +27,22 @@ from lib.diagnostics import log_debug
 from lib.feature_flags import PREMIUM_TOOLS as _FF_PREMIUM
 from lib.feature_flags import chips_active as _ff_chips_active
 from lib.memory_capture import process_recent_memory_events
+from lib.memory_store import maintain_ann_index
+from lib.noise_classifier import check, contains, is_noise, pattern, prefixes, register
 from lib.noise_patterns import API_ERROR_STRINGS, GENERIC_ADVICE_STRINGS
 from lib.openclaw_paths import discover_openclaw_workspaces
 from lib.opportunity_scanner_adapter import scan_runtime_opportunities
 from lib.pattern_detection import process_pattern_events
 from lib.prediction_loop import process_prediction_cycle
-from lib.queue import EventType, read_recent_events
+from lib.queue import EventType, load_cursor, read_events_from_cursor, save_cursor
 from lib.runtime_hygiene import cleanup_runtime_artifacts
 from lib.tastebank import add_item, parse_like_message
 from lib.validation_loop import process_outcome_validation, process_validation_events
 
 BRIDGE_HEARTBEAT_FILE = Path.home() / ".spark" / "bridge_worker_heartbeat.json"
+# Queue cursor for the fallback event batch (when the pipeline surfaces none).
+BRIDGE_CURSOR_NAME = "bridge_cycle"
+BRIDGE_FALLBACK_EVENTS = 40
 _reconcile_done = False
 
 # --- Defaults — overridden by config-authority resolution below ---
@@ -429,6 +434,14 @@ def run_bridge_cycle(
             stats["errors"].append("memory")
             log_debug("bridge_worker", f"memory capture failed ({error})", None)
 
+        # --- Memory ANN index: flagged (re)builds train here, off the write path ---
+        ok, ann_stats, error = _run_step("memory_ann", maintain_ann_index, timeout_s=60)
+        if ok:
+            stats["memory_ann"] = ann_stats or {}
+        else:
+            stats["errors"].append("memory_ann")
+            log_debug("bridge_worker", f"memory ANN maintenance failed ({error})", None)
+
         # --- Flush cognitive learner so memory-captured insights hit disk ---
         # Without this, batch mode defers all writes until the very end,
         # and any failure in later steps loses captured memories.
@@ -493,15 +506,12 @@ def run_bridge_cycle(
             # Release reference from metrics to prevent memory accumulation
             pipeline_metrics.processed_events = []
         else:
-            events = read_recent_events(40)
-            # Fallback: if the queue head advanced to EOF (no active bytes) but the
-            # pipeline didn't surface processed_events, downstream systems lose context.
-            if not events:
-                try:
-                    from lib.queue import read_recent_events_raw
-                    events = read_recent_events_raw(40)
-                except Exception:
-                    pass
+            # Only events this consumer has not seen yet, so chips, content
+            # learning and cognitive signals never re-process the same tail.
+            cursor = load_cursor(BRIDGE_CURSOR_NAME)
+            events, next_cursor = read_events_from_cursor(cursor, limit=BRIDGE_FALLBACK_EVENTS)
+            if next_cursor != cursor:
+                save_cursor(next_cursor)
 
         # --- Single-pass event classification ---
         # Instead of iterating events 5+ separate times, classify once
@@ -960,37 +970,33 @@ def _looks_like_raw_transcript(text: str) -> bool:
     return any(indicators)
 
 
-def _is_noise_insight(text: str) -> bool:
-    """Return True if insight is benchmark noise / not actionable."""
-    t = text.lower()
-    for pattern in _INSIGHT_NOISE_PATTERNS:
-        if pattern.lower() in t:
-            return True
+def _bridge_insight_fields(text: str) -> Dict[str, str]:
+    return {"raw": text, "t": text.strip(), "lower": text.lower()}
+
+
+register("bridge_insight", (
+    contains("benchmark_noise", (p.lower() for p in _INSIGHT_NOISE_PATTERNS), field="lower"),
     # Skip very short insights — too vague to be useful
-    if len(text.strip()) < 30:
-        return True
+    check("too_short", lambda f: len(f["t"]) < 30),
     # Skip raw transcript fragments
-    if _looks_like_raw_transcript(text):
-        return True
+    check("raw_transcript", lambda f: _looks_like_raw_transcript(f["raw"])),
     # Skip insights with code blocks — usually raw examples, not distilled wisdom
-    if "```" in text:
-        return True
+    contains("code_block", ("```",), field="raw"),
     # Skip insights that are just "Prefer X over Y" with raw data fragments
-    if text.startswith("Prefer '") and "over '" in text:
-        return True
+    prefixes("raw_preference", ("Prefer '",), field="raw", when=lambda f: "over '" in f["raw"]),
     # Skip "User prefers:" followed by very short/vague content
-    if text.startswith("User prefers:") and len(text) < 40:
-        return True
+    prefixes("short_preference", ("User prefers:",), field="raw", when=lambda f: len(f["raw"]) < 40),
     # Skip markdown tables and headers stored as insights
-    if text.strip().startswith("|") or text.strip().startswith("##"):
-        return True
-    # Skip docstrings/code stored as insights
-    if text.strip().startswith('"""') or text.strip().startswith("def ") or text.strip().startswith("class "):
-        return True
-    # Skip Python constants/assignments stored as insights
-    if re.match(r'^[A-Z_]+ = ', text.strip()):
-        return True
-    return False
+    prefixes("markdown", ("|", "##"), field="t"),
+    # Skip docstrings/code and Python constants/assignments stored as insights
+    prefixes("code_snippet", ('"""', "def ", "class "), field="t"),
+    pattern("code_snippet", r"^[A-Z_]+ = ", field="t"),
+), prepare=_bridge_insight_fields, empty="too_short")
+
+
+def _is_noise_insight(text: str) -> bool:
+    """Return True if insight is benchmark noise / not actionable."""
+    return is_noise(text, "bridge_insight")
 
 
 def _get_filtered_insights(limit: int = 10, source: str = "") -> list:
@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Optional
 import json
 import time
 
+from .append_log import AppendLog
+
 
 SPARK_DIR = Path.home() / ".spark"
 ADVISORY_LOG = SPARK_DIR / "advisory_engine.jsonl"
@@ -41,26 +43,11 @@ def _read_json(path: Path) -> Dict[str, Any]:
 
 
 def _read_jsonl(path: Path, limit: int = 0) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except Exception:
-        return []
+    """Last ``limit`` rows (all when 0) of a possibly segmented JSONL log."""
+    log = AppendLog(path)
     if limit and limit > 0:
-        lines = lines[-int(limit):]
-    rows: List[Dict[str, Any]] = []
-    for line in lines:
-        raw = (line or "").strip()
-        if not raw:
-            continue
-        try:
-            row = json.loads(raw)
-        except Exception:
-            continue
-        if isinstance(row, dict):
-            rows.append(row)
-    return rows
+        return log.tail(int(limit))
+    return list(log.iter_rows())
 
 
 def _count_advisory_events(rows: List[Dict[str, Any]], start_ts: float, end_ts: float) -> Dict[str, Any]:
@@ -7,13 +7,160 @@ which chips should process it?
 
 import re
 import logging
-from typing import Dict, List, Tuple, Any, Optional
+from collections import deque
+from typing import Dict, Iterable, List, Tuple, Any, Optional
 from dataclasses import dataclass
 
 from .loader import Chip, ChipObserver
 
 log = logging.getLogger("spark.chips")
 
+TriggerHit = Tuple[float, str]  # (confidence, snippet)
+
+
+def _normalize_trigger(trigger: Any) -> str:
+    return str(trigger or "").strip().lower()
+
+
+def _is_word_char(ch: str) -> bool:
+    # Same character class as the regex \w used by _match_trigger.
+    return ch.isalnum() or ch == "_"
+
+
+def _snippet(content: str, start: int, end: int) -> str:
+    return content[max(0, start - 20):min(len(content), end + 20)]
+
+
+class _TriggerAutomaton:
+    """Aho-Corasick automaton over normalized trigger strings.
+
+    One pass over the content finds every occurrence of every trigger
+    (including overlapping ones), which is then scored exactly like
+    ChipRouter._match_trigger: first word-bounded occurrence -> 0.95, else
+    first plain occurrence of a 4+ char trigger -> 0.7.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+        self.patterns = 0
+        for pattern in dict.fromkeys(p for p in patterns if p):
+            self._add(pattern)
+            self.patterns += 1
+        self._link()
+
+    @property
+    def states(self) -> int:
+        return len(self._goto)
+
+    def _add(self, pattern: str) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._out[state] = self._out[state] + (pattern,)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, content: str) -> Dict[str, TriggerHit]:
+        """Return {trigger: (confidence, snippet)} for every trigger that matches."""
+        goto, fail, out = self._goto, self._fail, self._out
+        first: Dict[str, int] = {}
+        bounded: Dict[str, int] = {}
+        n = len(content)
+        state = 0
+        for i, ch in enumerate(content):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            for pattern in out[state]:
+                if pattern in bounded:
+                    continue
+                start = i - len(pattern) + 1
+                if pattern not in first:
+                    first[pattern] = start
+                if (start == 0 or not _is_word_char(content[start - 1])) and (
+                    i + 1 >= n or not _is_word_char(content[i + 1])
+                ):
+                    bounded[pattern] = start
+
+        hits: Dict[str, TriggerHit] = {}
+        for pattern, start in first.items():
+            if pattern in bounded:
+                start = bounded[pattern]
+                hits[pattern] = (0.95, _snippet(content, start, start + len(pattern)))
+            elif len(pattern) >= 4:
+                hits[pattern] = (0.7, _snippet(content, start, start + len(pattern)))
+        return hits
+
+
+class _ChipPlan:
+    """Normalized content triggers of one chip, in _match_chip order."""
+
+    __slots__ = ("chip", "observer_triggers", "pattern_triggers", "terms")
+
+    def __init__(self, chip: Chip):
+        self.chip = chip
+        self.observer_triggers = [
+            (observer, trigger, _normalize_trigger(trigger))
+            for observer in chip.observers
+            for trigger in observer.triggers
+        ]
+        self.pattern_triggers = [
+            (trigger, _normalize_trigger(trigger))
+            for trigger in (getattr(chip, "trigger_patterns", None) or chip.triggers)
+        ]
+        terms = {t for _, _, t in self.observer_triggers} | {t for _, t in self.pattern_triggers}
+        for tool_trigger in getattr(chip, "trigger_tools", []) or []:
+            if isinstance(tool_trigger, dict):
+                terms.update(_normalize_trigger(p) for p in tool_trigger.get("context_contains", []) or [])
+        terms.discard("")
+        self.terms = frozenset(terms)
+
+
+class _CompiledTriggers:
+    """One automaton over every known chip's triggers, plus per-chip plans."""
+
+    def __init__(self, chips: Iterable[Chip]):
+        self.plans: Dict[Any, _ChipPlan] = {}
+        for chip in chips:
+            self.plans[_chip_key(chip)] = _ChipPlan(chip)
+        terms: set = set()
+        for plan in self.plans.values():
+            terms.update(plan.terms)
+        self.automaton = _TriggerAutomaton(sorted(terms))
+
+    def covers(self, chips: List[Chip]) -> bool:
+        for chip in chips:
+            plan = self.plans.get(_chip_key(chip))
+            if plan is None or plan.chip is not chip:
+                return False
+        return True
+
+
+def _chip_key(chip: Chip) -> Any:
+    return getattr(chip, "id", None) or id(chip)
+
 
 @dataclass
 class TriggerMatch:
@@ -31,8 +178,36 @@ class ChipRouter:
 
     When we see an Edit to "lobster-royale/src/main.js" containing
     "health", "damage", "physics", this routes to the game_dev chip.
+
+    Content triggers of all chips seen so far are compiled into a single
+    automaton that is scanned once per event. It is rebuilt only when a chip
+    it has not seen arrives (ChipLoader hands out new Chip objects whenever it
+    (re)loads a chip). use_automaton=False keeps the per-trigger regex path.
     """
 
+    def __init__(self, use_automaton: bool = True):
+        self.use_automaton = bool(use_automaton)
+        self._compiled: Optional[_CompiledTriggers] = None
+        self.compile_count = 0
+
+    def _compiled_for(self, chips: List[Chip]) -> _CompiledTriggers:
+        compiled = self._compiled
+        if compiled is not None and compiled.covers(chips):
+            return compiled
+        known: Dict[Any, Chip] = {}
+        if compiled is not None:
+            known.update((key, plan.chip) for key, plan in compiled.plans.items())
+        for chip in chips:
+            known[_chip_key(chip)] = chip
+        compiled = _CompiledTriggers(known.values())
+        self._compiled = compiled
+        self.compile_count += 1
+        log.debug(
+            "Compiled chip triggers: %d chips, %d patterns, %d states",
+            len(compiled.plans), compiled.automaton.patterns, compiled.automaton.states,
+        )
+        return compiled
+
     def route_event(self, event: Dict[str, Any], chips: List[Chip]) -> List[TriggerMatch]:
         """
         Route an event to matching chips.
@@ -52,8 +227,17 @@ class ChipRouter:
         self._current_event_type = self._normalize_event_type(raw_event_type)
         self._current_tool_name = str(raw_tool_name or "").strip().lower()
 
+        hits: Optional[Dict[str, TriggerHit]] = None
+        plans: Dict[Any, _ChipPlan] = {}
+        if self.use_automaton and chips:
+            compiled = self._compiled_for(chips)
+            hits = compiled.automaton.scan(content_lower)
+            plans = compiled.plans
+
         for chip in chips:
-            chip_matches = self._match_chip(chip, content_lower, content)
+            chip_matches = self._match_chip(
+                chip, content_lower, content, hits=hits, plan=plans.get(_chip_key(chip)),
+            )
             matches.extend(chip_matches)
 
         # Sort by confidence
@@ -138,10 +322,30 @@ class ChipRouter:
 
         return ' '.join(parts)
 
-    def _match_chip(self, chip: Chip, content_lower: str, content_raw: str) -> List[TriggerMatch]:
-        """Match content against a chip's triggers."""
+    def _match_chip(
+        self,
+        chip: Chip,
+        content_lower: str,
+        content_raw: str,
+        hits: Optional[Dict[str, TriggerHit]] = None,
+        plan: Optional[_ChipPlan] = None,
+    ) -> List[TriggerMatch]:
+        """Match content against a chip's triggers.
+
+        With `hits` (an automaton scan of the content) and the chip's `plan`,
+        content triggers are looked up instead of searched.
+        """
         matches = []
         seen_triggers = set()
+        if hits is not None and plan is not None:
+            lookup = hits.get
+        else:
+            lookup = None
+
+        def _match(trigger: str, normalized: Optional[str] = None) -> Optional[TriggerHit]:
+            if lookup is None:
+                return self._match_trigger(trigger, content_lower)
+            return lookup(_normalize_trigger(trigger) if normalized is None else normalized)
 
         # Event-type triggers (high confidence)
         event_type = self._current_event_type or ""
@@ -172,7 +376,7 @@ class ChipRouter:
 
             if tool_name and name.lower() == tool_name:
                 if context_patterns and context_patterns != ["*"]:
-                    if not any(self._match_trigger(p, content_lower) for p in context_patterns):
+                    if not any(_match(p) for p in context_patterns):
                         continue
                 trigger_label = f"tool:{name}"
                 seen_key = f"tool:{trigger_label}"
@@ -187,34 +391,41 @@ class ChipRouter:
                     content_snippet=name
                 ))
 
+        if lookup is not None:
+            if plan.terms.isdisjoint(hits):
+                return matches
+            observer_triggers = plan.observer_triggers
+            pattern_triggers = plan.pattern_triggers
+        else:
+            observer_triggers = [(o, t, None) for o in chip.observers for t in o.triggers]
+            pattern_triggers = [(t, None) for t in (getattr(chip, "trigger_patterns", None) or chip.triggers)]
+
         # Match observer-level triggers (higher confidence if observer-specific)
-        for observer in chip.observers:
-            for trigger in observer.triggers:
-                seen_key = f"observer:{observer.name}:{trigger}"
-                if seen_key in seen_triggers:
-                    continue
+        for observer, trigger, normalized in observer_triggers:
+            seen_key = f"observer:{observer.name}:{trigger}"
+            if seen_key in seen_triggers:
+                continue
 
-                match_result = self._match_trigger(trigger, content_lower)
-                if match_result:
-                    seen_triggers.add(seen_key)
-                    confidence, snippet = match_result
-                    # Boost confidence slightly for observer matches
-                    matches.append(TriggerMatch(
-                        chip=chip,
-                        observer=observer,
-                        trigger=trigger,
-                        confidence=min(1.0, confidence + 0.1),
-                        content_snippet=snippet
-                    ))
+            match_result = _match(trigger, normalized)
+            if match_result:
+                seen_triggers.add(seen_key)
+                confidence, snippet = match_result
+                # Boost confidence slightly for observer matches
+                matches.append(TriggerMatch(
+                    chip=chip,
+                    observer=observer,
+                    trigger=trigger,
+                    confidence=min(1.0, confidence + 0.1),
+                    content_snippet=snippet
+                ))
 
         # Match chip-level triggers
-        trigger_patterns = getattr(chip, "trigger_patterns", None) or chip.triggers
-        for trigger in trigger_patterns:
+        for trigger, normalized in pattern_triggers:
             seen_key = f"pattern:{trigger}"
             if seen_key in seen_triggers:
                 continue
 
-            match_result = self._match_trigger(trigger, content_lower)
+            match_result = _match(trigger, normalized)
             if match_result:
                 seen_triggers.add(seen_key)
                 confidence, snippet = match_result
@@ -14,6 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..append_log import AppendLog
 
 # Default paths
 SPARK_DIR = Path.home() / ".spark"
@@ -42,6 +43,12 @@ class ChipStore:
         self.predictions_file = self.base_dir / "predictions.jsonl"
         self.outcomes_file = self.base_dir / "outcomes.jsonl"
 
+        self._observations = AppendLog(
+            self.observations_file,
+            max_bytes=self.OBS_MAX_BYTES,
+            segment_bytes=self.OBS_MAX_BYTES // 4,
+        )
+
         # In-memory cache
         self._insights: Dict[str, Any] = {}
         self._load_insights()
@@ -69,7 +76,7 @@ class ChipStore:
         with open(self.insights_file, "w") as f:
             json.dump(self._insights, f, indent=2)
 
-    # Max observation file size before rotation (5 MB per chip)
+    # Max observation log size (5 MB per chip); whole 1/4-size segments are dropped past it
     OBS_MAX_BYTES = 5 * 1024 * 1024
 
     def add_observation(self, observation) -> None:
@@ -85,51 +92,17 @@ class ChipStore:
             data = observation
 
         data["stored_at"] = datetime.utcnow().isoformat()
-
-        # Rotate if observations file is too large
-        if self.observations_file.exists():
-            try:
-                if self.observations_file.stat().st_size > self.OBS_MAX_BYTES:
-                    self._rotate_jsonl(self.observations_file)
-            except Exception:
-                pass
-
-        with open(self.observations_file, "a") as f:
-            f.write(json.dumps(data) + "\n")
-
-    def _rotate_jsonl(self, path: Path) -> None:
-        """Rotate a JSONL file by keeping only the last ~25% of data."""
-        try:
-            size = path.stat().st_size
-            keep_bytes = self.OBS_MAX_BYTES // 4
-            if size <= keep_bytes:
-                return
-            with open(path, 'rb') as f:
-                f.seek(max(0, size - keep_bytes))
-                f.readline()  # skip partial line
-                tail = f.read()
-            tmp = path.with_suffix('.jsonl.tmp')
-            with open(tmp, 'wb') as f:
-                f.write(tail)
-            tmp.replace(path)
-        except Exception:
-            pass
+        self._observations.append(data)
 
     def get_observations(self, limit: int = 100, observer_name: Optional[str] = None) -> List[Dict]:
         """Get recent observations."""
-        if not self.observations_file.exists():
-            return []
+        if not observer_name:
+            return self._observations.tail(limit)
 
-        observations = []
-        with open(self.observations_file, "r") as f:
-            for line in f:
-                try:
-                    obs = json.loads(line.strip())
-                    if observer_name and obs.get("observer_name") != observer_name:
-                        continue
-                    observations.append(obs)
-                except Exception:
-                    pass
+        observations = [
+            obs for obs in self._observations.iter_rows()
+            if obs.get("observer_name") == observer_name
+        ]
 
         # Return most recent
         return observations[-limit:]
@@ -268,10 +241,7 @@ class ChipStore:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get store statistics."""
-        obs_count = 0
-        if self.observations_file.exists():
-            with open(self.observations_file, "r") as f:
-                obs_count = sum(1 for _ in f)
+        obs_count = self._observations.count()
 
         pred_count = 0
         if self.predictions_file.exists():
@@ -295,7 +265,8 @@ class ChipStore:
 
     def clear(self) -> None:
         """Clear all data for this chip."""
-        for f in [self.observations_file, self.predictions_file, self.outcomes_file]:
+        self._observations.clear()
+        for f in [self.predictions_file, self.outcomes_file]:
             if f.exists():
                 f.unlink()
 
@@ -17,16 +17,23 @@ Learning Categories:
 8. CREATIVITY - Novel problem-solving approaches
 """
 
+import heapq
 import json
 import logging
 import os
 import re
+import sqlite3
+import threading
 import time
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from lib.insight_store import InsightStore
+from lib.noise_classifier import check, contains, is_noise, keyword_regex, pattern, prefixes, register
 
 INSIGHT_CONTEXT_CHARS = 320
 INSIGHT_EVIDENCE_CHARS = 280
@@ -371,6 +378,332 @@ def _flatten_evidence(items: List[Any]) -> List[str]:
     return out
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except Exception:
+        return default
+
+
+def _insight_signature(insight: "CognitiveInsight") -> int:
+    """Cheap change-detection fingerprint for an in-memory insight."""
+    fields = (
+        insight.category, insight.insight, insight.context, insight.confidence,
+        insight.created_at, insight.times_validated, insight.times_contradicted,
+        insight.promoted, insight.promoted_to, insight.last_validated_at,
+        insight.source, insight.action_domain, insight.advisory_readiness,
+    )
+    try:
+        return hash((fields, tuple(insight.evidence), tuple(insight.counter_examples)))
+    except TypeError:
+        return hash((fields, repr(insight.evidence), repr(insight.counter_examples)))
+
+
+# Stopwords to skip in word-matching (common words that cause false matches)
+_RETRIEVAL_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "from", "this", "that", "used", "have",
+    "been", "were", "was", "are", "not", "but", "its", "into", "also",
+    "more", "than", "can", "all", "had", "has", "will", "each", "which",
+    "their", "them", "then", "when", "what", "how", "about", "would",
+    "make", "like", "just", "over", "such", "take", "only", "come",
+    "could", "after", "use", "two", "way", "our", "out", "get", "may",
+    "cycle", "summary", "summary:", "times", "across", "uses", "success",
+    "100%", "had", "session", "session(s)", "consecutive", "failures",
+})
+_RETRIEVAL_STRIP = ".,;:!?()'\""
+_RETRIEVAL_SUFFIXES = (
+    "tion", "sion", "ment", "ness", "able", "ible", "ying", "ling", "ting", "ning", "ring", "ding",
+    "ling", "ing", "ied", "ies", "ted", "ely", "ful", "ous", "ive", "ity", "ize", "ise", "ers", "ure",
+    "ual", "ial", "ent", "ant", "ist", "ism", "age", "ary", "ory", "ery", "lly", "ily", "ed", "ly", "er", "es",
+)
+
+
+def _retrieval_stem(w: str) -> str:
+    """Basic suffix stemming for better recall."""
+    for sfx in _RETRIEVAL_SUFFIXES:
+        if w.endswith(sfx) and len(w) - len(sfx) >= 3:
+            return w[:-len(sfx)]
+    return w
+
+
+def _retrieval_words(text_lower: str, max_words: Optional[int] = None) -> set:
+    """Meaningful (4+ chars, non-stopword) words of already-lowercased text."""
+    words = text_lower.split()
+    if max_words is not None:
+        words = words[:max_words]
+    return set(
+        w.rstrip(_RETRIEVAL_STRIP) for w in words
+        if len(w) >= 4 and w.rstrip(_RETRIEVAL_STRIP) not in _RETRIEVAL_STOPWORDS
+    )
+
+
+class _ContextEntry:
+    """Query-independent retrieval data for one insight."""
+
+    __slots__ = ("text", "context", "ready", "ic", "ii", "words", "stems")
+
+    def __init__(self, insight: Any, is_noise: Callable[[str], bool]):
+        self.text = insight.insight or ""
+        self.context = insight.context or ""
+        # Cycle summaries and noise are never retrievable.
+        self.ready = not self.text.startswith("Cycle summary:") and not is_noise(self.text)
+        self.ic = self.context.lower()
+        self.ii = self.text.lower()
+        # Scan the first 30 words of the insight text for word matching.
+        self.words = frozenset(_retrieval_words(self.ii, 30)) if self.ready else frozenset()
+        self.stems = frozenset(_retrieval_stem(w) for w in self.words)
+
+    def matches(self, insight: Any) -> bool:
+        return self.text == (insight.insight or "") and self.context == (insight.context or "")
+
+
+_CONTEXT_HEAD_CHARS = 8
+_CONTEXT_GRAM_CHARS = 3
+
+
+def _token_grams(token: str) -> set:
+    n = _CONTEXT_GRAM_CHARS
+    return {token[i:i + n] for i in range(len(token) - n + 1)}
+
+
+class _InsightTermIndex:
+    """Stemmed term -> insight keys, plus context strings for direct hits.
+
+    A direct hit is a context that is a substring of the query or contains
+    it. Contexts are indexed both ways so a query only probes its own text:
+    by their first few characters (found by sliding over the query), and by
+    their whitespace tokens, whose character trigrams point back at the
+    tokens (a query inside a context shares every trigram of its tokens).
+
+    Entries are built from an insight's text and context and rebuilt whenever
+    either changes. The insight map reports puts/deletes; saves report keys
+    that were edited in place. Guarded by a lock: advisor sources may query
+    from worker threads.
+    """
+
+    def __init__(self, is_noise: Callable[[str], bool]):
+        self._is_noise = is_noise
+        self._lock = threading.RLock()
+        self._built = False
+        self._entries: Dict[str, _ContextEntry] = {}
+        self._postings: Dict[str, set] = {}
+        self._contexts: Dict[str, set] = {}  # lowercased context -> keys
+        self._heads: Dict[str, set] = {}  # context[:_CONTEXT_HEAD_CHARS] -> contexts
+        self._head_sizes: Dict[int, int] = {}  # head length -> number of heads
+        self._context_terms: Dict[str, set] = {}  # context token -> contexts
+        self._term_grams: Dict[str, set] = {}  # token trigram -> context tokens
+        self._order: Dict[str, int] = {}  # key -> insertion position (ties keep map order)
+        self._next = 0
+        self._stale: set = set()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if self._built:
+                self._stale.add(key)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            if self._built:
+                self._remove(key)
+                self._order.pop(key, None)
+                self._stale.discard(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for stem in entry.stems:
+            keys = self._postings.get(stem)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[stem]
+        if entry.ready and entry.ic:
+            keys = self._contexts.get(entry.ic)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._contexts[entry.ic]
+                    self._unlink_context(entry.ic)
+
+    def _add(self, key: str, insight: Any) -> _ContextEntry:
+        entry = _ContextEntry(insight, self._is_noise)
+        self._entries[key] = entry
+        if key not in self._order:
+            self._order[key] = self._next
+            self._next += 1
+        for stem in entry.stems:
+            self._postings.setdefault(stem, set()).add(key)
+        if entry.ready and entry.ic:
+            keys = self._contexts.get(entry.ic)
+            if keys is None:
+                keys = self._contexts[entry.ic] = set()
+                self._link_context(entry.ic)
+            keys.add(key)
+        return entry
+
+    def _link_context(self, ic: str) -> None:
+        head = ic[:_CONTEXT_HEAD_CHARS]
+        heads = self._heads.get(head)
+        if heads is None:
+            heads = self._heads[head] = set()
+            self._head_sizes[len(head)] = self._head_sizes.get(len(head), 0) + 1
+        heads.add(ic)
+        for token in set(ic.split()):
+            contexts = self._context_terms.get(token)
+            if contexts is None:
+                contexts = self._context_terms[token] = set()
+                for gram in _token_grams(token):
+                    self._term_grams.setdefault(gram, set()).add(token)
+            contexts.add(ic)
+
+    def _unlink_context(self, ic: str) -> None:
+        head = ic[:_CONTEXT_HEAD_CHARS]
+        heads = self._heads.get(head)
+        if heads is not None:
+            heads.discard(ic)
+            if not heads:
+                del self._heads[head]
+                self._head_sizes[len(head)] -= 1
+                if not self._head_sizes[len(head)]:
+                    del self._head_sizes[len(head)]
+        for token in set(ic.split()):
+            contexts = self._context_terms.get(token)
+            if contexts is None:
+                continue
+            contexts.discard(ic)
+            if contexts:
+                continue
+            del self._context_terms[token]
+            for gram in _token_grams(token):
+                tokens = self._term_grams.get(gram)
+                if tokens is not None:
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._term_grams[gram]
+
+    def _direct_contexts(self, context_lower: str) -> set:
+        """Indexed contexts ``ic`` with ``ic in context_lower or context_lower in ic``."""
+        found: set = set()
+        # Contexts inside the query: their head is one of the query's windows.
+        end = len(context_lower)
+        for size in self._head_sizes:
+            for i in range(end - size + 1):
+                heads = self._heads.get(context_lower[i:i + size])
+                if heads:
+                    found.update(ic for ic in heads if ic in context_lower)
+        # Contexts containing the query: one of their tokens holds the query's
+        # rarest trigram. Queries without a 3-character run scan the contexts.
+        grams = set()
+        for token in context_lower.split():
+            grams |= _token_grams(token)
+        if grams:
+            tokens = min((self._term_grams.get(gram, ()) for gram in grams), key=len)
+            pool = set()
+            for token in tokens:
+                pool |= self._context_terms[token]
+        else:
+            pool = self._contexts.keys()
+        found.update(ic for ic in pool if context_lower in ic)
+        return found
+
+    def entry(self, key: str, insight: Any) -> _ContextEntry:
+        entry = self._entries.get(key)
+        if entry is None or not entry.matches(insight):
+            with self._lock:
+                self._remove(key)
+                entry = self._add(key, insight)
+        return entry
+
+    def sync(self, insights: MutableMapping) -> None:
+        with self._lock:
+            self._sync(insights)
+
+    def _sync(self, insights: MutableMapping) -> None:
+        if not self._built:
+            for key, insight in insights.items():
+                self._add(key, insight)
+            self._built = True
+            self._stale.clear()
+            return
+        while self._stale:
+            key = self._stale.pop()
+            self._remove(key)
+            if key in insights:
+                self._add(key, insights[key])
+            else:
+                self._order.pop(key, None)
+
+    def candidates(self, insights: MutableMapping, context_lower: str, stems: set) -> List[str]:
+        """Keys that share a stem with the query or whose context is a direct hit."""
+        with self._lock:
+            self._sync(insights)
+            keys: set = set()
+            for stem in stems:
+                hits = self._postings.get(stem)
+                if hits:
+                    keys.update(hits)
+            for ic in self._direct_contexts(context_lower):
+                keys.update(self._contexts[ic])
+            return sorted(keys, key=self._order.__getitem__)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "built": int(self._built),
+            "entries": len(self._entries),
+            "terms": len(self._postings),
+            "contexts": len(self._contexts),
+            "context_terms": len(self._context_terms),
+            "stale": len(self._stale),
+        }
+
+
+class _LazyInsights(MutableMapping):
+    """Insight map that keeps store rows as JSON text until first access."""
+
+    def __init__(self, decode: Callable[[str, str], Any], index: Optional[_InsightTermIndex] = None):
+        self._data: Dict[str, Any] = {}
+        self._decode = decode
+        self.index = index
+
+    def __getitem__(self, key: str):
+        value = self._data[key]
+        if isinstance(value, str):
+            value = self._decode(key, value)
+            self._data[key] = value
+        return value
+
+    def __setitem__(self, key: str, value) -> None:
+        self._data[key] = value
+        if self.index is not None:
+            self.index.invalidate(key)
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+        if self.index is not None:
+            self.index.discard(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def put_raw(self, key: str, text: str) -> None:
+        self._data[key] = text
+        if self.index is not None:
+            self.index.invalidate(key)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._data and not isinstance(self._data[key], str)
+
+    def loaded_items(self) -> List[tuple]:
+        return [(k, v) for k, v in self._data.items() if not isinstance(v, str)]
+
+
 class _insights_lock:  # noqa: N801
     """Best-effort lock using an exclusive lock file."""
 
@@ -579,6 +912,270 @@ def classify_action_domain(insight_text: str, category: str = "", source: str =
     return "general"
 
 
+# =========================================================================
+# NOISE RULES (final gate, see CognitiveLearner._is_noise_insight)
+# =========================================================================
+
+_TOOL_NAME_RE = keyword_regex(("bash", "read", "edit", "write", "grep", "glob",
+                               "todowrite", "taskoutput", "webfetch", "task"))
+_CHIP_DIAG_FIELDS_RE = re.compile(
+    r"(tool_name|file_path|status|command|tool_input|context|content|user_prompt)[=:\s]"
+)
+_FILLER_PHRASES = ("you know", "in such a way", "kind of", "sort of",
+                   "make sure that we", "those things", "these things",
+                   "in a way that", "going forward", "i would say",
+                   "by the way", "let's bring", "let's make sure",
+                   "is going to be")
+_TECH_KEYWORD_RE = re.compile(
+    r"\b(?:function|class|import|error|bug|api|database|auth|deploy|test|config|server"
+    r"|client|endpoint|query|schema|type)\b"
+)
+# NOTE: "we should", "we need to", "we have to" are VALID imperatives and are
+# deliberately not conversational starts.
+_CONVERSATIONAL_STARTS = (
+    "do you think", "can you ", "let's ", "let me ", "okay,",
+    "ok,", "alright,", "all right,", "by the way,", "oh,",
+    "so,", "well,", "hmm", "what about", "how about",
+    "continue to do", "i would say", "yeah,", "yeah ", "yep,",
+    "sure,", "right,", "no,", "nah,", "i mean,",
+    "it's probably", "it's not", "we already", "we were ",
+    # Captured transcript fragments often drop apostrophes ("lets" vs "let's").
+    "lets ",
+)
+_ACTION_VERBS = ("use ", "avoid ", "check ", "verify ", "ensure ", "always ",
+                 "never ", "remember ", "don't ", "prefer ", "when ",
+                 "must ", "should ", "fix ", "run ", "stop ", "try ",
+                 "update ", "critical", "important", "correction:")
+_INSIGHT_STARTS = ("user prefers ", "principle:", "i struggle ", "i tend to ",
+                   "blind spot:", "assumption ", "when i see ",
+                   "remember:", "critical:", "correction:",
+                   "rule ", "we should ", "we need to ")
+_TRANSCRIPT_FRAGMENTS = (" and is this ", " can you ", " do you think", " at some point",
+                         " council of ", " lets push", " let's push")
+_LABEL_PREFIXES = ("principle:", "constraint:", "reasoning:", "failure reason:",
+                   "success factor:", "test:")
+_LABEL_CONVERSATIONAL = ("that ", "this ", "those ", "these ", "it ",
+                         "right now", "all of", "we ", "they ", "follows ",
+                         "abides", "keep to", "talk about", "with the ",
+                         "with a ", "drop,", "what we", "make sure",
+                         "the way", "i would", "i think", "utilize ",
+                         "the primary", "the system", "the use of")
+_LABEL_CONVERSATIONAL_RE = re.compile(
+    r"please|let me know|as well|about each|right now|at the moment|over here|about this|let's|utilise|utilize all"
+)
+
+
+def _noise_fields(text: str) -> Dict[str, str]:
+    t = text.strip()
+    return {"raw": text.rstrip(), "t": t, "tl": t.lower()}
+
+
+def _is_tool_heavy(f: Dict[str, str]) -> bool:
+    words = f["tl"].split()
+    return bool(words) and sum(1 for w in words if _TOOL_NAME_RE.search(w)) / len(words) > 0.4
+
+
+def _is_code_dump(f: Dict[str, str]) -> bool:
+    lines = f["t"].split("\n")
+    if len(lines) <= 5:
+        return False
+    return sum(1 for ln in lines if ln.startswith("  ") or ln.startswith("\t")) > len(lines) * 0.5
+
+
+def _has_garbled_over_fragment(f: Dict[str, str]) -> bool:
+    m = re.search(r"over '(.{1,3})'", f["t"]) if "' over '" in f["t"] else None
+    return bool(m) and len(m.group(1)) <= 2
+
+
+def _is_filler_rambling(f: Dict[str, str]) -> bool:
+    if len(f["t"]) <= 80:
+        return False
+    filler_count = sum(1 for fp in _FILLER_PHRASES if fp in f["tl"])
+    return filler_count >= 2 and not _TECH_KEYWORD_RE.search(f["tl"])
+
+
+def _is_long_without_action(f: Dict[str, str]) -> bool:
+    tl = f["tl"]
+    if len(f["t"]) <= 250:
+        return False
+    return not any(v in tl for v in _ACTION_VERBS) and not tl.startswith(_INSIGHT_STARTS)
+
+
+def _is_garbled_when_using(f: Dict[str, str]) -> bool:
+    t, tl = f["t"], f["tl"]
+    # Long rambling continuations ("... and is this system ...") are almost always
+    # raw transcript fragments rather than durable advice.
+    if len(t) > 90 and any(frag in tl for frag in _TRANSCRIPT_FRAGMENTS):
+        return True
+    # Truncated single-quoted fragment (starts with lowercase mid-word)
+    if re.search(r"'([a-z])", t):
+        return True
+    return bool(re.search(r"(remember|prefer)[:\s]+'?(actually|lets|let's|just|maybe)", tl))
+
+
+def _is_label_fragment(f: Dict[str, str]) -> bool:
+    rest = f["tl"].split(":", 1)[1].strip()
+    return rest.startswith(_LABEL_CONVERSATIONAL) or len(rest) < 15
+
+
+def _is_garbled_user_preference(f: Dict[str, str]) -> bool:
+    t = f["t"]
+    # Markdown bold markers / numbered list fragments, or a single-quoted
+    # fragment starting lower-case (truncated).
+    return "**" in t or ("over '" not in t and bool(re.search(r"'([a-z])", t)))
+
+
+def _short_preference_rest(f: Dict[str, str]) -> bool:
+    return len(f["t"].split(":", 1)[1].strip()) < 25
+
+
+# Order matters only for the reason code: the verdict is the first rule that fires.
+_NOISE_RULES = (
+    # Indented code, checked before stripping: "    current.confidence = max(...)", "    return x"
+    pattern(
+        "indented_code",
+        r"\A[ \t]\s{3,}(?:[\w.]+\s*=\s*.+|self\.\w+|if |for |def |class |return |import |from "
+        r"|try:|except|raise |print\(|elif )",
+        field="raw",
+    ),
+    # Tool sequences: "Sequence 'X -> Y -> Z' worked well", arrow chains
+    prefixes("tool_sequence", ("Sequence '", 'Sequence "'), field="t"),
+    contains("tool_sequence", ("sequence",), when=lambda f: "worked" in f["tl"]),
+    contains(
+        "tool_chain",
+        ("->",),
+        field="t",
+        when=lambda f: f["t"].count("->") >= 2
+        or any(s in f["tl"] for s in ("sequence", "pattern", "worked well", "works well")),
+    ),
+    # Pattern telemetry: "Pattern 'X -> Y' risky" (unless it has actionable content)
+    prefixes(
+        "pattern_telemetry",
+        ("Pattern '",),
+        field="t",
+        when=lambda f: "->" in f["t"] and "risky" not in f["tl"],
+    ),
+    # Usage telemetry: "Heavy Bash usage (42 calls)"
+    pattern("usage_telemetry", r"\bheavy\s+\w+\s+usage\b|\busage\s*\(\d+\s*calls?\)|usage count|^usage "),
+    # User wanted without context (short, no explanation)
+    prefixes("user_wanted_short", ("User wanted:",), field="t", when=lambda f: len(f["t"]) < 60),
+    # Tool satisfaction/frustration telemetry, word tracking
+    prefixes(
+        "tool_feedback",
+        ("User was satisfied after:", "User frustrated after:", "User persistently asking about:"),
+        field="t",
+    ),
+    # Generic success factors without reasoning
+    prefixes("success_factor", ("Success factor:",), field="t", when=lambda f: len(f["t"]) < 100),
+    # Tool-heavy text (>40% tool names)
+    check("tool_heavy", _is_tool_heavy),
+    # Vague observations without action
+    prefixes("vague_observation", (
+        "user seems to", "user appears to", "it seems", "it appears",
+        "might be", "could be", "probably", "possibly",
+    )),
+    # Pure metrics/stats
+    pattern("metrics", r"^\d+%?\s+(success|failure|error)|(success|error|failure)\s+rate[:\s]+\d+"),
+    # Too short to be actionable
+    check("too_short", lambda f: len(f["t"]) < 20),
+    # "User prefers X over Y" without reasoning (short form)
+    pattern("short_preference", r"^user prefers .{5,30} over .{5,30}$"),
+    # Chip telemetry: "[Vibecoding Intelligence] post_tool Edit C:\workspace\...",
+    # "Triggered by 'post_tool_failure'", "status: success, tool_name: X"
+    pattern(
+        "chip_telemetry",
+        r"^\[[\w\s-]+ intelligence\]\s*(post_tool|pre_tool)|triggered by ['\"]?(post_tool|pre_tool)",
+    ),
+    contains("chip_telemetry", ("] post_tool ", "] pre_tool "), field="t"),
+    pattern("chip_telemetry", r"status[=:]\s*(success|failure|error),?\s*tool_name[=:]"),
+    # Task notification XML blobs
+    contains("task_xml", ("<task-notification>", "<task-id>", "<output-file>"), field="t"),
+    # Code dumps (>5 lines, majority indented at 2+ spaces)
+    contains("code_dump", ("\n",), field="t", when=_is_code_dump),
+    # Garbled user preferences: "User prefers 'eeding to pay for it' over 'n'"
+    contains("garbled_preference", ("User prefers '",), field="t", when=_has_garbled_over_fragment),
+    # Intelligence chip artifacts with diagnostic fields
+    pattern(
+        "chip_telemetry",
+        r"^\[[\w\s-]+ Intelligence\]",
+        field="t",
+        when=lambda f: bool(_CHIP_DIAG_FIELDS_RE.search(f["t"])),
+    ),
+    # Prompt injection test artifacts
+    contains("quality_test", ("QUALITY_TEST", "quality_test_"), field="t"),
+    # Screenshot / image paths stored as insights
+    pattern("screenshot", r"\\Screenshots\\|\.png['\"\s]|\.jpg['\"\s]", field="t"),
+    # Rambling transcribed speech without technical substance
+    check("filler_rambling", _is_filler_rambling),
+    # Workflow execution telemetry from Mind: "Workflow Execution 1/9/2026, 5:06:01 PM ..."
+    pattern("workflow_telemetry", r"^workflow execution\s+\d{1,2}/\d{1,2}/\d{4}"),
+    # Generic testing/pipeline assertions without context
+    pattern(
+        "test_assertion",
+        r"^testing\s+\w+\s+\w+\s+(works|passes|runs|completed|succeeded)\s*(correctly|successfully)?\.?$",
+    ),
+    # Document-like content: "# Semantic Advisor Design", "## Session History"
+    pattern("markdown_header", r"^#{1,4}\s+", field="t"),
+    # Raw file paths: "c:\workspace\xmcp ..."
+    pattern("file_path", r"^[a-zA-Z]:\\", field="t"),
+    # Conversational fragments: "Do you think we should...", "Can you..."
+    prefixes("conversational", _CONVERSATIONAL_STARTS),
+    # Very long text without action verbs or an insight shape: documents/transcripts
+    check("long_transcript", _is_long_without_action),
+    # Garbled "When using X" fragments: "When using Bash, prefer 'ver hallucinating'"
+    pattern("garbled_when_using", r"^when using \w+,\s*(prefer|remember)[:\s]", when=_is_garbled_when_using),
+    # Label + conversational fragment: "Principle: that the @META_RALPH"
+    prefixes("label_fragment", _LABEL_PREFIXES, when=_is_label_fragment),
+    # Chip output with engagement metrics or domain triggers:
+    # "[moltbook] (eng:45) ...", "[Market Intelligence] Triggered by 'vibe coding'"
+    pattern("chip_telemetry", r"^\[[\w-]+\]\s*\(eng:\d+\)|^\[[\w\s-]+ intelligence\]\s*triggered by"),
+    # Code snippets: "ADVICE_CACHE_TTL_SECONDS = 120"
+    pattern("code_snippet", r"^[A-Z][A-Z_]+\s*=\s*\S+", field="t"),
+    # Multi-line blocks: pasted code, transcript chunks or doc sections
+    contains("multi_line", ("\n",), field="t"),
+    # Docstring/comment fragments
+    prefixes("code_snippet", ('"""', "'''", "/*"), field="t"),
+    # File reference lists: "- `lib/pattern_detection/aggregator.py` (added per..."
+    pattern("file_list", r"^-\s*`(lib|src|hooks|scripts)/", field="t"),
+    # "User wanted: wrong?** 3. **What check would have p..."
+    pattern("garbled_preference", r"^user (wanted|prefers?)", when=_is_garbled_user_preference),
+    prefixes("conversational", ("about these ", "about this ")),
+    # Benchmark/pipeline test artifacts
+    contains("test_artifact", ("[pipeline_test", "[benchmark")),
+    # "User wanted:" + prompt transcription (let's, actually, ...)
+    pattern(
+        "user_wanted_transcript",
+        r"^user wanted:\s*(?:let's|lets|actually|i think|we should|can we|i want|please|just |maybe)",
+    ),
+    # Truncated "Prefer '" fragments: "Prefer 'aking them a little awkward..."
+    pattern("garbled_preference", r"^prefer\s+'[a-z]"),
+    # Generic hook error telemetry: "I struggle with tool_5_error tasks", "... Bash_error tasks"
+    pattern("tool_struggle", r"i struggle with tool_\d+_error|^i struggle with \w+_error tasks?$"),
+    # Cycle summaries, tool usage counts, large edit warnings, goal genesis counts
+    pattern("cycle_telemetry", r"^cycle summary:|^processed \d+ events with \d+ tools? tracked"),
+    pattern("tool_usage_count", r"\b\w+ used \d+ times?\b|\bhad \d+%? success across \d+ uses\b"),
+    pattern("large_edit", r"^large edit on \w+\.\w+\s*\("),
+    pattern("goal_telemetry", r"^\d+ goals? completed\. top gap:"),
+    # Column-0 Python imports: "from lib.diagnostics import log_debug as _bridge_log_debug"
+    pattern("code_import", r"^(from\s+[\w.]+\s+import\s|import\s+[\w.,\s]+$)", field="t"),
+    # Vague "Constraint:"/"Principle:" fragments: "Constraint: check and about each"
+    pattern(
+        "label_fragment",
+        r"^(?:constraint|principle|reasoning):",
+        when=lambda f: bool(_LABEL_CONVERSATIONAL_RE.search(f["tl"])),
+    ),
+    pattern(
+        "label_fragment",
+        r"^(?:constraint|principle|reasoning):\s*(?:check |look |see |about |what |how |when |where |that we|the way)",
+    ),
+    # Chip generic fields: "[Spark Core Intelligence] pattern: awaiting one"
+    pattern("chip_field", r"^\[[\w\s-]+\]\s*(pattern|observation|event|signal|trigger):", field="t", flags=re.I),
+    # "User prefers: X" extremely short
+    prefixes("short_preference", ("user prefers:", "user aversion:"), when=_short_preference_rest),
+)
+register("insight", _NOISE_RULES, prepare=_noise_fields, empty="empty")
+
+
 class CognitiveLearner:
     """
     Learns higher-level cognitive patterns, not just operational ones.
@@ -591,28 +1188,94 @@ class CognitiveLearner:
 
     INSIGHTS_FILE = Path.home() / ".spark" / "cognitive_insights.json"
     LOCK_FILE = Path.home() / ".spark" / ".cognitive.lock"
+    # cognitive_insights.json is an export of the SQLite store; rewrite it at
+    # most this often (it is always written when missing).
+    EXPORT_INTERVAL_S = _env_float("SPARK_COGNITIVE_EXPORT_INTERVAL_S", 30.0)
+    # Serve get_insights_for_context from the term index instead of a full
+    # scan (SPARK_COGNITIVE_TERM_INDEX=0 restores the scan).
+    TERM_INDEX_ENABLED = os.environ.get("SPARK_COGNITIVE_TERM_INDEX", "1").strip().lower() not in {
+        "0", "false", "off", "no",
+    }
 
     def __init__(self):
-        self.insights: Dict[str, CognitiveInsight] = {}
+        self._term_index = _InsightTermIndex(self._is_noise_insight)
+        self.insights: MutableMapping = _LazyInsights(self._decode_row, self._term_index)
         self._dirty = False  # Track unsaved changes
         self._defer_saves = False  # When True, accumulate changes without I/O
+        self._store = InsightStore(self.INSIGHTS_FILE.with_suffix(".sqlite"))
+        self._seq = 0  # store sequence this process has synced up to
+        self._row_seq: Dict[str, int] = {}  # key -> seq of the row we last saw
+        self._sigs: Dict[str, int] = {}  # key -> signature as last persisted/decoded
+        self._known: set = set()  # keys present in the store at last sync
         self._load_insights()
 
+    def _decode_row(self, key: str, text: str) -> "CognitiveInsight":
+        try:
+            insight = CognitiveInsight.from_dict(json.loads(text))
+        except Exception as e:
+            logging.getLogger(__name__).debug("Undecodable insight row %s: %s", key, e)
+            insight = CognitiveInsight(
+                category=CognitiveCategory.CONTEXT, insight="", evidence=[], confidence=0.0, context="",
+            )
+        self._sigs[key] = _insight_signature(insight)
+        return insight
+
+    def _put_row(self, key: str, text: str, seq: int) -> None:
+        if isinstance(self.insights, _LazyInsights):
+            self.insights.put_raw(key, text)
+            self._sigs.pop(key, None)
+        else:
+            self.insights[key] = self._decode_row(key, text)
+        self._row_seq[key] = seq
+        self._known.add(key)
+
     def _load_insights(self):
-        """Load existing cognitive insights."""
-        if self.INSIGHTS_FILE.exists():
-            try:
-                data = json.loads(self.INSIGHTS_FILE.read_text(encoding="utf-8"))
-                for key, info in data.items():
-                    self.insights[key] = CognitiveInsight.from_dict(info)
-                # Consolidate duplicate struggle variants (e.g., recovered X%).
+        """Load existing cognitive insights (rows are decoded on first access)."""
+        try:
+            imported = False
+            if self._store.json_changed_externally(self.INSIGHTS_FILE):
+                self._import_json()
+                imported = True
+            rows, seq = self._store.load_all()
+            for key, text, row_seq in rows:
+                self._put_row(key, text, row_seq)
+            self._seq = seq
+            if imported:
+                # Legacy/externally written data: normalize it once on import.
                 self.dedupe_struggles()
-                # Backfill action_domain for insights loaded without one
                 self._backfill_action_domains()
-                # Ensure advisory_readiness exists for legacy insights.
                 self._backfill_advisory_readiness()
-            except Exception as e:
-                print(f"[SPARK] Error loading insights: {e}")
+        except Exception as e:
+            print(f"[SPARK] Error loading insights: {e}")
+
+    def _import_json(self) -> Dict[str, int]:
+        """Fold an externally rewritten cognitive_insights.json into the store."""
+        def _merge(key: str, info: Dict[str, Any], disk_row) -> Optional[Dict[str, Any]]:
+            try:
+                incoming = CognitiveInsight.from_dict(info)
+                if disk_row is not None:
+                    incoming = self._merge_insight(incoming, CognitiveInsight.from_dict(json.loads(disk_row[1])))
+                return incoming.to_dict()
+            except Exception:
+                return None
+
+        return self._store.import_json(self.INSIGHTS_FILE, _merge)
+
+    def _backfill_insight(self, insight: "CognitiveInsight") -> None:
+        if not insight.action_domain:
+            insight.action_domain = classify_action_domain(
+                insight.insight,
+                category=insight.category.value if hasattr(insight.category, "value") else str(insight.category),
+                source=insight.source,
+            )
+        if insight.advisory_readiness <= 0.0:
+            insight.advisory_readiness = _compute_advisory_readiness(
+                insight.insight,
+                getattr(insight, "advisory_quality", None) or {},
+                confidence=getattr(insight, "confidence", 0.5) or 0.5,
+                times_validated=getattr(insight, "times_validated", 0),
+                times_contradicted=getattr(insight, "times_contradicted", 0),
+            )
 
     def _backfill_action_domains(self):
         """Backfill action_domain for insights that don't have one."""
@@ -705,57 +1368,116 @@ class CognitiveLearner:
             return
         self._save_insights_now()
 
+    def _changed_keys(self) -> List[str]:
+        """Keys whose in-memory insight differs from what was last persisted.
+
+        Callers (here and in other modules) mutate insights in place and then
+        call _save_insights(), so changes are found by signature rather than
+        explicit marking. Undecoded rows cannot have changed and are skipped.
+        """
+        if isinstance(self.insights, _LazyInsights):
+            items = self.insights.loaded_items()
+        else:
+            items = list(self.insights.items())
+        return [key for key, insight in items if self._sigs.get(key) != _insight_signature(insight)]
+
     def _save_insights_now(self, drop_keys: Optional[set] = None):
-        """Actually write insights to disk."""
+        """Upsert changed insights into the store (per-key merge with other writers)."""
         self._dirty = False
-        self.INSIGHTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with _insights_lock(self.LOCK_FILE) as lock:
-            if not lock.acquired:
-                # Another writer holds the lock; retry on next flush cycle.
-                self._dirty = True
-                return
-            disk_data: Dict[str, Dict[str, Any]] = {}
-            if self.INSIGHTS_FILE.exists():
-                try:
-                    disk_data = json.loads(self.INSIGHTS_FILE.read_text(encoding="utf-8"))
-                except Exception:
-                    disk_data = {}
-            if drop_keys:
-                for k in drop_keys:
-                    disk_data.pop(k, None)
-
-            merged: Dict[str, CognitiveInsight] = {}
-            # Start from disk to avoid losing entries from other processes
-            for key, info in disk_data.items():
-                try:
-                    merged[key] = CognitiveInsight.from_dict(info)
-                except Exception:
-                    continue
+        try:
+            if self._store.json_changed_externally(self.INSIGHTS_FILE):
+                self._import_json()
+        except Exception as e:
+            logging.getLogger(__name__).debug("cognitive_insights.json import failed: %s", e)
 
-            # Merge in-memory insights
-            for key, insight in self.insights.items():
-                if key in merged:
-                    merged[key] = self._merge_insight(insight, merged[key])
-                else:
-                    merged[key] = insight
+        present = set(self.insights)
+        forced = set(drop_keys or ()) & present  # rebuilt in memory; do not merge old disk rows
+        drop = (set(drop_keys or ()) | (self._known - present)) - present
+        changed = self._changed_keys()
 
-            # Keep in-memory view consistent with merged result
-            self.insights = merged
+        def _render(key: str, disk_row) -> Optional[Dict[str, Any]]:
+            insight = self.insights.get(key)
+            if insight is None:
+                return None
+            self._backfill_insight(insight)
+            if disk_row is not None and key not in forced and disk_row[2] != self._row_seq.get(key):
+                # Another process updated this key since we read it.
+                self._merge_insight(insight, CognitiveInsight.from_dict(json.loads(disk_row[1])))
+            return insight.to_dict()
 
-            data = {key: insight.to_dict() for key, insight in self.insights.items()}
-            tmp = self.INSIGHTS_FILE.with_suffix(f".json.tmp.{os.getpid()}")
-            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            for _ in range(5):
-                try:
-                    tmp.replace(self.INSIGHTS_FILE)
-                    break
-                except Exception:
-                    time.sleep(0.05)
-            try:
-                if tmp.exists():
-                    tmp.unlink()
-            except Exception:
-                pass
+        try:
+            written = self._store.write(changed, _render, delete_keys=drop)
+        except sqlite3.Error as e:
+            # Store busy/locked: keep changes pending for the next flush cycle.
+            logging.getLogger(__name__).debug("Insight store write deferred: %s", e)
+            self._dirty = True
+            return
+
+        for key, seq in written.items():
+            self._term_index.invalidate(key)
+            self._row_seq[key] = seq
+            self._sigs[key] = _insight_signature(self.insights[key])
+            self._known.add(key)
+        for key in drop:
+            self._known.discard(key)
+            self._row_seq.pop(key, None)
+            self._sigs.pop(key, None)
+
+        try:
+            self.refresh()
+            self._maybe_export()
+        except Exception as e:
+            logging.getLogger(__name__).debug("Insight refresh/export failed: %s", e)
+
+    def refresh(self) -> int:
+        """Pull rows other processes wrote or deleted since our last sync. Returns rows pulled."""
+        rows, latest = self._store.changed_since(self._seq)
+        pulled = 0
+        for key, text, seq in rows:
+            if text is None:
+                # Deleted elsewhere (prune, import): drop it even over unsaved
+                # local edits, or the next save would write the row back.
+                if key in self.insights or key in self._known:
+                    if key in self.insights:
+                        del self.insights[key]
+                    self._term_index.discard(key)
+                    self._row_seq.pop(key, None)
+                    self._sigs.pop(key, None)
+                    self._known.discard(key)
+                    pulled += 1
+                continue
+            if self._row_seq.get(key) == seq:
+                continue  # our own write
+            current = self.insights.get(key) if (
+                not isinstance(self.insights, _LazyInsights) or self.insights.is_loaded(key)
+            ) else None
+            if current is not None and self._sigs.get(key) != _insight_signature(current):
+                continue  # unsaved local edits; merged with this row on next save
+            self._put_row(key, text, seq)
+            pulled += 1
+        self._seq = max(self._seq, latest)
+        return pulled
+
+    def _maybe_export(self, force: bool = False) -> bool:
+        """Rewrite cognitive_insights.json when it is missing or stale enough."""
+        path = self.INSIGHTS_FILE
+        if not force and path.exists():
+            exported_seq = int(self._store.get_meta("exported_seq", "0") or 0)
+            if self._store.current_seq() <= exported_seq:
+                return False
+            exported_at = float(self._store.get_meta("exported_at", "0") or 0.0)
+            if time.time() - exported_at < float(self.EXPORT_INTERVAL_S):
+                return False
+        with _insights_lock(self.LOCK_FILE) as lock:
+            if not lock.acquired:
+                return False  # another process is exporting
+            self._store.export_json(path)
+        return True
+
+    def export_json(self) -> bool:
+        """Write cognitive_insights.json now (flushes pending changes first)."""
+        self.flush()
+        return self._maybe_export(force=True)
 
     def _touch_validation(self, insight: CognitiveInsight, validated_delta: int = 0, contradicted_delta: int = 0):
         """Update validation counters and timestamp."""
@@ -1075,414 +1797,11 @@ class CognitiveLearner:
     def _is_noise_insight(self, text: str) -> bool:
         """Final gate filter - block noise patterns at point of storage.
 
-        This catches anything that bypassed earlier filters.
-        Returns True if the insight is noise and should NOT be stored.
+        This catches anything that bypassed earlier filters (rules in
+        ``_NOISE_RULES``). Returns True if the insight is noise and should
+        NOT be stored.
         """
-        if not text:
-            return True
-
-        # Check indented code BEFORE stripping (strip removes the evidence)
-        raw = text.rstrip()
-        if raw and raw[0] in (' ', '\t'):
-            leading = len(raw) - len(raw.lstrip())
-            if leading >= 4:
-                stripped_line = raw.lstrip()
-                # Indented assignment: "    current.confidence = max(...)"
-                if re.match(r"[\w.]+\s*=\s*.+", stripped_line):
-                    return True
-                # Indented statement: "    self._log(...)", "    return x"
-                if re.match(r"(self\.\w+|if |for |def |class |return |import |from |try:|except|raise |print\(|elif )", stripped_line):
-                    return True
-
-        t = text.strip()
-        tl = t.lower()
-
-        # 1. Tool sequences: "Sequence 'X -> Y -> Z' worked well"
-        if t.startswith("Sequence '") or t.startswith('Sequence "'):
-            return True
-        if "sequence" in tl and "worked" in tl:
-            return True
-
-        # 2. Tool chains with arrows: indicates tool sequence
-        arrow_count = t.count("->")
-        if arrow_count >= 2:
-            return True
-        if arrow_count >= 1 and any(s in tl for s in ["sequence", "pattern", "worked well", "works well"]):
-            return True
-
-        # 3. Pattern telemetry: "Pattern 'X -> Y' risky" (unless it has actionable content)
-        if t.startswith("Pattern '") and "->" in t and "risky" not in tl:
-            return True
-
-        # 3b. Usage telemetry: "Heavy Bash usage (42 calls)"
-        if re.search(r"\bheavy\s+\w+\s+usage\b", tl):
-            return True
-        if re.search(r"\busage\s*\(\d+\s*calls?\)", tl):
-            return True
-        if "usage count" in tl or tl.startswith("usage "):
-            return True
-
-        # 4. User wanted without context (short, no explanation)
-        if t.startswith("User wanted:") and len(t) < 60:
-            return True
-
-        # 4b. Tool satisfaction/frustration telemetry
-        if t.startswith("User was satisfied after:") or t.startswith("User frustrated after:"):
-            return True
-
-        # 5. User persistently asking (just word tracking)
-        if t.startswith("User persistently asking about:"):
-            return True
-
-        # 6. Generic success factors
-        if t.startswith("Success factor:") and len(t) < 50:
-            return True
-
-        # 7. Tool-heavy text (>40% tool names)
-        tool_names = ["bash", "read", "edit", "write", "grep", "glob",
-                      "todowrite", "taskoutput", "webfetch", "task"]
-        words = tl.split()
-        if words:
-            tool_mentions = sum(1 for w in words if any(tn in w for tn in tool_names))
-            if tool_mentions / len(words) > 0.4:
-                return True
-
-        # 8. Vague observations without action (Task #12)
-        vague_starts = [
-            "user seems to", "user appears to", "it seems", "it appears",
-            "might be", "could be", "probably", "possibly",
-        ]
-        if any(tl.startswith(v) for v in vague_starts):
-            return True
-
-        # 9. Pure metrics/stats
-        if re.search(r"^\d+%?\s+(success|failure|error)", tl):
-            return True
-        if re.search(r"(success|error|failure)\s+rate[:\s]+\d+", tl):
-            return True
-
-        # 10. Too short to be actionable (< 20 chars after stripping)
-        if len(t) < 20:
-            return True
-
-        # 11. "User prefers X over Y" without reasoning (short form)
-        if re.match(r"^user prefers .{5,30} over .{5,30}$", tl):
-            return True
-
-        # 12. Chip insight patterns - these are telemetry, not cognitive insights
-        # Examples: "[Vibecoding Intelligence] post_tool Edit C:\workspace\..."
-        #           "[Market Intelligence] pre_tool Bash..."
-        #           "Triggered by 'post_tool_failure'"
-        chip_intel_pattern = r"^\[[\w\s-]+ intelligence\]\s*(post_tool|pre_tool)"
-        if re.search(chip_intel_pattern, tl):
-            return True
-
-        # 13. Triggered by telemetry
-        if re.search(r"triggered by ['\"]?(post_tool|pre_tool)", tl):
-            return True
-
-        # 14. Benchmark/Intelligence chip outputs with tool events
-        if "] post_tool " in t or "] pre_tool " in t:
-            return True
-
-        # 15. Chip status telemetry: "status: success, tool_name: X" or "status=success"
-        if re.search(r"status[=:]\s*(success|failure|error),?\s*tool_name[=:]", tl):
-            return True
-
-        # 16. Success factor without reasoning (short)
-        if t.startswith("Success factor:") and len(t) < 100:
-            return True
-
-        # 17. Task notification XML blobs
-        if "<task-notification>" in t or "<task-id>" in t or "<output-file>" in t:
-            return True
-
-        # 18. Code dumps (>5 lines, majority indented at 2+ spaces)
-        lines = t.split("\n")
-        if len(lines) > 5:
-            indented = sum(1 for ln in lines if ln.startswith("  ") or ln.startswith("\t"))
-            if indented > len(lines) * 0.5:
-                return True
-
-        # 19. Garbled user preferences with single-char fragments
-        # e.g. "User prefers 'eeding to pay for it' over 'n'"
-        if "User prefers '" in t and "' over '" in t:
-            m = re.search(r"over '(.{1,3})'", t)
-            if m and len(m.group(1)) <= 2:
-                return True
-
-        # 20. Benchmark/intelligence chip artifacts with diagnostic fields
-        # Catches [XXX Intelligence] + any of: tool_name, file_path, status, command, etc.
-        if re.match(r"^\[[\w\s-]+ Intelligence\]", t):
-            diag_fields = r"(tool_name|file_path|status|command|tool_input|context|content|user_prompt)[=:\s]"
-            if re.search(diag_fields, t):
-                return True
-
-        # 20b. Prompt injection test artifacts
-        if "QUALITY_TEST" in t or "quality_test_" in t:
-            return True
-
-        # 21. Screenshot / image paths stored as insights
-        if re.search(r"\\Screenshots\\|\.png['\"\s]|\.jpg['\"\s]", t):
-            return True
-
-        # 22. Rambling transcribed speech without technical substance
-        # Long text with filler phrases and no actionable keywords
-        if len(t) > 80:
-            filler_phrases = ["you know", "in such a way", "kind of", "sort of",
-                              "make sure that we", "those things", "these things",
-                              "in a way that", "going forward", "i would say",
-                              "by the way", "let's bring", "let's make sure",
-                              "is going to be"]
-            filler_count = sum(1 for fp in filler_phrases if fp in tl)
-            tech_keywords = ["function", "class", "import", "error", "bug", "api",
-                             "database", "auth", "deploy", "test", "config", "server",
-                             "client", "endpoint", "query", "schema", "type"]
-            has_tech = any(re.search(rf"\b{kw}\b", tl) for kw in tech_keywords)
-            if filler_count >= 2 and not has_tech:
-                return True
-
-        # 23. Workflow execution telemetry from Mind
-        # e.g., "Workflow Execution 1/9/2026, 5:06:01 PM workflow: Successful workflow pattern"
-        if re.match(r"^workflow execution\s+\d{1,2}/\d{1,2}/\d{4}", tl):
-            return True
-
-        # 24. Generic testing/pipeline assertions without context
-        if re.match(r"^testing\s+\w+\s+\w+\s+(works|passes|runs|completed|succeeded)\s*(correctly|successfully)?\.?$", tl):
-            return True
-
-        # 25. Document-like content: markdown headers stored as insights
-        # e.g., "# Semantic Advisor Design", "### What's Now Working"
-        if re.match(r"^#{1,4}\s+", t):
-            return True
-
-        # 26. File paths stored as insights (raw paths without context)
-        # e.g., "c:\workspace\xmcp ..."
-        if re.match(r"^[a-zA-Z]:\\", t):
-            return True
-
-        # 27. Conversational fragments stored as insights
-        # User messages captured verbatim: "Do you think we should...", "Can you..."
-        # NOTE: "we should", "we need to", "we have to" are VALID imperatives
-        # and were removed from this list to avoid filtering actionable insights.
-        conversational_starts = [
-            "do you think", "can you ", "let's ", "let me ", "okay,",
-            "ok,", "alright,", "all right,", "by the way,", "oh,",
-            "so,", "well,", "hmm", "what about", "how about",
-            "continue to do", "i would say", "yeah,", "yeah ", "yep,",
-            "sure,", "right,", "no,", "nah,", "i mean,",
-            "it's probably", "it's not", "we already", "we were ",
-            # Captured transcript fragments often drop apostrophes ("lets" vs "let's").
-            "lets ",
-        ]
-        if any(tl.startswith(cs) for cs in conversational_starts):
-            return True
-
-        # 28. Very long insights (>250 chars) that are likely documents/transcripts, not insights
-        if len(t) > 250:
-            # Allow long insights if they contain clear action verbs
-            action_verbs = ['use ', 'avoid ', 'check ', 'verify ', 'ensure ', 'always ',
-                            'never ', 'remember ', "don't ", 'prefer ', 'when ',
-                            'must ', 'should ', 'fix ', 'run ', 'stop ', 'try ',
-                            'update ', 'critical', 'important', 'correction:']
-            has_action = any(v in tl for v in action_verbs)
-            # Or if they start with established insight patterns
-            insight_starts = ['user prefers ', 'principle:', 'i struggle ', 'i tend to ',
-                              'blind spot:', 'assumption ', 'when i see ',
-                              'remember:', 'critical:', 'correction:',
-                              'rule ', 'we should ', 'we need to ']
-            has_insight_start = any(tl.startswith(s) for s in insight_starts)
-            if not has_action and not has_insight_start:
-                return True
-
-        # 29. Garbled "When using X" fragments from truncated transcription
-        # e.g., "When using Bash, prefer 'ver hallucinating'" -- mid-word cutoff
-        if re.match(r"^when using \w+,\s*(prefer|remember)[:\s]", tl):
-            # Reject long rambling continuations ("... and is this system ...") which are almost
-            # always raw transcript fragments rather than durable advice.
-            if len(t) > 90 and any(
-                frag in tl
-                for frag in (
-                    " and is this ",
-                    " can you ",
-                    " do you think",
-                    " at some point",
-                    " council of ",
-                    " lets push",
-                    " let's push",
-                )
-            ):
-                return True
-            # Check for truncated single-quoted fragment (starts with lowercase mid-word)
-            m = re.search(r"'([a-z])", t)
-            if m:
-                return True
-            # Also reject conversational continuations
-            if re.search(r"(remember|prefer)[:\s]+'?(actually|lets|let's|just|maybe)", tl):
-                return True
-
-        # 30. Label + conversational fragment patterns
-        # "Principle: that the @META_RALPH", "Constraint: talk about it right now"
-        # Real principles are declarative; these are conversational references.
-        label_prefixes = [
-            "principle:", "constraint:", "reasoning:", "failure reason:",
-            "success factor:", "test:",
-        ]
-        for lp in label_prefixes:
-            if tl.startswith(lp):
-                rest = tl[len(lp):].strip()
-                # Reject if followed by conversational words
-                conv_words = ["that ", "this ", "those ", "these ", "it ",
-                              "right now", "all of", "we ", "they ", "follows ",
-                              "abides", "keep to", "talk about", "with the ",
-                              "with a ", "drop,", "what we", "make sure",
-                              "the way", "i would", "i think", "utilize ",
-                              "the primary", "the system", "the use of"]
-                if any(rest.startswith(cw) for cw in conv_words):
-                    return True
-                # Reject if rest is too short (<15 chars) to be actionable
-                if len(rest) < 15:
-                    return True
-                break
-
-        # 31. Market intelligence chip output with engagement metrics
-        # e.g., "[moltbook] (eng:45) Moltbook is great but..."
-        if re.match(r"^\[[\w-]+\]\s*\(eng:\d+\)", tl):
-            return True
-
-        # 32. Intelligence chip "Triggered by" with domain tags
-        # e.g., "[Market Intelligence] Triggered by 'vibe coding'"
-        if re.match(r"^\[[\w\s-]+ intelligence\]\s*triggered by", tl):
-            return True
-
-        # 33. Code snippets stored as insights
-        # e.g., "ADVICE_CACHE_TTL_SECONDS = 120", "DEFAULT_MIN_VALIDATIONS = 2"
-        # Also catches indented code blocks
-        if re.match(r"^[A-Z][A-Z_]+\s*=\s*\S+", t):
-            return True
-        # Indented assignments / expressions (often copied from code or logs)
-        # e.g., "    current.confidence = max(...)" (including with dots)
-        if re.match(r"^\s{4,}[\w.]+\s*=\s*.+", t):
-            return True
-        if re.match(r"^\s{4,}(if |for |def |class |return |import |from |try:|except)", t):
-            return True
-        # Multi-line blocks are almost never durable "insights" and usually indicate a pasted code
-        # fragment, transcript chunk, or doc section.
-        if "\n" in t:
-            return True
-
-        # 34. Docstring/comment fragments (triple-quoted strings, JSDoc, etc.)
-        if t.startswith('"""') or t.startswith("'''") or t.startswith("/**") or t.startswith("/*"):
-            return True
-
-        # 35. File reference lists stored as insights
-        # e.g., "- `lib/pattern_detection/aggregator.py` (added per..."
-        if re.match(r"^-\s*`(lib|src|hooks|scripts)/", t):
-            return True
-
-        # 36. User preference/wanted with markdown formatting or garbled text
-        # e.g., "User wanted: wrong?** 3. **What check would have p..."
-        if re.match(r"^user (wanted|prefers?)", tl):
-            # Contains markdown bold markers or numbered list fragments
-            if "**" in t or re.search(r"\d+\.\s*\*\*", t):
-                return True
-            # Single-quoted content that starts with a lowercase letter (truncated)
-            m = re.search(r"'([a-z])", t)
-            if m and "over '" not in t:
-                return True
-
-        # 37. Conversational "About these" / "About this" starters
-        if tl.startswith("about these ") or tl.startswith("about this "):
-            return True
-
-        # 38. Benchmark/pipeline test artifacts
-        if "[pipeline_test" in tl or "[benchmark" in tl:
-            return True
-
-        # 39. "User wanted:" followed by conversational text (let's, actually, etc.)
-        # These are user prompt transcriptions, not actual preference data.
-        if tl.startswith("user wanted:"):
-            rest = tl[len("user wanted:"):].strip()
-            conv_starters = ["let's", "lets", "actually", "i think", "we should",
-                             "can we", "i want", "please", "just ", "maybe"]
-            if any(rest.startswith(cs) for cs in conv_starters):
-                return True
-
-        # 40. "Prefer '" with truncated/garbled content (mid-word cutoff)
-        # e.g., "Prefer 'aking them a little awkward..."
-        if re.match(r"^prefer\s+'[a-z]", tl):
-            return True
-
-        # 41. Markdown section headers embedded in insights
-        # e.g., "## Session History", "## Current State: 2026-02-03"
-        if re.match(r"^##\s+", t):
-            return True
-
-        # 42. "I struggle with tool_N_error" — generic hook error telemetry
-        # e.g., "I struggle with tool_5_error tasks", "I struggle with tool_49_error tasks"
-        if re.search(r"i struggle with tool_\d+_error", tl):
-            return True
-
-        # 47. Cycle summary telemetry — operational data, not cognitive insights
-        # e.g., "Cycle summary: Bash used 3 times (100% success)."
-        # e.g., "Processed 42 events with 5 tools tracked and 0 error patterns"
-        if tl.startswith("cycle summary:"):
-            return True
-        if re.match(r"^processed \d+ events with \d+ tools? tracked", tl):
-            return True
-
-        # 48. Tool usage counts — Tier 1 operational telemetry
-        # e.g., "Bash used 8 times (100% success)", "Read had 75% success across 4 uses"
-        if re.search(r"\b\w+ used \d+ times?\b", tl):
-            return True
-        if re.search(r"\bhad \d+%? success across \d+ uses\b", tl):
-            return True
-
-        # 49. Large edit warnings — operational telemetry about file edits
-        # e.g., "Large edit on pipeline.py (652→1036 chars). Consider smaller..."
-        if re.match(r"^large edit on \w+\.\w+\s*\(", tl):
-            return True
-
-        # 50. Generic tool struggle — auto-generated from any tool error
-        # e.g., "I struggle with Bash_error tasks", "I struggle with Glob_error tasks"
-        if re.match(r"^i struggle with \w+_error tasks?$", tl):
-            return True
-
-        # 51. Goal genesis telemetry — cycle counts, not actionable insights
-        # e.g., "3 goals completed. Top gap: cognitive:self_awareness (severity 1.00)"
-        if re.match(r"^\d+ goals? completed\. top gap:", tl):
-            return True
-
-        # 43. Python import statements stored as insights (column-0 imports)
-        # e.g., "from lib.diagnostics import log_debug as _bridge_log_debug"
-        if re.match(r"^(from\s+[\w.]+\s+import\s|import\s+[\w.,\s]+$)", t):
-            return True
-
-        # 44. Short/vague "Constraint:" or "Principle:" with conversational fragments
-        # e.g., "Constraint: check and about each", "Constraint: utilise all those APIs"
-        for lp in ("constraint:", "principle:", "reasoning:"):
-            if tl.startswith(lp):
-                rest = tl[len(lp):].strip()
-                # Conversational markers: direct address, vague references
-                if re.search(r"(please|let me know|as well|about each|right now|at the moment|over here|about this|let's|utilise|utilize all)", rest):
-                    return True
-                # Fragments that just reference something without actionable content
-                if re.search(r"^(check |look |see |about |what |how |when |where |that we|the way)", rest):
-                    return True
-                break
-
-        # 45. Chip intelligence with generic "pattern:" or "observation:" fields
-        # e.g., "[Spark Core Intelligence] pattern: awaiting one"
-        if re.match(r"^\[[\w\s-]+\]\s*(pattern|observation|event|signal|trigger):", t, re.IGNORECASE):
-            return True
-
-        # 46. "User prefers: X" extremely short (< 25 chars after prefix)
-        if tl.startswith("user prefers:") or tl.startswith("user aversion:"):
-            rest = t.split(":", 1)[1].strip() if ":" in t else ""
-            if len(rest) < 25:
-                return True
-
-        return False
+        return is_noise(text, "insight")
 
     def is_noise_insight(self, text: str) -> bool:
         """Public helper for filtering noise insights."""
@@ -1492,17 +1811,7 @@ class CognitiveLearner:
     # RETRIEVAL AND QUERY
     # =========================================================================
 
-    # Stopwords to skip in word-matching (common words that cause false matches)
-    _RETRIEVAL_STOPWORDS = frozenset({
-        "the", "and", "for", "with", "from", "this", "that", "used", "have",
-        "been", "were", "was", "are", "not", "but", "its", "into", "also",
-        "more", "than", "can", "all", "had", "has", "will", "each", "which",
-        "their", "them", "then", "when", "what", "how", "about", "would",
-        "make", "like", "just", "over", "such", "take", "only", "come",
-        "could", "after", "use", "two", "way", "our", "out", "get", "may",
-        "cycle", "summary", "summary:", "times", "across", "uses", "success",
-        "100%", "had", "session", "session(s)", "consecutive", "failures",
-    })
+    _RETRIEVAL_STOPWORDS = _RETRIEVAL_STOPWORDS
 
     def get_insights_for_context(
         self,
@@ -1521,56 +1830,51 @@ class CognitiveLearner:
         - Filters out noise insights BEFORE limit truncation
         - Requires 2+ word matches (not single-word) to reduce false positives
         - Skips stopwords and short words in word-matching
+
+        Only insights sharing a stemmed term with the query, or whose context
+        is a direct hit, are scored (see _InsightTermIndex).
         """
         relevant: List[tuple[float, str, CognitiveInsight]] = []
         context_lower = (context or "").lower()
         if not context_lower:
             return []
 
-        for key, insight in self.insights.items():
+        # Also extract meaningful words from query for bidirectional matching
+        query_words = _retrieval_words(context_lower)
+        stemmed_query = {_retrieval_stem(w) for w in query_words}
+
+        # Resolve the generic_demotion area once per query, not per insight.
+        demote_generic = self._llm_area_enabled("generic_demotion")
+
+        if self.TERM_INDEX_ENABLED and isinstance(self.insights, _LazyInsights):
+            index = self._term_index
+            candidates = (
+                (key, self.insights[key]) for key in index.candidates(self.insights, context_lower, stemmed_query)
+            )
+        else:
+            index = None
+            candidates = self.insights.items()
+
+        for key, insight in candidates:
+            entry = index.entry(key, insight) if index is not None else _ContextEntry(insight, self._is_noise_insight)
             # Pre-filter: skip cycle summaries and noise
-            ii_text = insight.insight or ""
-            if ii_text.startswith("Cycle summary:"):
-                continue
-            if self._is_noise_insight(ii_text):
-                continue
-            # LLM area: generic_demotion — skip generic platitudes during retrieval
-            if self._llm_area_generic_demotion(ii_text, context_lower):
+            if not entry.ready:
                 continue
-
-            ic = (insight.context or "").lower()
-            ii = ii_text.lower()
+            ic = entry.ic
+            ii = entry.ii
 
             # Direct context field matching (high precision)
             direct_hit = (
                 (ic and ic in context_lower) or
-                (context_lower and context_lower in ic)
+                (context_lower in ic)
             )
 
             # Word-matching: require 2+ meaningful word matches
-            # Scan more of the insight text (first 30 words) for better recall
             word_hit = False
             word_match_count = 0
             if not direct_hit:
-                words = ii.split()[:30]
-                meaningful_words = set(
-                    w.rstrip(".,;:!?()'\"") for w in words
-                    if len(w) >= 4 and w.rstrip(".,;:!?()'\"") not in self._RETRIEVAL_STOPWORDS
-                )
-                # Also extract meaningful words from query for bidirectional matching
-                query_words = set(
-                    w.rstrip(".,;:!?()'\"") for w in context_lower.split()
-                    if len(w) >= 4 and w.rstrip(".,;:!?()'\"") not in self._RETRIEVAL_STOPWORDS
-                )
-                # Basic suffix stemming for better recall
-                def _stem(w: str) -> str:
-                    for sfx in ("tion", "sion", "ment", "ness", "able", "ible", "ying", "ling", "ting", "ning", "ring", "ding", "ling", "ing", "ied", "ies", "ted", "ely", "ful", "ous", "ive", "ity", "ize", "ise", "ers", "ure", "ual", "ial", "ent", "ant", "ist", "ism", "age", "ary", "ory", "ery", "lly", "ily", "ed", "ly", "er", "es"):
-                        if w.endswith(sfx) and len(w) - len(sfx) >= 3:
-                            return w[:-len(sfx)]
-                    return w
-                stemmed_insight = {_stem(w) for w in meaningful_words}
-                stemmed_query = {_stem(w) for w in query_words}
-                word_match_count = len(meaningful_words & query_words) + len(stemmed_insight & stemmed_query - (meaningful_words & query_words))
+                exact = entry.words & query_words
+                word_match_count = len(exact) + len((entry.stems & stemmed_query) - exact)
                 # 2+ matches for normal insights, 1 match for high-reliability ones
                 word_hit = (
                     word_match_count >= 2 or
@@ -1579,11 +1883,14 @@ class CognitiveLearner:
 
             if not direct_hit and not word_hit:
                 continue
+            # LLM area: generic_demotion — skip generic platitudes during retrieval
+            if demote_generic and self._llm_area_generic_demotion(entry.text, context_lower):
+                continue
 
             match_score = 0.0
-            if context_lower and context_lower in ic:
+            if context_lower in ic:
                 match_score += 1.0
-            if context_lower and context_lower in ii:
+            if context_lower in ii:
                 match_score += 0.7
             if word_hit and not direct_hit:
                 # Scale word match score by how many words matched (more = better)
@@ -1591,14 +1898,32 @@ class CognitiveLearner:
 
             relevant.append((match_score, key, insight))
 
+        if 0 < limit < len(relevant):
+            # Entries below the limit-th best score cannot make the cut; drop them
+            # before computing reliability for the tie-break sort.
+            cutoff = heapq.nlargest(limit, (t[0] for t in relevant))[-1]
+            relevant = [t for t in relevant if t[0] >= cutoff]
         relevant.sort(key=lambda t: (t[0], t[2].reliability, t[2].times_validated), reverse=True)
         top = relevant[:limit]
         if with_keys:
             return [(k, i) for _, k, i in top]
         return [i for _, _, i in top]
 
+    def term_index_stats(self) -> Dict[str, int]:
+        """Size of the in-process retrieval index (built on first query)."""
+        return self._term_index.stats()
+
     # -- LLM area hooks (opt-in via llm_areas tuneable section) --
 
+    @staticmethod
+    def _llm_area_enabled(area_id: str) -> bool:
+        try:
+            from .llm_dispatch import get_area_config
+
+            return bool(get_area_config(area_id).get("enabled"))
+        except Exception:
+            return False
+
     @staticmethod
     def _llm_area_evidence_compress(evidence: str) -> str:
         """LLM area: compress verbose evidence text before storage."""
@@ -1726,6 +2051,7 @@ class CognitiveLearner:
                 existing.evidence = existing.evidence[-10:]
             if normalized_context and len(normalized_context) > len(str(existing.context or "")):
                 existing.context = normalized_context
+                self._term_index.invalidate(key)
             if emotion_state:
                 existing.emotion_state = emotion_state
             # Refresh advisory quality on validation
@@ -6,21 +6,35 @@ Precedence per key:
 2) versioned baseline (config/tuneables.json)
 3) runtime override (~/.spark/tuneables.json)
 4) explicit env override mapping (opt-in per key)
+
+Parsed files and resolved file/schema layers are cached process-wide and
+keyed on each file's (mtime_ns, size, inode), so repeated resolves cost two
+stat calls. Cached snapshots are immutable; resolve_section hands out fresh
+copies, get_section_snapshot the shared read-only view. Env overrides are
+applied per call. Files modified within RACY_WINDOW_S are re-read on every
+call because coarse timestamps cannot tell two quick same-size writes apart.
+get_cache_stats() reports how many resolves were served from cache.
 """
 
 from __future__ import annotations
 
 import json
 import os
+import threading
+import time
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent.parent / "config" / "tuneables.json"
 DEFAULT_RUNTIME_PATH = Path.home() / ".spark" / "tuneables.json"
 
 ParserFn = Callable[[str], Any]
+FileStamp = Optional[Tuple[int, int, int]]
+
+RACY_WINDOW_S = 2.0
 
 
 @dataclass(frozen=True)
@@ -36,18 +50,112 @@ class ResolvedSection:
     warnings: List[str] = field(default_factory=list)
 
 
-def _read_json(path: Path) -> Dict[str, Any]:
+@dataclass(frozen=True)
+class SectionSnapshot:
+    """Immutable resolved section (nested dicts are read-only, lists are tuples)."""
+
+    data: Mapping[str, Any]
+    sources: Mapping[str, str]
+    warnings: Tuple[str, ...] = ()
+
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+_MAPPINGS = (dict, MappingProxyType)  # concrete types: isinstance on typing.Mapping is slow
+_cache_lock = threading.Lock()
+_file_cache: Dict[str, Tuple[FileStamp, Mapping[str, Any], bool]] = {}
+# Keyed layers remember the file snapshots they were built from (by identity).
+_section_cache: Dict[
+    Tuple[str, str, str, bool],
+    Tuple[Tuple[FileStamp, FileStamp], Tuple[Mapping[str, Any], Mapping[str, Any]], SectionSnapshot],
+] = {}
+_stats: Dict[str, int] = {
+    "resolve_cache_hits": 0,
+    "resolve_cache_misses": 0,
+    "file_cache_hits": 0,
+    "file_reads": 0,
+    "invalidations": 0,
+}
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, _MAPPINGS):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, _MAPPINGS):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _file_stamp(path: Path) -> Tuple[FileStamp, bool]:
+    """(mtime_ns, size, inode) of path (None if missing) and whether it is too fresh to trust."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None, False
+    racy = time.time_ns() - st.st_mtime_ns < RACY_WINDOW_S * 1e9
+    return (st.st_mtime_ns, st.st_size, st.st_ino), racy
+
+
+def load_json_snapshot(path: Path) -> Tuple[FileStamp, Mapping[str, Any], bool]:
+    """Parsed JSON object at path via the shared cache: (stamp, frozen data, parsed).
+
+    ``parsed`` is False when the file exists but is not a JSON object (invalid
+    or partially written); data is then empty. A missing file parses as ``{}``.
+    An unchanged file returns the same data object, so callers can cache on it.
+    """
+    path = Path(path)
+    key = str(path)
+    stamp, racy = _file_stamp(path)
+    with _cache_lock:
+        cached = _file_cache.get(key)
+        if cached is not None and cached[0] == stamp and not racy:
+            _stats["file_cache_hits"] += 1
+            return stamp, cached[1], cached[2]
+    raw = _read_json(path) if stamp is not None else {}
+    parsed = isinstance(raw, dict)
+    data = _freeze(raw) if parsed else _EMPTY
+    with _cache_lock:
+        previous = _file_cache.get(key)
+        if previous is not None and previous[0] != stamp:
+            _stats["invalidations"] += 1
+        _file_cache[key] = (stamp, data, parsed)
+        _stats["file_reads"] += 1
+    return stamp, data, parsed
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Counters: resolves served from cache vs rebuilt, file reads, invalidations."""
+    with _cache_lock:
+        return dict(_stats)
+
+
+def clear_cache() -> None:
+    """Drop cached files and sections (counters are kept)."""
+    with _cache_lock:
+        _file_cache.clear()
+        _section_cache.clear()
+
+
+def _read_json(path: Path) -> Any:
+    """Decoded JSON at path: {} when missing, None when unreadable or invalid."""
     try:
-        if path.exists():
-            return json.loads(path.read_text(encoding="utf-8-sig"))
-    except (json.JSONDecodeError, OSError):
-        pass
-    return {}
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding="utf-8-sig"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return None
 
 
-def _section(data: Dict[str, Any], section_name: str) -> Dict[str, Any]:
+def _section(data: Mapping[str, Any], section_name: str) -> Mapping[str, Any]:
     row = data.get(section_name, {})
-    return dict(row) if isinstance(row, dict) else {}
+    return row if isinstance(row, _MAPPINGS) else {}
 
 
 def _parse_bool(raw: str) -> bool:
@@ -95,17 +203,27 @@ def env_float(name: str, *, lo: Optional[float] = None, hi: Optional[float] = No
     return EnvOverride(name, _parse)
 
 
-def resolve_section(
+def _file_layers(
     section_name: str,
-    *,
-    baseline_path: Optional[Path] = None,
-    runtime_path: Optional[Path] = None,
-    env_overrides: Optional[Dict[str, EnvOverride]] = None,
-    include_schema_defaults: bool = True,
-) -> ResolvedSection:
-    """Resolve a tuneables section with source attribution."""
-    baseline = baseline_path or DEFAULT_BASELINE_PATH
-    runtime = runtime_path or DEFAULT_RUNTIME_PATH
+    baseline: Path,
+    runtime: Path,
+    include_schema_defaults: bool,
+) -> SectionSnapshot:
+    """Schema + baseline + runtime layers of a section, cached per file stamps."""
+    baseline_stamp, baseline_data, _ = load_json_snapshot(baseline)
+    runtime_stamp, runtime_data, _ = load_json_snapshot(runtime)
+    stamps = (baseline_stamp, runtime_stamp)
+    key = (section_name, str(baseline), str(runtime), include_schema_defaults)
+    with _cache_lock:
+        cached = _section_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == stamps
+            and cached[1][0] is baseline_data
+            and cached[1][1] is runtime_data
+        ):
+            _stats["resolve_cache_hits"] += 1
+            return cached[2]
 
     merged: Dict[str, Any] = {}
     sources: Dict[str, str] = {}
@@ -117,24 +235,34 @@ def resolve_section(
 
             defaults = get_section_defaults(section_name)
             if isinstance(defaults, dict):
-                for key, value in defaults.items():
-                    merged[key] = deepcopy(value)
-                    sources[key] = "schema"
+                for key_name, value in defaults.items():
+                    merged[key_name] = _freeze(value)
+                    sources[key_name] = "schema"
         except Exception as exc:
             warnings.append(f"schema_load_failed:{section_name}:{exc!r}")
 
-    baseline_section = _section(_read_json(baseline), section_name)
-    for key, value in baseline_section.items():
-        merged[key] = deepcopy(value)
-        sources[key] = "baseline"
-
-    runtime_section = _section(_read_json(runtime), section_name)
-    for key, value in runtime_section.items():
-        merged[key] = deepcopy(value)
-        sources[key] = "runtime"
-
+    for layer, data in (("baseline", baseline_data), ("runtime", runtime_data)):
+        for key_name, value in _section(data, section_name).items():
+            merged[key_name] = value
+            sources[key_name] = layer
+
+    snapshot = SectionSnapshot(MappingProxyType(merged), MappingProxyType(sources), tuple(warnings))
+    with _cache_lock:
+        _section_cache[key] = (stamps, (baseline_data, runtime_data), snapshot)
+        _stats["resolve_cache_misses"] += 1
+    return snapshot
+
+
+def _apply_env_overrides(
+    merged: Dict[str, Any],
+    sources: Dict[str, str],
+    warnings: List[str],
+    env_overrides: Optional[Dict[str, EnvOverride]],
+    env: Optional[Mapping[str, str]] = None,
+) -> None:
+    environ = os.environ if env is None else env
     for key, override in dict(env_overrides or {}).items():
-        raw = os.getenv(override.env_name)
+        raw = environ.get(override.env_name)
         if raw is None or str(raw).strip() == "":
             continue
         try:
@@ -143,4 +271,53 @@ def resolve_section(
         except Exception:
             warnings.append(f"invalid_env_override:{override.env_name}")
 
+
+def resolve_section(
+    section_name: str,
+    *,
+    baseline_path: Optional[Path] = None,
+    runtime_path: Optional[Path] = None,
+    env_overrides: Optional[Dict[str, EnvOverride]] = None,
+    include_schema_defaults: bool = True,
+    env: Optional[Mapping[str, str]] = None,
+) -> ResolvedSection:
+    """Resolve a tuneables section with source attribution (a fresh, mutable copy).
+
+    `env` replaces os.environ as the source of `env_overrides`, e.g. for a
+    resident server applying the environment a client forwarded.
+    """
+    snapshot = _file_layers(
+        section_name,
+        baseline_path or DEFAULT_BASELINE_PATH,
+        runtime_path or DEFAULT_RUNTIME_PATH,
+        include_schema_defaults,
+    )
+    merged = _thaw(snapshot.data)
+    sources = dict(snapshot.sources)
+    warnings = list(snapshot.warnings)
+    _apply_env_overrides(merged, sources, warnings, env_overrides, env)
     return ResolvedSection(data=merged, sources=sources, warnings=warnings)
+
+
+def get_section_snapshot(
+    section_name: str,
+    *,
+    baseline_path: Optional[Path] = None,
+    runtime_path: Optional[Path] = None,
+    env_overrides: Optional[Dict[str, EnvOverride]] = None,
+    include_schema_defaults: bool = True,
+) -> SectionSnapshot:
+    """Resolve a section as a shared read-only snapshot (no copy unless an env override applies)."""
+    snapshot = _file_layers(
+        section_name,
+        baseline_path or DEFAULT_BASELINE_PATH,
+        runtime_path or DEFAULT_RUNTIME_PATH,
+        include_schema_defaults,
+    )
+    if not any(os.getenv(o.env_name, "").strip() for o in (env_overrides or {}).values()):
+        return snapshot
+    merged = dict(snapshot.data)
+    sources = dict(snapshot.sources)
+    warnings = list(snapshot.warnings)
+    _apply_env_overrides(merged, sources, warnings, env_overrides)
+    return SectionSnapshot(MappingProxyType(_freeze(merged)), MappingProxyType(sources), tuple(warnings))
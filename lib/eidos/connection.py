@@ -0,0 +1,108 @@
+"""
+EIDOS Connection Manager: shared SQLite connections for the EIDOS stores
+
+The hook, the bridge worker and the observatory all use eidos.db and
+evidence.db at the same time. Opening a new rollback-journal connection for
+every call meant per-call connect/pragma cost and writers that blocked
+readers. A ConnectionManager instead:
+
+- caches one connection per thread (reopened after fork)
+- switches the database to WAL, so readers never wait on a writer
+- applies tuned pragmas (synchronous, cache_size, mmap_size, temp_store)
+- keeps a large prepared-statement cache on each connection, so repeated
+  statements are compiled once per thread instead of once per call
+- wraps writes in short BEGIN IMMEDIATE transactions (nested use joins the
+  outer transaction), so batched saves commit once
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_PRAGMAS: Sequence[Tuple[str, str]] = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", "-8192"),            # KiB, i.e. 8 MiB page cache per connection
+    ("mmap_size", str(64 * 1024 * 1024)),
+    ("temp_store", "MEMORY"),
+)
+
+
+class ConnectionManager:
+    """Per-thread cached SQLite connections for one database file."""
+
+    def __init__(
+        self,
+        db_path: str,
+        timeout_s: float = 10.0,
+        cached_statements: int = 256,
+        pragmas: Optional[Sequence[Tuple[str, str]]] = None,
+    ):
+        self.db_path = str(db_path)
+        self.timeout_s = float(timeout_s)
+        self.cached_statements = int(cached_statements)
+        self.pragmas = tuple(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open: List[sqlite3.Connection] = []
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection (autocommit mode, sqlite3.Row rows)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and getattr(self._local, "pid", None) == os.getpid():
+            return conn
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout_s,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas:
+            try:
+                conn.execute(f"PRAGMA {name}={value}")
+            except sqlite3.DatabaseError:
+                pass  # e.g. WAL unsupported on this filesystem; keep the default
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        with self._lock:
+            self._open.append(conn)
+        return conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Connection for reads; each statement sees the latest committed data."""
+        yield self.connection()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Connection inside one IMMEDIATE transaction, committed on exit."""
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def journal_mode(self) -> str:
+        row = self.connection().execute("PRAGMA journal_mode").fetchone()
+        return str(row[0]).lower() if row else ""
+
+    def close(self) -> None:
+        """Close every connection this manager opened (all threads)."""
+        with self._lock:
+            conns, self._open = self._open, []
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._local = threading.local()
@@ -29,6 +29,10 @@ from ..distillation_transformer import transform_for_advisory
 from ..elevation import elevate
 from ..noise_patterns import is_session_boilerplate
 from .models import Distillation, DistillationType, Episode, Evaluation, Outcome, Step
+from .similarity import build_index, jaccard, statement_tokens
+
+# Word-set Jaccard above which two same-type distillations are merged.
+SIMILARITY_THRESHOLD = 0.5
 
 
 def _llm_area_outcome_link_reconstruct(
@@ -691,7 +695,9 @@ class DistillationEngine:
         if len(group) < 2:
             return group
 
-        # Simple merge: keep highest confidence, combine evidence
+        # Keep highest confidence, combine evidence. LSH buckets limit the
+        # Jaccard check to candidate pairs instead of every pair.
+        index = build_index((i, d.statement) for i, d in enumerate(group))
         result = []
         used = set()
 
@@ -701,11 +707,12 @@ class DistillationEngine:
 
             # Find similar distillations
             similar = [d1]
-            for j, d2 in enumerate(group[i+1:], i+1):
-                if j in used:
+            tokens1 = index.tokens(i)
+            for j in sorted(index.candidates(i)):
+                if j <= i or j in used:
                     continue
-                if self._are_similar(d1.statement, d2.statement):
-                    similar.append(d2)
+                if jaccard(tokens1, index.tokens(j)) > SIMILARITY_THRESHOLD:
+                    similar.append(group[j])
                     used.add(j)
 
             # Merge similar ones
@@ -720,16 +727,8 @@ class DistillationEngine:
         return result
 
     def _are_similar(self, s1: str, s2: str) -> bool:
-        """Check if two statements are similar."""
-        # Simple word overlap check
-        words1 = set(s1.lower().split())
-        words2 = set(s2.lower().split())
-
-        if not words1 or not words2:
-            return False
-
-        overlap = len(words1 & words2) / len(words1 | words2)
-        return overlap > 0.5
+        """Check if two statements are similar (word-set Jaccard)."""
+        return jaccard(statement_tokens(s1), statement_tokens(s2)) > SIMILARITY_THRESHOLD
 
     def _merge_distillations(self, similar: List[Distillation]) -> Distillation:
         """Merge multiple similar distillations into one."""
@@ -28,6 +28,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .connection import ConnectionManager
+
 _SQL_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 
@@ -154,52 +156,56 @@ class EvidenceStore:
             db_path = str(spark_dir / "evidence.db")
 
         self.db_path = db_path
+        self._db = ConnectionManager(db_path)
         self._init_db()
 
     def _init_db(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            # First, create table WITHOUT trace_id index (for compatibility with old DBs)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS evidence (
-                    evidence_id TEXT PRIMARY KEY,
-                    step_id TEXT,
-                    trace_id TEXT,
-
-                    type TEXT NOT NULL,
-                    tool_name TEXT,
-
-                    content TEXT,
-                    content_hash TEXT,
-                    byte_size INTEGER,
-                    compressed INTEGER DEFAULT 0,
-
-                    exit_code INTEGER,
-                    duration_ms INTEGER,
-
-                    created_at REAL DEFAULT (strftime('%s', 'now')),
-                    expires_at REAL,
-                    retention_reason TEXT
-                )
-            """)
-
-            # Migration: add trace_id column if missing (for old databases)
-            try:
-                if not self._column_exists(conn, "evidence", "trace_id"):
-                    conn.execute("ALTER TABLE evidence ADD COLUMN trace_id TEXT")
-            except Exception:
-                pass
-
-            # Now create all indexes (trace_id column guaranteed to exist)
-            conn.executescript("""
-                CREATE INDEX IF NOT EXISTS idx_evidence_step ON evidence(step_id);
-                CREATE INDEX IF NOT EXISTS idx_evidence_trace ON evidence(trace_id);
-                CREATE INDEX IF NOT EXISTS idx_evidence_expires ON evidence(expires_at)
-                    WHERE expires_at IS NOT NULL;
-                CREATE INDEX IF NOT EXISTS idx_evidence_type ON evidence(type);
-                CREATE INDEX IF NOT EXISTS idx_evidence_hash ON evidence(content_hash);
-            """)
-            conn.commit()
+        conn = self._db.connection()
+        # First, create table WITHOUT trace_id index (for compatibility with old DBs)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS evidence (
+                evidence_id TEXT PRIMARY KEY,
+                step_id TEXT,
+                trace_id TEXT,
+
+                type TEXT NOT NULL,
+                tool_name TEXT,
+
+                content TEXT,
+                content_hash TEXT,
+                byte_size INTEGER,
+                compressed INTEGER DEFAULT 0,
+
+                exit_code INTEGER,
+                duration_ms INTEGER,
+
+                created_at REAL DEFAULT (strftime('%s', 'now')),
+                expires_at REAL,
+                retention_reason TEXT
+            )
+        """)
+
+        # Migration: add trace_id column if missing (for old databases)
+        try:
+            if not self._column_exists(conn, "evidence", "trace_id"):
+                conn.execute("ALTER TABLE evidence ADD COLUMN trace_id TEXT")
+        except Exception:
+            pass
+
+        # Now create all indexes (trace_id column guaranteed to exist)
+        conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_evidence_step ON evidence(step_id);
+            CREATE INDEX IF NOT EXISTS idx_evidence_trace ON evidence(trace_id);
+            CREATE INDEX IF NOT EXISTS idx_evidence_expires ON evidence(expires_at)
+                WHERE expires_at IS NOT NULL;
+            CREATE INDEX IF NOT EXISTS idx_evidence_type ON evidence(type);
+            CREATE INDEX IF NOT EXISTS idx_evidence_hash ON evidence(content_hash);
+        """)
+
+    def close(self) -> None:
+        """Close this store's cached connections (they reopen on next use)."""
+        self._db.close()
 
     def _column_exists(self, conn: sqlite3.Connection, table: str, column: str) -> bool:
         try:
@@ -218,7 +224,7 @@ class EvidenceStore:
         try:
             from .store import get_store
             store = get_store()
-            with sqlite3.connect(store.db_path) as conn:
+            with store._db.read() as conn:
                 row = conn.execute(
                     "SELECT trace_id FROM steps WHERE step_id = ?",
                     (step_id,),
@@ -229,14 +235,16 @@ class EvidenceStore:
             return None
         return None
 
-    def save(self, evidence: Evidence, compress_threshold: int = 10000) -> str:
-        """
-        Save evidence to the store.
+    _EVIDENCE_UPSERT_SQL = """
+        INSERT OR REPLACE INTO evidence (
+            evidence_id, step_id, trace_id, type, tool_name,
+            content, content_hash, byte_size, compressed,
+            exit_code, duration_ms,
+            created_at, expires_at, retention_reason
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
-        Args:
-            evidence: Evidence object to save
-            compress_threshold: Compress content if larger than this (bytes)
-        """
+    def _evidence_params(self, evidence: Evidence, compress_threshold: int) -> tuple:
         if not evidence.trace_id and evidence.step_id:
             evidence.trace_id = self._infer_trace_id_from_step(evidence.step_id)
 
@@ -251,34 +259,48 @@ class EvidenceStore:
             compressed = True
             byte_size = len(compressed_bytes)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO evidence (
-                    evidence_id, step_id, trace_id, type, tool_name,
-                    content, content_hash, byte_size, compressed,
-                    exit_code, duration_ms,
-                    created_at, expires_at, retention_reason
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                evidence.evidence_id,
-                evidence.step_id,
-                evidence.trace_id,
-                evidence.type.value,
-                evidence.tool_name,
-                content,
-                evidence.content_hash,
-                byte_size,
-                1 if compressed else 0,
-                evidence.exit_code,
-                evidence.duration_ms,
-                evidence.created_at,
-                evidence.expires_at,
-                evidence.retention_reason,
-            ))
-            conn.commit()
+        return (
+            evidence.evidence_id,
+            evidence.step_id,
+            evidence.trace_id,
+            evidence.type.value,
+            evidence.tool_name,
+            content,
+            evidence.content_hash,
+            byte_size,
+            1 if compressed else 0,
+            evidence.exit_code,
+            evidence.duration_ms,
+            evidence.created_at,
+            evidence.expires_at,
+            evidence.retention_reason,
+        )
 
+    def save(self, evidence: Evidence, compress_threshold: int = 10000) -> str:
+        """
+        Save evidence to the store.
+
+        Args:
+            evidence: Evidence object to save
+            compress_threshold: Compress content if larger than this (bytes)
+        """
+        params = self._evidence_params(evidence, compress_threshold)
+        with self._db.write() as conn:
+            conn.execute(self._EVIDENCE_UPSERT_SQL, params)
         return evidence.evidence_id
 
+    def save_evidence_many(
+        self,
+        evidence_items: List[Evidence],
+        compress_threshold: int = 10000,
+    ) -> List[str]:
+        """Save several evidence items in one transaction."""
+        rows = [self._evidence_params(ev, compress_threshold) for ev in evidence_items]
+        if rows:
+            with self._db.write() as conn:
+                conn.executemany(self._EVIDENCE_UPSERT_SQL, rows)
+        return [row[0] for row in rows]
+
     def backfill_trace_ids(self, steps_db_path: Optional[str] = None) -> Dict[str, int]:
         """
         Backfill missing trace_id values on evidence using step trace_ids.
@@ -300,7 +322,7 @@ class EvidenceStore:
 
         updated = 0
         missing = 0
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             rows = conn.execute(
                 "SELECT evidence_id, step_id FROM evidence WHERE trace_id IS NULL OR trace_id = ''"
             ).fetchall()
@@ -315,7 +337,6 @@ class EvidenceStore:
                     (trace_id, evidence_id),
                 )
                 updated += 1
-            conn.commit()
 
         return {
             "evidence_missing": missing,
@@ -324,8 +345,7 @@ class EvidenceStore:
 
     def get(self, evidence_id: str) -> Optional[Evidence]:
         """Get evidence by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             row = conn.execute(
                 "SELECT * FROM evidence WHERE evidence_id = ?",
                 (evidence_id,)
@@ -338,8 +358,7 @@ class EvidenceStore:
 
     def get_for_step(self, step_id: str) -> List[Evidence]:
         """Get all evidence for a step."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 "SELECT * FROM evidence WHERE step_id = ? ORDER BY created_at",
                 (step_id,)
@@ -353,8 +372,7 @@ class EvidenceStore:
         limit: int = 50
     ) -> List[Evidence]:
         """Get recent evidence of a specific type."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 """SELECT * FROM evidence
                    WHERE type = ?
@@ -396,14 +414,13 @@ class EvidenceStore:
 
     def flag_permanent(self, evidence_id: str, reason: str = "user_flagged"):
         """Mark evidence as permanent (no expiry)."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             conn.execute("""
                 UPDATE evidence
                 SET expires_at = NULL,
                     retention_reason = ?
                 WHERE evidence_id = ?
             """, (reason, evidence_id))
-            conn.commit()
 
     def extend_retention(
         self,
@@ -412,30 +429,28 @@ class EvidenceStore:
         reason: str = ""
     ):
         """Extend retention period for evidence."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             conn.execute("""
                 UPDATE evidence
                 SET expires_at = COALESCE(expires_at, strftime('%s', 'now')) + ?,
                     retention_reason = COALESCE(retention_reason || '; ', '') || ?
                 WHERE evidence_id = ?
             """, (additional_seconds, reason, evidence_id))
-            conn.commit()
 
     def cleanup_expired(self) -> int:
         """Remove expired evidence. Returns count of deleted items."""
         now = time.time()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             cursor = conn.execute("""
                 DELETE FROM evidence
                 WHERE expires_at IS NOT NULL
                 AND expires_at < ?
             """, (now,))
-            conn.commit()
             return cursor.rowcount
 
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             total = conn.execute("SELECT COUNT(*) FROM evidence").fetchone()[0]
             total_bytes = conn.execute(
                 "SELECT COALESCE(SUM(byte_size), 0) FROM evidence"
@@ -520,5 +535,7 @@ def get_evidence_store(db_path: Optional[str] = None) -> EvidenceStore:
     """Get the singleton evidence store instance."""
     global _evidence_store
     if _evidence_store is None or (db_path and _evidence_store.db_path != db_path):
+        if _evidence_store is not None:
+            _evidence_store.close()
         _evidence_store = EvidenceStore(db_path)
     return _evidence_store
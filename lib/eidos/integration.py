@@ -33,6 +33,7 @@ from .evidence_store import get_evidence_store, Evidence, EvidenceType, create_e
 from .guardrails import GuardrailEngine
 from .escalation import build_escalation, EscalationType
 from .validation import validate_step, get_deferred_tracker
+from ..session_state import get_session_state
 
 # Elevated Control Layer
 from .elevated_control import (
@@ -45,113 +46,79 @@ from .minimal_mode import get_minimal_mode_controller
 
 # ===== Session/Episode Tracking =====
 
+# Session state lives in lib.session_state (one row per session and namespace).
+# The JSON file below is only read once, to carry over in-flight sessions.
 ACTIVE_EPISODES_FILE = Path.home() / ".spark" / "eidos_active_episodes.json"
-ACTIVE_STEPS_FILE = Path.home() / ".spark" / "eidos_active_steps.json"
-PENDING_GOALS_FILE = Path.home() / ".spark" / "eidos_pending_goals.json"
+
+_NS_EPISODE = "eidos_episode"
+_NS_STEP = "eidos_step"
+_NS_PENDING_GOAL = "eidos_pending_goal"
+
+ACTIVE_EPISODE_TTL_S = 7 * 24 * 3600
+ACTIVE_STEP_TTL_S = 600
+PENDING_GOAL_TTL_S = 600
 
 # Stale episode threshold: episodes older than 30 min with no end_ts are abandoned
 STALE_EPISODE_THRESHOLD_S = 1800
 
 
-def _load_active_episodes() -> Dict[str, str]:
-    """Load session_id -> episode_id mapping."""
+def _session_state():
+    state = get_session_state()
+    state.import_once("eidos_active_episodes_json", lambda: _import_legacy_active_episodes(state))
+    return state
+
+
+def _import_legacy_active_episodes(state) -> None:
     try:
         if ACTIVE_EPISODES_FILE.exists():
-            return json.loads(ACTIVE_EPISODES_FILE.read_text(encoding="utf-8"))
+            mapping = json.loads(ACTIVE_EPISODES_FILE.read_text(encoding="utf-8"))
+            if isinstance(mapping, dict):
+                state.put_many(
+                    _NS_EPISODE,
+                    [(k, v) for k, v in mapping.items() if isinstance(v, str)],
+                    ttl_s=ACTIVE_EPISODE_TTL_S,
+                )
     except Exception:
         pass
-    return {}
 
 
-def _save_active_episodes(mapping: Dict[str, str]):
-    """Save session_id -> episode_id mapping."""
-    try:
-        ACTIVE_EPISODES_FILE.parent.mkdir(parents=True, exist_ok=True)
-        ACTIVE_EPISODES_FILE.write_text(json.dumps(mapping), encoding="utf-8")
-    except Exception:
-        pass
+def _get_active_episode_id(session_id: str) -> Optional[str]:
+    """Episode id currently mapped to a session, if any."""
+    episode_id = _session_state().get(_NS_EPISODE, session_id)
+    return episode_id if isinstance(episode_id, str) and episode_id else None
+
+
+def _set_active_episode(session_id: str, episode_id: Optional[str]):
+    """Map a session to an episode (None removes the mapping)."""
+    if episode_id:
+        _session_state().put(_NS_EPISODE, session_id, episode_id, ttl_s=ACTIVE_EPISODE_TTL_S)
+    else:
+        _session_state().delete(_NS_EPISODE, session_id)
 
 
 def _load_active_step(session_id: str) -> Optional[Dict]:
     """Load the active step for a session (used between pre and post tool)."""
-    try:
-        if ACTIVE_STEPS_FILE.exists():
-            try:
-                steps = json.loads(ACTIVE_STEPS_FILE.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, ValueError):
-                return None  # Corrupted file, skip gracefully
-            return steps.get(session_id)
-    except Exception:
-        pass
-    return None
+    step_data = _session_state().get(_NS_STEP, session_id)
+    return step_data if isinstance(step_data, dict) else None
 
 
 def _save_active_step(session_id: str, step_data: Optional[Dict]):
-    """Save the active step for a session."""
-    try:
-        ACTIVE_STEPS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        steps = {}
-        if ACTIVE_STEPS_FILE.exists():
-            try:
-                steps = json.loads(ACTIVE_STEPS_FILE.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, ValueError):
-                steps = {}  # Reset on corruption
-
-        if step_data:
-            steps[session_id] = step_data
-        elif session_id in steps:
-            del steps[session_id]
-
-        # Clean old entries (> 10 min)
-        cutoff = time.time() - 600
-        steps = {k: v for k, v in steps.items()
-                 if isinstance(v, dict) and v.get("timestamp", 0) > cutoff}
-
-        # Atomic write to prevent corruption
-        tmp = ACTIVE_STEPS_FILE.with_suffix('.tmp')
-        tmp.write_text(json.dumps(steps), encoding="utf-8")
-        tmp.replace(ACTIVE_STEPS_FILE)
-    except Exception:
-        pass
-
-
-def _load_pending_goals() -> Dict[str, str]:
-    """Load session_id -> goal mapping for goals that arrived before episode creation."""
-    try:
-        if PENDING_GOALS_FILE.exists():
-            data = json.loads(PENDING_GOALS_FILE.read_text(encoding="utf-8"))
-            # Clean entries older than 10 min
-            cutoff = time.time() - 600
-            return {k: v for k, v in data.items()
-                    if isinstance(v, dict) and v.get("ts", 0) > cutoff}
-    except Exception:
-        pass
-    return {}
+    """Save (or with None, clear) the active step for a session."""
+    if step_data:
+        _session_state().put(_NS_STEP, session_id, step_data, ttl_s=ACTIVE_STEP_TTL_S)
+    else:
+        _session_state().delete(_NS_STEP, session_id)
 
 
 def _save_pending_goal(session_id: str, goal: str):
     """Store a goal for a session that doesn't have an episode yet."""
-    try:
-        PENDING_GOALS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        pending = _load_pending_goals()
-        pending[session_id] = {"goal": goal, "ts": time.time()}
-        PENDING_GOALS_FILE.write_text(json.dumps(pending), encoding="utf-8")
-    except Exception:
-        pass
+    _session_state().put(_NS_PENDING_GOAL, session_id, goal, ttl_s=PENDING_GOAL_TTL_S)
 
 
 def _consume_pending_goal(session_id: str) -> str:
     """Get and remove pending goal for a session. Returns '' if none."""
-    try:
-        pending = _load_pending_goals()
-        if session_id in pending:
-            goal = pending[session_id].get("goal", "")
-            del pending[session_id]
-            PENDING_GOALS_FILE.write_text(json.dumps(pending), encoding="utf-8")
-            return goal
-    except Exception:
-        pass
-    return ""
+    goal = _session_state().pop(_NS_PENDING_GOAL, session_id, "")
+    return goal if isinstance(goal, str) else ""
 
 
 # ===== Episode Management =====
@@ -167,18 +134,17 @@ def get_or_create_episode(
     refined later via ``update_episode_goal``.
     """
     store = get_store()
-    mapping = _load_active_episodes()
+    episode_id = _get_active_episode_id(session_id)
 
-    if session_id in mapping:
-        episode = store.get_episode(mapping[session_id])
+    if episode_id:
+        episode = store.get_episode(episode_id)
         if episode and episode.outcome == Outcome.IN_PROGRESS:
             # Check if episode is stale (no activity for STALE_EPISODE_THRESHOLD_S)
             elapsed = time.time() - episode.start_ts
             if elapsed > STALE_EPISODE_THRESHOLD_S and episode.step_count > 0:
                 # Auto-close stale episode with partial outcome
                 _auto_close_episode(store, episode)
-                del mapping[session_id]
-                _save_active_episodes(mapping)
+                _set_active_episode(session_id, None)
                 # Fall through to create a new one
             else:
                 return episode
@@ -199,14 +165,8 @@ def get_or_create_episode(
     )
     store.save_episode(episode)
 
-    # Save mapping
-    mapping[session_id] = episode.episode_id
-
-    # Clean old mappings (keep last 100)
-    if len(mapping) > 100:
-        mapping = dict(list(mapping.items())[-100:])
-
-    _save_active_episodes(mapping)
+    # Save mapping (old mappings expire via TTL)
+    _set_active_episode(session_id, episode.episode_id)
 
     return episode
 
@@ -233,14 +193,14 @@ def update_episode_goal(session_id: str, goal: str):
     clean_goal = goal[:200].replace("\n", " ").strip()
 
     store = get_store()
-    mapping = _load_active_episodes()
+    episode_id = _get_active_episode_id(session_id)
 
-    if session_id not in mapping:
+    if not episode_id:
         # Episode doesn't exist yet — store goal for later
         _save_pending_goal(session_id, clean_goal)
         return
 
-    episode = store.get_episode(mapping[session_id])
+    episode = store.get_episode(episode_id)
     if not episode or episode.outcome != Outcome.IN_PROGRESS:
         return
     # Only update if current goal is generic
@@ -297,12 +257,12 @@ def complete_episode(
     Called when session ends or user explicitly completes a task.
     """
     store = get_store()
-    mapping = _load_active_episodes()
+    episode_id = _get_active_episode_id(session_id)
 
-    if session_id not in mapping:
+    if not episode_id:
         return None
 
-    episode = store.get_episode(mapping[session_id])
+    episode = store.get_episode(episode_id)
     if not episode:
         return None
 
@@ -334,8 +294,7 @@ def complete_episode(
         _run_distillation(episode, steps)
 
     # Remove from active
-    del mapping[session_id]
-    _save_active_episodes(mapping)
+    _set_active_episode(session_id, None)
 
     return episode
 
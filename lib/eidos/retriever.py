@@ -358,9 +358,10 @@ class StructuralRetriever:
         """
         intent_key = self._normalize_intent(intent)
 
-        all_anti = self.store.get_distillations_by_type(
-            DistillationType.ANTI_PATTERN,
-            limit=30
+        all_anti = self._with_keyword_candidates(
+            self.store.get_distillations_by_type(DistillationType.ANTI_PATTERN, limit=30),
+            intent + " " + hypothesis,
+            [DistillationType.ANTI_PATTERN],
         )
 
         relevant = []
@@ -398,12 +399,17 @@ class StructuralRetriever:
             DistillationType.SHARP_EDGE,
             limit=20
         )
+        candidates = self._with_keyword_candidates(
+            anti_patterns + sharp_edges,
+            hypothesis,
+            [DistillationType.ANTI_PATTERN, DistillationType.SHARP_EDGE],
+        )
 
         # Filter by keyword overlap with hypothesis
         relevant = []
         hypothesis_words = set(re.findall(r'\b[a-z]+\b', hypothesis.lower()))
 
-        for d in anti_patterns + sharp_edges:
+        for d in candidates:
             statement_words = set(re.findall(r'\b[a-z]+\b', d.statement.lower()))
             overlap = len(hypothesis_words & statement_words)
             if overlap >= 2:
@@ -413,6 +419,22 @@ class StructuralRetriever:
         relevant.sort(key=lambda x: x[0], reverse=True)
         return [d for _, d in relevant[:5]]
 
+    def _with_keyword_candidates(
+        self, base: List[Distillation], text: str, types: List[DistillationType], limit: int = 20
+    ) -> List[Distillation]:
+        """Add statement full-text matches beyond the top-N-by-confidence scan.
+
+        The overlap filters still decide relevance; this only widens the pool
+        so older low-confidence rules that share words with the text are seen.
+        """
+        seen = {d.distillation_id for d in base}
+        out = list(base)
+        for d in self.store.search_distillations(text, types=types, limit=limit):
+            if d.distillation_id not in seen:
+                out.append(d)
+                seen.add(d.distillation_id)
+        return out
+
     # ==================== Matching Helpers ====================
 
     def _matches_trigger(self, text: str, triggers: List[str]) -> bool:
@@ -0,0 +1,115 @@
+"""
+EIDOS Similarity: MinHash/LSH signatures for near-duplicate statements.
+
+Distillation statements are compared as word sets (Jaccard). A MinHash
+signature of NUM_PERM values estimates that similarity, and cutting it into
+BANDS bands of ROWS values gives bucket keys: two statements that share any
+bucket are candidates, everything else is skipped. With 32 bands of 2 rows a
+pair at Jaccard 0.5 shares a bucket with probability > 0.9999, while
+unrelated statements rarely do, so the exact Jaccard check runs only on
+candidates instead of on every pair. Identical word sets share every bucket.
+
+Signatures are deterministic across processes (blake2b token hashes, fixed
+permutation seeds), so bucket keys can be persisted (EidosStore keeps them in
+``distillation_lsh``). Token sets and signatures are memoized per statement.
+"""
+
+import hashlib
+import random
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Set, Tuple
+
+NUM_PERM = 64
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_EMPTY_SIGNATURE = (_PRIME,) * NUM_PERM
+
+
+@lru_cache(maxsize=8192)
+def statement_tokens(text: str) -> FrozenSet[str]:
+    """Lower-cased word set of a statement."""
+    return frozenset((text or "").lower().split())
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two word sets (0.0 if either is empty)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@lru_cache(maxsize=16384)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+@lru_cache(maxsize=8192)
+def minhash_signature(tokens: FrozenSet[str]) -> Tuple[int, ...]:
+    """MinHash signature (NUM_PERM values) of a word set."""
+    if not tokens:
+        return _EMPTY_SIGNATURE
+    hashes = [_token_hash(t) for t in tokens]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def band_keys(signature: Tuple[int, ...], namespace: str = "") -> List[int]:
+    """One 63-bit bucket key per band; ``namespace`` (e.g. the type) separates key spaces."""
+    keys = []
+    for band in range(BANDS):
+        chunk = signature[band * ROWS:(band + 1) * ROWS]
+        raw = f"{namespace}|{band}|{','.join(map(str, chunk))}".encode("utf-8")
+        keys.append(int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "big") >> 1)
+    return keys
+
+
+class SimilarityIndex:
+    """In-memory LSH buckets over keyed statements."""
+
+    def __init__(self):
+        self._buckets: Dict[int, List[Hashable]] = defaultdict(list)
+        self._keys: Dict[Hashable, List[int]] = {}
+        self._tokens: Dict[Hashable, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def add(self, key: Hashable, statement: str) -> None:
+        tokens = statement_tokens(statement)
+        buckets = band_keys(minhash_signature(tokens))
+        self._tokens[key] = tokens
+        self._keys[key] = buckets
+        for bucket in buckets:
+            self._buckets[bucket].append(key)
+
+    def tokens(self, key: Hashable) -> FrozenSet[str]:
+        return self._tokens.get(key, frozenset())
+
+    def candidates(self, key: Hashable) -> Set[Hashable]:
+        """Keys sharing at least one bucket with ``key`` (excluding itself)."""
+        found: Set[Hashable] = set()
+        for bucket in self._keys.get(key, ()):
+            found.update(self._buckets[bucket])
+        found.discard(key)
+        return found
+
+    def similar(self, statement: str, threshold: float = 0.5) -> List[Tuple[Hashable, float]]:
+        """Indexed keys whose Jaccard with ``statement`` is >= threshold, best first."""
+        tokens = statement_tokens(statement)
+        found: Set[Hashable] = set()
+        for bucket in band_keys(minhash_signature(tokens)):
+            found.update(self._buckets.get(bucket, ()))
+        scored = [(k, jaccard(tokens, self._tokens[k])) for k in found]
+        return sorted((s for s in scored if s[1] >= threshold), key=lambda s: -s[1])
+
+
+def build_index(items: Iterable[Tuple[Hashable, str]]) -> SimilarityIndex:
+    """Index (key, statement) pairs."""
+    index = SimilarityIndex()
+    for key, statement in items:
+        index.add(key, statement)
+    return index
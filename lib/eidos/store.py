@@ -7,6 +7,12 @@ Tables:
 - episodes: Bounded learning units
 - steps: Decision packets (the core intelligence unit)
 - distillations: Extracted rules (where intelligence lives)
+- distillation_triggers / distillation_domains: normalized lookup index over
+  the JSON trigger/domain arrays (kept in sync by SQL triggers)
+- distillations_fts: optional FTS5 index over statements
+- distillation_lsh: MinHash/LSH bucket keys per statement (near-duplicate
+  lookup); SQL triggers queue changed rows in distillation_lsh_pending and
+  the keys are computed before the next duplicate lookup
 - policies: Operating constraints
 
 This is NOT where tool logs go. Tool logs are ephemeral evidence.
@@ -22,12 +28,134 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..distillation_transformer import transform_for_advisory
+from .connection import ConnectionManager
 from .models import (
     Episode, Step, Distillation, Policy,
     Budget, Phase, Outcome, Evaluation, DistillationType, ActionType
 )
+from .similarity import band_keys, jaccard, minhash_signature, statement_tokens
 
 _SQL_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_FTS_TERM_RE = re.compile(r"[a-z0-9_]{2,}")
+
+# Upper bound for prefix range scans: sorts after any real UTF-8 string.
+_PREFIX_HIGH = "\U0010ffff"
+
+
+def _json_terms_sql(column: str, row: str = "new") -> str:
+    """SELECT (distillation_id, term) over the string elements of a JSON array column.
+
+    ``row`` is the trigger pseudo-row ("new") or, for backfills, an alias
+    under which the whole distillations table is scanned. Terms are trimmed
+    and lower-cased; malformed JSON yields no rows instead of failing the write.
+    """
+    source = "" if row == "new" else f"distillations AS {row}, "
+    return (
+        f"SELECT DISTINCT {row}.distillation_id, lower(trim(j.value)) FROM {source}json_each("
+        f"CASE WHEN json_valid({row}.{column}) THEN {row}.{column} ELSE '[]' END) AS j "
+        f"WHERE j.type = 'text' AND trim(j.value) != ''"
+    )
+
+
+# Term index maintenance lives in SQL triggers so every writer (save_distillation,
+# pruning, archive restore, maintenance scripts) keeps it in sync. INSERT OR
+# REPLACE does not fire delete triggers, so the insert trigger clears first.
+_TERM_INDEX_SQL = f"""
+    CREATE TABLE IF NOT EXISTS distillation_triggers (
+        trigger TEXT NOT NULL,
+        distillation_id TEXT NOT NULL,
+        PRIMARY KEY (trigger, distillation_id)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS distillation_domains (
+        domain TEXT NOT NULL,
+        distillation_id TEXT NOT NULL,
+        PRIMARY KEY (domain, distillation_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_distillation_triggers_id ON distillation_triggers(distillation_id);
+    CREATE INDEX IF NOT EXISTS idx_distillation_domains_id ON distillation_domains(distillation_id);
+
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_terms_ai AFTER INSERT ON distillations BEGIN
+        DELETE FROM distillation_triggers WHERE distillation_id = new.distillation_id;
+        DELETE FROM distillation_domains WHERE distillation_id = new.distillation_id;
+        INSERT OR IGNORE INTO distillation_triggers (distillation_id, trigger) {_json_terms_sql("triggers")};
+        INSERT OR IGNORE INTO distillation_domains (distillation_id, domain) {_json_terms_sql("domains")};
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_triggers_au AFTER UPDATE OF triggers ON distillations BEGIN
+        DELETE FROM distillation_triggers WHERE distillation_id = old.distillation_id;
+        INSERT OR IGNORE INTO distillation_triggers (distillation_id, trigger) {_json_terms_sql("triggers")};
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_domains_au AFTER UPDATE OF domains ON distillations BEGIN
+        DELETE FROM distillation_domains WHERE distillation_id = old.distillation_id;
+        INSERT OR IGNORE INTO distillation_domains (distillation_id, domain) {_json_terms_sql("domains")};
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_terms_ad AFTER DELETE ON distillations BEGIN
+        DELETE FROM distillation_triggers WHERE distillation_id = old.distillation_id;
+        DELETE FROM distillation_domains WHERE distillation_id = old.distillation_id;
+    END;
+"""
+
+# Standalone FTS5 table keyed by the distillations rowid. Rows orphaned by
+# INSERT OR REPLACE are harmless: searches join back to distillations.
+_FTS_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS distillations_fts USING fts5(statement);
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_fts_ai AFTER INSERT ON distillations BEGIN
+        DELETE FROM distillations_fts WHERE rowid = new.rowid;
+        INSERT INTO distillations_fts (rowid, statement) VALUES (new.rowid, new.statement);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_fts_au AFTER UPDATE OF statement ON distillations BEGIN
+        DELETE FROM distillations_fts WHERE rowid = old.rowid;
+        INSERT INTO distillations_fts (rowid, statement) VALUES (new.rowid, new.statement);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_fts_ad AFTER DELETE ON distillations BEGIN
+        DELETE FROM distillations_fts WHERE rowid = old.rowid;
+    END;
+"""
+
+# Bucket keys are computed in Python, so SQL triggers only queue the rows
+# every writer touches; _sync_similarity_index drains the queue.
+_LSH_SQL = """
+    CREATE TABLE IF NOT EXISTS distillation_lsh (
+        band_key INTEGER NOT NULL,
+        distillation_id TEXT NOT NULL,
+        PRIMARY KEY (band_key, distillation_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_distillation_lsh_id ON distillation_lsh(distillation_id);
+    CREATE TABLE IF NOT EXISTS distillation_lsh_pending (
+        distillation_id TEXT PRIMARY KEY
+    ) WITHOUT ROWID;
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_lsh_ai AFTER INSERT ON distillations BEGIN
+        INSERT OR IGNORE INTO distillation_lsh_pending (distillation_id) VALUES (new.distillation_id);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_lsh_au AFTER UPDATE OF statement, type ON distillations BEGIN
+        INSERT OR IGNORE INTO distillation_lsh_pending (distillation_id) VALUES (new.distillation_id);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_distillations_lsh_ad AFTER DELETE ON distillations BEGIN
+        DELETE FROM distillation_lsh WHERE distillation_id = old.distillation_id;
+        DELETE FROM distillation_lsh_pending WHERE distillation_id = old.distillation_id;
+    END;
+"""
+
+
+def _sql_statements(script: str) -> List[str]:
+    """Split a schema script into statements (trigger bodies stay whole).
+
+    executescript() commits first, so scripts that must share a transaction
+    with their existence check and backfill run statement by statement.
+    """
+    statements, buf = [], ""
+    for line in script.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            statements.append(buf.strip())
+            buf = ""
+    if buf.strip():
+        statements.append(buf.strip())
+    return statements
+
+
+def _sql_objects(script: str) -> List[str]:
+    """Names of the tables, indexes and triggers a schema script creates."""
+    return re.findall(r"\bIF NOT EXISTS\s+(\w+)", script)
 
 
 def _normalize_distillation_statement(text: str) -> str:
@@ -43,6 +171,12 @@ def _normalize_distillation_statement(text: str) -> str:
     return s
 
 
+def _statement_band_keys(dtype: str, statement: str) -> List[int]:
+    """LSH bucket keys of a normalized statement, namespaced by distillation type."""
+    tokens = statement_tokens(_normalize_distillation_statement(statement))
+    return band_keys(minhash_signature(tokens), namespace=dtype)
+
+
 def _merge_unique_str(items_a: List[str], items_b: List[str]) -> List[str]:
     out: List[str] = []
     for item in (items_a or []) + (items_b or []):
@@ -85,151 +219,220 @@ class EidosStore:
             db_path = str(spark_dir / "eidos.db")
 
         self.db_path = db_path
+        self._db = ConnectionManager(db_path)
+        self.fts_enabled = False
         self._init_db()
 
     def _init_db(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript("""
-                -- Episodes
-                CREATE TABLE IF NOT EXISTS episodes (
-                    episode_id TEXT PRIMARY KEY,
-                    goal TEXT NOT NULL,
-                    success_criteria TEXT,
-                    constraints TEXT,  -- JSON
-                    budget_max_steps INTEGER DEFAULT 25,
-                    budget_max_time_seconds INTEGER DEFAULT 720,
-                    budget_max_retries INTEGER DEFAULT 3,
-                    phase TEXT DEFAULT 'explore',
-                    outcome TEXT DEFAULT 'in_progress',
-                    final_evaluation TEXT,
-                    start_ts REAL,
-                    end_ts REAL,
-                    step_count INTEGER DEFAULT 0,
-                    error_counts TEXT  -- JSON
-                );
-
-                -- Steps (the core intelligence unit)
-                CREATE TABLE IF NOT EXISTS steps (
-                    step_id TEXT PRIMARY KEY,
-                    episode_id TEXT REFERENCES episodes(episode_id),
-                    trace_id TEXT,
-
-                    -- Before action
-                    intent TEXT NOT NULL,
-                    decision TEXT NOT NULL,
-                    alternatives TEXT,  -- JSON
-                    assumptions TEXT,   -- JSON
-                    prediction TEXT,
-                    confidence_before REAL DEFAULT 0.5,
-
-                    -- Action
-                    action_type TEXT DEFAULT 'reasoning',
-                    action_details TEXT,  -- JSON
-
-                    -- After action
-                    result TEXT,
-                    evaluation TEXT DEFAULT 'unknown',
-                    surprise_level REAL DEFAULT 0.0,
-                    lesson TEXT,
-                    confidence_after REAL DEFAULT 0.5,
-
-                    -- Memory binding
-                    retrieved_memories TEXT,  -- JSON
-                    memory_cited INTEGER DEFAULT 0,
-                    memory_useful INTEGER,
-
-                    -- Validation
-                    validated INTEGER DEFAULT 0,
-                    validation_method TEXT,
-
-                    created_at REAL DEFAULT (strftime('%s', 'now'))
-                );
-
-                -- Distillations (where intelligence lives)
-                CREATE TABLE IF NOT EXISTS distillations (
-                    distillation_id TEXT PRIMARY KEY,
-                    type TEXT NOT NULL,
-                    statement TEXT NOT NULL,
-                    domains TEXT,       -- JSON
-                    triggers TEXT,      -- JSON
-                    anti_triggers TEXT, -- JSON
-
-                    source_steps TEXT,  -- JSON
-                    validation_count INTEGER DEFAULT 0,
-                    contradiction_count INTEGER DEFAULT 0,
-                    confidence REAL DEFAULT 0.5,
-
-                    times_retrieved INTEGER DEFAULT 0,
-                    times_used INTEGER DEFAULT 0,
-                    times_helped INTEGER DEFAULT 0,
-
-                    created_at REAL DEFAULT (strftime('%s', 'now')),
-                    revalidate_by REAL,
-                    refined_statement TEXT,
-                    advisory_quality TEXT
-                );
-
-                -- Archived distillations (reversible purge history)
-                CREATE TABLE IF NOT EXISTS distillations_archive (
-                    archive_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    distillation_id TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    statement TEXT NOT NULL,
-                    domains TEXT,
-                    triggers TEXT,
-                    anti_triggers TEXT,
-                    source_steps TEXT,
-                    validation_count INTEGER DEFAULT 0,
-                    contradiction_count INTEGER DEFAULT 0,
-                    confidence REAL DEFAULT 0.5,
-                    times_retrieved INTEGER DEFAULT 0,
-                    times_used INTEGER DEFAULT 0,
-                    times_helped INTEGER DEFAULT 0,
-                    created_at REAL,
-                    revalidate_by REAL,
-                    refined_statement TEXT,
-                    archive_reason TEXT NOT NULL,
-                    advisory_quality TEXT,
-                    archived_at REAL DEFAULT (strftime('%s', 'now'))
-                );
-
-                -- Policies (operating constraints)
-                CREATE TABLE IF NOT EXISTS policies (
-                    policy_id TEXT PRIMARY KEY,
-                    statement TEXT NOT NULL,
-                    scope TEXT DEFAULT 'GLOBAL',
-                    priority INTEGER DEFAULT 50,
-                    source TEXT DEFAULT 'INFERRED',
-                    created_at REAL DEFAULT (strftime('%s', 'now'))
-                );
-
-                -- Indexes for efficient retrieval
-                CREATE INDEX IF NOT EXISTS idx_steps_episode ON steps(episode_id);
-                CREATE INDEX IF NOT EXISTS idx_steps_created ON steps(created_at DESC);
-                CREATE INDEX IF NOT EXISTS idx_steps_trace ON steps(trace_id);
-                CREATE INDEX IF NOT EXISTS idx_distillations_type ON distillations(type);
-                CREATE INDEX IF NOT EXISTS idx_distillations_confidence ON distillations(confidence DESC);
-                CREATE INDEX IF NOT EXISTS idx_distillations_archive_dist_id ON distillations_archive(distillation_id);
-                CREATE INDEX IF NOT EXISTS idx_policies_scope ON policies(scope);
-                CREATE INDEX IF NOT EXISTS idx_policies_priority ON policies(priority DESC);
-            """)
-            # Lightweight migration for existing databases.
-            try:
-                if not self._column_exists(conn, "steps", "trace_id"):
-                    conn.execute("ALTER TABLE steps ADD COLUMN trace_id TEXT")
-                if not self._column_exists(conn, "distillations", "refined_statement"):
-                    conn.execute("ALTER TABLE distillations ADD COLUMN refined_statement TEXT")
-                if not self._column_exists(conn, "distillations", "advisory_quality"):
-                    conn.execute("ALTER TABLE distillations ADD COLUMN advisory_quality TEXT")
-                if not self._column_exists(conn, "distillations_archive", "refined_statement"):
-                    conn.execute("ALTER TABLE distillations_archive ADD COLUMN refined_statement TEXT")
-                if not self._column_exists(conn, "distillations_archive", "advisory_quality"):
-                    conn.execute("ALTER TABLE distillations_archive ADD COLUMN advisory_quality TEXT")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_steps_trace ON steps(trace_id)")
-            except Exception:
-                pass
-            conn.commit()
+        conn = self._db.connection()
+        conn.executescript("""
+            -- Episodes
+            CREATE TABLE IF NOT EXISTS episodes (
+                episode_id TEXT PRIMARY KEY,
+                goal TEXT NOT NULL,
+                success_criteria TEXT,
+                constraints TEXT,  -- JSON
+                budget_max_steps INTEGER DEFAULT 25,
+                budget_max_time_seconds INTEGER DEFAULT 720,
+                budget_max_retries INTEGER DEFAULT 3,
+                phase TEXT DEFAULT 'explore',
+                outcome TEXT DEFAULT 'in_progress',
+                final_evaluation TEXT,
+                start_ts REAL,
+                end_ts REAL,
+                step_count INTEGER DEFAULT 0,
+                error_counts TEXT  -- JSON
+            );
+
+            -- Steps (the core intelligence unit)
+            CREATE TABLE IF NOT EXISTS steps (
+                step_id TEXT PRIMARY KEY,
+                episode_id TEXT REFERENCES episodes(episode_id),
+                trace_id TEXT,
+
+                -- Before action
+                intent TEXT NOT NULL,
+                decision TEXT NOT NULL,
+                alternatives TEXT,  -- JSON
+                assumptions TEXT,   -- JSON
+                prediction TEXT,
+                confidence_before REAL DEFAULT 0.5,
+
+                -- Action
+                action_type TEXT DEFAULT 'reasoning',
+                action_details TEXT,  -- JSON
+
+                -- After action
+                result TEXT,
+                evaluation TEXT DEFAULT 'unknown',
+                surprise_level REAL DEFAULT 0.0,
+                lesson TEXT,
+                confidence_after REAL DEFAULT 0.5,
+
+                -- Memory binding
+                retrieved_memories TEXT,  -- JSON
+                memory_cited INTEGER DEFAULT 0,
+                memory_useful INTEGER,
+
+                -- Validation
+                validated INTEGER DEFAULT 0,
+                validation_method TEXT,
+
+                created_at REAL DEFAULT (strftime('%s', 'now'))
+            );
+
+            -- Distillations (where intelligence lives)
+            CREATE TABLE IF NOT EXISTS distillations (
+                distillation_id TEXT PRIMARY KEY,
+                type TEXT NOT NULL,
+                statement TEXT NOT NULL,
+                domains TEXT,       -- JSON
+                triggers TEXT,      -- JSON
+                anti_triggers TEXT, -- JSON
+
+                source_steps TEXT,  -- JSON
+                validation_count INTEGER DEFAULT 0,
+                contradiction_count INTEGER DEFAULT 0,
+                confidence REAL DEFAULT 0.5,
+
+                times_retrieved INTEGER DEFAULT 0,
+                times_used INTEGER DEFAULT 0,
+                times_helped INTEGER DEFAULT 0,
+
+                created_at REAL DEFAULT (strftime('%s', 'now')),
+                revalidate_by REAL,
+                refined_statement TEXT,
+                advisory_quality TEXT
+            );
+
+            -- Archived distillations (reversible purge history)
+            CREATE TABLE IF NOT EXISTS distillations_archive (
+                archive_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                distillation_id TEXT NOT NULL,
+                type TEXT NOT NULL,
+                statement TEXT NOT NULL,
+                domains TEXT,
+                triggers TEXT,
+                anti_triggers TEXT,
+                source_steps TEXT,
+                validation_count INTEGER DEFAULT 0,
+                contradiction_count INTEGER DEFAULT 0,
+                confidence REAL DEFAULT 0.5,
+                times_retrieved INTEGER DEFAULT 0,
+                times_used INTEGER DEFAULT 0,
+                times_helped INTEGER DEFAULT 0,
+                created_at REAL,
+                revalidate_by REAL,
+                refined_statement TEXT,
+                archive_reason TEXT NOT NULL,
+                advisory_quality TEXT,
+                archived_at REAL DEFAULT (strftime('%s', 'now'))
+            );
+
+            -- Policies (operating constraints)
+            CREATE TABLE IF NOT EXISTS policies (
+                policy_id TEXT PRIMARY KEY,
+                statement TEXT NOT NULL,
+                scope TEXT DEFAULT 'GLOBAL',
+                priority INTEGER DEFAULT 50,
+                source TEXT DEFAULT 'INFERRED',
+                created_at REAL DEFAULT (strftime('%s', 'now'))
+            );
+
+            -- Indexes for efficient retrieval
+            CREATE INDEX IF NOT EXISTS idx_steps_episode ON steps(episode_id);
+            CREATE INDEX IF NOT EXISTS idx_steps_created ON steps(created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_steps_trace ON steps(trace_id);
+            CREATE INDEX IF NOT EXISTS idx_distillations_type ON distillations(type);
+            CREATE INDEX IF NOT EXISTS idx_distillations_confidence ON distillations(confidence DESC);
+            CREATE INDEX IF NOT EXISTS idx_distillations_archive_dist_id ON distillations_archive(distillation_id);
+            CREATE INDEX IF NOT EXISTS idx_policies_scope ON policies(scope);
+            CREATE INDEX IF NOT EXISTS idx_policies_priority ON policies(priority DESC);
+        """)
+        # Lightweight migration for existing databases.
+        try:
+            if not self._column_exists(conn, "steps", "trace_id"):
+                conn.execute("ALTER TABLE steps ADD COLUMN trace_id TEXT")
+            if not self._column_exists(conn, "distillations", "refined_statement"):
+                conn.execute("ALTER TABLE distillations ADD COLUMN refined_statement TEXT")
+            if not self._column_exists(conn, "distillations", "advisory_quality"):
+                conn.execute("ALTER TABLE distillations ADD COLUMN advisory_quality TEXT")
+            if not self._column_exists(conn, "distillations_archive", "refined_statement"):
+                conn.execute("ALTER TABLE distillations_archive ADD COLUMN refined_statement TEXT")
+            if not self._column_exists(conn, "distillations_archive", "advisory_quality"):
+                conn.execute("ALTER TABLE distillations_archive ADD COLUMN advisory_quality TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_steps_trace ON steps(trace_id)")
+        except Exception:
+            pass
+        self._migrate_term_index(conn)
+
+    def _table_exists(self, conn: sqlite3.Connection, name: str) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?", (name,)
+        ).fetchone()
+        return row is not None
+
+    def _migrate_term_index(self, conn: sqlite3.Connection) -> None:
+        """Create the trigger/domain index (and FTS if available); backfill once.
+
+        Each existence check, create and backfill runs in one IMMEDIATE
+        transaction, so two processes opening a fresh database cannot both
+        backfill (duplicate FTS rowids fail the insert). Opens that find the
+        schema complete take no write lock.
+        """
+        if not self._schema_complete(conn, _TERM_INDEX_SQL + _LSH_SQL):
+            self._migrate_terms_and_lsh()
+        if self._schema_complete(conn, _FTS_SQL):
+            self.fts_enabled = True
+            return
+        try:
+            with self._db.write() as wconn:
+                backfill_fts = not self._table_exists(wconn, "distillations_fts")
+                for statement in _sql_statements(_FTS_SQL):
+                    wconn.execute(statement)
+                if backfill_fts:
+                    wconn.execute(
+                        "INSERT INTO distillations_fts (rowid, statement) SELECT rowid, statement FROM distillations"
+                    )
+        except sqlite3.OperationalError:
+            return  # SQLite built without FTS5: keyword search falls back to scans
+        self.fts_enabled = True
+
+    def _schema_complete(self, conn: sqlite3.Connection, script: str) -> bool:
+        names = _sql_objects(script)
+        row = conn.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({','.join('?' * len(names))})", names  # noqa: S608
+        ).fetchone()
+        return int(row[0]) == len(names)
+
+    def _migrate_terms_and_lsh(self) -> None:
+        with self._db.write() as wconn:
+            backfill_terms = not self._table_exists(wconn, "distillation_triggers")
+            for statement in _sql_statements(_TERM_INDEX_SQL):
+                wconn.execute(statement)
+            if backfill_terms:
+                for table, column, source in (
+                    ("distillation_triggers", "trigger", "triggers"),
+                    ("distillation_domains", "domain", "domains"),
+                ):
+                    wconn.execute(
+                        f"INSERT OR IGNORE INTO {table} (distillation_id, {column}) "  # noqa: S608 - fixed identifiers
+                        + _json_terms_sql(source, row="d")
+                    )
+
+            backfill_lsh = not self._table_exists(wconn, "distillation_lsh")
+            for statement in _sql_statements(_LSH_SQL):
+                wconn.execute(statement)
+            if backfill_lsh:
+                wconn.execute(
+                    "INSERT OR IGNORE INTO distillation_lsh_pending (distillation_id) "
+                    "SELECT distillation_id FROM distillations"
+                )
+
+    def close(self) -> None:
+        """Close this store's cached connections (they reopen on next use)."""
+        self._db.close()
 
     def _column_exists(self, conn: sqlite3.Connection, table: str, column: str) -> bool:
         try:
@@ -254,7 +457,7 @@ class EidosStore:
 
     def save_episode(self, episode: Episode) -> str:
         """Save an episode to the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO episodes (
                     episode_id, goal, success_criteria, constraints,
@@ -278,13 +481,11 @@ class EidosStore:
                 episode.step_count,
                 json.dumps(episode.error_counts)
             ))
-            conn.commit()
         return episode.episode_id
 
     def get_episode(self, episode_id: str) -> Optional[Episode]:
         """Get an episode by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             row = conn.execute(
                 "SELECT * FROM episodes WHERE episode_id = ?",
                 (episode_id,)
@@ -314,8 +515,7 @@ class EidosStore:
 
     def get_recent_episodes(self, limit: int = 10) -> List[Episode]:
         """Get most recent episodes."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 "SELECT * FROM episodes ORDER BY start_ts DESC LIMIT ?",
                 (limit,)
@@ -346,46 +546,59 @@ class EidosStore:
 
     # ==================== Step Operations ====================
 
-    def save_step(self, step: Step) -> str:
-        """Save a step to the database."""
+    _STEP_UPSERT_SQL = """
+        INSERT OR REPLACE INTO steps (
+            step_id, episode_id, trace_id, intent, decision, alternatives, assumptions,
+            prediction, confidence_before, action_type, action_details,
+            result, evaluation, surprise_level, lesson, confidence_after,
+            retrieved_memories, memory_cited, memory_useful,
+            validated, validation_method, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _step_params(self, step: Step) -> tuple:
         if not step.trace_id:
             step.trace_id = self._fallback_trace_id(step)
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO steps (
-                    step_id, episode_id, trace_id, intent, decision, alternatives, assumptions,
-                    prediction, confidence_before, action_type, action_details,
-                    result, evaluation, surprise_level, lesson, confidence_after,
-                    retrieved_memories, memory_cited, memory_useful,
-                    validated, validation_method, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                step.step_id,
-                step.episode_id,
-                step.trace_id,
-                step.intent,
-                step.decision,
-                json.dumps(step.alternatives),
-                json.dumps(step.assumptions),
-                step.prediction,
-                step.confidence_before,
-                step.action_type.value,
-                json.dumps(step.action_details),
-                step.result,
-                step.evaluation.value,
-                step.surprise_level,
-                step.lesson,
-                step.confidence_after,
-                json.dumps(step.retrieved_memories),
-                1 if step.memory_cited else 0,
-                1 if step.memory_useful else (0 if step.memory_useful is False else None),
-                1 if step.validated else 0,
-                step.validation_method,
-                step.created_at
-            ))
-            conn.commit()
+        return (
+            step.step_id,
+            step.episode_id,
+            step.trace_id,
+            step.intent,
+            step.decision,
+            json.dumps(step.alternatives),
+            json.dumps(step.assumptions),
+            step.prediction,
+            step.confidence_before,
+            step.action_type.value,
+            json.dumps(step.action_details),
+            step.result,
+            step.evaluation.value,
+            step.surprise_level,
+            step.lesson,
+            step.confidence_after,
+            json.dumps(step.retrieved_memories),
+            1 if step.memory_cited else 0,
+            1 if step.memory_useful else (0 if step.memory_useful is False else None),
+            1 if step.validated else 0,
+            step.validation_method,
+            step.created_at
+        )
+
+    def save_step(self, step: Step) -> str:
+        """Save a step to the database."""
+        params = self._step_params(step)
+        with self._db.write() as conn:
+            conn.execute(self._STEP_UPSERT_SQL, params)
         return step.step_id
 
+    def save_steps(self, steps: List[Step]) -> List[str]:
+        """Save several steps in one transaction."""
+        rows = [self._step_params(step) for step in steps]
+        if rows:
+            with self._db.write() as conn:
+                conn.executemany(self._STEP_UPSERT_SQL, rows)
+        return [row[0] for row in rows]
+
     def backfill_trace_ids(self, evidence_db_path: Optional[str] = None) -> Dict[str, int]:
         """
         Backfill missing trace_id values on steps using evidence where possible.
@@ -407,7 +620,7 @@ class EidosStore:
 
         updated = 0
         missing = 0
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             rows = conn.execute(
                 "SELECT step_id, episode_id, created_at FROM steps WHERE trace_id IS NULL OR trace_id = ''"
             ).fetchall()
@@ -423,7 +636,6 @@ class EidosStore:
                     (trace_id, step_id),
                 )
                 updated += 1
-            conn.commit()
 
         return {
             "steps_missing": missing,
@@ -432,8 +644,7 @@ class EidosStore:
 
     def get_step(self, step_id: str) -> Optional[Step]:
         """Get a step by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             row = conn.execute(
                 "SELECT * FROM steps WHERE step_id = ?",
                 (step_id,)
@@ -446,8 +657,7 @@ class EidosStore:
 
     def get_episode_steps(self, episode_id: str) -> List[Step]:
         """Get all steps for an episode."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 "SELECT * FROM steps WHERE episode_id = ? ORDER BY created_at",
                 (episode_id,)
@@ -457,8 +667,7 @@ class EidosStore:
 
     def get_recent_steps(self, limit: int = 50) -> List[Step]:
         """Get most recent steps across all episodes."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 "SELECT * FROM steps ORDER BY created_at DESC LIMIT ?",
                 (limit,)
@@ -527,15 +736,12 @@ class EidosStore:
                 return parsed if isinstance(parsed, dict) else {}
             return {}
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.write() as conn:
             target_norm = _normalize_distillation_statement(distillation.statement)
             existing = None
-            candidates = conn.execute(
-                """SELECT * FROM distillations
-                   WHERE type = ?""",
-                (distillation.type.value,),
-            ).fetchall()
+            # Equal normalized statements share every LSH bucket, so the
+            # bucket candidates always include an exact duplicate.
+            candidates = self._lsh_candidate_rows(conn, distillation.type.value, distillation.statement)
             for row in candidates:
                 if _normalize_distillation_statement(row["statement"] or "") == target_norm:
                     existing = row
@@ -618,7 +824,6 @@ class EidosStore:
                         str(existing["distillation_id"]),
                     ),
                 )
-                conn.commit()
                 return str(existing["distillation_id"])
 
             conn.execute(
@@ -650,13 +855,11 @@ class EidosStore:
                     json.dumps(distillation.advisory_quality or {}),
                 ),
             )
-            conn.commit()
         return distillation.distillation_id
 
     def get_distillation(self, distillation_id: str) -> Optional[Distillation]:
         """Get a distillation by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             row = conn.execute(
                 "SELECT * FROM distillations WHERE distillation_id = ?",
                 (distillation_id,)
@@ -673,8 +876,7 @@ class EidosStore:
         limit: int = 20
     ) -> List[Distillation]:
         """Get distillations of a specific type."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 """SELECT * FROM distillations
                    WHERE type = ?
@@ -690,8 +892,7 @@ class EidosStore:
         limit: int = 20
     ) -> List[Distillation]:
         """Get distillations above confidence threshold."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 """SELECT * FROM distillations
                    WHERE confidence >= ?
@@ -704,8 +905,7 @@ class EidosStore:
     def get_distillations_for_revalidation(self) -> List[Distillation]:
         """Get distillations due for revalidation."""
         now = time.time()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 """SELECT * FROM distillations
                    WHERE revalidate_by IS NOT NULL AND revalidate_by <= ?""",
@@ -714,45 +914,136 @@ class EidosStore:
 
             return [self._row_to_distillation(row) for row in rows]
 
-    def get_distillations_by_trigger(
-        self,
-        trigger: str,
-        limit: int = 20
+    def _get_distillations_by_term(
+        self, table: str, column: str, term: str, limit: int, prefix: bool
     ) -> List[Distillation]:
-        """Get distillations that match a trigger pattern."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            # Search in JSON triggers array
+        key = str(term or "").strip().lower()
+        if not key:
+            return []
+        high = key + _PREFIX_HIGH if prefix else key
+        with self._db.read() as conn:
             rows = conn.execute(
-                """SELECT * FROM distillations
-                   WHERE triggers LIKE ?
-                   ORDER BY confidence DESC, times_used DESC LIMIT ?""",
-                (f'%{trigger}%', limit)
+                f"""SELECT * FROM distillations
+                   WHERE distillation_id IN (
+                       SELECT distillation_id FROM {table} WHERE {column} >= ? AND {column} <= ?
+                   )
+                   ORDER BY confidence DESC, times_used DESC LIMIT ?""",  # noqa: S608 - fixed identifiers
+                (key, high, limit)
             ).fetchall()
 
             return [self._row_to_distillation(row) for row in rows]
 
+    def get_distillations_by_trigger(
+        self,
+        trigger: str,
+        limit: int = 20,
+        prefix: bool = True
+    ) -> List[Distillation]:
+        """Get distillations with a trigger equal to (or starting with) ``trigger``.
+
+        Case-insensitive; served from the distillation_triggers index.
+        """
+        return self._get_distillations_by_term("distillation_triggers", "trigger", trigger, limit, prefix)
+
     def get_distillations_by_domain(
         self,
         domain: str,
+        limit: int = 20,
+        prefix: bool = True
+    ) -> List[Distillation]:
+        """Get distillations with a domain equal to (or starting with) ``domain``."""
+        return self._get_distillations_by_term("distillation_domains", "domain", domain, limit, prefix)
+
+    def search_distillations(
+        self,
+        text: str,
+        types: Optional[List[DistillationType]] = None,
         limit: int = 20
     ) -> List[Distillation]:
-        """Get distillations for a specific domain."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                """SELECT * FROM distillations
-                   WHERE domains LIKE ?
-                   ORDER BY confidence DESC, times_used DESC LIMIT ?""",
-                (f'%{domain}%', limit)
-            ).fetchall()
+        """Distillations whose statement shares any keyword with ``text``, best BM25 first.
 
-            return [self._row_to_distillation(row) for row in rows]
+        Returns [] when FTS5 is unavailable; callers keep their scan fallback.
+        """
+        if not self.fts_enabled:
+            return []
+        terms = list(dict.fromkeys(_FTS_TERM_RE.findall(str(text or "").lower())))[:16]
+        if not terms:
+            return []
+        query = " OR ".join(f'"{t}"' for t in terms)
+        type_values = [t.value for t in (types or [])]
+        type_clause = f"AND d.type IN ({', '.join('?' * len(type_values))})" if type_values else ""
+        try:
+            with self._db.read() as conn:
+                rows = conn.execute(
+                    f"""SELECT d.* FROM distillations_fts AS f
+                       JOIN distillations AS d ON d.rowid = f.rowid
+                       WHERE distillations_fts MATCH ? {type_clause}
+                       ORDER BY bm25(distillations_fts) LIMIT ?""",  # noqa: S608 - placeholders only
+                    (query, *type_values, limit)
+                ).fetchall()
+        except sqlite3.OperationalError:
+            return []
+        return [self._row_to_distillation(row) for row in rows]
+
+    def _sync_similarity_index(self, conn: sqlite3.Connection) -> None:
+        """Compute LSH bucket keys for rows queued by the distillation triggers."""
+        pending = conn.execute(
+            """SELECT p.distillation_id, d.type, d.statement FROM distillation_lsh_pending AS p
+               LEFT JOIN distillations AS d ON d.distillation_id = p.distillation_id"""
+        ).fetchall()
+        if not pending:
+            return
+        ids = [(row[0],) for row in pending]
+        conn.executemany("DELETE FROM distillation_lsh WHERE distillation_id = ?", ids)
+        conn.executemany(
+            "INSERT OR IGNORE INTO distillation_lsh (band_key, distillation_id) VALUES (?, ?)",
+            [
+                (key, did)
+                for did, dtype, statement in pending
+                if dtype is not None
+                for key in _statement_band_keys(dtype, statement or "")
+            ],
+        )
+        conn.executemany("DELETE FROM distillation_lsh_pending WHERE distillation_id = ?", ids)
+
+    def _lsh_candidate_rows(self, conn: sqlite3.Connection, dtype: str, statement: str) -> List[sqlite3.Row]:
+        """Rows of ``dtype`` sharing an LSH bucket with ``statement`` (call inside write())."""
+        self._sync_similarity_index(conn)
+        keys = _statement_band_keys(dtype, statement)
+        return conn.execute(
+            f"""SELECT * FROM distillations WHERE type = ? AND distillation_id IN (
+                   SELECT distillation_id FROM distillation_lsh
+                   WHERE band_key IN ({', '.join('?' * len(keys))}))
+               ORDER BY rowid""",  # noqa: S608 - placeholders only
+            (dtype, *keys),
+        ).fetchall()
+
+    def find_similar_distillations(
+        self,
+        statement: str,
+        dtype: DistillationType,
+        threshold: float = 0.5,
+        limit: int = 10
+    ) -> List[Distillation]:
+        """Near-duplicates of ``statement`` among ``dtype`` distillations, most similar first.
+
+        Similarity is word-set Jaccard of normalized statements (>= threshold),
+        checked only for rows sharing an LSH bucket with the statement.
+        """
+        target = statement_tokens(_normalize_distillation_statement(statement))
+        with self._db.write() as conn:
+            rows = self._lsh_candidate_rows(conn, dtype.value, statement)
+        scored = []
+        for row in rows:
+            score = jaccard(target, statement_tokens(_normalize_distillation_statement(row["statement"] or "")))
+            if score >= threshold:
+                scored.append((score, row))
+        scored.sort(key=lambda item: -item[0])
+        return [self._row_to_distillation(row) for _, row in scored[:limit]]
 
     def get_all_distillations(self, limit: int = 100) -> List[Distillation]:
         """Get all distillations ordered by confidence."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 """SELECT * FROM distillations
                    ORDER BY confidence DESC, times_used DESC LIMIT ?""",
@@ -763,14 +1054,13 @@ class EidosStore:
 
     def record_distillation_retrieval(self, distillation_id: str):
         """Record that a distillation was retrieved."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             conn.execute(
                 """UPDATE distillations
                    SET times_retrieved = times_retrieved + 1
                    WHERE distillation_id = ?""",
                 (distillation_id,)
             )
-            conn.commit()
 
     def find_distillation_by_prefix(self, id_prefix: str) -> Optional[str]:
         """Find a distillation ID by its prefix (used for outcome routing).
@@ -781,7 +1071,7 @@ class EidosStore:
         if not id_prefix or len(id_prefix) < 6:
             return None
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._db.read() as conn:
                 row = conn.execute(
                     "SELECT distillation_id FROM distillations WHERE distillation_id LIKE ?",
                     (id_prefix + "%",)
@@ -798,7 +1088,7 @@ class EidosStore:
         - Negative: confidence decays (accelerates with high contradiction rate)
         - Below 0.1 after 10+ uses: effectively dead, prunable
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             if helped:
                 conn.execute(
                     """UPDATE distillations
@@ -818,7 +1108,6 @@ class EidosStore:
                 )
 
             # Evolve confidence based on track record
-            conn.row_factory = sqlite3.Row
             row = conn.execute(
                 "SELECT times_used, times_helped, contradiction_count, confidence "
                 "FROM distillations WHERE distillation_id = ?",
@@ -854,7 +1143,6 @@ class EidosStore:
                         (round(new_conf, 4), distillation_id)
                     )
 
-            conn.commit()
 
     def _row_to_distillation(self, row: sqlite3.Row) -> Distillation:
         """Convert a database row to Distillation object."""
@@ -906,7 +1194,7 @@ class EidosStore:
         pruned = {"dead_playbooks": 0, "low_success": 0, "corrupted": 0}
         one_day_ago = time.time() - 86400
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             # 1. Dead playbooks
             cur = conn.execute(
                 "DELETE FROM distillations WHERE times_retrieved = 0 "
@@ -916,7 +1204,6 @@ class EidosStore:
             pruned["dead_playbooks"] = cur.rowcount
 
             # 2. Low success ratio after 10+ uses
-            conn.row_factory = sqlite3.Row
             rows = conn.execute(
                 "SELECT distillation_id, times_used, times_helped "
                 "FROM distillations WHERE times_used >= 10"
@@ -950,7 +1237,6 @@ class EidosStore:
             )
             pruned["corrupted"] = cur.rowcount
 
-            conn.commit()
 
         return pruned
 
@@ -979,8 +1265,7 @@ class EidosStore:
         purge_ids: List[str] = []
         archive_rows: List[Dict[str, Any]] = []
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.write() as conn:
             rows = conn.execute("SELECT * FROM distillations").fetchall()
             scanned = len(rows)
             for row in rows:
@@ -1060,7 +1345,6 @@ class EidosStore:
                     "DELETE FROM distillations WHERE distillation_id = ?",
                     [(did,) for did in purge_ids],
                 )
-                conn.commit()
 
         return {
             "scanned": scanned,
@@ -1089,8 +1373,7 @@ class EidosStore:
         errors = 0
         details: List[Dict[str, Any]] = []
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.write() as conn:
             rows = conn.execute("SELECT * FROM distillations").fetchall()
 
             for row in rows:
@@ -1146,7 +1429,6 @@ class EidosStore:
                     errors += 1
                     details.append({"id": did, "error": str(exc)[:200]})
 
-            conn.commit()
 
         return {
             "total": len(rows),
@@ -1161,7 +1443,7 @@ class EidosStore:
 
     def save_policy(self, policy: Policy) -> str:
         """Save a policy to the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO policies (
                     policy_id, statement, scope, priority, source, created_at
@@ -1174,13 +1456,11 @@ class EidosStore:
                 policy.source,
                 policy.created_at
             ))
-            conn.commit()
         return policy.policy_id
 
     def get_policy(self, policy_id: str) -> Optional[Policy]:
         """Get a policy by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             row = conn.execute(
                 "SELECT * FROM policies WHERE policy_id = ?",
                 (policy_id,)
@@ -1197,8 +1477,7 @@ class EidosStore:
         limit: int = 50
     ) -> List[Policy]:
         """Get policies by scope."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 """SELECT * FROM policies
                    WHERE scope = ?
@@ -1210,8 +1489,7 @@ class EidosStore:
 
     def get_all_policies(self) -> List[Policy]:
         """Get all policies ordered by priority."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             rows = conn.execute(
                 "SELECT * FROM policies ORDER BY priority DESC"
             ).fetchall()
@@ -1233,7 +1511,7 @@ class EidosStore:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.read() as conn:
             episode_count = conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0]
             step_count = conn.execute("SELECT COUNT(*) FROM steps").fetchone()[0]
             distillation_count = conn.execute("SELECT COUNT(*) FROM distillations").fetchone()[0]
@@ -1282,7 +1560,7 @@ class EidosStore:
         removed_ids: List[str] = []
         preview: List[str] = []
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.write() as conn:
             rows = conn.execute(
                 "SELECT distillation_id, statement FROM distillations"
             ).fetchall()
@@ -1316,6 +1594,8 @@ def get_store(db_path: Optional[str] = None) -> EidosStore:
     """Get the singleton store instance."""
     global _store
     if _store is None or (db_path and _store.db_path != db_path):
+        if _store is not None:
+            _store.close()
         _store = EidosStore(db_path)
     return _store
 
@@ -7,6 +7,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List
 
+from lib.append_log import tail_rows
 from lib.outcome_log import OUTCOMES_FILE
 from lib.prediction_loop import PREDICTIONS_FILE
 
@@ -46,7 +47,7 @@ def evaluate_predictions(
 ) -> Dict[str, Any]:
     """Compute lightweight evaluation metrics from predictions/outcomes."""
     preds = _load_jsonl(PREDICTIONS_FILE, limit=800)
-    outcomes = _load_jsonl(OUTCOMES_FILE, limit=800)
+    outcomes = tail_rows(OUTCOMES_FILE, 800)[::-1]  # newest first, across segments
     if not preds or not outcomes:
         return {
             "predictions": len(preds),
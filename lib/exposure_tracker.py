@@ -3,21 +3,18 @@
 from __future__ import annotations
 
 import json
-import os
 import re
 import time
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
+from .append_log import AppendLog
 from .primitive_filter import is_primitive_text
 
 
 EXPOSURES_FILE = Path.home() / ".spark" / "exposures.jsonl"
 LAST_EXPOSURE_FILE = Path.home() / ".spark" / "last_exposure.json"
 
-# Chunk size for tail reads (64KB)
-_TAIL_CHUNK_BYTES = 65536
-
 # Write-volume policies for high-frequency exposure sources.
 _SOURCE_WRITE_POLICIES = {
     "sync_context": {"max_items": 6, "dedupe_window_s": 600.0},
@@ -84,55 +81,23 @@ def _recent_signatures_for_source(source: str, now_ts: float, max_age_s: float)
     return signatures
 
 
-def _tail_lines(path: Path, count: int) -> List[str]:
-    """Read the last N lines of a file without loading the whole file into memory."""
-    if count <= 0 or not path.exists():
-        return []
+# Exposures are a segmented append log; retention drops whole old segments.
+EXPOSURES_MAX_BYTES = 10 * 1024 * 1024
+EXPOSURES_SEGMENT_BYTES = 2 * 1024 * 1024
 
-    try:
-        with open(path, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            pos = f.tell()
-            buffer = b""
-            lines: List[bytes] = []
-
-            while pos > 0 and len(lines) <= count:
-                read_size = min(_TAIL_CHUNK_BYTES, pos)
-                pos -= read_size
-                f.seek(pos)
-                data = f.read(read_size)
-                buffer = data + buffer
-
-                if b"\n" in buffer:
-                    parts = buffer.split(b"\n")
-                    buffer = parts[0]
-                    lines = parts[1:] + lines
-
-            if buffer:
-                lines = [buffer] + lines
-
-            # Normalize and decode
-            return [
-                ln.decode("utf-8", errors="replace").rstrip("\r")
-                for ln in lines[-count:]
-                if ln
-            ]
-    except Exception:
-        return []
 
+def _exposures_log() -> AppendLog:
+    return AppendLog(
+        EXPOSURES_FILE,
+        max_bytes=EXPOSURES_MAX_BYTES,
+        segment_bytes=EXPOSURES_SEGMENT_BYTES,
+        ensure_ascii=False,
+    )
 
-def _maybe_rotate_exposures():
-    """Rotate exposures.jsonl when it exceeds 5MB."""
-    if not EXPOSURES_FILE.exists():
-        return
-    try:
-        if EXPOSURES_FILE.stat().st_size > 5 * 1024 * 1024:  # 5MB
-            rotated = EXPOSURES_FILE.with_suffix('.1.jsonl')
-            if rotated.exists():
-                rotated.unlink()
-            EXPOSURES_FILE.rename(rotated)
-    except Exception:
-        pass
+
+def _tail_lines(path: Path, count: int) -> List[str]:
+    """Read the last N lines of a (segmented) log without loading it into memory."""
+    return AppendLog(path).tail_lines(count)
 
 
 def record_exposures(
@@ -143,7 +108,6 @@ def record_exposures(
     trace_id: Optional[str] = None
 ) -> int:
     """Append exposure entries. Returns count written."""
-    _maybe_rotate_exposures()
     rows: List[Dict] = []
     now = time.time()
     for item in items:
@@ -186,10 +150,7 @@ def record_exposures(
         if not rows:
             return 0
 
-    EXPOSURES_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with EXPOSURES_FILE.open("a", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    _exposures_log().append_many(rows)
     try:
         # Persist the most recent exposure for quick linking.
         LAST_EXPOSURE_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -201,7 +162,7 @@ def record_exposures(
 
 def read_recent_exposures(limit: int = 200, max_age_s: float = 6 * 3600) -> List[Dict]:
     """Read recent exposures using streaming tail read (memory efficient)."""
-    if not EXPOSURES_FILE.exists():
+    if not AppendLog(EXPOSURES_FILE).exists():
         return []
 
     # Use tail read to avoid loading entire file into memory
@@ -224,22 +185,16 @@ def read_recent_exposures(limit: int = 200, max_age_s: float = 6 * 3600) -> List
 
 
 def read_exposures_within(*, max_age_s: float, now: Optional[float] = None, limit: int = 200) -> List[Dict]:
-    """Read exposures within max_age_s relative to now (memory efficient)."""
-    if not EXPOSURES_FILE.exists():
-        return []
-
-    # Use tail read to avoid loading entire file into memory
-    lines = _tail_lines(EXPOSURES_FILE, limit)
-    if not lines:
-        return []
+    """Read exposures within max_age_s relative to now, newest first.
 
+    With a max age the segment index binary-searches straight to the window;
+    otherwise the last ``limit`` rows are tail-read.
+    """
     now_ts = float(now or time.time())
+    log = _exposures_log()
+    rows = log.since(now_ts - max_age_s, limit=limit) if max_age_s else log.tail(limit)
     out: List[Dict] = []
-    for line in reversed(lines):
-        try:
-            row = json.loads(line)
-        except Exception:
-            continue
+    for row in reversed(rows):
         ts = float(row.get("ts") or 0.0)
         if max_age_s and ts and (now_ts - ts) > max_age_s:
             continue
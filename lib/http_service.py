@@ -0,0 +1,418 @@
+"""Shared HTTP server core for sparkd and mind_server.
+
+Two pieces:
+
+- ``PooledHTTPServer``: an ``HTTPServer`` that serves requests on a bounded
+  thread pool instead of spawning an unbounded thread per connection
+  (``ThreadingHTTPServer``) or serving one at a time (``HTTPServer``). When
+  every worker is busy for longer than ``admission_timeout_s`` a new
+  connection gets a plain 503 and is closed, so a flood of clients cannot
+  pile up unbounded work. A worker is held for one request, not for a whole
+  keep-alive connection: idle connections wait on a selector, so they never
+  crowd out new clients.
+- ``JobRunner``: runs long operations (bridge cycles) on its own small pool and
+  tracks them as jobs the client can poll. Request workers only enqueue, so
+  ``/ingest`` and ``/health`` never wait behind a cycle.
+"""
+
+from __future__ import annotations
+
+import selectors
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .diagnostics import log_exception
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_ADMISSION_TIMEOUT_S = 2.0
+DEFAULT_IDLE_TIMEOUT_S = 30.0
+DEFAULT_MAX_IDLE_CONNECTIONS = 256
+DEFAULT_MAX_RETAINED_JOBS = 100
+
+_BUSY_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: text/plain; charset=utf-8\r\n"
+    b"Content-Length: 4\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n\r\n"
+    b"busy"
+)
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that serves requests on a bounded worker pool.
+
+    For ``BaseHTTPRequestHandler`` handlers a worker slot covers one request.
+    Between requests a keep-alive connection is parked on a selector and
+    re-admitted when its next request arrives, ahead of new connections.
+    Parked connections are closed after ``idle_timeout_s`` (default: the
+    handler's ``timeout``) and, oldest first, beyond ``max_idle_connections``.
+    Other handlers hold their slot for the whole connection.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        admission_timeout_s: float = DEFAULT_ADMISSION_TIMEOUT_S,
+        idle_timeout_s: Optional[float] = None,
+        max_idle_connections: int = DEFAULT_MAX_IDLE_CONNECTIONS,
+        thread_name_prefix: str = "http-worker",
+    ):
+        super().__init__(server_address, handler_class)
+        self.max_workers = max(1, int(max_workers))
+        self.admission_timeout_s = max(0.0, float(admission_timeout_s))
+        if idle_timeout_s is None:
+            idle_timeout_s = getattr(handler_class, "timeout", None) or DEFAULT_IDLE_TIMEOUT_S
+        self.idle_timeout_s = max(0.0, float(idle_timeout_s))
+        self.max_idle_connections = max(0, int(max_idle_connections))
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=thread_name_prefix)
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._served = 0
+        self._rejected = 0
+        # Parked keep-alive connections: handler -> idle deadline (park order).
+        self._idle_lock = threading.Lock()
+        self._idle: "OrderedDict[Any, float]" = OrderedDict()
+        # Parked connections whose next request arrived while no slot was free;
+        # the next finished request hands its slot to them.
+        self._handoff_lock = threading.Lock()
+        self._ready: Deque[Any] = deque()
+        self._closing = False
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        # Daemon: it only watches idle sockets, never an in-flight request.
+        self._idle_thread = threading.Thread(
+            target=self._idle_loop, name=f"{thread_name_prefix}-idle", daemon=True
+        )
+        self._idle_thread.start()
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(timeout=self.admission_timeout_s):
+            with self._stats_lock:
+                self._rejected += 1
+            try:
+                request.sendall(_BUSY_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        with self._stats_lock:
+            self._in_flight += 1
+        try:
+            self._pool.submit(self._serve, request, client_address)
+        except RuntimeError:
+            # Pool already shut down (server closing).
+            self._release()
+            self.shutdown_request(request)
+
+    def _serve(self, request, client_address):
+        if not hasattr(self.RequestHandlerClass, "handle_one_request"):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                self._release()
+            return
+        try:
+            # BaseRequestHandler.__init__ minus handle()/finish(): the handler
+            # (and its buffered rfile) lives as long as the connection.
+            handler = self.RequestHandlerClass.__new__(self.RequestHandlerClass)
+            handler.request, handler.client_address, handler.server = request, client_address, self
+            handler.setup()
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            self._release()
+            return
+        self._run(handler)
+
+    def _run(self, handler) -> None:
+        """Serve the requests already sent on ``handler``'s connection, then park it."""
+        keep = False
+        try:
+            while True:
+                handler.close_connection = True
+                handler.handle_one_request()
+                if handler.close_connection:
+                    break
+                if not self._has_buffered(handler):
+                    keep = True
+                    break
+        except Exception:
+            self.handle_error(handler.request, handler.client_address)
+        if not (keep and self._park(handler)):
+            self._close(handler)
+        self._release()
+
+    @staticmethod
+    def _has_buffered(handler) -> bool:
+        # A pipelined request may already sit in rfile's buffer, where the
+        # selector cannot see it.
+        sock = handler.connection
+        try:
+            sock.setblocking(False)
+            return bool(handler.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            try:
+                sock.settimeout(handler.timeout)
+            except OSError:
+                pass
+
+    def _park(self, handler) -> bool:
+        evicted = []
+        with self._idle_lock:
+            if self._closing or self.max_idle_connections <= 0:
+                return False
+            while len(self._idle) >= self.max_idle_connections:
+                old, _ = self._idle.popitem(last=False)
+                self._unregister(old)
+                evicted.append(old)
+            try:
+                self._selector.register(handler.connection, selectors.EVENT_READ, handler)
+            except (OSError, ValueError):
+                return False
+            self._idle[handler] = time.monotonic() + self.idle_timeout_s
+        for old in evicted:
+            self._close(old)
+        self._wake()
+        return True
+
+    def _unregister(self, handler) -> None:
+        try:
+            self._selector.unregister(handler.connection)
+        except (KeyError, OSError, ValueError):
+            pass
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
+
+    def _idle_loop(self) -> None:
+        while not self._closing:
+            with self._idle_lock:
+                first = next(iter(self._idle.values()), None)
+            timeout = None if first is None else max(0.0, first - time.monotonic())
+            try:
+                events = self._selector.select(timeout)
+            except (OSError, ValueError):
+                if self._closing:
+                    return
+                continue
+            ready, expired = [], []
+            now = time.monotonic()
+            with self._idle_lock:
+                for key, _ in events:
+                    if key.fileobj is self._wake_r:
+                        try:
+                            while self._wake_r.recv(4096):
+                                pass
+                        except OSError:
+                            pass
+                        continue
+                    if self._idle.pop(key.data, None) is not None:
+                        self._unregister(key.data)
+                        ready.append(key.data)
+                while self._idle:
+                    handler, deadline = next(iter(self._idle.items()))
+                    if deadline > now:
+                        break
+                    del self._idle[handler]
+                    self._unregister(handler)
+                    expired.append(handler)
+            for handler in expired:
+                self._close(handler)
+            for handler in ready:
+                self._resume(handler)
+
+    def _resume(self, handler) -> None:
+        with self._handoff_lock:
+            if not self._slots.acquire(blocking=False):
+                self._ready.append(handler)
+                return
+        with self._stats_lock:
+            self._in_flight += 1
+        self._submit_run(handler)
+
+    def _submit_run(self, handler) -> None:
+        try:
+            self._pool.submit(self._run, handler)
+        except RuntimeError:
+            self._close(handler)
+            self._release()
+
+    def _close(self, handler) -> None:
+        try:
+            handler.finish()
+        except Exception:
+            pass
+        self.shutdown_request(handler.request)
+
+    def _release(self) -> None:
+        with self._handoff_lock:
+            handler = self._ready.popleft() if self._ready else None
+            if handler is None:
+                self._slots.release()
+        with self._stats_lock:
+            self._served += 1
+            if handler is None:
+                self._in_flight -= 1
+        if handler is not None:
+            # The slot passes straight to a parked connection with a request waiting.
+            self._submit_run(handler)
+
+    def pool_stats(self) -> Dict[str, int]:
+        with self._idle_lock:
+            idle = len(self._idle)
+        with self._stats_lock:
+            return {
+                "max_workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "idle_connections": idle,
+                "served": self._served,
+                "rejected_busy": self._rejected,
+            }
+
+    def server_close(self):
+        super().server_close()
+        with self._idle_lock:
+            self._closing = True
+            parked = list(self._idle)
+            self._idle.clear()
+            for handler in parked:
+                self._unregister(handler)
+        with self._handoff_lock:
+            parked.extend(self._ready)
+            self._ready.clear()
+        self._wake()
+        self._idle_thread.join(timeout=1.0)
+        for handler in parked:
+            self._close(handler)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for sock in (self._wake_r, self._wake_w):
+            try:
+                sock.close()
+            except OSError:
+                pass
+        try:
+            self._selector.close()
+        except Exception:
+            pass
+
+
+class JobRunner:
+    """Run named jobs on a small dedicated pool and keep their status pollable.
+
+    Submitting a kind that already has a queued (not yet running) job returns
+    that job instead of stacking another one behind it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 1,
+        max_retained: int = DEFAULT_MAX_RETAINED_JOBS,
+        thread_name_prefix: str = "job",
+    ):
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix=thread_name_prefix)
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._max_retained = max(1, int(max_retained))
+
+    def submit(self, kind: str, fn: Callable[[], Any]) -> Dict[str, Any]:
+        """Queue ``fn`` as a ``kind`` job and return a snapshot of the job record."""
+        with self._lock:
+            for job in reversed(self._jobs.values()):
+                if job["kind"] == kind and job["status"] == "queued":
+                    return dict(job, coalesced=True)
+            job = {
+                "job_id": uuid.uuid4().hex[:16],
+                "kind": kind,
+                "status": "queued",
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+                "error": None,
+            }
+            self._jobs[job["job_id"]] = job
+            self._trim()
+            snapshot = dict(job)
+        self._pool.submit(self._run, job["job_id"], fn)
+        return snapshot
+
+    def _run(self, job_id: str, fn: Callable[[], Any]) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job["status"] = "running"
+            job["started_at"] = time.time()
+        try:
+            result = fn()
+            status, error = "done", None
+        except Exception as e:
+            result, status = None, "error"
+            error = f"{type(e).__name__}: {e}"[:200]
+            log_exception("http_service", f"job {job_id} failed", e)
+        with self._lock:
+            job["status"] = status
+            job["result"] = result
+            job["error"] = error
+            job["finished_at"] = time.time()
+
+    def _trim(self) -> None:
+        # Drop the oldest finished jobs first; live jobs are never evicted.
+        excess = len(self._jobs) - self._max_retained
+        if excess <= 0:
+            return
+        for job_id in [j for j, rec in self._jobs.items() if rec["status"] in ("done", "error")][:excess]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Block until the job finishes (or timeout) and return its record."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job["status"] in ("done", "error"):
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(0.02)
+
+    def list(self, limit: int = 20) -> List[Dict[str, Any]]:
+        with self._lock:
+            jobs = list(self._jobs.values())[-max(0, int(limit)):]
+            return [{k: v for k, v in j.items() if k != "result"} for j in reversed(jobs)]
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            out = {"queued": 0, "running": 0, "done": 0, "error": 0}
+            for job in self._jobs.values():
+                out[job["status"]] = out.get(job["status"], 0) + 1
+            return out
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
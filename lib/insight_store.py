@@ -0,0 +1,335 @@
+"""SQLite (WAL) row store backing CognitiveLearner.
+
+`cognitive_insights.json` used to be the storage engine: every mutation took
+a lock, re-parsed the whole file, merged every insight and rewrote it. This
+store keeps one row per insight key instead:
+
+- writes are row-level upserts inside a short IMMEDIATE transaction
+- every write bumps a store-wide sequence number, so a process can pull just
+  the rows other processes changed since it last looked (`changed_since`)
+- deletes leave a tombstone carrying their own sequence number, so those
+  pulls see removals too, not only upserts
+- rows are returned as raw JSON text; decoding is left to the caller so
+  read-only users do not materialize every insight
+
+`cognitive_insights.json` remains as a periodic export for the many readers
+that still consume it (observatory, production gates, scripts). External
+rewrites of that file (cleanup scripts, older versions) are detected by file
+signature and imported with per-key merge semantics.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+Row = Tuple[str, str, int]  # (key, json text, seq)
+Change = Tuple[str, Optional[str], int]  # (key, json text or None if deleted, seq)
+
+
+def file_signature(path: Path) -> str:
+    try:
+        st = path.stat()
+        return f"{st.st_mtime_ns}:{st.st_size}"
+    except Exception:
+        return ""
+
+
+class InsightStore:
+    """Key -> JSON row store with a monotonic change sequence."""
+
+    def __init__(self, path: Path, timeout_s: float = 5.0):
+        self.path = Path(path)
+        self.timeout_s = float(timeout_s)
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=self.timeout_s, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS insights (
+                  key TEXT PRIMARY KEY,
+                  data TEXT NOT NULL,
+                  seq INTEGER NOT NULL,
+                  updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_insights_seq ON insights(seq)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS insight_tombstones (
+                  key TEXT PRIMARY KEY,
+                  seq INTEGER NOT NULL,
+                  deleted_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_insight_tombstones_seq ON insight_tombstones(seq)")
+            conn.execute("CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._schema_ready = True
+        return conn
+
+    # ------------------------------------------------------------------ meta
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str, default: str = "") -> str:
+        row = conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return str(row[0]) if row and row[0] is not None else default
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, values: Dict[str, Any]) -> None:
+        conn.executemany(
+            "INSERT INTO store_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(k, str(v)) for k, v in values.items()],
+        )
+
+    def get_meta(self, key: str, default: str = "") -> str:
+        conn = self._connect()
+        try:
+            return self._get_meta(conn, key, default)
+        finally:
+            conn.close()
+
+    def current_seq(self) -> int:
+        conn = self._connect()
+        try:
+            return int(self._get_meta(conn, "seq", "0") or 0)
+        finally:
+            conn.close()
+
+    # ----------------------------------------------------------------- reads
+
+    def load_all(self) -> Tuple[List[Row], int]:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN")
+            rows = conn.execute("SELECT key, data, seq FROM insights ORDER BY rowid").fetchall()
+            seq = int(self._get_meta(conn, "seq", "0") or 0)
+            conn.execute("COMMIT")
+            return [(r[0], r[1], int(r[2])) for r in rows], seq
+        finally:
+            conn.close()
+
+    def changed_since(self, seq: int) -> Tuple[List[Change], int]:
+        """Rows written or deleted after `seq`; deletions come back with data None."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN")
+            rows = conn.execute(
+                "SELECT key, data, seq FROM insights WHERE seq > ? "
+                "UNION ALL SELECT key, NULL, seq FROM insight_tombstones WHERE seq > ? "
+                "ORDER BY seq",
+                (int(seq), int(seq)),
+            ).fetchall()
+            latest = int(self._get_meta(conn, "seq", "0") or 0)
+            conn.execute("COMMIT")
+            return [(r[0], r[1], int(r[2])) for r in rows], latest
+        finally:
+            conn.close()
+
+    def count(self) -> int:
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM insights").fetchone()[0])
+        finally:
+            conn.close()
+
+    # ---------------------------------------------------------------- writes
+
+    def write(
+        self,
+        keys: Iterable[str],
+        render: Callable[[str, Optional[Row]], Optional[Dict[str, Any]]],
+        delete_keys: Iterable[str] = (),
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, int]:
+        """Upsert `keys` and delete `delete_keys` in one transaction.
+
+        `render(key, disk_row)` receives the row currently on disk (or None)
+        and returns the dict to persist, which lets the caller merge with
+        concurrent writers per key. Returning None skips the key.
+        Returns {key: seq} for the rows written.
+        """
+        key_list = [k for k in dict.fromkeys(keys) if k]
+        drop = [k for k in dict.fromkeys(delete_keys) if k]
+        if not key_list and not drop and not meta:
+            return {}
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                written = self._write_locked(conn, key_list, render, drop, meta)
+                conn.execute("COMMIT")
+                return written
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    def _write_locked(
+        self,
+        conn: sqlite3.Connection,
+        key_list: List[str],
+        render: Callable[[str, Optional[Row]], Optional[Dict[str, Any]]],
+        drop: List[str],
+        meta: Optional[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """Body of `write`; the caller holds a BEGIN IMMEDIATE transaction."""
+        seq = int(self._get_meta(conn, "seq", "0") or 0)
+        disk: Dict[str, Row] = {}
+        for start in range(0, len(key_list), 500):
+            chunk = key_list[start:start + 500]
+            for r in conn.execute(
+                f"SELECT key, data, seq FROM insights WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ):
+                disk[r[0]] = (r[0], r[1], int(r[2]))
+        now = time.time()
+        written: Dict[str, int] = {}
+        rows = []
+        for key in key_list:
+            payload = render(key, disk.get(key))
+            if payload is None:
+                continue
+            seq += 1
+            rows.append((key, json.dumps(payload), seq, now))
+            written[key] = seq
+        conn.executemany(
+            "INSERT INTO insights (key, data, seq, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET data = excluded.data, seq = excluded.seq, "
+            "updated_at = excluded.updated_at",
+            rows,
+        )
+        conn.executemany("DELETE FROM insight_tombstones WHERE key = ?", [(r[0],) for r in rows])
+        tombstones = []
+        for start in range(0, len(drop), 500):
+            chunk = drop[start:start + 500]
+            marks = ','.join('?' * len(chunk))
+            present = [r[0] for r in conn.execute(f"SELECT key FROM insights WHERE key IN ({marks})", chunk)]
+            conn.execute(f"DELETE FROM insights WHERE key IN ({marks})", chunk)
+            for key in present:
+                seq += 1
+                tombstones.append((key, seq, now))
+        conn.executemany(
+            "INSERT INTO insight_tombstones (key, seq, deleted_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET seq = excluded.seq, deleted_at = excluded.deleted_at",
+            tombstones,
+        )
+        values = dict(meta or {})
+        values["seq"] = seq
+        self._set_meta(conn, values)
+        return written
+
+    # ------------------------------------------------------- JSON export/import
+
+    def export_json(self, path: Path) -> int:
+        """Write every row to `path` as the legacy {key: insight} document."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN")
+            rows = conn.execute("SELECT key, data FROM insights ORDER BY rowid").fetchall()
+            seq = int(self._get_meta(conn, "seq", "0") or 0)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        data = {}
+        for key, text in rows:
+            try:
+                data[key] = json.loads(text)
+            except Exception:
+                continue
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".json.tmp.{os.getpid()}")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        for _ in range(5):
+            try:
+                tmp.replace(path)
+                break
+            except Exception:
+                time.sleep(0.05)
+        try:
+            if tmp.exists():
+                tmp.unlink()
+        except Exception:
+            pass
+        conn = self._connect()
+        try:
+            self._set_meta(conn, {
+                "json_sig": file_signature(path),
+                "exported_seq": seq,
+                "exported_at": time.time(),
+            })
+        finally:
+            conn.close()
+        return len(data)
+
+    def json_changed_externally(self, path: Path) -> bool:
+        sig = file_signature(Path(path))
+        return bool(sig) and sig != self.get_meta("json_sig")
+
+    def import_json(
+        self,
+        path: Path,
+        merge: Callable[[str, Dict[str, Any], Optional[Row]], Optional[Dict[str, Any]]],
+    ) -> Dict[str, int]:
+        """Fold an externally written JSON document into the store.
+
+        Keys present in the file are merged per key. Keys missing from the
+        file are deleted only if they have not changed since the last export
+        (i.e. the file's author saw them and removed them).
+        """
+        path = Path(path)
+        sig = file_signature(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            data = None
+        if not isinstance(data, dict):
+            if sig:
+                conn = self._connect()
+                try:
+                    self._set_meta(conn, {"json_sig": sig})
+                finally:
+                    conn.close()
+            return {"imported": 0, "deleted": 0}
+
+        def _render(key: str, disk_row: Optional[Row]) -> Optional[Dict[str, Any]]:
+            info = data.get(key)
+            if not isinstance(info, dict):
+                return None
+            return merge(key, info, disk_row)
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Stale keys are selected under the same write lock as the
+                # delete, so a key another process updates meanwhile is kept.
+                exported_seq = int(self._get_meta(conn, "exported_seq", "0") or 0)
+                stale = [
+                    r[0] for r in conn.execute(
+                        "SELECT key FROM insights WHERE seq <= ?", (exported_seq,)
+                    ).fetchall()
+                    if r[0] not in data
+                ]
+                keys = [k for k in dict.fromkeys(data.keys()) if k]
+                written = self._write_locked(conn, keys, _render, stale, {"json_sig": sig})
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+        return {"imported": len(written), "deleted": len(stale)}
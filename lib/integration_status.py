@@ -16,6 +16,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+from .append_log import AppendLog
+
 # Paths
 CLAUDE_DIR = Path.home() / ".claude"
 SPARK_DIR = Path.home() / ".spark"
@@ -165,22 +167,23 @@ def check_hook_to_queue_flow(minutes: int = 20) -> Tuple[bool, str]:
 
 def check_advice_log_growing() -> Tuple[bool, str]:
     """Check if advice log is being written to."""
-    log_file = RECENT_ADVICE if RECENT_ADVICE.exists() else ADVICE_LOG
+    log = AppendLog(RECENT_ADVICE)
+    if not log.exists():
+        log = AppendLog(ADVICE_LOG)
 
-    if not log_file.exists():
+    if not log.exists():
         return False, "No advice log found"
 
     try:
-        # Check modification time
-        mtime = log_file.stat().st_mtime
+        # Check modification time (the newest segment; sealed ones keep theirs)
+        mtime = max(p.stat().st_mtime for p in log.segments())
         age_hours = (time.time() - mtime) / 3600
 
         if age_hours > 24:
             return False, f"Advice log stale ({age_hours:.1f}h since last write)"
 
-        # Count recent entries
-        lines = log_file.read_text(encoding='utf-8', errors='replace').strip().split('\n')
-        return True, f"{len(lines)} advice entries, last write {age_hours:.1f}h ago"
+        # Count entries across segments from the sidecar index
+        return True, f"{log.count()} advice entries, last write {age_hours:.1f}h ago"
     except Exception as e:
         return False, f"Error reading advice log: {e}"
 
@@ -426,7 +429,7 @@ def print_status():
     a) Confirm advisory packets are being saved (`build_packet`/`save_packet` flow runs)
     b) Verify packet TTL is not too short for your workflow
     c) Trim invalidation rules if too many packets become invalidated
-    d) Inspect ~/.spark/advice_packets/index.json for unexpected corruption
+    d) Inspect ~/.spark/advice_packets/packets.sqlite for unexpected corruption
 """)
                 elif "Codex Sync Outputs" in check["check"] and not check["ok"]:
                     if "Codex sync not configured" in check["message"]:
@@ -20,9 +20,9 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
-from .config_authority import resolve_section
+from .config_authority import get_section_snapshot
 from .diagnostics import log_debug
 
 # ---------------------------------------------------------------------------
@@ -132,10 +132,10 @@ _VALID_PROVIDERS = {"auto", "minimax", "ollama", "gemini", "openai", "anthropic"
 def _load_area_config(area_id: str) -> Dict[str, Any]:
     """Load config for a single area from the ``llm_areas`` tuneable section."""
     try:
-        section = resolve_section("llm_areas").data
+        section = get_section_snapshot("llm_areas").data
     except Exception:
         section = {}
-    if not isinstance(section, dict):
+    if not isinstance(section, Mapping):
         section = {}
 
     defaults = _AREA_DEFAULTS.get(area_id, {"provider": "minimax", "timeout_s": 6.0, "max_chars": 300})
@@ -184,15 +184,11 @@ def get_all_area_configs() -> Dict[str, Dict[str, Any]]:
 # Provider dispatch (delegates to advisory_synthesizer._query_provider)
 # ---------------------------------------------------------------------------
 
-_timeout_lock = __import__("threading").Lock()
-
-
 def _dispatch_provider(provider: str, prompt: str, timeout_s: float) -> Optional[str]:
     """Call the LLM provider. Wraps advisory_synthesizer._query_provider.
 
-    Uses a lock to protect the module-level AI_TIMEOUT_S mutation so
-    concurrent calls from different threads don't clobber each other's
-    timeout.
+    The timeout is passed per call to the provider's pooled client, so
+    concurrent areas run in parallel with their own budgets.
     """
     try:
         # "claude" provider uses ask_claude via CLI — has its own timeout param
@@ -201,16 +197,8 @@ def _dispatch_provider(provider: str, prompt: str, timeout_s: float) -> Optional
             return ask_claude(prompt, timeout_s=int(timeout_s))
 
         from .advisory_synthesizer import _query_provider
-        import lib.advisory_synthesizer as _synth_mod
-
-        with _timeout_lock:
-            original_timeout = _synth_mod.AI_TIMEOUT_S
-            _synth_mod.AI_TIMEOUT_S = timeout_s
-            try:
-                result = _query_provider(provider, prompt)
-                return result
-            finally:
-                _synth_mod.AI_TIMEOUT_S = original_timeout
+
+        return _query_provider(provider, prompt, timeout_s=timeout_s)
     except Exception as exc:
         log_debug("llm_dispatch", f"provider dispatch failed: {provider}", exc)
         return None
@@ -287,8 +275,8 @@ def llm_area_call(
 def _reload_llm_areas_from(_section_data) -> None:
     """Hot-reload callback for llm_areas config.
 
-    Config is read fresh from resolve_section() on every llm_area_call(),
-    so there's no cached state to invalidate. This callback exists to
+    Config is read from the config_authority snapshot on every
+    llm_area_call(); the snapshot follows file changes on its own. This callback exists to
     ensure the tuneables_reload framework recognises 'llm_areas' as a
     live section (used by Observatory diagnostics and the deep-dive page).
     """
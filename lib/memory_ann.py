@@ -0,0 +1,560 @@
+"""IVF approximate nearest-neighbour index over memory_store vectors.
+
+memory_store keeps one embedding per memory in `memories_vec`, but until now
+vectors were only used to rerank BM25 candidates, so memories that share no
+tokens with the query could never be retrieved. This module adds an
+inverted-file (IVF) index so retrieval can pull vector-first candidates:
+
+- spherical k-means centroids (~sqrt(N) lists) trained over memories_vec
+- every vector is assigned to its nearest list; queries probe the `nprobe`
+  closest lists and score those rows exactly (cosine)
+- below `min_vectors` there is no index and search is an exact scan
+
+Centroids and list assignments live in memory_store.sqlite itself so they
+persist across processes. New vectors are assigned incrementally in the same
+transaction as the memory they describe. Training (first build, and a retrain
+once the collection has grown by `rebuild_growth`) is only flagged there;
+the bridge cycle runs it (`maybe_rebuild`), reading a snapshot outside any
+transaction and installing the centroids in one short write transaction, so
+no writer (e.g. the hook path) ever pays for k-means. Until the first build
+the writer keeps a per-dimension vector count in the meta table instead of
+counting `memories_vec` on every upsert.
+
+Requires numpy; without it every entry point is a no-op and memory_store
+falls back to BM25-only candidates.
+"""
+
+from __future__ import annotations
+
+import math
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover - numpy is optional
+    _np = None
+
+ANN_ENABLED = True
+ANN_MIN_VECTORS = 2000
+ANN_NPROBE = 8
+ANN_CANDIDATES = 20
+ANN_MIN_SIMILARITY = 0.25
+ANN_REBUILD_GROWTH = 2.0
+ANN_MAX_LISTS = 1024
+ANN_TRAIN_ITERATIONS = 10
+ANN_TRAIN_SAMPLE = 20000
+
+
+def _load_memory_ann_config() -> None:
+    global ANN_ENABLED, ANN_MIN_VECTORS, ANN_NPROBE, ANN_CANDIDATES
+    global ANN_MIN_SIMILARITY, ANN_REBUILD_GROWTH, ANN_MAX_LISTS
+    try:
+        from lib.config_authority import resolve_section, env_bool, env_int
+        cfg = resolve_section(
+            "memory_ann",
+            env_overrides={
+                "enabled": env_bool("SPARK_MEMORY_ANN"),
+                "nprobe": env_int("SPARK_MEMORY_ANN_NPROBE"),
+                "candidates": env_int("SPARK_MEMORY_ANN_CANDIDATES"),
+            },
+        ).data
+        ANN_ENABLED = bool(cfg.get("enabled", True))
+        ANN_MIN_VECTORS = int(cfg.get("min_vectors", 2000))
+        ANN_NPROBE = int(cfg.get("nprobe", 8))
+        ANN_CANDIDATES = int(cfg.get("candidates", 20))
+        ANN_MIN_SIMILARITY = float(cfg.get("min_similarity", 0.25))
+        ANN_REBUILD_GROWTH = float(cfg.get("rebuild_growth", 2.0))
+        ANN_MAX_LISTS = int(cfg.get("max_lists", 1024))
+    except Exception:
+        pass
+
+
+_load_memory_ann_config()
+
+try:
+    from lib.tuneables_reload import register_reload
+    register_reload("memory_ann", lambda _s: _load_memory_ann_config(), "memory_ann.reload")
+except Exception:
+    pass
+
+
+# (database file, generation) -> (dim, normalized centroid matrix)
+_CENTROID_CACHE: Dict[Tuple[str, str], Tuple[int, Any]] = {}
+
+
+def available() -> bool:
+    return ANN_ENABLED and _np is not None
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS memories_ann_meta (key TEXT PRIMARY KEY, value TEXT);"
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS memories_ann_centroids (
+          list_id INTEGER PRIMARY KEY,
+          vector BLOB
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS memories_ann_lists (
+          memory_id TEXT PRIMARY KEY,
+          list_id INTEGER NOT NULL
+        );
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_ann_lists_list ON memories_ann_lists(list_id);")
+
+
+def _get_meta(conn: sqlite3.Connection) -> Dict[str, str]:
+    rows = conn.execute("SELECT key, value FROM memories_ann_meta").fetchall()
+    return {str(r[0]): str(r[1]) for r in rows}
+
+
+def _set_meta(conn: sqlite3.Connection, values: Dict[str, Any]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO memories_ann_meta (key, value) VALUES (?, ?)",
+        [(k, str(v)) for k, v in values.items()],
+    )
+
+
+def _db_file(conn: sqlite3.Connection) -> str:
+    try:
+        for row in conn.execute("PRAGMA database_list").fetchall():
+            if row[1] == "main":
+                return str(row[2] or ":memory:")
+    except Exception:
+        pass
+    return ":memory:"
+
+
+def _normalize_rows(mat):
+    norms = _np.linalg.norm(mat, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return mat / norms
+
+
+def _normalize_query(qvec: Sequence[float]):
+    q = _np.asarray(qvec, dtype=_np.float32)
+    norm = float(_np.linalg.norm(q))
+    if norm <= 0.0:
+        return None
+    return q / norm
+
+
+def _rows_to_matrix(rows: List[Any], dim: int) -> Tuple[List[str], Any]:
+    ids: List[str] = []
+    blobs: List[bytes] = []
+    width = dim * 4
+    for r in rows:
+        blob = r[1]
+        if blob is None or len(blob) != width:
+            continue
+        ids.append(r[0])
+        blobs.append(bytes(blob))
+    if not ids:
+        return [], _np.zeros((0, dim), dtype=_np.float32)
+    mat = _np.frombuffer(b"".join(blobs), dtype=_np.float32).reshape(len(ids), dim)
+    return ids, mat
+
+
+def _dominant_dim(conn: sqlite3.Connection) -> Tuple[int, int]:
+    row = conn.execute(
+        "SELECT dim, COUNT(*) AS n FROM memories_vec GROUP BY dim ORDER BY n DESC LIMIT 1"
+    ).fetchone()
+    if not row or not row[0]:
+        return 0, 0
+    return int(row[0]), int(row[1])
+
+
+def _kmeans(data, nlist: int, iterations: int):
+    """Spherical k-means over L2-normalized rows; deterministic seeding."""
+    rng = _np.random.default_rng(0)
+    n = data.shape[0]
+    centroids = data[rng.choice(n, size=nlist, replace=False)].copy()
+    for _ in range(max(1, iterations)):
+        assign = _assign_lists(data, centroids)
+        sums = _np.zeros_like(centroids)
+        _np.add.at(sums, assign, data)
+        counts = _np.bincount(assign, minlength=nlist)
+        empty = _np.flatnonzero(counts == 0)
+        if empty.size:
+            # Re-seed empty lists with the rows worst served by their centroid.
+            fit = _np.einsum("ij,ij->i", data, centroids[assign])
+            worst = _np.argsort(fit)[: empty.size]
+            sums[empty] = data[worst]
+        centroids = _normalize_rows(sums)
+    return centroids.astype(_np.float32)
+
+
+def _assign_lists(data, centroids, chunk: int = 8192):
+    out = _np.empty(data.shape[0], dtype=_np.int64)
+    for start in range(0, data.shape[0], chunk):
+        block = data[start:start + chunk]
+        out[start:start + chunk] = _np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+def _train(conn: sqlite3.Connection, nlist: Optional[int] = None) -> Dict[str, Any]:
+    """Read every vector of the dominant dimension and train centroids (no writes)."""
+    if _np is None:
+        return {"built": False, "reason": "numpy_unavailable"}
+    dim, _count = _dominant_dim(conn)
+    if dim <= 0:
+        return {"built": False, "reason": "no_vectors"}
+    rows = conn.execute(
+        "SELECT memory_id, vector FROM memories_vec WHERE dim = ?", (dim,)
+    ).fetchall()
+    ids, mat = _rows_to_matrix(rows, dim)
+    n = len(ids)
+    if n == 0:
+        return {"built": False, "reason": "no_vectors"}
+    data = _normalize_rows(mat.astype(_np.float32))
+    lists = nlist or int(round(math.sqrt(n)))
+    lists = max(1, min(int(lists), int(ANN_MAX_LISTS), n))
+
+    train = data
+    if n > ANN_TRAIN_SAMPLE:
+        step = n / float(ANN_TRAIN_SAMPLE)
+        train = data[(_np.arange(ANN_TRAIN_SAMPLE) * step).astype(_np.int64)]
+    centroids = _kmeans(train, lists, ANN_TRAIN_ITERATIONS)
+    return {
+        "built": True,
+        "dim": dim,
+        "nlist": lists,
+        "ids": ids,
+        "assign": _assign_lists(data, centroids),
+        "centroids": centroids,
+    }
+
+
+def _install(conn: sqlite3.Connection, trained: Dict[str, Any]) -> Dict[str, Any]:
+    """Write trained centroids and list assignments (caller owns the transaction).
+
+    Vectors written after the training snapshot are assigned here; rows
+    deleted since then are skipped.
+    """
+    dim, lists, centroids = trained["dim"], trained["nlist"], trained["centroids"]
+    current = {r[0] for r in conn.execute("SELECT memory_id FROM memories_vec WHERE dim = ?", (dim,))}
+    assignments = [
+        (mid, int(list_id)) for mid, list_id in zip(trained["ids"], trained["assign"]) if mid in current
+    ]
+    fresh = current.difference(trained["ids"])
+    if fresh:
+        fresh_list = sorted(fresh)
+        for start in range(0, len(fresh_list), 500):
+            chunk = fresh_list[start:start + 500]
+            rows = conn.execute(
+                f"SELECT memory_id, vector FROM memories_vec WHERE memory_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            ids, mat = _rows_to_matrix(rows, dim)
+            if ids:
+                fresh_assign = _assign_lists(_normalize_rows(mat.astype(_np.float32)), centroids)
+                assignments.extend((mid, int(a)) for mid, a in zip(ids, fresh_assign))
+
+    generation = f"{time.time():.6f}:{len(assignments)}"
+    conn.execute("DELETE FROM memories_ann_centroids")
+    conn.execute("DELETE FROM memories_ann_lists")
+    conn.execute("DELETE FROM memories_ann_meta WHERE key LIKE 'vectors:%' OR key = 'vectors_counted'")
+    conn.executemany(
+        "INSERT INTO memories_ann_centroids (list_id, vector) VALUES (?, ?)",
+        [(i, centroids[i].tobytes()) for i in range(lists)],
+    )
+    conn.executemany("INSERT INTO memories_ann_lists (memory_id, list_id) VALUES (?, ?)", assignments)
+    _set_meta(conn, {
+        "dim": dim,
+        "nlist": lists,
+        "built_count": len(assignments),
+        "added": 0,
+        "rebuild_due": 0,
+        "generation": generation,
+        "built_at": time.time(),
+    })
+    _CENTROID_CACHE[(_db_file(conn), generation)] = (dim, centroids)
+    return {"built": True, "dim": dim, "nlist": lists, "vectors": len(assignments)}
+
+
+def build(conn: sqlite3.Connection, *, nlist: Optional[int] = None) -> Dict[str, Any]:
+    """(Re)train centroids over every vector of the dominant dimension.
+
+    Runs inside the caller's transaction; prefer `rebuild`, which trains
+    before taking the write lock.
+    """
+    trained = _train(conn, nlist)
+    if not trained.get("built"):
+        return trained
+    return _install(conn, trained)
+
+
+def rebuild(conn: sqlite3.Connection, *, nlist: Optional[int] = None) -> Dict[str, Any]:
+    """Train from a read snapshot, then install in one short write transaction."""
+    if conn.in_transaction:
+        conn.commit()
+    trained = _train(conn, nlist)
+    if not trained.get("built"):
+        return trained
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        result = _install(conn, trained)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return result
+
+
+def rebuild_due(conn: sqlite3.Connection) -> bool:
+    """Whether a write flagged a (re)build (meta lookup only, no vector scan)."""
+    if not available():
+        return False
+    return _get_meta(conn).get("rebuild_due") == "1"
+
+
+def maybe_rebuild(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+    """Run a flagged (re)build. Trains, so call it from background work only."""
+    if not rebuild_due(conn):
+        return None
+    if not _get_meta(conn).get("generation"):
+        # Deletes do not decrement the pre-build counts; confirm before training.
+        _dim, count = _dominant_dim(conn)
+        if count < max(1, int(ANN_MIN_VECTORS)):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                _count_vectors(conn)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            return None
+    return rebuild(conn)
+
+
+def _count_vectors(conn: sqlite3.Connection) -> Dict[str, str]:
+    """(Re)seed the pre-build per-dimension vector counts from memories_vec."""
+    counts = {
+        f"vectors:{int(r[0])}": int(r[1])
+        for r in conn.execute("SELECT dim, COUNT(*) FROM memories_vec GROUP BY dim").fetchall()
+        if r[0]
+    }
+    conn.execute("DELETE FROM memories_ann_meta WHERE key LIKE 'vectors:%'")
+    due = max(counts.values(), default=0) >= max(1, int(ANN_MIN_VECTORS))
+    _set_meta(conn, {**counts, "vectors_counted": 1, "rebuild_due": int(due)})
+    return _get_meta(conn)
+
+
+def _count_new_vector(conn: sqlite3.Connection, meta: Dict[str, str], dim: int, is_new: bool) -> None:
+    """Pre-build bookkeeping: bump the count for `dim` and flag the first build."""
+    if meta.get("vectors_counted") != "1":
+        _count_vectors(conn)  # one scan per store; includes the row just written
+        return
+    if not is_new:
+        return
+    key = f"vectors:{int(dim)}"
+    count = int(meta.get(key) or 0) + 1
+    values: Dict[str, Any] = {key: count}
+    if count >= max(1, int(ANN_MIN_VECTORS)):
+        values["rebuild_due"] = 1
+    _set_meta(conn, values)
+
+
+def _load_centroids(conn: sqlite3.Connection, meta: Optional[Dict[str, str]] = None):
+    meta = meta if meta is not None else _get_meta(conn)
+    generation = meta.get("generation")
+    if not generation:
+        return None
+    key = (_db_file(conn), generation)
+    cached = _CENTROID_CACHE.get(key)
+    if cached is not None:
+        return cached
+    dim = int(meta.get("dim") or 0)
+    rows = conn.execute(
+        "SELECT list_id, vector FROM memories_ann_centroids ORDER BY list_id"
+    ).fetchall()
+    if dim <= 0 or not rows:
+        return None
+    _ids, centroids = _rows_to_matrix([(r[0], r[1]) for r in rows], dim)
+    if centroids.shape[0] == 0:
+        return None
+    for stale in [k for k in _CENTROID_CACHE if k[0] == key[0]]:
+        _CENTROID_CACHE.pop(stale, None)
+    _CENTROID_CACHE[key] = (dim, centroids)
+    return _CENTROID_CACHE[key]
+
+
+def add_vector(
+    conn: sqlite3.Connection,
+    memory_id: str,
+    vec: Sequence[float],
+    *,
+    is_new: bool = True,
+) -> bool:
+    """Assign one freshly written vector; flags a (re)build when due.
+
+    Called from memory_store.upsert_entry inside its transaction, so it never
+    trains (see `maybe_rebuild`). `is_new` is False when the memory already
+    had a vector. Returns True when the vector is covered by the index
+    afterwards.
+    """
+    if not available() or not memory_id or not vec:
+        return False
+    meta = _get_meta(conn)
+    loaded = _load_centroids(conn, meta)
+    if loaded is None:
+        if not meta.get("generation"):
+            _count_new_vector(conn, meta, len(vec), is_new)
+        return False
+
+    dim, centroids = loaded
+    if len(vec) != dim:
+        return False
+    q = _normalize_query(vec)
+    if q is None:
+        return False
+    list_id = int(_np.argmax(centroids @ q))
+    existed = conn.execute(
+        "SELECT 1 FROM memories_ann_lists WHERE memory_id = ?", (memory_id,)
+    ).fetchone()
+    conn.execute(
+        "INSERT OR REPLACE INTO memories_ann_lists (memory_id, list_id) VALUES (?, ?)",
+        (memory_id, list_id),
+    )
+    if existed:
+        return True
+    added = int(meta.get("added") or 0) + 1
+    built_count = max(1, int(meta.get("built_count") or 1))
+    growth = float(ANN_REBUILD_GROWTH)
+    due = growth > 1.0 and built_count + added >= built_count * growth
+    _set_meta(conn, {"added": added, "rebuild_due": int(due)})
+    return True
+
+
+def remove_ids(conn: sqlite3.Connection, memory_ids: Sequence[str]) -> None:
+    ids = [m for m in memory_ids if m]
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        conn.execute(
+            f"DELETE FROM memories_ann_lists WHERE memory_id IN ({','.join('?' * len(chunk))})",
+            chunk,
+        )
+
+
+def _scored_rows(rows: List[Any], dim: int, q, k: int) -> List[Tuple[str, float]]:
+    ids, mat = _rows_to_matrix(rows, dim)
+    if not ids:
+        return []
+    norms = _np.linalg.norm(mat, axis=1)
+    norms[norms == 0.0] = 1.0
+    sims = (mat @ q) / norms
+    k = min(int(k), len(ids))
+    if k <= 0:
+        return []
+    if k < len(ids):
+        top = _np.argpartition(-sims, k - 1)[:k]
+    else:
+        top = _np.arange(len(ids))
+    top = top[_np.argsort(-sims[top], kind="stable")]
+    return [(ids[i], float(sims[i])) for i in top]
+
+
+def _scope_clause(project_key: Optional[str]) -> Tuple[str, List[Any]]:
+    if project_key:
+        return " AND (m.scope = 'global' OR m.project_key = ?)", [project_key]
+    return "", []
+
+
+def exact_search(
+    conn: sqlite3.Connection,
+    qvec: Sequence[float],
+    *,
+    k: int,
+    project_key: Optional[str] = None,
+) -> List[Tuple[str, float]]:
+    """Brute-force cosine top-k (ground truth and small-collection path)."""
+    if _np is None or not qvec:
+        return []
+    q = _normalize_query(qvec)
+    if q is None:
+        return []
+    clause, params = _scope_clause(project_key)
+    rows = conn.execute(
+        f"""
+        SELECT v.memory_id, v.vector
+        FROM memories_vec v
+        JOIN memories m ON m.memory_id = v.memory_id
+        WHERE v.dim = ?{clause}
+        """,
+        [len(q), *params],
+    ).fetchall()
+    return _scored_rows(rows, len(q), q, k)
+
+
+def search(
+    conn: sqlite3.Connection,
+    qvec: Sequence[float],
+    *,
+    k: Optional[int] = None,
+    nprobe: Optional[int] = None,
+    project_key: Optional[str] = None,
+) -> List[Tuple[str, float]]:
+    """Top-k (memory_id, cosine) by probing the nearest IVF lists.
+
+    Falls back to an exact scan while the collection is below the build
+    threshold (or the index was trained for a different embedding dim).
+    """
+    if not available() or not qvec:
+        return []
+    k = int(k if k is not None else ANN_CANDIDATES)
+    if k <= 0:
+        return []
+    loaded = _load_centroids(conn)
+    if loaded is None or loaded[0] != len(qvec):
+        return exact_search(conn, qvec, k=k, project_key=project_key)
+    dim, centroids = loaded
+    q = _normalize_query(qvec)
+    if q is None:
+        return []
+    probes = max(1, min(int(nprobe if nprobe is not None else ANN_NPROBE), centroids.shape[0]))
+    centroid_sims = centroids @ q
+    if probes < centroids.shape[0]:
+        probe_ids = _np.argpartition(-centroid_sims, probes - 1)[:probes]
+    else:
+        probe_ids = _np.arange(centroids.shape[0])
+    clause, params = _scope_clause(project_key)
+    placeholders = ",".join("?" * len(probe_ids))
+    rows = conn.execute(
+        f"""
+        SELECT l.memory_id, v.vector
+        FROM memories_ann_lists l
+        JOIN memories_vec v ON v.memory_id = l.memory_id
+        JOIN memories m ON m.memory_id = l.memory_id
+        WHERE l.list_id IN ({placeholders}){clause}
+        """,
+        [int(i) for i in probe_ids] + params,
+    ).fetchall()
+    return _scored_rows(rows, dim, q, k)
+
+
+def status(conn: sqlite3.Connection) -> Dict[str, Any]:
+    meta = _get_meta(conn)
+    indexed = conn.execute("SELECT COUNT(*) FROM memories_ann_lists").fetchone()[0]
+    return {
+        "available": available(),
+        "built": bool(meta.get("generation")),
+        "dim": int(meta.get("dim") or 0),
+        "nlist": int(meta.get("nlist") or 0),
+        "indexed": int(indexed or 0),
+        "built_count": int(meta.get("built_count") or 0),
+        "added_since_build": int(meta.get("added") or 0),
+        "rebuild_due": meta.get("rebuild_due") == "1",
+        "pending_vectors": max(
+            (int(v or 0) for k, v in meta.items() if k.startswith("vectors:")), default=0
+        ),
+        "min_vectors": int(ANN_MIN_VECTORS),
+        "nprobe": int(ANN_NPROBE),
+    }
@@ -10,6 +10,8 @@ Support layered memory without platform coupling:
 Design constraints
 ------------------
 - Lightweight + stable: local JSONL files, simple keyword retrieval
+- JSONL banks stay the append log; retrieval runs over an in-process
+  inverted index of each bank's recent window, refreshed by file offset
 - Compatible everywhere: driven by Spark queue + SparkEventV1 payloads
 - Natural-language-first UX: users should not need CLI; CLI is for dev/debug
 
@@ -17,8 +19,11 @@ Design constraints
 
 from __future__ import annotations
 
+import bisect
 import json
+import os
 import re
+import threading
 import time
 import hashlib
 from dataclasses import dataclass
@@ -419,10 +424,176 @@ def _read_jsonl(path: Path, limit: int = 500) -> List[Dict[str, Any]]:
     return out
 
 
+# Entries per bank considered by retrieve() (the newest ones).
+BANK_WINDOW = 800
+# A refresh that would parse more than this re-reads the tail window instead.
+_MAX_INCREMENTAL_BYTES = 4 * 1024 * 1024
+_TAIL_SIG_BYTES = 64
+_TOKEN_RE = re.compile(r"\W+")
+
+
+class _BankIndex:
+    """Inverted index over the newest BANK_WINDOW entries of one bank file.
+
+    Entries get increasing sequence numbers; postings map each lower-cased word
+    to the sequences containing it. A refresh stats the file and parses only
+    the bytes appended since the last one; a replaced or rewritten file (inode
+    change, shrink, or changed bytes before the cursor) reloads the tail window.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.inode: Optional[int] = None
+        self.offset = 0
+        self.tail_sig = b""
+        self._reset()
+
+    def _reset(self) -> None:
+        self.next_seq = 0
+        self.floor = 0  # sequences below this have been trimmed
+        self.entries: Dict[int, Tuple[Dict[str, Any], str]] = {}  # seq -> (row, lowered text)
+        self.postings: Dict[str, List[int]] = {}
+        self._vocab: Optional[List[str]] = None
+
+    def _add(self, line: str) -> None:
+        try:
+            row = json.loads(line)
+        except Exception:
+            return
+        if not isinstance(row, dict):
+            return
+        raw = str(row.get("text") or "")
+        text = raw.lower()
+        seq = self.next_seq
+        self.next_seq += 1
+        if not text or _is_telemetry_memory(text) or _is_telemetry_memory(raw.strip()):
+            return
+        self.entries[seq] = (row, text)
+        for tok in set(_TOKEN_RE.split(text)):
+            if tok:
+                self.postings.setdefault(tok, []).append(seq)
+        self._vocab = None
+
+    def _trim(self) -> None:
+        """Drop entries older than the window once it has doubled (amortized)."""
+        low = self.next_seq - BANK_WINDOW
+        if low - self.floor < BANK_WINDOW:
+            return
+        self.entries = {seq: e for seq, e in self.entries.items() if seq >= low}
+        postings: Dict[str, List[int]] = {}
+        for tok, seqs in self.postings.items():
+            kept = [seq for seq in seqs if seq >= low]
+            if kept:
+                postings[tok] = kept
+        self.postings = postings
+        self.floor = low
+        self._vocab = None
+
+    def refresh(self) -> None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            self.inode, self.offset, self.tail_sig = None, 0, b""
+            self._reset()
+            return
+        if st.st_ino == self.inode and st.st_size == self.offset:
+            return
+        with self.path.open("rb") as f:
+            incremental = (
+                st.st_ino == self.inode
+                and self.offset <= st.st_size
+                and st.st_size - self.offset <= _MAX_INCREMENTAL_BYTES
+            )
+            if incremental and self.tail_sig:
+                f.seek(self.offset - len(self.tail_sig))
+                incremental = f.read(len(self.tail_sig)) == self.tail_sig
+            if incremental:
+                f.seek(self.offset)
+                data = f.read(st.st_size - self.offset)
+                cut = data.rfind(b"\n")
+                if cut < 0:
+                    return
+                lines = data[:cut].decode("utf-8", errors="replace").split("\n")
+                end = self.offset + cut + 1
+            else:
+                self._reset()
+                lines = _tail_lines(self.path, BANK_WINDOW)
+                end = st.st_size
+            f.seek(max(0, end - _TAIL_SIG_BYTES))
+            self.tail_sig = f.read(end - max(0, end - _TAIL_SIG_BYTES))
+        self.inode, self.offset = st.st_ino, end
+        # Only the newest BANK_WINDOW lines are ever visible.
+        self.next_seq += max(0, len(lines) - BANK_WINDOW)
+        for line in lines[-BANK_WINDOW:]:
+            self._add(line)
+        self._trim()
+
+    def match(self, words: List[str]) -> set:
+        """Sequences (within the window) with a word starting with any of ``words``."""
+        if self._vocab is None:
+            self._vocab = sorted(self.postings)
+        low = self.next_seq - BANK_WINDOW
+        found: set = set()
+        for w in words:
+            i = bisect.bisect_left(self._vocab, w)
+            while i < len(self._vocab) and self._vocab[i].startswith(w):
+                found.update(seq for seq in self.postings[self._vocab[i]] if seq >= low)
+                i += 1
+        return found
+
+    def newest(self, n: int) -> List[int]:
+        low = self.next_seq - BANK_WINDOW
+        out: List[int] = []
+        for seq in reversed(self.entries):
+            if len(out) >= n or seq < low:
+                break
+            out.append(seq)
+        return out
+
+
+_BANK_INDEXES: Dict[str, _BankIndex] = {}
+_BANK_INDEXES_LOCK = threading.Lock()
+
+
+def _bank_index(path: Path) -> _BankIndex:
+    key = os.path.abspath(str(path))
+    with _BANK_INDEXES_LOCK:
+        idx = _BANK_INDEXES.get(key)
+        if idx is None:
+            idx = _BANK_INDEXES[key] = _BankIndex(Path(key))
+    return idx
+
+
+def _bank_candidates(
+    path: Path, q: str, q_words: List[str], newest: int
+) -> List[Tuple[int, Dict[str, Any], str]]:
+    """(seq, row, lowered text) for entries matching the query, newest first.
+
+    ``newest`` extra most-recent entries are included regardless of text (the
+    project bank boost can rank them without a keyword hit).
+    """
+    idx = _bank_index(path)
+    with idx.lock:
+        try:
+            idx.refresh()
+        except Exception:
+            return []
+        if q_words:
+            seqs = idx.match(q_words)
+        else:
+            low = idx.next_seq - BANK_WINDOW
+            seqs = {seq for seq, (_, text) in idx.entries.items() if seq >= low and q in text}
+        seqs.update(idx.newest(newest))
+        return [(seq, *idx.entries[seq]) for seq in sorted(seqs, reverse=True)]
+
+
 def retrieve(query: str, project_key: Optional[str] = None, limit: int = 6) -> List[Dict[str, Any]]:
     """Retrieve relevant memories from project + global banks.
 
-    Lightweight keyword match + recency.
+    Keyword match + recency over the indexed window of each bank (the newest
+    BANK_WINDOW entries). Query words match words they prefix; scoring then
+    checks the phrase and words against the entry text.
     """
 
     q = (query or "").lower().strip()
@@ -445,28 +616,22 @@ def retrieve(query: str, project_key: Optional[str] = None, limit: int = 6) -> L
     except Exception:
         out = []
 
-    candidates: List[Dict[str, Any]] = []
+    q_words = [w for w in _TOKEN_RE.split(q) if len(w) > 2][:8]
+    want = max(0, int(limit or 0)) + len(seen)
 
+    candidates: List[Tuple[int, Dict[str, Any], str]] = []
     if project_key:
-        candidates.extend(_read_jsonl(PROJECTS_DIR / f"{project_key}.jsonl", limit=800))
-
-    candidates.extend(_read_jsonl(GLOBAL_FILE, limit=800))
+        candidates.extend(_bank_candidates(PROJECTS_DIR / f"{project_key}.jsonl", q, q_words, want))
+    candidates.extend(_bank_candidates(GLOBAL_FILE, q, q_words, 0))
 
     scored: List[Tuple[float, Dict[str, Any]]] = []
-    q_words = [w for w in re.split(r"\W+", q) if len(w) > 2]
-
-    for it in candidates:
-        text = (it.get("text") or "").lower()
-        if not text:
-            continue
-        if _is_telemetry_memory(text):
-            continue
-
+    now = time.time()
+    for _, it, text in candidates:
         # basic scoring
         score = 0.0
         if q in text:
             score += 2.0
-        for w in q_words[:8]:
+        for w in q_words:
             if w in text:
                 score += 0.25
 
@@ -476,7 +641,7 @@ def retrieve(query: str, project_key: Optional[str] = None, limit: int = 6) -> L
 
         # recency boost
         created = float(it.get("created_at") or 0.0)
-        age = max(1.0, time.time() - created)
+        age = max(1.0, now - created)
         score += min(0.4, 50000.0 / age / 100000.0)
 
         if score > 0.25:
@@ -484,9 +649,6 @@ def retrieve(query: str, project_key: Optional[str] = None, limit: int = 6) -> L
 
     scored.sort(key=lambda t: t[0], reverse=True)
     for _, it in scored:
-        text = (it.get("text") or "").strip()
-        if _is_telemetry_memory(text):
-            continue
         key = it.get("entry_id") or it.get("text")
         if key and key in seen:
             continue
@@ -32,6 +32,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from lib.cognitive_learner import CognitiveCategory
 from lib.config_authority import resolve_section
 from lib.memory_banks import store_memory
+from lib.noise_classifier import check, is_noise, pattern, register
 from lib.outcome_checkin import record_checkin_request
 from lib.outcome_log import append_outcome, make_outcome_id
 from lib.queue import EventType, read_recent_events
@@ -179,21 +180,26 @@ def _is_decision_text(text: str) -> bool:
     return False
 
 
-def _is_capture_noise(text: str) -> bool:
-    sample = str(text or "").strip()
-    if not sample:
-        return True
-    sample_clean = _strip_inline_noise_tokens(sample)
-    if not sample_clean:
-        return True
-    if any(rx.search(sample_clean) for rx in _CAPTURE_NOISE_PATTERNS):
-        return True
-    noise_lines, total_lines, signal_lines = _noise_line_stats(sample_clean)
+def _capture_fields(text: str) -> Dict[str, str]:
+    return {"clean": _strip_inline_noise_tokens(text.strip())}
+
+
+def _mostly_noise_lines(fields: Dict[str, str]) -> bool:
+    noise_lines, total_lines, signal_lines = _noise_line_stats(fields["clean"])
     if total_lines >= 4 and noise_lines / max(1, total_lines) >= 0.55 and signal_lines <= 1:
         return True
-    if total_lines >= 8 and noise_lines >= 6:
-        return True
-    return False
+    return total_lines >= 8 and noise_lines >= 6
+
+
+register("capture", (
+    check("empty", lambda f: not f["clean"]),
+    *(pattern("scaffolding", rx, field="clean") for rx in _CAPTURE_NOISE_PATTERNS),
+    check("noise_lines", _mostly_noise_lines),
+), prepare=_capture_fields, empty="empty")
+
+
+def _is_capture_noise(text: str) -> bool:
+    return is_noise(text, "capture")
 
 
 def _compact_context_snippet(text: str, *, max_chars: int) -> str:
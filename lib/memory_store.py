@@ -21,6 +21,7 @@ from array import array
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from lib import memory_ann
 from lib.config_authority import env_bool, env_float, resolve_section
 from lib.embeddings import embed_texts
 
@@ -430,6 +431,7 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
     )
     conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_source ON memory_edges(source_id);")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_target ON memory_edges(target_id);")
+    memory_ann.ensure_schema(conn)
     conn.commit()
 
 
@@ -811,10 +813,17 @@ def _upsert_entry_raw(
     vectors = _embed_texts([content])
     if vectors:
         vec = vectors[0]
+        had_vector = conn.execute(
+            "SELECT 1 FROM memories_vec WHERE memory_id = ?", (memory_id,)
+        ).fetchone() is not None
         conn.execute(
             "INSERT OR REPLACE INTO memories_vec (memory_id, dim, vector) VALUES (?, ?, ?)",
             (memory_id, len(vec), _vector_to_blob(vec)),
         )
+        try:
+            memory_ann.add_vector(conn, memory_id, vec, is_new=not had_vector)
+        except Exception:
+            pass
 
     _link_edges(conn, memory_id, project_key, scope, created_at)
 
@@ -934,6 +943,10 @@ def upsert_entry(
         conn.close()
 
 
+def _has_vectors(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM memories_vec LIMIT 1").fetchone() is not None
+
+
 def _fetch_vectors(conn: sqlite3.Connection, ids: Iterable[str]) -> Dict[str, List[float]]:
     id_list = [i for i in ids if i]
     if not id_list:
@@ -1017,6 +1030,7 @@ def purge_telemetry_memories(
             if _ensure_fts(conn):
                 conn.execute("DELETE FROM memories_fts WHERE memory_id IN (SELECT memory_id FROM _tmp_memory_ids)")
             conn.execute("DELETE FROM memories_vec WHERE memory_id IN (SELECT memory_id FROM _tmp_memory_ids)")
+            conn.execute("DELETE FROM memories_ann_lists WHERE memory_id IN (SELECT memory_id FROM _tmp_memory_ids)")
             conn.execute(
                 """
                 DELETE FROM memory_edges
@@ -1041,6 +1055,82 @@ def _parse_meta(raw: Any) -> Dict[str, Any]:
         return {}
 
 
+def _ann_candidates(
+    conn: sqlite3.Connection,
+    qvec: List[float],
+    project_key: Optional[str],
+    exclude: set,
+) -> List[Dict[str, Any]]:
+    """Nearest memories by vector alone, as lexical-score-0 retrieve() items."""
+    try:
+        hits = memory_ann.search(conn, qvec, project_key=project_key)
+    except Exception:
+        return []
+    min_sim = float(memory_ann.ANN_MIN_SIMILARITY)
+    hits = [(mid, sim) for mid, sim in hits if mid not in exclude and sim >= min_sim]
+    if not hits:
+        return []
+    rows = conn.execute(
+        f"""
+        SELECT memory_id, content, scope, project_key, category, meta
+        FROM memories
+        WHERE memory_id IN ({",".join("?" * len(hits))});
+        """,
+        [mid for mid, _sim in hits],
+    ).fetchall()
+    row_map = {r["memory_id"]: r for r in rows}
+    out: List[Dict[str, Any]] = []
+    for mid, sim in hits:
+        r = row_map.get(mid)
+        if r is None:
+            continue
+        content = r["content"] or ""
+        if _is_telemetry_memory(content):
+            continue
+        meta = _parse_meta(r["meta"])
+        parent_id = str(meta.get("parent_id") or "").strip() or None
+        out.append({
+            "entry_id": mid,
+            "text": content,
+            "scope": r["scope"],
+            "project_key": r["project_key"],
+            "category": r["category"],
+            "bm25": None,
+            "score": 0.0,
+            "ann_similarity": round(float(sim), 4),
+            "meta": meta,
+            "parent_id": parent_id,
+            "patch_index": meta.get("patch_index"),
+        })
+    return out
+
+
+def ann_status() -> Dict[str, Any]:
+    conn = _connect()
+    try:
+        return memory_ann.status(conn)
+    finally:
+        conn.close()
+
+
+def rebuild_ann_index() -> Dict[str, Any]:
+    conn = _connect()
+    try:
+        return memory_ann.rebuild(conn)
+    finally:
+        conn.close()
+
+
+def maintain_ann_index() -> Dict[str, Any]:
+    """Run an ANN (re)build that writes have flagged (bridge cycle, not hooks)."""
+    conn = _connect()
+    try:
+        result = memory_ann.maybe_rebuild(conn)
+        return result if result is not None else {"built": False, "reason": "not_due"}
+    finally:
+        conn.close()
+
+
 def retrieve(
     query: str,
     *,
@@ -1151,12 +1241,23 @@ def retrieve(
                     "patch_index": meta.get("patch_index"),
                 })
 
-        if not items:
+        # Nothing matched lexically and there is nothing to search by vector:
+        # skip the query embedding.
+        if not items and not (memory_ann.available() and _has_vectors(conn)):
             return []
 
         vectors = _embed_texts([q])
-        if vectors:
-            qvec = vectors[0]
+        qvec = vectors[0] if vectors else None
+
+        # Vector-first candidates: memories that are semantically close but
+        # share no tokens with the query never come back from BM25.
+        if qvec and memory_ann.available():
+            items.extend(_ann_candidates(conn, qvec, project_key, {i["entry_id"] for i in items}))
+
+        if not items:
+            return []
+
+        if qvec:
             vecs = _fetch_vectors(conn, [i["entry_id"] for i in items])
             for it in items:
                 vec = vecs.get(it["entry_id"])
@@ -389,6 +389,12 @@ class MetaRalph:
         self.mind = mind_client
         self.roast_history: List[Dict] = []
         self.outcome_records: Dict[str, OutcomeRecord] = {}
+        # Per-insight outcome counters derived from outcome_records (see
+        # "INSIGHT AGGREGATES"); kept in step by track_retrieval/track_outcome.
+        self._insight_aggregates: Dict[str, Dict[str, Any]] = {}
+        self._insight_contrib: Dict[str, Tuple[str, bool, bool]] = {}
+        self._insight_strict_ids: Dict[str, set] = {}
+        self._aggregate_signature: Optional[Tuple[int, bool]] = None
         # Track last loaded mtime so we only merge when another process updated disk.
         self._outcome_loaded_mtime: float = 0.0
         self.learnings_stored: Dict[str, Dict] = {}
@@ -490,6 +496,7 @@ class MetaRalph:
                     self._outcome_loaded_mtime = 0.0
             except Exception:
                 pass
+        self._rebuild_insight_aggregates()
 
         if self.LEARNINGS_STORE_FILE.exists():
             try:
@@ -609,6 +616,7 @@ class MetaRalph:
                 self.outcome_records[disk_record.learning_id] = self._merge_outcome_record(
                     existing, disk_record
                 )
+            self._reindex_outcome_record(disk_record.learning_id)
         try:
             if disk_mtime is not None:
                 self._outcome_loaded_mtime = float(disk_mtime)
@@ -714,9 +722,14 @@ class MetaRalph:
                     break
                 keep.extend(bucket[: 500 - len(keep)])
             self.outcome_records = {r.learning_id: r for r in keep}
+            self._rebuild_insight_aggregates()
 
+        self._ensure_insight_aggregates()
         self._atomic_write_json(self.OUTCOME_TRACKING_FILE, {
             "records": [r.to_dict() for r in list(self.outcome_records.values())[-500:]],
+            "insight_aggregates": {
+                key: dict(agg) for key, agg in self._insight_aggregates.items()
+            },
             "last_updated": datetime.now().isoformat()
         })
         try:
@@ -1592,6 +1605,7 @@ class MetaRalph:
                 source=source,
                 trace_id=trace_id,
             )
+            self._reindex_outcome_record(learning_id)
             self._save_state()
             return
 
@@ -1620,6 +1634,7 @@ class MetaRalph:
         rec.outcome_at = None
         rec.outcome_trace_id = None
         rec.outcome_latency_s = None
+        self._reindex_outcome_record(learning_id)
         self._save_state()
 
     def track_outcome(
@@ -1664,7 +1679,8 @@ class MetaRalph:
             rec.insight_key = insight_key
         if source and rec.source in ("auto_created", "unattributed"):
             rec.source = source
-        outcome_now = datetime.now().isoformat()
+        outcome_dt = datetime.now()
+        outcome_now = outcome_dt.isoformat()
         rec.acted_on = True
         rec.outcome = outcome
         rec.outcome_evidence = evidence
@@ -1682,9 +1698,29 @@ class MetaRalph:
         latency_s = self._compute_outcome_latency_s(rec)
         if latency_s is not None:
             rec.outcome_latency_s = latency_s
+        self._reindex_outcome_record(learning_id)
         self._update_learning_outcomes(rec)
         self._apply_outcome_to_cognitive(rec)
         self._save_state()
+        self._index_outcome(rec, outcome_dt.timestamp())
+
+    def _index_outcome(self, rec: OutcomeRecord, ts: float) -> None:
+        """Write the outcome time into the advisory emission index (best-effort)."""
+        if str(rec.outcome or "").strip().lower() not in {"good", "bad", "neutral"}:
+            return
+        rows = []
+        ik = str(rec.insight_key or "").strip().lower()
+        if ik:
+            rows.append(("outcome_insight", ik, "", ts))
+        aid = str(rec.learning_id or "").strip().lower()
+        if aid:
+            rows.append(("outcome_advice", aid, "", ts))
+        try:
+            from .advisory_emission_index import emission_index_for
+
+            emission_index_for(self.OUTCOME_TRACKING_FILE).record(rows)
+        except Exception:
+            pass
 
     def _normalize_outcome(self, outcome: Optional[str]) -> str:
         if not outcome:
@@ -2104,6 +2140,133 @@ class MetaRalph:
             "effectiveness_rate": good_outcomes / max(len(with_explicit), 1)
         }
 
+    # =========================================================================
+    # INSIGHT AGGREGATES
+    # =========================================================================
+
+    def _insight_contribution(self, record: OutcomeRecord) -> Optional[Tuple[str, bool, bool]]:
+        """(insight_key, is_good, is_strict) for a record that counts toward effectiveness."""
+        key = record.insight_key
+        if not key or not record.acted_on:
+            return None
+        outcome = self._normalize_outcome(record.outcome)
+        if outcome not in ("good", "bad"):
+            return None
+        strict = self._is_strictly_attributable(
+            record,
+            window_s=int(ATTRIBUTION_WINDOW_S),
+            require_trace=bool(STRICT_ATTRIBUTION_REQUIRE_TRACE),
+        )
+        return key, outcome == "good", strict
+
+    def _last_strict_outcome_at(self, insight_key: str) -> Optional[datetime]:
+        last = None
+        for learning_id in self._insight_strict_ids.get(insight_key, ()):
+            rec = self.outcome_records.get(learning_id)
+            ts = self._parse_iso_timestamp(rec.outcome_at) if rec else None
+            if ts and (last is None or ts > last):
+                last = ts
+        return last
+
+    def _add_contribution(self, learning_id: str, contrib: Tuple[str, bool, bool], sign: int) -> None:
+        key, good, strict = contrib
+        agg = self._insight_aggregates.get(key)
+        if agg is None:
+            if sign < 0:
+                return
+            agg = {"weak_good": 0, "weak_bad": 0, "strict_good": 0, "strict_bad": 0, "last_strict_at": None}
+            self._insight_aggregates[key] = agg
+        agg["weak_good" if good else "weak_bad"] += sign
+        if strict:
+            agg["strict_good" if good else "strict_bad"] += sign
+            members = self._insight_strict_ids.setdefault(key, set())
+            if sign > 0:
+                members.add(learning_id)
+            else:
+                members.discard(learning_id)
+                if not members:
+                    self._insight_strict_ids.pop(key, None)
+            last = self._last_strict_outcome_at(key)
+            agg["last_strict_at"] = last.isoformat() if last else None
+        if agg["weak_good"] + agg["weak_bad"] <= 0:
+            self._insight_aggregates.pop(key, None)
+            self._insight_strict_ids.pop(key, None)
+
+    def _reindex_outcome_record(self, learning_id: str) -> None:
+        """Move one record's contribution to the per-insight counters."""
+        if self._aggregate_signature is None:
+            self._rebuild_insight_aggregates()
+            return
+        old = self._insight_contrib.pop(learning_id, None)
+        if old is not None:
+            self._add_contribution(learning_id, old, -1)
+        rec = self.outcome_records.get(learning_id)
+        new = self._insight_contribution(rec) if rec is not None else None
+        if new is not None:
+            self._insight_contrib[learning_id] = new
+            self._add_contribution(learning_id, new, +1)
+
+    def _rebuild_insight_aggregates(self) -> None:
+        self._insight_aggregates = {}
+        self._insight_contrib = {}
+        self._insight_strict_ids = {}
+        self._aggregate_signature = (int(ATTRIBUTION_WINDOW_S), bool(STRICT_ATTRIBUTION_REQUIRE_TRACE))
+        for learning_id, rec in self.outcome_records.items():
+            contrib = self._insight_contribution(rec)
+            if contrib is not None:
+                self._insight_contrib[learning_id] = contrib
+                self._add_contribution(learning_id, contrib, +1)
+
+    def _ensure_insight_aggregates(self) -> None:
+        # Strictness depends on the attribution config, which can hot-reload.
+        if self._aggregate_signature != (int(ATTRIBUTION_WINDOW_S), bool(STRICT_ATTRIBUTION_REQUIRE_TRACE)):
+            self._rebuild_insight_aggregates()
+
+    def get_insight_aggregate(self, insight_key: str) -> Dict[str, Any]:
+        """Return the outcome counters for one insight (zeros if unseen)."""
+        self._ensure_insight_aggregates()
+        agg = self._insight_aggregates.get(insight_key)
+        if not agg:
+            return {"weak_good": 0, "weak_bad": 0, "strict_good": 0, "strict_bad": 0, "last_strict_at": None}
+        return dict(agg)
+
+    def check_insight_aggregates(self, repair: bool = False) -> Dict[str, Any]:
+        """Compare the incremental counters with a full recomputation.
+
+        Records edited in place (instead of through track_retrieval /
+        track_outcome) are the usual cause of drift; repair=True rebuilds.
+        """
+        self._ensure_insight_aggregates()
+        expected: Dict[str, Dict[str, int]] = {}
+        for rec in self.outcome_records.values():
+            contrib = self._insight_contribution(rec)
+            if contrib is None:
+                continue
+            key, good, strict = contrib
+            row = expected.setdefault(key, {"weak_good": 0, "weak_bad": 0, "strict_good": 0, "strict_bad": 0})
+            row["weak_good" if good else "weak_bad"] += 1
+            if strict:
+                row["strict_good" if good else "strict_bad"] += 1
+
+        mismatches = []
+        for key in sorted(set(expected) | set(self._insight_aggregates)):
+            want = expected.get(key, {})
+            have = self._insight_aggregates.get(key, {})
+            if any(int(want.get(f, 0)) != int(have.get(f, 0)) for f in ("weak_good", "weak_bad", "strict_good", "strict_bad")):
+                mismatches.append({
+                    "insight_key": key,
+                    "aggregate": {f: int(have.get(f, 0)) for f in ("weak_good", "weak_bad", "strict_good", "strict_bad")},
+                    "recomputed": {f: int(want.get(f, 0)) for f in ("weak_good", "weak_bad", "strict_good", "strict_bad")},
+                })
+        if mismatches and repair:
+            self._rebuild_insight_aggregates()
+        return {
+            "ok": not mismatches,
+            "insights": len(expected),
+            "mismatches": mismatches,
+            "repaired": bool(mismatches and repair),
+        }
+
     def get_insight_effectiveness(self, insight_key: str) -> float:
         """Get effectiveness rate for a specific insight (0.0 to 1.0).
 
@@ -2112,24 +2275,22 @@ class MetaRalph:
         2) Enforce strict quality floor once strict attribution samples are sufficient.
 
         Returns 0.5 (neutral) if no usable outcome data is available.
-        Used by Advisor for outcome-based ranking.
+        Used by Advisor for outcome-based ranking; reads the per-insight
+        counters instead of scanning outcome_records.
         """
         if not insight_key:
             return 0.5
 
-        # Weak coverage set: acted-on records with explicit good/bad outcomes.
-        weak = [
-            r
-            for r in self.outcome_records.values()
-            if r.insight_key == insight_key
-            and r.acted_on
-            and self._normalize_outcome(r.outcome) in ("good", "bad")
-        ]
-        if not weak:
+        # Weak coverage: acted-on records with explicit good/bad outcomes.
+        self._ensure_insight_aggregates()
+        agg = self._insight_aggregates.get(insight_key)
+        if not agg:
             return 0.5
 
-        weak_good = len([r for r in weak if self._normalize_outcome(r.outcome) == "good"])
-        weak_total = len(weak)
+        weak_good = int(agg["weak_good"])
+        weak_total = weak_good + int(agg["weak_bad"])
+        if weak_total <= 0:
+            return 0.5
         weak_rate = weak_good / max(weak_total, 1)
 
         warmup_min = max(1, int(INSIGHT_WARMUP_WEAK_SAMPLES))
@@ -2137,17 +2298,8 @@ class MetaRalph:
             # Do not over-suppress new/low-volume advisories.
             return weak_rate
 
-        strict = [
-            r
-            for r in weak
-            if self._is_strictly_attributable(
-                r,
-                window_s=int(ATTRIBUTION_WINDOW_S),
-                require_trace=bool(STRICT_ATTRIBUTION_REQUIRE_TRACE),
-            )
-        ]
-        strict_good = len([r for r in strict if self._normalize_outcome(r.outcome) == "good"])
-        strict_total = len(strict)
+        strict_good = int(agg["strict_good"])
+        strict_total = strict_good + int(agg["strict_bad"])
         strict_rate = strict_good / max(strict_total, 1) if strict_total > 0 else 0.0
 
         strict_min = max(1, int(INSIGHT_MIN_STRICT_SAMPLES))
@@ -2159,11 +2311,7 @@ class MetaRalph:
         if strict_rate < strict_floor:
             # Periodic re-test path: after a cooldown, stop hard-suppressing and let
             # weak evidence (or neutral baseline) resurface the advisory for re-evaluation.
-            last_strict_at = None
-            for rec in strict:
-                ts = self._parse_iso_timestamp(rec.outcome_at)
-                if ts and (last_strict_at is None or ts > last_strict_at):
-                    last_strict_at = ts
+            last_strict_at = self._last_strict_outcome_at(insight_key)
 
             if last_strict_at is not None:
                 age_s = max(0.0, datetime.now().timestamp() - last_strict_at.timestamp())
@@ -0,0 +1,284 @@
+"""
+Noise classifier: one compiled rule engine behind the noise filters.
+
+Each filter registers a profile, an ordered list of rules with reason codes:
+the cognitive insight gate ("insight"), primitive telemetry ("primitive"),
+shared patterns ("common"), the advisory gate ("advisory_primitive"), the
+bridge insight filter ("bridge_insight"), memory capture ("capture") and
+the advisor drop checks ("advice" and its parts). The rule tables stay next
+to the filter that owns them; this module only compiles and runs them.
+
+Plain rules (regexes, prefixes, keyword sets) are compiled per text field
+into a few combined matchers: one alternation of anchored regexes, one of
+floating regexes and one keyword set. Each matcher runs at most once per
+text, and the rules behind it are only walked, in order, when it hits, so
+clean text costs a handful of scans instead of one per rule. Compound rules
+(ratios, length-gated fragments) are ordinary predicates. The first rule
+that fires gives the verdict and its reason code, so a profile returns the
+same boolean the old if-chains did.
+
+Verdicts are memoized in an LRU keyed by (profile, blake2b digest of the
+text): the same insight re-checked by several gates or cycles costs a hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Pattern, Sequence, Tuple, Union
+
+Fields = Dict[str, str]
+Predicate = Callable[[Fields], bool]
+
+CACHE_SIZE = 8192
+
+_INLINE_FLAGS = ((re.I, "i"), (re.M, "m"), (re.S, "s"), (re.X, "x"))
+
+
+@dataclass(frozen=True)
+class NoiseVerdict:
+    """Outcome of a classification; truthy when the text is noise."""
+
+    noise: bool
+    reason: str = ""
+    profile: str = ""
+
+    def __bool__(self) -> bool:
+        return self.noise
+
+
+@dataclass(frozen=True)
+class NoiseRule:
+    """One rule: a regex or keyword set on a field (optionally gated by ``when``), or a bare predicate."""
+
+    reason: str
+    regex: Optional[str] = None
+    field: str = "tl"
+    flags: int = 0
+    when: Optional[Predicate] = None
+    words: Tuple[str, ...] = ()
+
+    def source(self) -> str:
+        """Regex source with its flags scoped inline, for the combined alternation."""
+        letters = "".join(ch for flag, ch in _INLINE_FLAGS if self.flags & flag)
+        return f"(?{letters}:{self.regex})" if letters else f"(?:{self.regex})"
+
+
+def pattern(
+    reason: str,
+    regex: Union[str, Pattern[str]],
+    *,
+    field: str = "tl",
+    flags: int = 0,
+    when: Optional[Predicate] = None,
+) -> NoiseRule:
+    """Rule that fires when ``regex`` is found in ``field`` (``re.search``)."""
+    if isinstance(regex, re.Pattern):
+        regex, flags = regex.pattern, regex.flags | flags
+    return NoiseRule(reason, regex, field, flags & (re.I | re.M | re.S | re.X), when)
+
+
+def prefixes(reason: str, words: Iterable[str], *, field: str = "tl", when: Optional[Predicate] = None) -> NoiseRule:
+    """Rule that fires when ``field`` starts with any of ``words``."""
+    return pattern(reason, r"\A(?:" + _alternation(words) + ")", field=field, when=when)
+
+
+def contains(reason: str, words: Iterable[str], *, field: str = "tl", when: Optional[Predicate] = None) -> NoiseRule:
+    """Rule that fires when any of ``words`` occurs in ``field``."""
+    return NoiseRule(reason, field=field, when=when, words=tuple(sorted(set(words))))
+
+
+def check(reason: str, fn: Predicate) -> NoiseRule:
+    """Rule that fires when ``fn(fields)`` is true."""
+    return NoiseRule(reason, when=fn)
+
+
+def keyword_regex(words: Iterable[str], flags: int = 0) -> Pattern[str]:
+    """Compiled alternation of literal ``words`` (longest first)."""
+    return re.compile(_alternation(words), flags)
+
+
+def _alternation(words: Iterable[str]) -> str:
+    unique = sorted(set(words), key=lambda w: (-len(w), w))
+    if not unique:
+        return r"(?!)"
+    return "|".join(re.escape(w) for w in unique)
+
+
+def _is_anchored(regex: str, flags: int) -> bool:
+    """True when every top-level branch of ``regex`` starts at the beginning of the text."""
+    if flags & re.M:
+        return False
+    branches, depth, start, i = [], 0, 0, 0
+    in_class = False
+    while i < len(regex):
+        ch = regex[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+            if regex[i + 1:i + 2] == "]":
+                i += 1
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            branches.append(regex[start:i])
+            start = i + 1
+        i += 1
+    branches.append(regex[start:])
+    return all(b.startswith(("^", "\\A")) for b in branches)
+
+
+def default_fields(text: str) -> Fields:
+    """``raw`` text, stripped ``t`` and lower-cased stripped ``tl``."""
+    t = text.strip()
+    return {"raw": text, "t": t, "tl": t.lower()}
+
+
+_ANCHORED, _FLOATING, _LITERAL, _CHECK = range(4)
+
+
+class NoiseRuleSet:
+    """An ordered, compiled profile of noise rules.
+
+    Per field, anchored regexes are combined into one alternation tried only
+    at the start of the text (``match``), the other regexes into one
+    alternation that is searched, and keyword rules into one literal set
+    scanned with substring search (an alternation of literals is slower in
+    ``re`` than the C substring scan). A group is tested at most once, the
+    first time a rule in it comes up; its rules are skipped when it misses.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rules: Sequence[NoiseRule],
+        *,
+        prepare: Callable[[str], Fields] = default_fields,
+        empty: Optional[str] = None,
+    ):
+        self.name = name
+        self.rules: Tuple[NoiseRule, ...] = tuple(rules)
+        self.prepare = prepare
+        self.empty = empty
+        self._clean = NoiseVerdict(False, "", name)
+        self._empty = NoiseVerdict(empty is not None, empty or "", name)
+        sources: Dict[Tuple[str, int], list] = {}
+        plan = []
+        for rule in self.rules:
+            if rule.words:
+                kind, test = _LITERAL, rule.words
+            elif rule.regex is not None:
+                kind = _ANCHORED if _is_anchored(rule.regex, rule.flags) else _FLOATING
+                rx = re.compile(rule.regex, rule.flags)
+                test = rx.match if kind == _ANCHORED else rx.search
+            else:
+                kind, test = _CHECK, None
+            if kind == _LITERAL:
+                sources.setdefault((rule.field, kind), []).extend(rule.words)
+            elif kind != _CHECK:
+                sources.setdefault((rule.field, kind), []).append(rule.source())
+            plan.append(((rule.field, kind), kind, test, rule.when, NoiseVerdict(True, rule.reason, name)))
+        self._plan = tuple(plan)
+        self._groups: Dict[Tuple[str, int], Callable[[str], bool]] = {}
+        for (field, kind), items in sources.items():
+            if kind == _LITERAL:
+                self._groups[(field, kind)] = _literal_scan(tuple(sorted(set(items))))
+            else:
+                rx = re.compile("|".join(items))
+                self._groups[(field, kind)] = rx.match if kind == _ANCHORED else rx.search
+
+    def evaluate(self, text: str) -> NoiseVerdict:
+        """Uncached verdict for ``text``."""
+        if not text:
+            return self._empty
+        fields = self.prepare(text)
+        hits: Dict[Tuple[str, int], bool] = {}
+        for group, kind, test, when, verdict in self._plan:
+            if kind != _CHECK:
+                value = fields[group[0]]
+                hit = hits.get(group)
+                if hit is None:
+                    hit = hits[group] = bool(self._groups[group](value))
+                if not hit:
+                    continue
+                if kind == _LITERAL:
+                    if not any(w in value for w in test):
+                        continue
+                elif test(value) is None:
+                    continue
+            if when is None or when(fields):
+                return verdict
+        return self._clean
+
+
+def _literal_scan(words: Tuple[str, ...]) -> Callable[[str], bool]:
+    return lambda value: any(w in value for w in words)
+
+
+_PROFILES: Dict[str, NoiseRuleSet] = {}
+_CACHE: "OrderedDict[Tuple[str, bytes], NoiseVerdict]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def register(
+    name: str,
+    rules: Sequence[NoiseRule],
+    *,
+    prepare: Callable[[str], Fields] = default_fields,
+    empty: Optional[str] = None,
+) -> NoiseRuleSet:
+    """Compile and register a profile (replacing any previous one of that name)."""
+    ruleset = NoiseRuleSet(name, rules, prepare=prepare, empty=empty)
+    _PROFILES[name] = ruleset
+    clear_cache()
+    return ruleset
+
+
+def profiles() -> Dict[str, NoiseRuleSet]:
+    return dict(_PROFILES)
+
+
+def classify(text: object, profile: str) -> NoiseVerdict:
+    """Verdict for ``text`` under ``profile`` (cached by text digest)."""
+    ruleset = _PROFILES[profile]
+    if not isinstance(text, str):
+        text = str(text or "")
+    key = (profile, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    with _CACHE_LOCK:
+        verdict = _CACHE.get(key)
+        if verdict is not None:
+            _CACHE.move_to_end(key)
+            _CACHE_STATS["hits"] += 1
+            return verdict
+        _CACHE_STATS["misses"] += 1
+    verdict = ruleset.evaluate(text)
+    with _CACHE_LOCK:
+        _CACHE[key] = verdict
+        if len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return verdict
+
+
+def is_noise(text: object, profile: str) -> bool:
+    return classify(text, profile).noise
+
+
+def cache_info() -> Dict[str, int]:
+    with _CACHE_LOCK:
+        return {**_CACHE_STATS, "size": len(_CACHE), "maxsize": CACHE_SIZE}
+
+
+def clear_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        _CACHE_STATS["hits"] = _CACHE_STATS["misses"] = 0
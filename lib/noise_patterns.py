@@ -10,6 +10,8 @@ Created in Batch 6 of Intelligence Flow Evolution.
 import re
 from typing import FrozenSet, Tuple
 
+from lib.noise_classifier import contains, is_noise, pattern, register
+
 # ---------------------------------------------------------------------------
 # Tool token lists (shared by primitive_filter + cognitive_learner)
 # ---------------------------------------------------------------------------
@@ -148,6 +150,18 @@ def is_session_boilerplate(text: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
+def _long_enough(fields) -> bool:
+    return len(fields["raw"]) >= 10
+
+
+register("common", (
+    pattern("tool_sequence", TOOL_SEQUENCE_RE, field="raw", when=_long_enough),
+    pattern("stats_telemetry", STATS_TELEMETRY_RE, field="raw", when=_long_enough),
+    contains("api_error", API_ERROR_STRINGS, when=_long_enough),
+    contains("generic_advice", GENERIC_ADVICE_STRINGS, when=_long_enough),
+))
+
+
 def is_common_noise(text: str) -> bool:
     """Fast check against the most commonly shared noise patterns.
 
@@ -155,15 +169,4 @@ def is_common_noise(text: str) -> bool:
     API errors, or generic advice patterns.  Consumers should still apply
     their own domain-specific filters on top.
     """
-    if not text or len(text) < 10:
-        return False
-    if TOOL_SEQUENCE_RE.search(text):
-        return True
-    if STATS_TELEMETRY_RE.search(text):
-        return True
-    text_lower = text.lower()
-    if any(p in text_lower for p in API_ERROR_STRINGS):
-        return True
-    if any(p in text_lower for p in GENERIC_ADVICE_STRINGS):
-        return True
-    return False
+    return is_noise(text, "common")
@@ -1,16 +1,19 @@
 """Read-only data loaders for all 12 pipeline stages.
 
 Each reader returns a dict of metrics from ~/.spark/ state files.
-No imports from pipeline modules — pure file I/O, zero side effects.
+No imports from pipeline modules — pure file I/O, zero side effects (JSONL
+logs are read through the read-only side of lib.append_log).
 """
 
 from __future__ import annotations
 
 import json
 import sqlite3
+import time
 from pathlib import Path
 from typing import Any
 
+from ..append_log import AppendLog
 from .config import spark_dir
 
 _SD = spark_dir()
@@ -25,67 +28,13 @@ def _load_json(path: Path) -> dict | list | None:
 
 
 def _tail_jsonl(path: Path, n: int = 20) -> list[dict]:
-    """Read the last N lines of a JSONL file efficiently."""
-    if not path.exists():
-        return []
-    try:
-        size = path.stat().st_size
-        if size == 0:
-            return []
-        # For small files, just read all
-        if size < 500_000:
-            lines = path.read_text(encoding="utf-8", errors="replace").strip().splitlines()
-            results = []
-            for line in lines[-n:]:
-                try:
-                    results.append(json.loads(line))
-                except Exception:
-                    pass
-            return results
-        # For large files, seek from end
-        with open(path, "rb") as f:
-            f.seek(max(0, size - 100_000))  # read last ~100KB
-            chunk = f.read().decode("utf-8", errors="replace")
-        lines = chunk.strip().splitlines()
-        # First line may be partial, skip it
-        if len(lines) > 1:
-            lines = lines[1:]
-        results = []
-        for line in lines[-n:]:
-            try:
-                results.append(json.loads(line))
-            except Exception:
-                pass
-        return results
-    except Exception:
-        return []
+    """Read the last N rows of a (possibly segmented) JSONL log."""
+    return AppendLog(path).tail(n)
 
 
 def _count_jsonl(path: Path) -> int:
-    """Estimate line count of a JSONL file from file size."""
-    if not path.exists():
-        return 0
-    try:
-        size = path.stat().st_size
-        if size == 0:
-            return 0
-        if size < 200_000:
-            return len(path.read_text(encoding="utf-8", errors="replace").strip().splitlines())
-        # Sample 10 lines from start to estimate avg line size
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            sample_lines = []
-            for i, line in enumerate(f):
-                if i >= 10:
-                    break
-                sample_lines.append(line)
-        if not sample_lines:
-            return 0
-        avg_line = sum(len(line) for line in sample_lines) / len(sample_lines)
-        if avg_line <= 0:
-            return 0
-        return int(size / avg_line)
-    except Exception:
-        return 0
+    """Exact line count of a (possibly segmented) JSONL log, from its sidecar index."""
+    return AppendLog(path).count()
 
 
 def _file_mtime(path: Path) -> float | None:
@@ -104,6 +53,11 @@ def _file_size(path: Path) -> int:
         return 0
 
 
+def _log_size(path: Path) -> int:
+    """Total bytes across every segment of a JSONL log, or 0."""
+    return AppendLog(path).size_bytes()
+
+
 def _as_int(value: Any, default: int = 0) -> int:
     try:
         return int(value)
@@ -300,6 +254,27 @@ def read_cognitive(max_recent: int = 15) -> dict[str, Any]:
 
 # ── Stage 7: EIDOS ──────────────────────────────────────────────────
 
+def _count_session_state(namespace: str, legacy_json: str) -> int:
+    """Live entries of a lib.session_state namespace, read-only."""
+    db = _SD / "session_state.sqlite"
+    if not db.exists():
+        legacy = _load_json(_SD / legacy_json) or {}
+        return len(legacy) if isinstance(legacy, dict) else 0
+    try:
+        conn = sqlite3.connect(f"file:{db.as_posix()}?mode=ro", uri=True, timeout=2.0)
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM session_state WHERE namespace = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, time.time()),
+            ).fetchone()
+        finally:
+            conn.close()
+        return int(row[0]) if row else 0
+    except Exception:
+        return 0
+
+
 def read_eidos() -> dict[str, Any]:
     d: dict[str, Any] = {"stage": 7, "name": "EIDOS"}
     db_path = _SD / "eidos.db"
@@ -449,11 +424,9 @@ def read_eidos() -> dict[str, Any]:
         d["advisory_quality_histogram"] = []
         d["feedback_loop"] = {}
         d["suppression_breakdown"] = {}
-    # Active episodes/steps
-    ae = _load_json(_SD / "eidos_active_episodes.json") or {}
-    d["active_episodes"] = len(ae) if isinstance(ae, dict) else 0
-    ast = _load_json(_SD / "eidos_active_steps.json") or {}
-    d["active_steps"] = len(ast) if isinstance(ast, dict) else 0
+    # Active episodes/steps (session_state.sqlite; JSON files on older installs)
+    d["active_episodes"] = _count_session_state("eidos_episode", "eidos_active_episodes.json")
+    d["active_steps"] = _count_session_state("eidos_step", "eidos_active_steps.json")
 
     # Distillation curriculum snapshot metrics.
     curriculum_latest = _load_json(_SD / "eidos_curriculum_latest.json")
@@ -639,9 +612,9 @@ def read_predictions(max_recent: int = 10) -> dict[str, Any]:
     d["predictions_count"] = _count_jsonl(pred_path)
     d["predictions_size"] = _file_size(pred_path)
     d["outcomes_count"] = _count_jsonl(outcomes_path)
-    d["outcomes_size"] = _file_size(outcomes_path)
+    d["outcomes_size"] = _log_size(outcomes_path)
     d["links_count"] = _count_jsonl(links_path)
-    d["links_size"] = _file_size(links_path)
+    d["links_size"] = _log_size(links_path)
     d["recent_outcomes"] = _tail_jsonl(outcomes_path, max_recent)
     # Prediction state
     ps = _load_json(_SD / "prediction_state.json") or {}
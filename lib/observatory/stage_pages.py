@@ -519,8 +519,7 @@ def _gen_eidos(d: dict, all_data: dict) -> str:
 
     s += _source_files("lib/eidos/ (aggregator.py, distiller.py, store.py, models.py)", [
         "eidos.db",
-        "eidos_active_episodes.json",
-        "eidos_active_steps.json",
+        "session_state.sqlite",
     ])
     return s
 
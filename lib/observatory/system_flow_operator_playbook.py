@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
+from ..append_log import AppendLog
 from .config import spark_dir
 
 _SPARK_DIR = spark_dir()
@@ -28,26 +29,11 @@ def _read_json(path: Path) -> Dict[str, Any]:
 
 
 def _read_jsonl(path: Path, max_rows: int = 6000) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    rows: List[Dict[str, Any]] = []
-    try:
-        with path.open("r", encoding="utf-8", errors="replace") as f:
-            for line in f:
-                raw = line.strip()
-                if not raw:
-                    continue
-                try:
-                    row = json.loads(raw)
-                except Exception:
-                    continue
-                if isinstance(row, dict):
-                    rows.append(row)
-    except Exception:
-        return []
-    if max_rows > 0 and len(rows) > max_rows:
-        rows = rows[-max_rows:]
-    return rows
+    """Last ``max_rows`` rows (all when 0) of a possibly segmented JSONL log."""
+    log = AppendLog(path)
+    if max_rows > 0:
+        return log.tail(max_rows)
+    return list(log.iter_rows())
 
 
 def _parse_ts(value: Any) -> float:
@@ -94,6 +94,7 @@ KNOWN_RELOAD_SECTIONS = {
     "eidos": ["lib/eidos/models.py", "lib/distillation_refiner.py"],
     "memory_capture": ["lib/memory_capture.py"],
     "memory_deltas": ["lib/memory_store.py"],
+    "memory_ann": ["lib/memory_ann.py", "lib/memory_store.py"],
     "memory_emotion": ["lib/memory_store.py", "lib/memory_banks.py"],
     "memory_learning": ["lib/memory_store.py"],
     "memory_retrieval_guard": ["lib/memory_store.py"],
@@ -155,6 +156,7 @@ SECTION_IMPACT = {
     "memory_retrieval_guard": "LOW",
     "memory_capture": "LOW",
     "memory_deltas": "LOW",
+    "memory_ann": "LOW",
     "observatory": "LOW",
     "feature_flags": "HIGH",
     "observe_hook": "MEDIUM",
@@ -725,81 +725,71 @@ def _generate_llm_self_candidates(
     )
 
     meta["attempted"] = True
-    prev_timeout = getattr(synth, "AI_TIMEOUT_S", None)
-    try:
-        synth.AI_TIMEOUT_S = LLM_TIMEOUT_S
-        chain = synth._get_provider_chain(LLM_PROVIDER or None)
-        if LLM_PROVIDER:
-            chain = [p for p in chain if str(p or "").strip().lower() == LLM_PROVIDER]
-        chain = [p for p in chain if str(p or "").strip().lower() not in _FORBIDDEN_LLM_PROVIDERS]
-        if not chain:
-            meta["error"] = "no_allowed_provider"
-            return [], meta
-        last_error = None
-        for provider in chain:
-            try:
-                # Per-provider time budget. Cloud providers (esp. minimax) are higher-latency than local.
-                provider_timeout = float(LLM_TIMEOUT_S)
-                if str(provider or "").strip().lower() == "minimax":
-                    provider_timeout = max(provider_timeout, 12.0)
-                synth.AI_TIMEOUT_S = provider_timeout
-                _LAST_LLM_ATTEMPT_BY_KEY[str(cooldown_key or session_id or "default")] = time.time()
-                raw = synth._query_provider(provider, prompt)
-            except Exception as e:
-                last_error = f"{provider}:{type(e).__name__}"
-                continue
-            if not raw:
-                # Surface timeouts/empty responses in scanner meta so operators can tune
-                # SPARK_OPPORTUNITY_LLM_TIMEOUT_S or switch providers.
-                last_error = last_error or f"{provider}:empty_or_timeout"
-                continue
-            parsed = _extract_json_candidate(raw)
-            rows = _sanitize_llm_self_rows(parsed)
-            if not rows:
-                # MiniMax sometimes spends the whole token budget in <think>. One retry with a
-                # shorter prompt is cheap insurance.
-                if str(provider or "").strip().lower() == "minimax":
-                    retry_prompt = (
-                        "Return ONLY JSON. No markdown.\n"
-                        'Output: {"opportunities":[{"category":"...","priority":"high|medium|low","confidence":0.72,'
-                        '"question":"...","next_step":"...","rationale":"..."}]}.\n'
-                        "Max 2 opportunities.\n"
-                        "Rules: no telemetry; meaningful improvements; self-directed; actionable.\n"
-                        f"Context: {context_text[:360]}"
-                    )
-                    try:
-                        raw2 = synth._query_provider(provider, retry_prompt)
-                    except Exception:
-                        raw2 = None
-                    if raw2:
-                        parsed2 = _extract_json_candidate(raw2)
-                        rows2 = _sanitize_llm_self_rows(parsed2)
-                        if rows2:
-                            rows = rows2
-                        else:
-                            last_error = f"{provider}:unparseable_or_empty"
-                            continue
+    chain = synth._get_provider_chain(LLM_PROVIDER or None)
+    if LLM_PROVIDER:
+        chain = [p for p in chain if str(p or "").strip().lower() == LLM_PROVIDER]
+    chain = [p for p in chain if str(p or "").strip().lower() not in _FORBIDDEN_LLM_PROVIDERS]
+    if not chain:
+        meta["error"] = "no_allowed_provider"
+        return [], meta
+    last_error = None
+    for provider in chain:
+        try:
+            # Per-provider time budget. Cloud providers (esp. minimax) are higher-latency than local.
+            provider_timeout = float(LLM_TIMEOUT_S)
+            if str(provider or "").strip().lower() == "minimax":
+                provider_timeout = max(provider_timeout, 12.0)
+            _LAST_LLM_ATTEMPT_BY_KEY[str(cooldown_key or session_id or "default")] = time.time()
+            raw = synth._query_provider(provider, prompt, timeout_s=provider_timeout)
+        except Exception as e:
+            last_error = f"{provider}:{type(e).__name__}"
+            continue
+        if not raw:
+            # Surface timeouts/empty responses in scanner meta so operators can tune
+            # SPARK_OPPORTUNITY_LLM_TIMEOUT_S or switch providers.
+            last_error = last_error or f"{provider}:empty_or_timeout"
+            continue
+        parsed = _extract_json_candidate(raw)
+        rows = _sanitize_llm_self_rows(parsed)
+        if not rows:
+            # MiniMax sometimes spends the whole token budget in <think>. One retry with a
+            # shorter prompt is cheap insurance.
+            if str(provider or "").strip().lower() == "minimax":
+                retry_prompt = (
+                    "Return ONLY JSON. No markdown.\n"
+                    'Output: {"opportunities":[{"category":"...","priority":"high|medium|low","confidence":0.72,'
+                    '"question":"...","next_step":"...","rationale":"..."}]}.\n'
+                    "Max 2 opportunities.\n"
+                    "Rules: no telemetry; meaningful improvements; self-directed; actionable.\n"
+                    f"Context: {context_text[:360]}"
+                )
+                try:
+                    raw2 = synth._query_provider(provider, retry_prompt, timeout_s=provider_timeout)
+                except Exception:
+                    raw2 = None
+                if raw2:
+                    parsed2 = _extract_json_candidate(raw2)
+                    rows2 = _sanitize_llm_self_rows(parsed2)
+                    if rows2:
+                        rows = rows2
                     else:
                         last_error = f"{provider}:unparseable_or_empty"
                         continue
                 else:
                     last_error = f"{provider}:unparseable_or_empty"
                     continue
-            meta["used"] = True
-            meta["provider"] = provider
-            meta["candidates"] = len(rows)
-            for r in rows:
-                if isinstance(r, dict):
-                    r.setdefault("llm_provider", provider)
-            return rows, meta
-        if last_error:
-            meta["error"] = last_error
-    finally:
-        if prev_timeout is not None:
-            try:
-                synth.AI_TIMEOUT_S = prev_timeout
-            except Exception:
-                pass
+            else:
+                last_error = f"{provider}:unparseable_or_empty"
+                continue
+        meta["used"] = True
+        meta["provider"] = provider
+        meta["candidates"] = len(rows)
+        for r in rows:
+            if isinstance(r, dict):
+                r.setdefault("llm_provider", provider)
+        return rows, meta
+    if last_error:
+        meta["error"] = last_error
 
     return [], meta
 
@@ -10,13 +10,14 @@ Phase 3: Outcome-Driven Learning
 from __future__ import annotations
 
 import hashlib
-import json
-import os
+import re
 import time
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .file_lock import file_lock_for
+from .append_log import AppendLog
 
 OUTCOMES_FILE = Path.home() / ".spark" / "outcomes.jsonl"
 OUTCOMES_FILE_MAX = 3000
@@ -24,26 +25,25 @@ OUTCOME_LINKS_FILE = Path.home() / ".spark" / "outcome_links.jsonl"
 OUTCOME_LINKS_FILE_MAX = 3000
 
 
-def _rotate_jsonl(path: Path, max_lines: int) -> None:
-    """Trim a JSONL file to its last *max_lines* lines.
+def _outcomes_log() -> AppendLog:
+    """Segmented outcomes log; appends are fail-closed so rows are never written unlocked."""
+    return AppendLog(
+        OUTCOMES_FILE,
+        max_lines=OUTCOMES_FILE_MAX,
+        ts_key="created_at",
+        ensure_ascii=False,
+        fail_open=False,
+    )
 
-    Uses atomic temp-write + os.replace to avoid partial-write corruption.
-    Callers should hold the per-file lock across append+rotate.
-    """
-    try:
-        if not path.exists():
-            return
-        if path.stat().st_size // 250 <= max_lines:
-            return
-        lines = path.read_text(encoding="utf-8").splitlines()
-        if len(lines) <= max_lines:
-            return
-        keep = "\n".join(lines[-max_lines:]) + "\n"
-        tmp = path.with_suffix(path.suffix + f".tmp.{os.getpid()}.{time.time_ns()}")
-        tmp.write_text(keep, encoding="utf-8")
-        os.replace(str(tmp), str(path))
-    except Exception:
-        pass
+
+def _links_log() -> AppendLog:
+    return AppendLog(
+        OUTCOME_LINKS_FILE,
+        max_lines=OUTCOME_LINKS_FILE_MAX,
+        ts_key="created_at",
+        ensure_ascii=False,
+        fail_open=False,
+    )
 
 
 def _hash_id(*parts: str) -> str:
@@ -78,22 +78,15 @@ def append_outcomes(rows: Iterable[Dict[str, Any]]) -> int:
     """Append outcome rows to the shared outcomes log. Returns count written."""
     if not rows:
         return 0
-    OUTCOMES_FILE.parent.mkdir(parents=True, exist_ok=True)
-    to_write: List[str] = []
-    written = 0
+    to_write: List[Dict[str, Any]] = []
     for row in rows:
         if not row:
             continue
         _ensure_trace_id(row)
-        to_write.append(json.dumps(row, ensure_ascii=False) + "\n")
-        written += 1
+        to_write.append(row)
     if not to_write:
         return 0
-    with file_lock_for(OUTCOMES_FILE, fail_open=False):
-        with OUTCOMES_FILE.open("a", encoding="utf-8") as f:
-            f.writelines(to_write)
-        _rotate_jsonl(OUTCOMES_FILE, OUTCOMES_FILE_MAX)
-    return written
+    return _outcomes_log().append_many(to_write)
 
 
 def append_outcome(row: Dict[str, Any]) -> int:
@@ -155,24 +148,55 @@ def link_outcome_to_insight(
 
     The validation loop uses these links to validate/contradict insights.
     """
-    link = {
-        "link_id": _hash_id(outcome_id, insight_key, str(time.time())),
+    link = _build_link(outcome_id, insight_key, chip_id=chip_id, confidence=confidence, notes=notes)
+    _links_log().append(link)
+    return link
+
+
+def _build_link(
+    outcome_id: str,
+    insight_key: str,
+    *,
+    chip_id: Optional[str] = None,
+    confidence: float = 1.0,
+    notes: str = "",
+) -> Dict[str, Any]:
+    now = time.time()
+    return {
+        "link_id": _hash_id(outcome_id, insight_key, str(now)),
         "outcome_id": outcome_id,
         "insight_key": insight_key,
         "chip_id": chip_id,
         "confidence": confidence,
         "notes": notes,
-        "created_at": time.time(),
+        "created_at": now,
         "validated": False,
     }
 
-    OUTCOME_LINKS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with file_lock_for(OUTCOME_LINKS_FILE, fail_open=False):
-        with OUTCOME_LINKS_FILE.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(link, ensure_ascii=False) + "\n")
-        _rotate_jsonl(OUTCOME_LINKS_FILE, OUTCOME_LINKS_FILE_MAX)
 
-    return link
+def link_outcomes_many(links: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Link many outcomes to insights with a single append.
+
+    Each item takes the keyword arguments of link_outcome_to_insight
+    (outcome_id, insight_key, and optionally chip_id, confidence, notes).
+    Items missing outcome_id or insight_key are skipped. Returns the links written.
+    """
+    rows = [
+        _build_link(
+            str(item["outcome_id"]),
+            str(item["insight_key"]),
+            chip_id=item.get("chip_id"),
+            confidence=item.get("confidence", 1.0),
+            notes=item.get("notes", ""),
+        )
+        for item in links
+        if item.get("outcome_id") and item.get("insight_key")
+    ]
+    if not rows:
+        return []
+    written = _links_log().append_many(rows)
+    return rows if written == len(rows) else []
 
 
 def get_outcome_links(
@@ -182,23 +206,19 @@ def get_outcome_links(
     limit: Optional[int] = 100,
 ) -> List[Dict[str, Any]]:
     """Get outcome-insight links, optionally filtered."""
-    if not OUTCOME_LINKS_FILE.exists():
-        return []
+    log = _links_log()
+    if not (insight_key or outcome_id or chip_id) and limit and limit > 0:
+        return log.tail(limit)
 
     links = []
-    with OUTCOME_LINKS_FILE.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                link = json.loads(line.strip())
-                if insight_key and link.get("insight_key") != insight_key:
-                    continue
-                if outcome_id and link.get("outcome_id") != outcome_id:
-                    continue
-                if chip_id and link.get("chip_id") != chip_id:
-                    continue
-                links.append(link)
-            except Exception:
-                pass
+    for link in log.iter_rows():
+        if insight_key and link.get("insight_key") != insight_key:
+            continue
+        if outcome_id and link.get("outcome_id") != outcome_id:
+            continue
+        if chip_id and link.get("chip_id") != chip_id:
+            continue
+        links.append(link)
 
     if limit is None or limit <= 0:
         return links
@@ -212,23 +232,24 @@ def read_outcomes(
     since: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Read outcomes from the log, optionally filtered."""
-    if not OUTCOMES_FILE.exists():
-        return []
+    log = _outcomes_log()
+    if not (polarity or chip_id or since) and limit and limit > 0:
+        return log.tail(limit)
 
+    # The index narrows a ``since`` read to the matching suffix of the log.
+    rows = log.since(since) if since else log.iter_rows()
     outcomes = []
-    with OUTCOMES_FILE.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                outcome = json.loads(line.strip())
-                if polarity and outcome.get("polarity") != polarity:
-                    continue
-                if chip_id and outcome.get("chip_id") != chip_id:
-                    continue
-                if since and (outcome.get("created_at", 0) < since):
-                    continue
-                outcomes.append(outcome)
-            except Exception:
-                pass
+    for outcome in rows:
+        try:
+            if polarity and outcome.get("polarity") != polarity:
+                continue
+            if chip_id and outcome.get("chip_id") != chip_id:
+                continue
+            if since and (outcome.get("created_at", 0) < since):
+                continue
+            outcomes.append(outcome)
+        except Exception:
+            pass
 
     if limit is None or limit <= 0:
         return outcomes
@@ -297,38 +318,26 @@ def get_outcome_stats(chip_id: Optional[str] = None) -> Dict[str, Any]:
     validated_links = 0
     linked_ids = set()
 
-    if OUTCOME_LINKS_FILE.exists():
-        with OUTCOME_LINKS_FILE.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    link = json.loads(line.strip())
-                except Exception:
-                    continue
-                if chip_id and link.get("chip_id") != chip_id:
-                    continue
-                total_links += 1
-                if link.get("validated"):
-                    validated_links += 1
-                oid = link.get("outcome_id")
-                if oid:
-                    linked_ids.add(oid)
+    for link in _links_log().iter_rows():
+        if chip_id and link.get("chip_id") != chip_id:
+            continue
+        total_links += 1
+        if link.get("validated"):
+            validated_links += 1
+        oid = link.get("outcome_id")
+        if oid:
+            linked_ids.add(oid)
 
     unlinked_count = 0
-    if OUTCOMES_FILE.exists():
-        with OUTCOMES_FILE.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    outcome = json.loads(line.strip())
-                except Exception:
-                    continue
-                if chip_id and outcome.get("chip_id") != chip_id:
-                    continue
-                total_outcomes += 1
-                pol = outcome.get("polarity", "neutral")
-                by_polarity[pol] = by_polarity.get(pol, 0) + 1
-                oid = outcome.get("outcome_id")
-                if not oid or oid not in linked_ids:
-                    unlinked_count += 1
+    for outcome in _outcomes_log().iter_rows():
+        if chip_id and outcome.get("chip_id") != chip_id:
+            continue
+        total_outcomes += 1
+        pol = outcome.get("polarity", "neutral")
+        by_polarity[pol] = by_polarity.get(pol, 0) + 1
+        oid = outcome.get("outcome_id")
+        if not oid or oid not in linked_ids:
+            unlinked_count += 1
 
     return {
         "total_outcomes": total_outcomes,
@@ -343,30 +352,37 @@ def get_outcome_stats(chip_id: Optional[str] = None) -> Dict[str, Any]:
 # Phase 3.5: Auto-Linking Outcomes to Insights
 # =============================================================================
 
+_STOPWORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "shall", "can", "need", "dare",
+    "ought", "used", "to", "of", "in", "for", "on", "with", "at", "by",
+    "from", "as", "into", "through", "during", "before", "after", "above",
+    "below", "between", "under", "again", "further", "then", "once", "here",
+    "there", "when", "where", "why", "how", "all", "each", "few", "more",
+    "most", "other", "some", "such", "no", "nor", "not", "only", "own",
+    "same", "so", "than", "too", "very", "just", "and", "but", "if", "or",
+    "because", "until", "while", "this", "that", "these", "those", "it",
+    "its", "user", "prefers", "likes", "tool", "worked", "failed",
+})
+_WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+
+
 def _extract_keywords(text: str) -> List[str]:
     """Extract meaningful keywords from text for matching."""
-    import re
-    stopwords = {
-        "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
-        "have", "has", "had", "do", "does", "did", "will", "would", "could",
-        "should", "may", "might", "must", "shall", "can", "need", "dare",
-        "ought", "used", "to", "of", "in", "for", "on", "with", "at", "by",
-        "from", "as", "into", "through", "during", "before", "after", "above",
-        "below", "between", "under", "again", "further", "then", "once", "here",
-        "there", "when", "where", "why", "how", "all", "each", "few", "more",
-        "most", "other", "some", "such", "no", "nor", "not", "only", "own",
-        "same", "so", "than", "too", "very", "just", "and", "but", "if", "or",
-        "because", "until", "while", "this", "that", "these", "those", "it",
-        "its", "user", "prefers", "likes", "tool", "worked", "failed",
-    }
-    words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-    return [w for w in words if w not in stopwords][:10]
+    words = _WORD_RE.findall(text.lower())
+    return [w for w in words if w not in _STOPWORDS][:10]
+
+
+@lru_cache(maxsize=8192)
+def _keyword_set(text: str) -> frozenset:
+    return frozenset(_extract_keywords(text))
 
 
 def _compute_similarity(text1: str, text2: str) -> float:
     """Compute simple keyword overlap similarity between two texts."""
-    kw1 = set(_extract_keywords(text1))
-    kw2 = set(_extract_keywords(text2))
+    kw1 = _keyword_set(text1)
+    kw2 = _keyword_set(text2)
     if not kw1 or not kw2:
         return 0.0
     intersection = len(kw1 & kw2)
@@ -374,6 +390,50 @@ def _compute_similarity(text1: str, text2: str) -> float:
     return intersection / union if union > 0 else 0.0
 
 
+class InsightLinker:
+    """Sparse keyword index over insights for batched best-match lookup.
+
+    Each insight is tokenized once into its keyword set; the term -> insight
+    postings are the sparse term-index matrix. Scoring an outcome walks the
+    postings of its (at most 10) keywords to get the overlap with every
+    insight it shares a term with, so the cost is proportional to matches
+    rather than outcomes x insights. Scores are exactly _compute_similarity
+    (keyword Jaccard); ties go to the earliest insight, as in a linear scan.
+    """
+
+    def __init__(self, insights: Iterable[Tuple[str, str]]):
+        self.keys: List[str] = []
+        self.texts: List[str] = []
+        self.sizes: List[int] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for key, text in insights:
+            kws = _keyword_set(text)
+            row = len(self.keys)
+            self.keys.append(key)
+            self.texts.append(text)
+            self.sizes.append(len(kws))
+            for kw in kws:
+                self.postings[kw].append(row)
+
+    def best_match(self, text: str, min_similarity: float) -> Optional[Tuple[str, str, float]]:
+        """(insight_key, insight_text, score) of the best insight above the threshold."""
+        kws = _keyword_set(text)
+        if not kws:
+            return None
+        overlap: Dict[int, int] = defaultdict(int)
+        for kw in kws:
+            for row in self.postings.get(kw, ()):
+                overlap[row] += 1
+        best_row, best_score = -1, 0.0
+        for row, inter in overlap.items():
+            score = inter / (len(kws) + self.sizes[row] - inter)
+            if score >= min_similarity and (score > best_score or (score == best_score and row < best_row)):
+                best_row, best_score = row, score
+        if best_row < 0:
+            return None
+        return self.keys[best_row], self.texts[best_row], best_score
+
+
 def auto_link_outcomes(
     min_similarity: float = 0.25,
     limit: int = 50,
@@ -382,8 +442,9 @@ def auto_link_outcomes(
     """
     Automatically link unlinked outcomes to relevant insights.
 
-    Uses keyword similarity to match outcomes to insights.
-    Only links if similarity exceeds min_similarity threshold.
+    Uses keyword similarity to match outcomes to insights (via InsightLinker).
+    Only links if similarity exceeds min_similarity threshold. All new links
+    are written with one append.
 
     Args:
         min_similarity: Minimum similarity score to create a link (0.0-1.0)
@@ -400,9 +461,12 @@ def auto_link_outcomes(
         return {"processed": 0, "linked": 0, "skipped": 0, "matches": []}
 
     cog = get_cognitive_learner()
-    insights = cog.insights
+    linker = InsightLinker(
+        (key, getattr(insight, "insight", "") or str(insight)) for key, insight in cog.insights.items()
+    )
 
     stats = {"processed": 0, "linked": 0, "skipped": 0, "matches": []}
+    pending: List[Dict[str, Any]] = []
 
     for outcome in unlinked:
         stats["processed"] += 1
@@ -413,37 +477,30 @@ def auto_link_outcomes(
             stats["skipped"] += 1
             continue
 
-        # Find best matching insight
-        best_match = None
-        best_score = 0.0
-
-        for key, insight in insights.items():
-            insight_text = getattr(insight, "insight", "") or str(insight)
-            score = _compute_similarity(outcome_text, insight_text)
-
-            if score > best_score and score >= min_similarity:
-                best_score = score
-                best_match = (key, insight_text[:100])
-
-        if best_match:
-            if not dry_run:
-                link_outcome_to_insight(
-                    outcome_id=outcome_id,
-                    insight_key=best_match[0],
-                    chip_id=outcome.get("chip_id"),
-                    confidence=best_score,
-                    notes=f"auto-linked (similarity={best_score:.2f})",
-                )
-            stats["linked"] += 1
-            stats["matches"].append({
-                "outcome_id": outcome_id,
-                "insight_key": best_match[0],
-                "similarity": round(best_score, 3),
-                "outcome_preview": outcome_text[:60],
-                "insight_preview": best_match[1][:60],
-            })
-        else:
+        best = linker.best_match(outcome_text, min_similarity)
+        if not best:
             stats["skipped"] += 1
+            continue
+
+        insight_key, insight_text, best_score = best
+        pending.append({
+            "outcome_id": outcome_id,
+            "insight_key": insight_key,
+            "chip_id": outcome.get("chip_id"),
+            "confidence": best_score,
+            "notes": f"auto-linked (similarity={best_score:.2f})",
+        })
+        stats["linked"] += 1
+        stats["matches"].append({
+            "outcome_id": outcome_id,
+            "insight_key": insight_key,
+            "similarity": round(best_score, 3),
+            "outcome_preview": outcome_text[:60],
+            "insight_preview": insight_text[:60],
+        })
+
+    if pending and not dry_run:
+        link_outcomes_many(pending)
 
     return stats
 
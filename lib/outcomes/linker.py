@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
+from ..append_log import AppendLog
 from .signals import Outcome, OutcomeType
 
 log = logging.getLogger("spark.outcomes")
@@ -189,40 +190,36 @@ class OutcomeLinker:
         Handles both the old linker schema (insight_id) and the canonical
         outcome_log schema (insight_key) for backward compatibility.
         """
-        if not LINKS_FILE.exists():
-            return
-
         try:
-            with open(LINKS_FILE, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        data = json.loads(line)
-                        # Normalize: canonical schema uses insight_key, linker uses insight_id
-                        if "insight_id" not in data and "insight_key" in data:
-                            data["insight_id"] = data["insight_key"]
-                        if "outcome_type" not in data:
-                            data["outcome_type"] = "unknown"
-                        if "recency_weight" not in data:
-                            data["recency_weight"] = 0.5
-                        if "context_match" not in data:
-                            data["context_match"] = float(data.get("confidence", 0.5))
-                        if "timestamp" not in data:
-                            data["timestamp"] = datetime.fromtimestamp(
-                                data.get("created_at", 0)
-                            ).isoformat() if data.get("created_at") else ""
-                        self._links.append(OutcomeLink(
-                            outcome_id=data["outcome_id"],
-                            insight_id=data["insight_id"],
-                            outcome_type=data["outcome_type"],
-                            confidence=float(data.get("confidence", 0.5)),
-                            recency_weight=float(data["recency_weight"]),
-                            context_match=float(data["context_match"]),
-                            timestamp=str(data["timestamp"]),
-                        ))
-                    except Exception:
-                        pass  # Skip malformed rows
+            for line in AppendLog(LINKS_FILE).iter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                    # Normalize: canonical schema uses insight_key, linker uses insight_id
+                    if "insight_id" not in data and "insight_key" in data:
+                        data["insight_id"] = data["insight_key"]
+                    if "outcome_type" not in data:
+                        data["outcome_type"] = "unknown"
+                    if "recency_weight" not in data:
+                        data["recency_weight"] = 0.5
+                    if "context_match" not in data:
+                        data["context_match"] = float(data.get("confidence", 0.5))
+                    if "timestamp" not in data:
+                        data["timestamp"] = datetime.fromtimestamp(
+                            data.get("created_at", 0)
+                        ).isoformat() if data.get("created_at") else ""
+                    self._links.append(OutcomeLink(
+                        outcome_id=data["outcome_id"],
+                        insight_id=data["insight_id"],
+                        outcome_type=data["outcome_type"],
+                        confidence=float(data.get("confidence", 0.5)),
+                        recency_weight=float(data["recency_weight"]),
+                        context_match=float(data["context_match"]),
+                        timestamp=str(data["timestamp"]),
+                    ))
+                except Exception:
+                    pass  # Skip malformed rows
         except Exception as e:
             log.warning(f"Failed to load outcome links: {e}")
 
@@ -245,12 +245,11 @@ class PatternAggregator:
         timed_out_steps = self._request_tracker.timeout_pending()
         if timed_out_steps:
             self._eidos_stats["steps_completed"] += len(timed_out_steps)
-            for step in timed_out_steps:
-                try:
-                    self._store.save_step(step)
-                    self._eidos_stats["steps_persisted"] += 1
-                except Exception:
-                    self._eidos_stats["step_persist_failures"] += 1
+            try:
+                self._store.save_steps(timed_out_steps)
+                self._eidos_stats["steps_persisted"] += len(timed_out_steps)
+            except Exception:
+                self._eidos_stats["step_persist_failures"] += len(timed_out_steps)
 
         # === Run all pattern detectors ===
         for detector in self.detectors:
@@ -4,27 +4,42 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
 
-from lib.queue import read_events, count_events, EventType
+from lib.queue import (
+    EventType,
+    QueueCursor,
+    count_events_after_cursor,
+    cursor_from_line_offset,
+    load_cursor,
+    read_events_from_cursor,
+    reset_cursor,
+    save_cursor,
+)
 from .aggregator import get_aggregator
 
 
-STATE_FILE = Path.home() / ".spark" / "pattern_detection_state.json"
+CURSOR_NAME = "pattern_detection"
+# Line-offset state from before queue cursors; read once to seed the cursor.
+LEGACY_STATE_FILE = Path.home() / ".spark" / "pattern_detection_state.json"
 
 
-def _load_state() -> Dict:
-    if not STATE_FILE.exists():
-        return {"offset": 0}
+def _load_cursor() -> QueueCursor:
+    """Load the worker cursor, seeding it once from the legacy line offset."""
+    cursor = load_cursor(CURSOR_NAME)
+    if cursor.generation or not LEGACY_STATE_FILE.exists():
+        return cursor
     try:
-        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+        offset = int(json.loads(LEGACY_STATE_FILE.read_text(encoding="utf-8")).get("offset") or 0)
     except Exception:
-        return {"offset": 0}
-
-
-def _save_state(state: Dict) -> None:
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        offset = 0
+    seeded = cursor_from_line_offset(CURSOR_NAME, offset)
+    if seeded.generation:
+        save_cursor(seeded)
+        try:
+            LEGACY_STATE_FILE.unlink()
+        except OSError:
+            pass
+    return seeded
 
 
 def _hook_event_from_type(event_type: EventType) -> str:
@@ -42,25 +57,16 @@ def _hook_event_from_type(event_type: EventType) -> str:
 def process_pattern_events(limit: int = 200) -> int:
     """Process new queued events and run pattern detection.
 
-    NOTE: When the pipeline's ``consume_processed()`` removes events from
-    the head of the queue, the total line count shrinks.  We detect this
-    and reset the offset so we don't skip events or stall.
+    Progress is a byte cursor on the queue (see ``lib.queue.QueueCursor``):
+    each call seeks straight to the first unread event. Events the pipeline
+    already consumed are skipped, and rotations are followed via the queue
+    generation id.
     """
-    state = _load_state()
-    offset = int(state.get("offset", 0))
-
-    # Handle queue rotation, truncation, or consumption
-    total = count_events()
-    if total < offset:
-        # Queue was consumed or rotated -- reset offset relative to new size
-        offset = max(0, total - limit)
-
-    events = read_events(limit=limit, offset=offset)
+    cursor = _load_cursor()
+    events, next_cursor = read_events_from_cursor(cursor, limit=limit)
     if not events:
-        # If the offset is stale and there are events, reset to 0
-        if total > 0 and offset > 0:
-            state["offset"] = 0
-            _save_state(state)
+        if next_cursor != cursor:
+            save_cursor(next_cursor)
         return 0
 
     aggregator = get_aggregator()
@@ -90,30 +96,20 @@ def process_pattern_events(limit: int = 200) -> int:
 
         processed += 1
 
-    state["offset"] = offset + processed
-    _save_state(state)
+    save_cursor(next_cursor)
     return processed
 
 
 def reset_offset() -> None:
-    """Reset the pattern detection offset to 0.
+    """Restart pattern detection at the queue head.
 
-    Called after queue consumption to keep the offset in sync.
+    Queue consumption no longer requires this (cursors never point before
+    the head), but it remains available for manual resets.
     """
-    state = _load_state()
-    state["offset"] = 0
-    _save_state(state)
+    reset_cursor(CURSOR_NAME)
 
 
 def get_pattern_backlog() -> int:
     """Return the count of queued events not yet processed by pattern detection."""
-    state = _load_state()
-    try:
-        offset = int(state.get("offset", 0))
-    except Exception:
-        offset = 0
-    total = count_events()
-    if total < offset:
-        offset = total
-    return max(0, total - offset)
+    return count_events_after_cursor(_load_cursor())
 
@@ -1106,15 +1106,8 @@ def run_processing_cycle(
         try:
             consumed = consume_processed(len(events))
             metrics.events_consumed = consumed
-            # Reset the pattern detection offset since we've removed lines
-            # from the head of the file.  Without this, the worker's saved
-            # offset would point past the end of the (now shorter) file.
-            if consumed > 0:
-                try:
-                    from lib.pattern_detection.worker import reset_offset
-                    reset_offset()
-                except Exception:
-                    pass
+            # The pattern worker's byte cursor never reads before the queue
+            # head, so consuming needs no cursor reset.
         except Exception as e:
             metrics.errors.append(f"consume: {str(e)[:100]}")
             log_debug("pipeline", "consume_processed failed", e)
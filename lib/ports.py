@@ -18,6 +18,7 @@ def _env_int(name: str, default: int) -> int:
 SPARKD_PORT = _env_int("SPARKD_PORT", 8787)
 PULSE_PORT = _env_int("SPARK_PULSE_PORT", 8765)
 MIND_PORT = _env_int("SPARK_MIND_PORT", 8080)
+OBSERVE_PORT = _env_int("SPARK_OBSERVE_PORT", 8789)
 
 
 def _host(host: str | None) -> str:
@@ -31,9 +32,11 @@ def build_url(port: int, host: str | None = None) -> str:
 SPARKD_URL = build_url(SPARKD_PORT)
 PULSE_URL = build_url(PULSE_PORT)
 MIND_URL = build_url(MIND_PORT)
+OBSERVE_URL = build_url(OBSERVE_PORT)
 
 SPARKD_HEALTH_URL = f"{SPARKD_URL}/health"
 PULSE_STATUS_URL = f"{PULSE_URL}/api/status"
 PULSE_UI_URL = f"{PULSE_URL}/"
 PULSE_DOCS_URL = f"{PULSE_URL}/docs"
 MIND_HEALTH_URL = f"{MIND_URL}/health"
+OBSERVE_HEALTH_URL = f"{OBSERVE_URL}/health"
@@ -16,7 +16,16 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from lib.queue import read_events, count_events, EventType, _tail_lines
+from lib.append_log import tail_rows
+from lib.queue import (
+    EventType,
+    QueueCursor,
+    _tail_lines,
+    cursor_from_line_offset,
+    load_cursor,
+    read_events_from_cursor,
+    save_cursor,
+)
 from lib.cognitive_learner import get_cognitive_learner, _boost_confidence
 from lib.aha_tracker import get_aha_tracker, SurpriseType
 from lib.diagnostics import log_debug
@@ -29,6 +38,7 @@ from lib.primitive_filter import is_primitive_text
 
 PREDICTIONS_FILE = Path.home() / ".spark" / "predictions.jsonl"
 STATE_FILE = Path.home() / ".spark" / "prediction_state.json"
+CURSOR_NAME = "prediction"
 
 DEFAULT_SOURCE_BUDGETS = {
     "chip_merge": 80,
@@ -71,11 +81,11 @@ TEST_NAMESPACE_PATTERN = re.compile(
 
 def _load_state() -> Dict:
     if not STATE_FILE.exists():
-        return {"offset": 0, "matched_ids": []}
+        return {"matched_ids": []}
     try:
         return json.loads(STATE_FILE.read_text(encoding="utf-8"))
     except Exception:
-        return {"offset": 0, "matched_ids": []}
+        return {"matched_ids": []}
 
 
 def _save_state(state: Dict) -> None:
@@ -83,6 +93,19 @@ def _save_state(state: Dict) -> None:
     STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
 
 
+def _load_cursor(state: Dict) -> QueueCursor:
+    """Load the queue cursor, seeding it once from a legacy line ``offset`` in ``state``."""
+    cursor = load_cursor(CURSOR_NAME)
+    if cursor.generation or "offset" not in state:
+        return cursor
+    seeded = cursor_from_line_offset(CURSOR_NAME, int(state.get("offset") or 0))
+    if seeded.generation:
+        save_cursor(seeded)
+        state.pop("offset", None)
+        _save_state(state)
+    return seeded
+
+
 def _hash_id(*parts: str) -> str:
     raw = "|".join(p or "" for p in parts).encode("utf-8")
     return hashlib.sha1(raw).hexdigest()[:12]
@@ -211,6 +234,11 @@ def _load_jsonl(path: Path, limit: int = 300) -> List[Dict]:
     return out
 
 
+def _load_outcomes(limit: int) -> List[Dict]:
+    """Last N outcomes across every segment of the outcomes log, newest first."""
+    return tail_rows(OUTCOMES_FILE, limit)[::-1]
+
+
 def _append_jsonl(path: Path, rows: List[Dict]) -> None:
     if not rows:
         return
@@ -358,16 +386,12 @@ def _outcome_polarity(text: str) -> Optional[str]:
 
 
 def collect_outcomes(limit: int = 200) -> Dict[str, int]:
-    """Collect outcomes from recent events."""
-    state = _load_state()
-    offset = int(state.get("offset", 0))
-
-    total = count_events()
-    if total < offset:
-        offset = max(0, total - limit)
-
-    events = read_events(limit=limit, offset=offset)
+    """Collect outcomes from queued events after the prediction cursor."""
+    cursor = _load_cursor(_load_state())
+    events, next_cursor = read_events_from_cursor(cursor, limit=limit)
     if not events:
+        if next_cursor != cursor:
+            save_cursor(next_cursor)
         return {"processed": 0, "outcomes": 0}
 
     rows: List[Dict] = []
@@ -456,8 +480,7 @@ def collect_outcomes(limit: int = 200) -> Dict[str, int]:
             rows.append(row)
 
     append_outcomes(rows)
-    state["offset"] = offset + len(events)
-    _save_state(state)
+    save_cursor(next_cursor)
     return {"processed": processed, "outcomes": len(rows)}
 
 
@@ -550,7 +573,7 @@ def match_predictions(
 ) -> Dict[str, int]:
     """Match predictions to outcomes and update insight reliability."""
     preds = _load_jsonl(PREDICTIONS_FILE, limit=1200)
-    outcomes = _load_jsonl(OUTCOMES_FILE, limit=1200)
+    outcomes = _load_outcomes(1200)
     if not preds or not outcomes:
         return {"matched": 0, "validated": 0, "contradicted": 0, "surprises": 0}
 
@@ -823,7 +846,7 @@ def _compute_loop_kpis(window_s: float = 7 * 24 * 3600) -> Dict[str, float]:
     since = now - float(window_s or 0.0)
 
     preds = _load_jsonl(PREDICTIONS_FILE, limit=5000)
-    outcomes = _load_jsonl(OUTCOMES_FILE, limit=5000)
+    outcomes = _load_outcomes(5000)
     preds = [
         p
         for p in preds
@@ -893,7 +916,7 @@ def get_prediction_state() -> Dict:
     return {
         "last_run_ts": state.get("last_run_ts"),
         "last_stats": state.get("last_stats") or {},
-        "offset": state.get("offset", 0),
+        "offset": _load_cursor(state).offset,
         "matched_count": len(state.get("matched_ids") or []),
         "kpis": kpis,
     }
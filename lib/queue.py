@@ -15,9 +15,10 @@ import os
 import time
 import hashlib
 import threading
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 from dataclasses import dataclass, asdict
 
@@ -32,6 +33,7 @@ MAX_QUEUE_BYTES = 10 * 1024 * 1024  # 10 MB
 LOCK_FILE = QUEUE_DIR / ".queue.lock"
 OVERFLOW_FILE = QUEUE_DIR / "events.overflow.jsonl"
 QUEUE_STATE_FILE = QUEUE_DIR / "state.json"
+CURSORS_DIR = QUEUE_DIR / "cursors"
 QUEUE_COMPACT_HEAD_BYTES = 5 * 1024 * 1024
 TUNEABLES_FILE = Path.home() / ".spark" / "tuneables.json"
 
@@ -174,6 +176,42 @@ def _set_queue_head_bytes(head_bytes: int) -> None:
     _save_queue_state(state)
 
 
+def _new_generation_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def _queue_generation(state: Dict[str, Any]) -> str:
+    """Return the generation id of the current queue file, creating one if needed.
+
+    A generation spans every byte ever appended to one physical queue file.
+    Head compaction keeps the generation (it only moves ``base_bytes``); a
+    rotation or clear starts a new one.
+    """
+    gen = str(state.get("generation") or "")
+    if not gen:
+        gen = _new_generation_id()
+        state["generation"] = gen
+        state.setdefault("base_bytes", 0)
+        _save_queue_state(state)
+    return gen
+
+
+def _start_generation(state: Dict[str, Any], kept_from: Optional[Tuple[int, int]] = None) -> None:
+    """Switch ``state`` to a fresh generation (caller saves).
+
+    kept_from=(start, end) records which logical byte range of the previous
+    generation the new file begins with, so cursors inside it can be mapped.
+    """
+    previous = str(state.get("generation") or "")
+    state["generation"] = _new_generation_id()
+    state["base_bytes"] = 0
+    state["head_bytes"] = 0
+    if previous and kept_from is not None:
+        state["previous_generation"] = {"id": previous, "start": int(kept_from[0]), "end": int(kept_from[1])}
+    else:
+        state.pop("previous_generation", None)
+
+
 def _invalidate_count_cache() -> None:
     global _last_count_value, _last_count_value_ts
     _last_count_value = None
@@ -321,6 +359,68 @@ class SparkEvent:
         return cls(**data)
 
 
+def _event_line(event_type: EventType, session_id: str, data: Dict[str, Any],
+                tool_name: Optional[str] = None, tool_input: Optional[Dict] = None,
+                error: Optional[str] = None, trace_id: Optional[str] = None) -> str:
+    """Validate capture arguments and serialize one queue line (raises ValueError)."""
+    if not isinstance(event_type, EventType):
+        raise ValueError("invalid_event_type")
+    if not isinstance(session_id, str) or not session_id.strip():
+        raise ValueError("invalid_session_id")
+    if not isinstance(data, dict):
+        raise ValueError("invalid_data")
+
+    event_ts = time.time()
+    data_out = dict(data)
+    trace_hint = ""
+    if trace_id:
+        data_out["trace_id"] = trace_id
+    if not data_out.get("trace_id"):
+        payload = data_out.get("payload")
+        if isinstance(payload, dict):
+            trace_hint = str(payload.get("text") or payload.get("intent") or payload.get("command") or "")[:80]
+        raw = f"{session_id}|{event_type.value}|{event_ts}|{tool_name or ''}|{trace_hint}"
+        data_out["trace_id"] = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    event = SparkEvent(
+        event_type=event_type,
+        session_id=session_id,
+        timestamp=event_ts,
+        data=data_out,
+        tool_name=tool_name,
+        tool_input=tool_input,
+        error=error
+    )
+    return json.dumps(event.to_dict()) + "\n"
+
+
+def _append_queue_text(text: str) -> bool:
+    """Append serialized lines with one short lock, overflow sidecar on contention."""
+    QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+    lock = _queue_lock(timeout_s=0.05)
+    with lock:
+        if lock.acquired:
+            with open(EVENTS_FILE, "a") as f:
+                f.write(text)
+            _invalidate_count_cache()
+            return True
+        # Lock busy (consumer/rotator active) -- write to overflow
+        # sidecar so no events are lost. Merged on next consume.
+        overflow_lock_file = _overflow_lock_path()
+        overflow_lock = _queue_lock(timeout_s=0.5, lock_file=overflow_lock_file)
+        with overflow_lock:
+            if not overflow_lock.acquired:
+                # Last-resort fallback: shard sidecar by pid/thread to
+                # avoid cross-thread lock contention drops.
+                if _append_overflow_shard(text):
+                    return True
+                log_debug("queue", "overflow lock busy and shard write failed; dropping event")
+                return False
+            with open(OVERFLOW_FILE, "a", encoding="utf-8") as f:
+                f.write(text)
+    return True
+
+
 def quick_capture(event_type: EventType, session_id: str, data: Dict[str, Any],
                   tool_name: Optional[str] = None, tool_input: Optional[Dict] = None,
                   error: Optional[str] = None, trace_id: Optional[str] = None) -> bool:
@@ -331,59 +431,9 @@ def quick_capture(event_type: EventType, session_id: str, data: Dict[str, Any],
     Method: Append-only file write with short lock, overflow sidecar on contention.
     """
     try:
-        if not isinstance(event_type, EventType):
-            raise ValueError("invalid_event_type")
-        if not isinstance(session_id, str) or not session_id.strip():
-            raise ValueError("invalid_session_id")
-        if not isinstance(data, dict):
-            raise ValueError("invalid_data")
-
-        QUEUE_DIR.mkdir(parents=True, exist_ok=True)
-
-        event_ts = time.time()
-        data_out = dict(data)
-        trace_hint = ""
-        if trace_id:
-            data_out["trace_id"] = trace_id
-        if not data_out.get("trace_id"):
-            payload = data_out.get("payload")
-            if isinstance(payload, dict):
-                trace_hint = str(payload.get("text") or payload.get("intent") or payload.get("command") or "")[:80]
-            raw = f"{session_id}|{event_type.value}|{event_ts}|{tool_name or ''}|{trace_hint}"
-            data_out["trace_id"] = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
-
-        event = SparkEvent(
-            event_type=event_type,
-            session_id=session_id,
-            timestamp=event_ts,
-            data=data_out,
-            tool_name=tool_name,
-            tool_input=tool_input,
-            error=error
-        )
-
-        line = json.dumps(event.to_dict()) + "\n"
-        lock = _queue_lock(timeout_s=0.05)
-        with lock:
-            if lock.acquired:
-                with open(EVENTS_FILE, "a") as f:
-                    f.write(line)
-                _invalidate_count_cache()
-            else:
-                # Lock busy (consumer/rotator active) -- write to overflow
-                # sidecar so no events are lost. Merged on next consume.
-                overflow_lock_file = _overflow_lock_path()
-                overflow_lock = _queue_lock(timeout_s=0.5, lock_file=overflow_lock_file)
-                with overflow_lock:
-                    if not overflow_lock.acquired:
-                        # Last-resort fallback: shard sidecar by pid/thread to
-                        # avoid cross-thread lock contention drops.
-                        if _append_overflow_shard(line):
-                            return True
-                        log_debug("queue", "overflow lock busy and shard write failed; dropping event")
-                        return False
-                    with open(OVERFLOW_FILE, "a", encoding="utf-8") as f:
-                        f.write(line)
+        line = _event_line(event_type, session_id, data, tool_name, tool_input, error, trace_id)
+        if not _append_queue_text(line):
+            return False
 
         # Best-effort rotation so the queue doesn't grow unbounded.
         rotate_if_needed()
@@ -396,6 +446,34 @@ def quick_capture(event_type: EventType, session_id: str, data: Dict[str, Any],
         return False
 
 
+def quick_capture_many(events: List[Dict[str, Any]]) -> List[bool]:
+    """Capture several events with one lock acquisition and one write.
+
+    Each item holds quick_capture's keyword arguments. Returns one flag per
+    item (False for items that failed validation or if the write was dropped).
+    Rotation is checked once for the whole batch.
+    """
+    flags: List[bool] = []
+    lines: List[str] = []
+    for kwargs in events or []:
+        try:
+            lines.append(_event_line(**kwargs))
+            flags.append(True)
+        except Exception as e:
+            log_debug("queue", "quick_capture_many skipped event", e)
+            flags.append(False)
+    if not lines:
+        return flags
+    try:
+        if not _append_queue_text("".join(lines)):
+            return [False] * len(flags)
+        rotate_if_needed()
+    except Exception as e:
+        log_debug("queue", "quick_capture_many failed", e)
+        return [False] * len(flags)
+    return flags
+
+
 def read_events(limit: int = 100, offset: int = 0) -> List[SparkEvent]:
     """Read events from the queue."""
     events = []
@@ -507,7 +585,9 @@ def clear_events() -> int:
             overflow_lock = _overflow_lock_path()
             if overflow_lock.exists():
                 overflow_lock.unlink()
-            _set_queue_head_bytes(0)
+            state = _load_queue_state()
+            _start_generation(state)
+            _save_queue_state(state)
             _invalidate_count_cache()
     
     return count
@@ -554,22 +634,44 @@ def rotate_if_needed() -> bool:
         return False
     
     try:
-        with _queue_lock():
+        with _queue_lock() as lock:
+            if not lock.acquired:
+                # Cursor readers pair state.json with the file under this lock.
+                return False
             _merge_overflow_locked()
             active_head = _queue_head_bytes()
+            state = _load_queue_state()
+            _queue_generation(state)
+            try:
+                old_end = int(state.get("base_bytes") or 0) + EVENTS_FILE.stat().st_size
+            except Exception:
+                old_end = int(state.get("base_bytes") or 0)
             # Keep only the last half to evict oldest events.
             if MAX_EVENTS > 0:
                 keep_count = max(1, MAX_EVENTS // 2)
             else:
                 keep_count = max(1, count // 2) if count else 5000
-            lines = _tail_lines(EVENTS_FILE, keep_count, start_offset_bytes=active_head)
+            # Copy the kept tail byte for byte (CRLF lines included) so the
+            # new file is exactly the old logical range [old_end - kept, old_end)
+            # and cursors inside it map without drift.
             tmp = EVENTS_FILE.with_suffix(".jsonl.rotate.tmp")
-            with open(tmp, "w", encoding="utf-8") as f:
-                for line in lines:
-                    if line:
-                        f.write(line.rstrip("\r\n") + "\n")
+            with open(EVENTS_FILE, "rb") as src, open(tmp, "wb") as dst:
+                src.seek(_tail_start_offset(src, keep_count, start_offset_bytes=active_head))
+                kept_bytes = 0
+                last = b"\n"
+                while True:
+                    chunk = src.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    kept_bytes += len(chunk)
+                    last = chunk[-1:]
+                if last != b"\n":
+                    # Terminate a half-written line so the next append starts clean.
+                    dst.write(b"\n")
             tmp.replace(EVENTS_FILE)
-            _set_queue_head_bytes(0)
+            _start_generation(state, kept_from=(max(0, old_end - kept_bytes), old_end))
+            _save_queue_state(state)
             _invalidate_count_cache()
             print(f"[SPARK] Rotated queue: {count} -> {keep_count} events")
             return True
@@ -593,7 +695,7 @@ def consume_processed(up_to_offset: int) -> int:
         return 0
 
     try:
-        with _queue_lock():
+        with _queue_lock() as lock:
             _merge_overflow_locked()
             head = _queue_head_bytes()
             removed = 0
@@ -619,10 +721,18 @@ def consume_processed(up_to_offset: int) -> int:
                 size = 0
             active = max(0, size - new_head)
             should_compact = (
-                new_head >= QUEUE_COMPACT_HEAD_BYTES
+                lock.acquired
+                and new_head >= QUEUE_COMPACT_HEAD_BYTES
                 and (new_head >= (size // 2) or active <= QUEUE_COMPACT_HEAD_BYTES)
             )
             if should_compact:
+                # Same generation: cursors keep their logical offsets. The
+                # state is settled before the swap and saved right after it,
+                # all under the lock cursor readers take.
+                state = _load_queue_state()
+                _queue_generation(state)
+                state["base_bytes"] = int(state.get("base_bytes") or 0) + new_head
+                state["head_bytes"] = 0
                 tmp = EVENTS_FILE.with_suffix(".jsonl.tmp")
                 with open(EVENTS_FILE, "rb") as src, open(tmp, "wb") as dst:
                     src.seek(new_head)
@@ -632,7 +742,7 @@ def consume_processed(up_to_offset: int) -> int:
                             break
                         dst.write(chunk)
                 tmp.replace(EVENTS_FILE)
-                _set_queue_head_bytes(0)
+                _save_queue_state(state)
 
             _invalidate_count_cache()
             log_debug("queue", f"consumed {removed} events", None)
@@ -642,6 +752,222 @@ def consume_processed(up_to_offset: int) -> int:
         return 0
 
 
+# ============= Consumer Cursors =============
+
+@dataclass
+class QueueCursor:
+    """Durable read position of one queue consumer.
+
+    ``offset`` is a logical byte offset inside queue ``generation``: it counts
+    every byte appended to that queue file, including bytes later dropped by
+    head compaction, so it stays valid until the queue is rotated or cleared.
+    """
+    name: str
+    generation: str = ""
+    offset: int = 0
+    updated_at: float = 0.0
+
+
+def _cursor_path(name: str) -> Path:
+    safe = "".join(c if (c.isalnum() or c in "-_.") else "_" for c in str(name or "default"))
+    return CURSORS_DIR / f"{safe}.json"
+
+
+def load_cursor(name: str) -> QueueCursor:
+    """Load a consumer cursor (a fresh cursor starts at the queue head)."""
+    path = _cursor_path(name)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return QueueCursor(
+            name=name,
+            generation=str(data.get("generation") or ""),
+            offset=max(0, int(data.get("offset") or 0)),
+            updated_at=float(data.get("updated_at") or 0.0),
+        )
+    except Exception:
+        return QueueCursor(name=name)
+
+
+def save_cursor(cursor: QueueCursor) -> None:
+    """Persist a cursor atomically (one small file per consumer)."""
+    path = _cursor_path(cursor.name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        cursor.updated_at = time.time()
+        tmp = path.with_suffix(f".json.tmp.{os.getpid()}.{threading.get_ident()}")
+        tmp.write_text(json.dumps(asdict(cursor)), encoding="utf-8")
+        tmp.replace(path)
+    except Exception as e:
+        log_debug("queue", f"save_cursor failed ({cursor.name})", e)
+
+
+def reset_cursor(name: str) -> None:
+    """Forget a cursor so the consumer restarts at the queue head."""
+    try:
+        _cursor_path(name).unlink()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log_debug("queue", f"reset_cursor failed ({name})", e)
+
+
+def _cursor_logical_offset(cursor: QueueCursor, state: Dict[str, Any], generation: str) -> Optional[int]:
+    if not cursor.generation:
+        return None
+    if cursor.generation == generation:
+        return int(cursor.offset)
+    prev = state.get("previous_generation")
+    if isinstance(prev, dict) and cursor.generation == prev.get("id"):
+        start, end = int(prev.get("start") or 0), int(prev.get("end") or 0)
+        if start <= cursor.offset <= end:
+            return int(cursor.offset) - start
+    return None
+
+
+def _open_at_cursor(cursor: QueueCursor):
+    """Open EVENTS_FILE positioned at the cursor's next unread line.
+
+    Returns (file, generation, base_bytes) or None when there is no queue.
+    The state is read and the file opened under the queue lock, so rotation
+    and compaction (which swap the file and rewrite the state under it)
+    cannot pair a new file with old offsets. If the lock is busy, the state
+    is re-read after opening instead, and a queue with no generation yet is
+    left for the next read rather than given one without the lock.
+    """
+    with _queue_lock() as lock:
+        for _ in range(3):
+            state = _load_queue_state()
+            if lock.acquired:
+                generation = _queue_generation(state)
+            else:
+                generation = str(state.get("generation") or "")
+                if not generation:
+                    return None
+            base = int(state.get("base_bytes") or 0)
+            head = int(state.get("head_bytes") or 0)
+            try:
+                f = open(EVENTS_FILE, "rb")
+            except FileNotFoundError:
+                return None
+            if not lock.acquired:
+                check = _load_queue_state()
+                if check.get("generation") != generation or int(check.get("base_bytes") or 0) != base:
+                    f.close()
+                    continue
+            try:
+                size = os.fstat(f.fileno()).st_size
+                head = min(max(0, head), size)
+                logical = _cursor_logical_offset(cursor, state, generation)
+                pos = head if logical is None else logical - base
+                if pos < head:
+                    # Never re-read events the pipeline already consumed.
+                    pos = head
+                if pos > size:
+                    pos = head
+                if pos > 0:
+                    f.seek(pos - 1)
+                    if f.read(1) != b"\n":
+                        # Offset is not on a line boundary (file rewritten under
+                        # us); resume at the next full line.
+                        f.readline()
+                else:
+                    f.seek(0)
+                return f, generation, base
+            except Exception:
+                f.close()
+                raise
+    return None
+
+
+def read_events_from_cursor(cursor: QueueCursor, limit: int = 100) -> Tuple[List[SparkEvent], QueueCursor]:
+    """Read up to ``limit`` events after ``cursor`` with a single seek.
+
+    Returns the events and the advanced cursor; persist it with
+    ``save_cursor()`` once the events are processed. A trailing line without
+    a newline (a writer mid-append) is left for the next read.
+    """
+    events: List[SparkEvent] = []
+    try:
+        opened = _open_at_cursor(cursor)
+    except Exception as e:
+        log_debug("queue", "read_events_from_cursor failed", e)
+        return events, cursor
+    if opened is None:
+        return events, cursor
+    f, generation, base = opened
+    try:
+        pos = f.tell()
+        while len(events) < limit:
+            raw = f.readline()
+            if not raw or not raw.endswith(b"\n"):
+                break
+            pos += len(raw)
+            try:
+                data = json.loads(raw.decode("utf-8", errors="replace"))
+                events.append(SparkEvent.from_dict(data))
+            except Exception:
+                continue
+    except Exception as e:
+        log_debug("queue", "read_events_from_cursor failed", e)
+    finally:
+        f.close()
+    return events, QueueCursor(name=cursor.name, generation=generation, offset=base + pos)
+
+
+def count_events_after_cursor(cursor: QueueCursor) -> int:
+    """Count complete events after ``cursor`` (reads only the unread tail)."""
+    try:
+        opened = _open_at_cursor(cursor)
+    except Exception as e:
+        log_debug("queue", "count_events_after_cursor failed", e)
+        return 0
+    if opened is None:
+        return 0
+    f = opened[0]
+    try:
+        count = 0
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                break
+            count += chunk.count(b"\n")
+        return count
+    finally:
+        f.close()
+
+
+def cursor_from_line_offset(name: str, line_offset: int) -> QueueCursor:
+    """Cursor ``line_offset`` events past the queue head (not persisted).
+
+    Seeds the cursor of a consumer that used to keep a line offset into the
+    active queue (``read_events(offset=...)``), so upgrading neither replays
+    nor skips events. An offset past the end lands at the end of the queue.
+    Without a queue (or a generation) the fresh cursor is returned as is.
+    """
+    cursor = QueueCursor(name=name)
+    try:
+        opened = _open_at_cursor(cursor)
+    except Exception as e:
+        log_debug("queue", "cursor_from_line_offset failed", e)
+        return cursor
+    if opened is None:
+        return cursor
+    f, generation, base = opened
+    try:
+        pos = f.tell()
+        for _ in range(max(0, int(line_offset or 0))):
+            raw = f.readline()
+            if not raw.endswith(b"\n"):
+                break
+            pos += len(raw)
+        return QueueCursor(name=name, generation=generation, offset=base + pos)
+    except Exception as e:
+        log_debug("queue", "cursor_from_line_offset failed", e)
+        return cursor
+    finally:
+        f.close()
+
+
 # ============= Event Priority Classification =============
 
 class EventPriority:
@@ -703,6 +1029,7 @@ def get_queue_stats() -> Dict:
         "file_bytes": file_bytes,
         "size_mb": round(size_bytes / (1024 * 1024), 2),
         "queue_file": str(EVENTS_FILE),
+        "generation": _load_queue_state().get("generation") or "",
         "max_events": MAX_EVENTS,
         "tail_chunk_bytes": TAIL_CHUNK_BYTES,
         "max_bytes": MAX_QUEUE_BYTES,
@@ -710,6 +1037,39 @@ def get_queue_stats() -> Dict:
     }
 
 
+def _tail_start_offset(f, count: int, start_offset_bytes: int = 0) -> int:
+    """Byte offset where the last ``count`` lines of open binary file ``f`` begin.
+
+    Counts raw newline-terminated lines (blank and CRLF lines included) and
+    never returns less than ``start_offset_bytes``.
+    """
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    start = min(max(0, start_offset_bytes), end)
+    if count <= 0:
+        return end
+    pos = end
+    if pos > start:
+        f.seek(pos - 1)
+        if f.read(1) == b"\n":
+            pos -= 1  # the last line's own terminator
+    found = 0
+    while pos > start:
+        read_size = min(TAIL_CHUNK_BYTES, pos - start)
+        pos -= read_size
+        f.seek(pos)
+        chunk = f.read(read_size)
+        idx = len(chunk)
+        while True:
+            idx = chunk.rfind(b"\n", 0, idx)
+            if idx < 0:
+                break
+            found += 1
+            if found == count:
+                return pos + idx + 1
+    return start
+
+
 def _tail_lines(path: Path, count: int, start_offset_bytes: int = 0) -> List[str]:
     """Read the last N lines of a file without loading the whole file.
 
@@ -23,6 +23,11 @@ from .config_authority import env_bool, resolve_section
 from .embeddings import embed_text, embed_texts
 from .diagnostics import log_debug
 
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover - optional dependency
+    _np = None
+
 
 DEFAULT_CONFIG = {
     "enabled": True,  # Enabled by default — falls back gracefully if fastembed unavailable
@@ -203,13 +208,180 @@ class TriggerMatcher:
         return matches
 
 
+def _blob_floats(blob: bytes) -> List[float]:
+    import array
+    arr = array.array("f")
+    arr.frombytes(blob)
+    return list(arr)
+
+
+class _VectorMatrix:
+    """In-memory vector table: contiguous float32 rows with precomputed norms.
+
+    Uses NumPy when available (one matrix-vector product + argpartition per
+    search); otherwise keeps plain lists and scores with a Python loop.
+    Rows are patched in place; deletes swap the last row into the hole.
+    Vectors whose dimension differs from the table's live in a small side
+    map and are always scored with the Python loop.
+    """
+
+    def __init__(self) -> None:
+        self.dim = 0
+        self.keys: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.ragged: Dict[str, Tuple[List[float], float]] = {}
+        self._n = 0
+        self._mat: Any = None
+        self._norms: Any = None
+        if _np is None:
+            self._mat = []
+            self._norms = []
+
+    def __len__(self) -> int:
+        return self._n + len(self.ragged)
+
+    @staticmethod
+    def _norm(vec: List[float]) -> float:
+        return math.sqrt(sum(x * x for x in vec)) or 1.0
+
+    def _grow(self, need: int) -> None:
+        cap = self._mat.shape[0]
+        if need <= cap:
+            return
+        new_cap = max(need, cap * 2, 64)
+        mat = _np.zeros((new_cap, self.dim), dtype=_np.float32)
+        norms = _np.ones(new_cap, dtype=_np.float32)
+        mat[: self._n] = self._mat[: self._n]
+        norms[: self._n] = self._norms[: self._n]
+        self._mat, self._norms = mat, norms
+
+    def set(self, key: str, vec: List[float]) -> None:
+        if not vec:
+            return
+        if not self.dim and not self._n:
+            self.dim = len(vec)
+            if _np is not None:
+                self._mat = _np.zeros((64, self.dim), dtype=_np.float32)
+                self._norms = _np.ones(64, dtype=_np.float32)
+        if len(vec) != self.dim:
+            self.remove(key)
+            self.ragged[key] = (list(vec), self._norm(vec))
+            return
+        self.ragged.pop(key, None)
+        row = self.row_of.get(key)
+        if row is None:
+            row = self._n
+            if _np is not None:
+                self._grow(row + 1)
+            else:
+                self._mat.append(None)
+                self._norms.append(1.0)
+            self.keys.append(key)
+            self.row_of[key] = row
+            self._n += 1
+        if _np is not None:
+            arr = _np.asarray(vec, dtype=_np.float32)
+            self._mat[row] = arr
+            self._norms[row] = float(_np.sqrt(_np.dot(arr, arr))) or 1.0
+        else:
+            self._mat[row] = list(vec)
+            self._norms[row] = self._norm(vec)
+
+    def load_blobs(self, rows: List[Tuple[str, bytes]]) -> None:
+        """Bulk-load float32 blobs straight into the matrix (NumPy fast path)."""
+        if _np is None or self._n or self.ragged:
+            for key, blob in rows:
+                self.set(key, _blob_floats(blob))
+            return
+        if not rows:
+            return
+        dim = len(rows[0][1]) // 4
+        same = [(k, b) for k, b in rows if len(b) == dim * 4]
+        if dim:
+            mat = _np.frombuffer(b"".join(b for _, b in same), dtype=_np.float32).reshape(len(same), dim)
+            self.dim = dim
+            self._mat = _np.array(mat, dtype=_np.float32)
+            norms = _np.sqrt(_np.einsum("ij,ij->i", self._mat, self._mat))
+            norms[norms == 0] = 1.0
+            self._norms = norms.astype(_np.float32)
+            self.keys = [k for k, _ in same]
+            self.row_of = {k: i for i, k in enumerate(self.keys)}
+            self._n = len(self.keys)
+        for key, blob in rows:
+            if len(blob) != dim * 4 or not dim:
+                self.set(key, _blob_floats(blob))
+
+    def remove(self, key: str) -> bool:
+        if self.ragged.pop(key, None) is not None:
+            return True
+        row = self.row_of.pop(key, None)
+        if row is None:
+            return False
+        last = self._n - 1
+        if row != last:
+            moved = self.keys[last]
+            self.keys[row] = moved
+            self.row_of[moved] = row
+            self._mat[row] = self._mat[last]
+            self._norms[row] = self._norms[last]
+        self.keys.pop()
+        if _np is None:
+            self._mat.pop()
+            self._norms.pop()
+        self._n = last
+        return True
+
+    def get(self, key: str) -> Optional[List[float]]:
+        if key in self.ragged:
+            return list(self.ragged[key][0])
+        row = self.row_of.get(key)
+        if row is None:
+            return None
+        if _np is not None:
+            return self._mat[row].tolist()
+        return list(self._mat[row])
+
+    def search(self, query_vec: List[float], limit: int) -> List[Tuple[str, float]]:
+        qnorm = self._norm(query_vec)
+        scores: List[Tuple[str, float]] = []
+        if self._n:
+            if _np is not None and len(query_vec) == self.dim:
+                q = _np.asarray(query_vec, dtype=_np.float32)
+                sims = (self._mat[: self._n] @ q) / (self._norms[: self._n] * _np.float32(qnorm))
+                k = min(max(0, limit), self._n)
+                if k <= 0:
+                    return []
+                if k < self._n:
+                    top = _np.argpartition(-sims, k - 1)[:k]
+                else:
+                    top = _np.arange(self._n)
+                for i in top.tolist():
+                    scores.append((self.keys[i], float(sims[i])))
+            else:
+                for i in range(self._n):
+                    scores.append((self.keys[i], self._score(query_vec, self._mat[i], qnorm, float(self._norms[i]))))
+        for key, (vec, vnorm) in self.ragged.items():
+            scores.append((key, self._score(query_vec, vec, qnorm, vnorm)))
+        scores.sort(key=lambda t: t[1], reverse=True)
+        return scores[:limit]
+
+    @staticmethod
+    def _score(query_vec: List[float], vec: Any, qnorm: float, vnorm: float) -> float:
+        dot = 0.0
+        for a, b in zip(query_vec, vec):
+            dot += a * b
+        return float(dot) / (qnorm * vnorm)
+
+
 class SemanticIndex:
     def __init__(self, path: Optional[Path] = None, cache_ttl_s: int = 120):
         self.path = path or (Path.home() / ".spark" / "semantic" / "insights_vec.sqlite")
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.cache_ttl_s = cache_ttl_s
         self._cache_ts = 0.0
-        self._cache: Optional[List[Tuple[str, List[float], float]]] = None
+        self._cache: Optional[_VectorMatrix] = None
+        # insight_key -> updated_at for rows mirrored in _cache (drives incremental refresh).
+        self._cache_updated: Dict[str, float] = {}
         self._init_db()
 
     def _init_db(self) -> None:
@@ -237,32 +409,64 @@ class SemanticIndex:
         return arr.tobytes()
 
     def _blob_to_vector(self, blob: bytes) -> List[float]:
-        import array
-        arr = array.array("f")
-        arr.frombytes(blob)
-        return list(arr)
+        return _blob_floats(blob)
 
     def _hash_text(self, text: str) -> str:
         return hashlib.sha256(text.encode("utf-8", errors="ignore")).hexdigest()
 
     def _invalidate_cache(self) -> None:
         self._cache = None
+        self._cache_updated = {}
         self._cache_ts = 0.0
 
-    def _load_cache(self) -> List[Tuple[str, List[float], float]]:
+    def _patch_cache(self, rows: List[Tuple[str, List[float], float]]) -> None:
+        """Apply local writes to the in-memory matrix without a reload."""
+        if self._cache is None:
+            return
+        for key, vec, updated_at in rows:
+            self._cache.set(key, vec)
+            self._cache_updated[key] = updated_at
+
+    def _load_cache(self) -> _VectorMatrix:
         now = time.time()
         if self._cache is not None and now - self._cache_ts < self.cache_ttl_s:
             return self._cache
-        items: List[Tuple[str, List[float], float]] = []
-        with self._connect() as conn:
-            rows = conn.execute("SELECT insight_key, vector FROM insights_vec").fetchall()
-        for row in rows:
-            vec = self._blob_to_vector(row["vector"])
-            norm = math.sqrt(sum(x * x for x in vec)) or 1.0
-            items.append((row["insight_key"], vec, norm))
-        self._cache = items
+        if self._cache is None:
+            matrix = _VectorMatrix()
+            updated: Dict[str, float] = {}
+            with self._connect() as conn:
+                rows = conn.execute("SELECT insight_key, vector, updated_at FROM insights_vec").fetchall()
+            matrix.load_blobs([(row["insight_key"], row["vector"]) for row in rows])
+            for row in rows:
+                updated[row["insight_key"]] = row["updated_at"]
+            self._cache = matrix
+            self._cache_updated = updated
+        else:
+            self._refresh_cache()
         self._cache_ts = now
-        return items
+        return self._cache
+
+    def _refresh_cache(self) -> None:
+        """TTL refresh: pick up other writers' changes by row, not by full decode."""
+        with self._connect() as conn:
+            stamps = {
+                r["insight_key"]: r["updated_at"]
+                for r in conn.execute("SELECT insight_key, updated_at FROM insights_vec").fetchall()
+            }
+            changed = [k for k, ts in stamps.items() if self._cache_updated.get(k, -1.0) != ts]
+            fresh: List[Tuple[str, List[float], float]] = []
+            for i in range(0, len(changed), 500):
+                chunk = changed[i:i + 500]
+                marks = ",".join("?" for _ in chunk)
+                for row in conn.execute(
+                    f"SELECT insight_key, vector, updated_at FROM insights_vec WHERE insight_key IN ({marks})",
+                    chunk,
+                ).fetchall():
+                    fresh.append((row["insight_key"], self._blob_to_vector(row["vector"]), row["updated_at"]))
+        for key in [k for k in self._cache_updated if k not in stamps]:
+            self._cache.remove(key)
+            self._cache_updated.pop(key, None)
+        self._patch_cache(fresh)
 
     def existing_hashes(self) -> Dict[str, str]:
         with self._connect() as conn:
@@ -289,15 +493,19 @@ class SemanticIndex:
             return 0
 
         now = time.time()
+        written: List[Tuple[str, List[float], float]] = []
         with self._connect() as conn:
             for (key, _, content_hash), vec in zip(to_embed, vectors):
+                blob = self._vector_to_blob(vec)
                 conn.execute(
                     "INSERT OR REPLACE INTO insights_vec (insight_key, content_hash, dim, vector, updated_at) VALUES (?, ?, ?, ?, ?)",
-                    (key, content_hash, len(vec), self._vector_to_blob(vec), now),
+                    (key, content_hash, len(vec), blob, now),
                 )
+                # Mirror the float32 round-trip so cached rows match a reload.
+                written.append((key, self._blob_to_vector(blob), now))
             conn.commit()
 
-        self._invalidate_cache()
+        self._patch_cache(written)
         return len(to_embed)
 
     def add(self, key: str, text: str) -> bool:
@@ -308,24 +516,21 @@ class SemanticIndex:
         if not key or not vector:
             return False
         now = time.time()
+        blob = self._vector_to_blob(vector)
         with self._connect() as conn:
             conn.execute(
                 "INSERT OR REPLACE INTO insights_vec (insight_key, content_hash, dim, vector, updated_at) VALUES (?, ?, ?, ?, ?)",
-                (key, None, len(vector), self._vector_to_blob(vector), now),
+                (key, None, len(vector), blob, now),
             )
             conn.commit()
-        self._invalidate_cache()
+        self._patch_cache([(key, self._blob_to_vector(blob), now)])
         return True
 
     def get(self, key: str) -> Optional[List[float]]:
         """Return a vector for a given insight_key if present."""
         if not key:
             return None
-        items = self._load_cache()
-        for k, vec, _ in items:
-            if k == key:
-                return vec
-        return None
+        return self._load_cache().get(key)
 
     def ensure_index(
         self,
@@ -373,18 +578,20 @@ class SemanticIndex:
         """
         if not valid_keys:
             return 0
-        pruned = 0
+        pruned_keys: List[str] = []
         with self._connect() as conn:
             rows = conn.execute("SELECT insight_key FROM insights_vec").fetchall()
             for row in rows:
                 if row["insight_key"] not in valid_keys:
                     conn.execute("DELETE FROM insights_vec WHERE insight_key = ?", (row["insight_key"],))
-                    pruned += 1
-            if pruned:
+                    pruned_keys.append(row["insight_key"])
+            if pruned_keys:
                 conn.commit()
-        if pruned:
-            self._invalidate_cache()
-        return pruned
+        if pruned_keys and self._cache is not None:
+            for key in pruned_keys:
+                self._cache.remove(key)
+                self._cache_updated.pop(key, None)
+        return len(pruned_keys)
 
     def count(self) -> int:
         """Return the number of indexed entries."""
@@ -395,17 +602,7 @@ class SemanticIndex:
     def search(self, query_vec: List[float], limit: int = 10) -> List[Tuple[str, float]]:
         if not query_vec:
             return []
-        qnorm = math.sqrt(sum(x * x for x in query_vec)) or 1.0
-        items = self._load_cache()
-        scores: List[Tuple[str, float]] = []
-        for key, vec, vnorm in items:
-            dot = 0.0
-            for a, b in zip(query_vec, vec):
-                dot += a * b
-            sim = dot / (qnorm * vnorm)
-            scores.append((key, sim))
-        scores.sort(key=lambda t: t[1], reverse=True)
-        return scores[:limit]
+        return self._load_cache().search(query_vec, limit)
 
 
 class SemanticRetriever:
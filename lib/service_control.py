@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ruff: noqa: S603,S607
-"""Service control helpers for Spark daemons (mind, sparkd, bridge_worker, pulse, watchdog)."""
+"""Service control helpers for Spark daemons (mind, sparkd, observe, bridge_worker, pulse, watchdog)."""
 
 from __future__ import annotations
 
@@ -19,6 +19,7 @@ from lib.diagnostics import _rotate_log_file, _LOG_MAX_BYTES, _LOG_BACKUPS
 
 from lib.ports import (
     MIND_HEALTH_URL,
+    OBSERVE_HEALTH_URL,
     PULSE_DOCS_URL,
     PULSE_UI_URL,
     PULSE_URL,
@@ -382,6 +383,8 @@ def _is_service_ready(name: str, bridge_stale_s: int = 90) -> bool:
         return _http_ok(MIND_HEALTH_URL)
     if name == "sparkd":
         return _http_ok(SPARKD_HEALTH_URL)
+    if name == "observe":
+        return _http_ok(OBSERVE_HEALTH_URL)
     if name == "pulse":
         return _pulse_ok()
     if name == "bridge_worker":
@@ -464,6 +467,7 @@ def _service_cmds(
 ) -> dict[str, Optional[list[str]]]:
     cmds = {
         "sparkd": [sys.executable, "-m", "sparkd"],
+        "observe": [sys.executable, str(ROOT_DIR / "hooks" / "observe_server.py")],
         "bridge_worker": [
             sys.executable,
             "-m",
@@ -495,6 +499,7 @@ def _service_cmds(
 def service_status(bridge_stale_s: int = 90, include_pulse_probe: bool = True) -> dict[str, dict]:
     mind_ok = _http_ok(MIND_HEALTH_URL)
     sparkd_ok = _http_ok(SPARKD_HEALTH_URL)
+    observe_ok = _http_ok(OBSERVE_HEALTH_URL)
     pulse_ok = _pulse_ok() if include_pulse_probe else False
     hb_age = _bridge_heartbeat_age()
 
@@ -502,6 +507,7 @@ def service_status(bridge_stale_s: int = 90, include_pulse_probe: bool = True) -
 
     mind_pid = _read_pid("mind")
     sparkd_pid = _read_pid("sparkd")
+    observe_pid = _read_pid("observe")
     pulse_pid = _read_pid("pulse")
     bridge_pid = _read_pid("bridge_worker")
     scheduler_pid = _read_pid("scheduler")
@@ -510,6 +516,7 @@ def service_status(bridge_stale_s: int = 90, include_pulse_probe: bool = True) -
     snapshot = _process_snapshot()
     mind_keys = [["mind_server.py"], ["lite_tier"], ["mind.serve"]]
     sparkd_keys = [["-m sparkd"], ["sparkd.py"]]
+    observe_keys = [["observe_server.py"]]
     pulse_keys = _pulse_process_patterns()
     bridge_keys = [["-m bridge_worker"], ["bridge_worker.py"]]
     scheduler_keys = [["spark_scheduler.py"]]
@@ -527,6 +534,12 @@ def service_status(bridge_stale_s: int = 90, include_pulse_probe: bool = True) -
         or _any_process_matches(sparkd_keys, snapshot)
         or _pid_alive_fallback(sparkd_pid, snapshot)
     )
+    observe_running = (
+        observe_ok
+        or _pid_matches(observe_pid, observe_keys, snapshot)
+        or _any_process_matches(observe_keys, snapshot)
+        or _pid_alive_fallback(observe_pid, snapshot)
+    )
     pulse_running = (
         pulse_ok
         or _pid_matches(pulse_pid, pulse_keys, snapshot)
@@ -564,6 +577,11 @@ def service_status(bridge_stale_s: int = 90, include_pulse_probe: bool = True) -
             "healthy": sparkd_ok,
             "pid": sparkd_pid,
         },
+        "observe": {
+            "running": observe_running,
+            "healthy": observe_ok,
+            "pid": observe_pid,
+        },
         "pulse": {
             "running": pulse_running,
             "healthy": pulse_ok,
@@ -612,7 +630,7 @@ def start_services(
     statuses = service_status(bridge_stale_s=bridge_stale_s)
     results: dict[str, str] = {}
 
-    order = ["mind", "sparkd", "bridge_worker", "scheduler", "pulse", "watchdog"]
+    order = ["mind", "sparkd", "observe", "bridge_worker", "scheduler", "pulse", "watchdog"]
     if not include_mind:
         order.remove("mind")
     if not include_pulse:
@@ -669,11 +687,12 @@ def ensure_services(
 
 def stop_services() -> dict[str, str]:
     results: dict[str, str] = {}
-    for name in ["watchdog", "pulse", "scheduler", "bridge_worker", "sparkd", "mind"]:
+    for name in ["watchdog", "pulse", "scheduler", "bridge_worker", "observe", "sparkd", "mind"]:
         pid = _read_pid(name)
         patterns = {
             "mind": [["mind_server.py"], ["lite_tier"], ["mind.serve"]],
             "sparkd": [["-m sparkd"], ["sparkd.py"]],
+            "observe": [["observe_server.py"]],
             "bridge_worker": [["-m bridge_worker"], ["bridge_worker.py"]],
             "scheduler": [["spark_scheduler.py"]],
             "pulse": _pulse_process_patterns(),
@@ -736,6 +755,7 @@ def stop_services() -> dict[str, str]:
 def format_status_lines(status: dict[str, dict], bridge_stale_s: int = 90) -> list[str]:
     lines: list[str] = []
     sparkd = status.get("sparkd", {})
+    observe = status.get("observe", {})
     pulse = status.get("pulse", {})
     bridge = status.get("bridge_worker", {})
     scheduler = status.get("scheduler", {})
@@ -750,6 +770,10 @@ def format_status_lines(status: dict[str, dict], bridge_stale_s: int = 90) -> li
         f"[spark] sparkd: {'RUNNING' if sparkd.get('running') else 'STOPPED'}"
         + (" (healthy)" if sparkd.get("healthy") else "")
     )
+    lines.append(
+        f"[spark] observe: {'RUNNING' if observe.get('running') else 'STOPPED'}"
+        + (" (healthy)" if observe.get("healthy") else "")
+    )
     lines.append(
         f"[spark] pulse: {'RUNNING' if pulse.get('running') else 'STOPPED'}"
         + (" (healthy)" if pulse.get("healthy") else "")
@@ -0,0 +1,246 @@
+"""Per-session hook state in one small transactional SQLite (WAL) store.
+
+The hooks keep short-lived state between PreToolUse and PostToolUse (active
+EIDOS step, predictions), per session (active episode, pending goal, recent
+tool failures). Each of these used to be a JSON file that every call read,
+filtered and rewrote whole, so concurrent sessions overwrote each other's
+entries. Here every entry is one row:
+
+- ``session_state``: (namespace, key) -> JSON value with an optional
+  ``expires_at``; expired rows are invisible to reads and purged lazily
+- ``state_meta``: one-time markers (e.g. legacy JSON imports)
+
+A hook call costs a single-row upsert / lookup. ``pop`` reads and deletes in
+one transaction, so one-shot state (a prediction, a failure awaiting
+recovery) is consumed by exactly one caller. All operations are
+best-effort: errors are logged and reads fall back to the default.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .diagnostics import log_debug
+
+SESSION_STATE_FILE = Path.home() / ".spark" / "session_state.sqlite"
+
+# Expired rows are deleted at most this often per store (reads already skip them).
+PURGE_INTERVAL_S = 60.0
+
+
+class SessionStateStore:
+    """Namespaced key/value rows with TTL; one connection per thread."""
+
+    def __init__(self, path: Path, timeout_s: float = 2.0):
+        self.path = Path(path)
+        self.timeout_s = float(timeout_s)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._last_purge = 0.0
+        self._markers_done: set = set()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.path), timeout=self.timeout_s, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS session_state (
+                      namespace TEXT NOT NULL,
+                      key TEXT NOT NULL,
+                      value TEXT NOT NULL,
+                      expires_at REAL,
+                      updated_at REAL NOT NULL,
+                      PRIMARY KEY (namespace, key)
+                    ) WITHOUT ROWID;
+                    CREATE INDEX IF NOT EXISTS idx_session_state_expires ON session_state(expires_at);
+                    CREATE TABLE IF NOT EXISTS state_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                    """
+                )
+                self._schema_ready = True
+        self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                self._local.conn = None
+
+    def _write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def _maybe_purge(self, conn: sqlite3.Connection, now: float) -> None:
+        if now - self._last_purge < PURGE_INTERVAL_S:
+            return
+        self._last_purge = now
+        conn.execute("DELETE FROM session_state WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+
+    def put(self, namespace: str, key: str, value: Any, ttl_s: Optional[float] = None) -> bool:
+        """Insert or replace one entry; ``ttl_s=None`` keeps it until deleted."""
+        now = time.time()
+        expires_at = now + float(ttl_s) if ttl_s is not None else None
+        try:
+            payload = json.dumps(value)
+
+            def _put(conn: sqlite3.Connection) -> None:
+                conn.execute(
+                    "INSERT INTO session_state (namespace, key, value, expires_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT(namespace, key) DO UPDATE SET "
+                    "value = excluded.value, expires_at = excluded.expires_at, updated_at = excluded.updated_at",
+                    (namespace, str(key), payload, expires_at, now),
+                )
+                self._maybe_purge(conn, now)
+
+            self._write(_put)
+            return True
+        except Exception as e:
+            log_debug("session_state", f"put {namespace} failed", e)
+            return False
+
+    def put_many(self, namespace: str, items: Iterable[Tuple[str, Any]], ttl_s: Optional[float] = None) -> int:
+        """Insert or replace several entries in one transaction; returns rows written."""
+        now = time.time()
+        expires_at = now + float(ttl_s) if ttl_s is not None else None
+        try:
+            rows = [(namespace, str(k), json.dumps(v), expires_at, now) for k, v in items]
+            if not rows:
+                return 0
+            self._write(lambda conn: conn.executemany(
+                "INSERT OR REPLACE INTO session_state (namespace, key, value, expires_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            ))
+            return len(rows)
+        except Exception as e:
+            log_debug("session_state", f"put_many {namespace} failed", e)
+            return 0
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Live value for one entry, or ``default``."""
+        try:
+            row = self._conn().execute(
+                "SELECT value FROM session_state WHERE namespace = ? AND key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, str(key), time.time()),
+            ).fetchone()
+            return json.loads(row[0]) if row else default
+        except Exception as e:
+            log_debug("session_state", f"get {namespace} failed", e)
+            return default
+
+    def pop(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Read and delete one entry atomically; expired entries return ``default``."""
+        now = time.time()
+
+        def _pop(conn: sqlite3.Connection) -> Any:
+            row = conn.execute(
+                "SELECT value, expires_at FROM session_state WHERE namespace = ? AND key = ?",
+                (namespace, str(key)),
+            ).fetchone()
+            if row is None:
+                return default
+            conn.execute("DELETE FROM session_state WHERE namespace = ? AND key = ?", (namespace, str(key)))
+            if row[1] is not None and row[1] <= now:
+                return default
+            return json.loads(row[0])
+
+        try:
+            return self._write(_pop)
+        except Exception as e:
+            log_debug("session_state", f"pop {namespace} failed", e)
+            return default
+
+    def delete(self, namespace: str, key: str) -> bool:
+        try:
+            self._write(lambda conn: conn.execute(
+                "DELETE FROM session_state WHERE namespace = ? AND key = ?", (namespace, str(key))
+            ))
+            return True
+        except Exception as e:
+            log_debug("session_state", f"delete {namespace} failed", e)
+            return False
+
+    def items(self, namespace: str) -> Dict[str, Any]:
+        """All live entries of a namespace."""
+        try:
+            rows = self._conn().execute(
+                "SELECT key, value FROM session_state WHERE namespace = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, time.time()),
+            ).fetchall()
+            return {key: json.loads(value) for key, value in rows}
+        except Exception as e:
+            log_debug("session_state", f"items {namespace} failed", e)
+            return {}
+
+    def purge_expired(self) -> int:
+        """Delete every expired row now; returns rows deleted."""
+        now = time.time()
+        try:
+            cur = self._write(lambda conn: conn.execute(
+                "DELETE FROM session_state WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+            ))
+            self._last_purge = now
+            return int(cur.rowcount or 0)
+        except Exception as e:
+            log_debug("session_state", "purge_expired failed", e)
+            return 0
+
+    def import_once(self, marker: str, load: Callable[[], None]) -> bool:
+        """Run ``load`` (e.g. a legacy JSON import) once per store; True if it ran."""
+        if marker in self._markers_done:
+            return False
+        try:
+            conn = self._conn()
+            if conn.execute("SELECT 1 FROM state_meta WHERE key = ?", (marker,)).fetchone():
+                self._markers_done.add(marker)
+                return False
+            load()
+            conn.execute(
+                "INSERT OR REPLACE INTO state_meta (key, value) VALUES (?, ?)", (marker, str(time.time()))
+            )
+            self._markers_done.add(marker)
+            return True
+        except Exception as e:
+            log_debug("session_state", f"import_once {marker} failed", e)
+            return False
+
+
+_STORES: Dict[str, SessionStateStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_session_state(path: Optional[Path] = None) -> SessionStateStore:
+    """Process-wide store for path (default ``~/.spark/session_state.sqlite``)."""
+    key = str(Path(path) if path is not None else SESSION_STATE_FILE)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = SessionStateStore(Path(key))
+            _STORES[key] = store
+        return store
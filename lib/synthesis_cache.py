@@ -0,0 +1,294 @@
+"""Shared on-disk cache for advisory synthesis results.
+
+Hooks run advisory in short-lived processes, so an in-memory dict was cold on
+almost every tool call and the same advice set was re-synthesized (often via
+a slow AI provider) each time. This cache lives in one SQLite (WAL) file that
+every process shares:
+
+- ``synth_cache``: key -> result with ``created_ts`` (TTL) and ``used_ts``
+  (LRU order, indexed so eviction never scans the table)
+- ``cache_stats``: hit/miss/eviction counters accumulated across processes
+
+Lookups are a plain SELECT and never take the write lock. Their hit/miss
+counts and ``used_ts`` touches are kept in memory and written in one
+transaction by the next ``put``/``trim``/``stats``, every
+``flush_interval_s``, when the cache is dropped and at interpreter exit, so
+LRU order lags by at most one flush.
+
+All operations are best-effort: a locked or broken database reads as a miss
+and a failed write is dropped, never raised into the advisory path.
+"""
+
+from __future__ import annotations
+
+import atexit
+import sqlite3
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .diagnostics import log_debug
+
+DEFAULT_FLUSH_INTERVAL_S = 5.0
+MAX_PENDING_TOUCHES = 256
+
+_LIVE_CACHES: "weakref.WeakSet[SynthesisCache]" = weakref.WeakSet()
+
+
+class SynthesisCache:
+    """TTL + LRU result cache backed by SQLite; one connection per thread."""
+
+    def __init__(self, path: Path, timeout_s: float = 2.0, flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S):
+        self.path = Path(path)
+        self.timeout_s = float(timeout_s)
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._stats_lock = threading.Lock()
+        self._process_stats = {"hits": 0, "misses": 0, "evictions": 0, "errors": 0}
+        # Lookup side effects not yet written: key -> latest used_ts, and counts.
+        self._pending_touches: Dict[str, float] = {}
+        self._pending_counts: Dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        _LIVE_CACHES.add(self)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.path), timeout=self.timeout_s, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS synth_cache (
+                      key TEXT PRIMARY KEY,
+                      result TEXT NOT NULL,
+                      created_ts REAL NOT NULL,
+                      used_ts REAL NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_synth_cache_used ON synth_cache(used_ts);
+                    CREATE INDEX IF NOT EXISTS idx_synth_cache_created ON synth_cache(created_ts);
+                    CREATE TABLE IF NOT EXISTS cache_stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+                    """
+                )
+                self._schema_ready = True
+        self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                self._local.conn = None
+
+    def __del__(self) -> None:
+        # The atexit flush only sees live caches; write what a dropped one holds.
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._process_stats[name] = self._process_stats.get(name, 0) + n
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str, n: int = 1) -> None:
+        conn.execute(
+            "INSERT INTO cache_stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, int(n)),
+        )
+
+    def _take_pending(self) -> Tuple[Dict[str, float], Dict[str, int]]:
+        with self._stats_lock:
+            touches, counts = self._pending_touches, self._pending_counts
+            self._pending_touches, self._pending_counts = {}, {}
+            self._last_flush = time.monotonic()
+        return touches, counts
+
+    def _restore_pending(self, touches: Dict[str, float], counts: Dict[str, int]) -> None:
+        with self._stats_lock:
+            for key, ts in touches.items():
+                if ts > self._pending_touches.get(key, 0.0):
+                    self._pending_touches[key] = ts
+            for name, n in counts.items():
+                self._pending_counts[name] = self._pending_counts.get(name, 0) + n
+
+    @classmethod
+    def _write_pending(cls, conn: sqlite3.Connection, touches: Dict[str, float], counts: Dict[str, int]) -> None:
+        if touches:
+            conn.executemany(
+                "UPDATE synth_cache SET used_ts = MAX(used_ts, ?) WHERE key = ?",
+                [(ts, key) for key, ts in touches.items()],
+            )
+        for name, n in counts.items():
+            if n:
+                cls._bump(conn, name, n)
+
+    def flush(self) -> None:
+        """Write pending lookup counts and LRU touches in one transaction."""
+        touches, counts = self._take_pending()
+        if not touches and not any(counts.values()):
+            return
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_pending(conn, touches, counts)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            # Keep them for the next flush rather than losing the counts.
+            self._restore_pending(touches, counts)
+            log_debug("synthesis_cache", "cache flush failed", e)
+
+    @staticmethod
+    def _evict_lru(conn: sqlite3.Connection, max_entries: int) -> int:
+        excess = conn.execute("SELECT COUNT(*) FROM synth_cache").fetchone()[0] - max(1, int(max_entries))
+        if excess <= 0:
+            return 0
+        return conn.execute(
+            "DELETE FROM synth_cache WHERE key IN (SELECT key FROM synth_cache ORDER BY used_ts ASC LIMIT ?)",
+            (excess,),
+        ).rowcount
+
+    def get(self, key: str, ttl_s: float, now: Optional[float] = None) -> Optional[str]:
+        """Return the cached result if it is younger than ttl_s (touch is deferred)."""
+        ts = float(now if now is not None else time.time())
+        try:
+            row = self._conn().execute(
+                "SELECT result FROM synth_cache WHERE key = ? AND created_ts > ?",
+                (key, ts - float(ttl_s)),
+            ).fetchone()
+        except Exception as e:
+            self._count("errors")
+            self._count("misses")
+            log_debug("synthesis_cache", "cache read failed", e)
+            return None
+        outcome = "hits" if row is not None else "misses"
+        with self._stats_lock:
+            self._process_stats[outcome] += 1
+            self._pending_counts[outcome] = self._pending_counts.get(outcome, 0) + 1
+            if row is not None and ts > self._pending_touches.get(key, 0.0):
+                self._pending_touches[key] = ts
+            due = (
+                len(self._pending_touches) >= MAX_PENDING_TOUCHES
+                or time.monotonic() - self._last_flush >= self.flush_interval_s
+            )
+        if due:
+            self.flush()
+        return str(row[0]) if row is not None else None
+
+    def put(
+        self,
+        key: str,
+        result: str,
+        *,
+        ttl_s: float,
+        max_entries: int,
+        now: Optional[float] = None,
+    ) -> None:
+        """Store result (with pending lookups), then drop expired rows and LRU overflow."""
+        ts = float(now if now is not None else time.time())
+        touches, counts = self._take_pending()
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_pending(conn, touches, counts)
+                conn.execute(
+                    "INSERT OR REPLACE INTO synth_cache (key, result, created_ts, used_ts) VALUES (?, ?, ?, ?)",
+                    (key, str(result), ts, ts),
+                )
+                evicted = conn.execute(
+                    "DELETE FROM synth_cache WHERE created_ts <= ?", (ts - float(ttl_s),)
+                ).rowcount
+                evicted += self._evict_lru(conn, max_entries)
+                if evicted:
+                    self._bump(conn, "evictions", evicted)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            self._restore_pending(touches, counts)
+            self._count("errors")
+            log_debug("synthesis_cache", "cache write failed", e)
+            return
+        if evicted:
+            self._count("evictions", evicted)
+
+    def trim(self, max_entries: int) -> int:
+        """Evict least-recently-used rows beyond max_entries; returns rows removed."""
+        touches, counts = self._take_pending()
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_pending(conn, touches, counts)
+                removed = self._evict_lru(conn, max_entries)
+                if removed:
+                    self._bump(conn, "evictions", removed)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            self._restore_pending(touches, counts)
+            log_debug("synthesis_cache", "cache trim failed", e)
+            return 0
+        self._count("evictions", removed)
+        return removed
+
+    def clear(self) -> None:
+        try:
+            self._conn().execute("DELETE FROM synth_cache")
+        except Exception as e:
+            log_debug("synthesis_cache", "cache clear failed", e)
+
+    def stats(self) -> Dict[str, object]:
+        """Entry count plus shared (all processes) and this-process counters."""
+        self.flush()
+        with self._stats_lock:
+            process = dict(self._process_stats)
+        shared: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+        entries = 0
+        try:
+            conn = self._conn()
+            entries = int(conn.execute("SELECT COUNT(*) FROM synth_cache").fetchone()[0])
+            for name, value in conn.execute("SELECT name, value FROM cache_stats"):
+                shared[str(name)] = int(value)
+        except Exception as e:
+            log_debug("synthesis_cache", "cache stats failed", e)
+        lookups = shared["hits"] + shared["misses"]
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "hits": shared["hits"],
+            "misses": shared["misses"],
+            "evictions": shared["evictions"],
+            "hit_rate": round(shared["hits"] / lookups, 4) if lookups else 0.0,
+            "process": process,
+        }
+
+
+def _flush_live_caches() -> None:
+    for cache in list(_LIVE_CACHES):
+        cache.flush()
+
+
+atexit.register(_flush_live_caches)
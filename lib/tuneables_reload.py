@@ -3,9 +3,13 @@ Central tuneables reload coordinator.
 
 Provides mtime-based hot-reload for all modules that consume tuneables.json.
 Each module registers a callback via register_reload(). A single
-check_and_reload() call checks the file mtime, validates via schema,
+check_and_reload() call checks the file stamp, validates via schema,
 and dispatches changed sections to registered callbacks.
 
+The file is read through config_authority's snapshot cache, so a change is
+parsed once and the resolve_section() calls made by callbacks (and every
+caller after them) are served from that same snapshot.
+
 Usage:
     # In each module, register at import time:
     from lib.tuneables_reload import register_reload
@@ -33,7 +37,7 @@ TUNEABLES_FILE = Path.home() / ".spark" / "tuneables.json"
 _CONFIG_DEFAULTS_FILE = Path(__file__).resolve().parent.parent / "config" / "tuneables.json"
 
 _lock = threading.Lock()
-_last_mtime: Optional[float] = None
+_last_stamp: Any = None
 _last_data: Dict[str, Any] = {}
 _callbacks: Dict[str, List[Tuple[str, ReloadCallback]]] = {}
 
@@ -116,29 +120,22 @@ def check_and_reload(*, force: bool = False) -> bool:
     Returns True if a reload happened, False if no change detected.
     Thread-safe via internal lock.
     """
-    global _last_mtime, _last_data
+    global _last_stamp, _last_data
 
     with _lock:
-        current_mtime: Optional[float] = None
-        try:
-            if TUNEABLES_FILE.exists():
-                current_mtime = TUNEABLES_FILE.stat().st_mtime
-        except OSError:
-            return False
+        from .config_authority import _thaw, load_json_snapshot
 
-        if not force and _last_mtime == current_mtime:
+        current_stamp, snapshot, parsed = load_json_snapshot(TUNEABLES_FILE)
+        if current_stamp is None:
             return False
-
-        # Read file
-        try:
-            if not TUNEABLES_FILE.exists():
-                return False
-            raw = json.loads(TUNEABLES_FILE.read_text(encoding="utf-8-sig"))
-            if not isinstance(raw, dict):
-                return False
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning("tuneables_reload: read failed: %s", e)
+        if not force and _last_stamp == current_stamp:
+            return False
+        if not parsed:
+            # Mid-write or invalid: keep the last applied state. A valid {}
+            # is a real change (it reverts every override) and is applied.
+            logger.debug("tuneables_reload: %s is not a readable JSON object", TUNEABLES_FILE)
             return False
+        raw = _thaw(snapshot)
 
         # Validate via schema (soft import to avoid circular deps)
         validated_data = raw
@@ -155,7 +152,7 @@ def check_and_reload(*, force: bool = False) -> bool:
 
         old_data = _last_data
         _last_data = validated_data
-        _last_mtime = current_mtime
+        _last_stamp = current_stamp
 
         # Determine which registered sections changed
         changed_sections: List[str] = []
@@ -170,7 +167,6 @@ def check_and_reload(*, force: bool = False) -> bool:
             changed_sections = list(_callbacks.keys())
 
         if not changed_sections:
-            _last_mtime = current_mtime
             return False
 
         # Dispatch callbacks
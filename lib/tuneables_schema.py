@@ -286,6 +286,10 @@ SCHEMA: Dict[str, Dict[str, TuneableSpec]] = {
                                     ["off", "standard", "replay"]),
         "guidance_style": TuneableSpec("str", "balanced", None, None, "Guidance verbosity",
                                        ["concise", "balanced", "coach"]),
+        "source_fanout": TuneableSpec("bool", True, None, None, "Run advice sources other than cognitive/tool on the shared source pool"),
+        "source_workers": TuneableSpec("int", 8, 2, 32, "Advice source pool size (read at first use)"),
+        "source_budget_ms": TuneableSpec("int", 1500, 0, 30000, "Per-source time budget (ms, 0 = no deadline)"),
+        "source_budgets_ms": TuneableSpec("dict", {}, None, None, "Per-source budget overrides (e.g. mind, replay)"),
         # source_weights: removed (Batch 5) — never read by any code
     },
 
@@ -639,6 +643,17 @@ SCHEMA: Dict[str, Dict[str, TuneableSpec]] = {
         "patch_min_chars": TuneableSpec("int", 120, 40, 400, "Min chars per memory patch"),
     },
 
+    # ---- memory_ann: IVF vector index for memory_store retrieval ----
+    "memory_ann": {
+        "enabled": TuneableSpec("bool", True, None, None, "Add vector-first ANN candidates to memory retrieval"),
+        "min_vectors": TuneableSpec("int", 2000, 50, 1000000, "Vectors before the bridge cycle builds an IVF index (exact scan below)"),
+        "nprobe": TuneableSpec("int", 8, 1, 256, "IVF lists probed per query"),
+        "candidates": TuneableSpec("int", 20, 1, 200, "Vector-first candidates merged with BM25 candidates"),
+        "min_similarity": TuneableSpec("float", 0.25, 0.0, 1.0, "Min cosine for a vector-only candidate"),
+        "rebuild_growth": TuneableSpec("float", 2.0, 1.1, 10.0, "Bridge cycle retrains centroids when the collection grows by this factor"),
+        "max_lists": TuneableSpec("int", 1024, 1, 65536, "Upper bound on IVF lists (~sqrt(N) by default)"),
+    },
+
     # ---- orchestration: agent context injection ----
     "orchestration": {
         "inject_enabled": TuneableSpec("bool", False, None, None, "Enable Spark context injection into agent prompts"),
@@ -864,11 +879,12 @@ SECTION_CONSUMERS: Dict[str, List[str]] = {
     "feature_flags": ["lib/feature_flags.py", "lib/advisor.py", "lib/bridge_cycle.py",
                       "lib/cognitive_learner.py", "lib/chips/runtime.py"],
     "production_gates": ["lib/production_gates.py"],
-    "observe_hook": ["hooks/observe.py"],
+    "observe_hook": ["hooks/observe.py", "hooks/observe_runtime.py"],
     "chips_runtime": ["lib/chips/runtime.py", "lib/chips/loader.py"],
     "opportunity_scanner": ["lib/opportunity_scanner.py"],
     "prediction": ["lib/prediction_loop.py"],
     "memory_deltas": ["lib/memory_store.py"],
+    "memory_ann": ["lib/memory_ann.py", "lib/memory_store.py"],
     "orchestration": ["lib/orchestration.py"],
     "feature_gates": ["lib/personality_evolver.py", "lib/outcome_predictor.py",
                       "lib/cognitive_learner.py", "lib/learning_systems_bridge.py"],
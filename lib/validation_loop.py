@@ -15,18 +15,27 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from lib.queue import read_events, count_events, EventType
+from lib.queue import (
+    EventType,
+    QueueCursor,
+    count_events_after_cursor,
+    cursor_from_line_offset,
+    load_cursor,
+    read_events_from_cursor,
+    save_cursor,
+)
 from lib.cognitive_learner import get_cognitive_learner, CognitiveCategory, _boost_confidence
 from lib.aha_tracker import get_aha_tracker, SurpriseType
 from lib.diagnostics import log_debug
 from lib.outcome_log import (
     get_outcome_links,
     read_outcomes,
-    OUTCOME_LINKS_FILE,
+    _links_log,
 )
 
 
 STATE_FILE = Path.home() / ".spark" / "validation_state.json"
+CURSOR_NAME = "validation"
 
 # Words that do not carry preference meaning for matching.
 STOPWORDS = {
@@ -58,11 +67,11 @@ POS_PREF_WORDS = {"prefer", "like", "love", "want", "need"}
 
 def _load_state() -> Dict:
     if not STATE_FILE.exists():
-        return {"offset": 0}
+        return {}
     try:
         return json.loads(STATE_FILE.read_text(encoding="utf-8"))
     except Exception:
-        return {"offset": 0}
+        return {}
 
 
 def _save_state(state: Dict) -> None:
@@ -70,6 +79,19 @@ def _save_state(state: Dict) -> None:
     STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
 
 
+def _load_cursor(state: Dict) -> QueueCursor:
+    """Load the queue cursor, seeding it once from a legacy line ``offset`` in ``state``."""
+    cursor = load_cursor(CURSOR_NAME)
+    if cursor.generation or "offset" not in state:
+        return cursor
+    seeded = cursor_from_line_offset(CURSOR_NAME, int(state.get("offset") or 0))
+    if seeded.generation:
+        save_cursor(seeded)
+        state.pop("offset", None)
+        _save_state(state)
+    return seeded
+
+
 def _normalize_text(text: str) -> str:
     t = (text or "").lower()
     t = t.replace("don't", "dont").replace("do not", "dont")
@@ -210,14 +232,11 @@ def _apply_validation(
 def process_validation_events(limit: int = 200) -> Dict[str, int]:
     """Process queued user prompts and validate preference/communication insights."""
     state = _load_state()
-    offset = int(state.get("offset", 0))
-
-    total = count_events()
-    if total < offset:
-        offset = max(0, total - limit)
-
-    events = read_events(limit=limit, offset=offset)
+    cursor = _load_cursor(state)
+    events, next_cursor = read_events_from_cursor(cursor, limit=limit)
     if not events:
+        if next_cursor != cursor:
+            save_cursor(next_cursor)
         return {"processed": 0, "validated": 0, "contradicted": 0, "surprises": 0}
 
     cog = get_cognitive_learner()
@@ -268,7 +287,7 @@ def process_validation_events(limit: int = 200) -> Dict[str, int]:
     if stats["validated"] or stats["contradicted"]:
         cog._save_insights()
 
-    state["offset"] = offset + len(events)
+    save_cursor(next_cursor)
     state["last_run_ts"] = time.time()
     state["last_stats"] = stats
     _save_state(state)
@@ -278,15 +297,7 @@ def process_validation_events(limit: int = 200) -> Dict[str, int]:
 
 def get_validation_backlog() -> int:
     """Return the count of queued events not yet processed by validation."""
-    state = _load_state()
-    try:
-        offset = int(state.get("offset", 0))
-    except Exception:
-        offset = 0
-    total = count_events()
-    if total < offset:
-        offset = total
-    return max(0, total - offset)
+    return count_events_after_cursor(_load_cursor(_load_state()))
 
 
 def get_validation_state() -> Dict:
@@ -295,7 +306,7 @@ def get_validation_state() -> Dict:
     return {
         "last_run_ts": state.get("last_run_ts"),
         "last_stats": state.get("last_stats") or {},
-        "offset": state.get("offset", 0),
+        "offset": _load_cursor(state).offset,
     }
 
 
@@ -398,31 +409,14 @@ def process_outcome_validation(limit: int = 100) -> Dict[str, int]:
 
 
 def _update_outcome_links(updated_links: List[Dict]) -> None:
-    """Update outcome links file with validation results."""
-    if not OUTCOME_LINKS_FILE.exists():
+    """Update outcome links with validation results, in whichever segment they live."""
+    updated_map = {link.get("link_id"): link for link in updated_links if link.get("link_id")}
+    if not updated_map:
         return
-
-    # Read all links
-    all_links = []
-    with OUTCOME_LINKS_FILE.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                all_links.append(json.loads(line.strip()))
-            except Exception:
-                pass
-
-    # Update the validated links
-    updated_map = {link.get("link_id"): link for link in updated_links}
-    for i, link in enumerate(all_links):
-        if link.get("link_id") in updated_map:
-            all_links[i] = updated_map[link.get("link_id")]
-
-    # Rewrite file atomically.
-    tmp = OUTCOME_LINKS_FILE.with_suffix(".jsonl.tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        for link in all_links:
-            f.write(json.dumps(link, ensure_ascii=False) + "\n")
-    tmp.replace(OUTCOME_LINKS_FILE)
+    try:
+        _links_log().update(lambda link: updated_map.get(link.get("link_id")))
+    except TimeoutError as e:
+        log_debug("outcome_validation", "outcome links busy; validation flags not saved", e)
 
 
 def get_insight_outcome_coverage() -> Dict[str, Any]:
@@ -14,6 +14,9 @@ Storage:
 
 Note: Retrieval is intentionally simple (keyword scoring) to keep this
 server zero-dependency. We can upgrade to embeddings later.
+
+Requests are served on a bounded worker pool (MIND_MAX_WORKERS); each request
+opens its own SQLite connection.
 """
 
 import json
@@ -22,12 +25,14 @@ import os
 import re
 import secrets
 import sqlite3
+import threading
 import uuid
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import BaseHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import urlparse
 
+from lib.http_service import PooledHTTPServer
 from lib.ports import MIND_PORT
 
 PORT = MIND_PORT
@@ -42,9 +47,13 @@ TOKEN = os.environ.get("MIND_TOKEN")
 MAX_BODY_BYTES = int(os.environ.get("MIND_MAX_BODY_BYTES", "262144"))
 MAX_CONTENT_CHARS = int(os.environ.get("MIND_MAX_CONTENT_CHARS", "4000"))
 MAX_QUERY_CHARS = int(os.environ.get("MIND_MAX_QUERY_CHARS", "1000"))
+MAX_WORKERS = int(os.environ.get("MIND_MAX_WORKERS", "16"))
+ADMISSION_TIMEOUT_S = float(os.environ.get("MIND_ADMISSION_TIMEOUT_S", "2"))
 _FTS_AVAILABLE = None
 _FTS_SCHEMA = None  # legacy | extended
 _FTS_TRIGGERS = None
+# First-time FTS setup rebuilds the index; workers must not race it.
+_FTS_INIT_LOCK = threading.Lock()
 _RRF_K = 60
 _SQL_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
@@ -166,11 +175,18 @@ def _safe_sql_identifier(name: str) -> str | None:
 
 
 def _ensure_fts(conn: sqlite3.Connection) -> bool:
-    global _FTS_AVAILABLE, _FTS_SCHEMA, _FTS_TRIGGERS
     if _FTS_AVAILABLE is False:
         return False
     if _FTS_AVAILABLE is True:
         return True
+    with _FTS_INIT_LOCK:
+        if _FTS_AVAILABLE is None:
+            _init_fts(conn)
+    return bool(_FTS_AVAILABLE)
+
+
+def _init_fts(conn: sqlite3.Connection) -> None:
+    global _FTS_AVAILABLE, _FTS_SCHEMA, _FTS_TRIGGERS
     try:
         conn.execute(
             """
@@ -214,7 +230,6 @@ def _ensure_fts(conn: sqlite3.Connection) -> bool:
         _FTS_AVAILABLE = True
     except sqlite3.OperationalError:
         _FTS_AVAILABLE = False
-    return _FTS_AVAILABLE
 
 
 def _normalize_scores(scores):
@@ -343,7 +358,7 @@ class Handler(BaseHTTPRequestHandler):
 
     def _db(self):
         DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(DB_PATH, timeout=10.0)
         conn.row_factory = sqlite3.Row
         _ensure_db(conn)
         return conn
@@ -531,12 +546,19 @@ class Handler(BaseHTTPRequestHandler):
 def main():
     print(f"Mind Lite+ listening on http://127.0.0.1:{PORT}")
     print(f"DB: {DB_PATH}")
-    server = HTTPServer(("127.0.0.1", PORT), Handler)
+    server = PooledHTTPServer(
+        ("127.0.0.1", PORT),
+        Handler,
+        max_workers=MAX_WORKERS,
+        admission_timeout_s=ADMISSION_TIMEOUT_S,
+        thread_name_prefix="mind-http",
+    )
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nShutting down...")
-        server.shutdown()
+    finally:
+        server.server_close()
 
 
 if __name__ == "__main__":
@@ -19,6 +19,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 from lib.action_matcher import FEEDBACK_FILE, OUTCOMES_FILE, match_actions
 from lib.advice_feedback import REQUESTS_FILE
 from lib.advisory_parser import parse_feedback_requests
+from lib.append_log import AppendLog
 from lib.production_gates import evaluate_gates, load_live_metrics
 
 
@@ -77,29 +78,11 @@ def _parse_ts(row: Dict[str, Any]) -> float:
 
 
 def _read_jsonl_since(path: Path, since_ts: float) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    out: List[Dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        if not line.strip():
-            continue
-        try:
-            row = json.loads(line)
-        except Exception:
-            continue
-        if _parse_ts(row) >= float(since_ts):
-            out.append(row)
-    return out
+    return [row for row in AppendLog(path).iter_rows() if _parse_ts(row) >= float(since_ts)]
 
 
 def _line_count(path: Path) -> int:
-    if not path.exists():
-        return 0
-    try:
-        with path.open("r", encoding="utf-8", errors="replace") as f:
-            return sum(1 for _ in f)
-    except Exception:
-        return 0
+    return AppendLog(path).count()
 
 
 def _sha1_file(path: Path) -> str:
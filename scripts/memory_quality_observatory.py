@@ -24,6 +24,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
+from lib.append_log import AppendLog
 from lib.memory_capture import importance_score, normalize_memory_text
 from lib.queue import EventType, read_recent_events
 
@@ -71,23 +72,10 @@ def _now_ts() -> float:
 
 
 def _read_jsonl(path: Path, limit: int | None = None) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    log = AppendLog(path)
     if limit is not None and limit > 0:
-        lines = lines[-limit:]
-    out: List[Dict[str, Any]] = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except Exception:
-            continue
-        if isinstance(row, dict):
-            out.append(row)
-    return out
+        return log.tail(limit)
+    return list(log.iter_rows())
 
 
 def _load_capture_rows(window_s: float) -> List[CaptureRow]:
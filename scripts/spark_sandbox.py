@@ -145,7 +145,7 @@ def _seed_project_profile(project_dir: Path) -> None:
 def _emit_observe_event(payload: Dict[str, Any]) -> None:
     # Run observe hook logic in-process to avoid subprocess and keep sandbox paths.
     import io
-    import hooks.observe as observe
+    import hooks.observe_runtime as observe
 
     old_stdin = sys.stdin
     old_exit = sys.exit
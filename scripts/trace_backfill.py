@@ -8,7 +8,6 @@ Usage:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import sys
@@ -17,37 +16,26 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from lib.eidos import get_store, get_evidence_store  # noqa: E402
-from lib.outcome_log import OUTCOMES_FILE, _ensure_trace_id  # noqa: E402
+from lib.outcome_log import _ensure_trace_id, _outcomes_log  # noqa: E402
 
 
 def backfill_outcomes() -> dict:
-    if not OUTCOMES_FILE.exists():
+    log = _outcomes_log()
+    if not log.exists():
         return {"outcomes_missing": 0, "outcomes_updated": 0}
 
-    rows = []
     missing = 0
-    updated = 0
-
-    for line in OUTCOMES_FILE.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            row = json.loads(line)
-        except Exception:
-            continue
-        if not row.get("trace_id"):
-            missing += 1
-            _ensure_trace_id(row)
-            if row.get("trace_id"):
-                updated += 1
-        rows.append(row)
-
-    if updated:
-        OUTCOMES_FILE.write_text(
-            "\n".join(json.dumps(r, ensure_ascii=False) for r in rows) + "\n",
-            encoding="utf-8",
-        )
 
+    def _fill(row: dict):
+        nonlocal missing
+        if row.get("trace_id"):
+            return None
+        missing += 1
+        _ensure_trace_id(row)
+        return row if row.get("trace_id") else None
+
+    # Rewrites only segments with a backfilled row, under the log lock.
+    updated = log.update(_fill)
     return {"outcomes_missing": missing, "outcomes_updated": updated}
 
 
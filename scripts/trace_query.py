@@ -13,6 +13,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from lib.append_log import AppendLog  # noqa: E402
 from lib.eidos import get_store, get_evidence_store  # noqa: E402
 
 
@@ -20,19 +21,7 @@ OUTCOMES_FILE = Path.home() / ".spark" / "outcomes.jsonl"
 
 
 def _read_jsonl(path: Path, limit: int = 400):
-    if not path.exists():
-        return []
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except Exception:
-        return []
-    rows = []
-    for line in lines[-limit:]:
-        try:
-            rows.append(json.loads(line))
-        except Exception:
-            continue
-    return rows
+    return AppendLog(path).tail(limit)
 
 
 def main() -> int:
@@ -3253,7 +3253,7 @@ Examples:
 
     # logs - unified log access
     logs_parser = subparsers.add_parser("logs", help="View service logs")
-    logs_parser.add_argument("--service", "-s", choices=["sparkd", "bridge_worker", "mind", "pulse", "watchdog", "scheduler"],
+    logs_parser.add_argument("--service", "-s", choices=["sparkd", "observe", "bridge_worker", "mind", "pulse", "watchdog", "scheduler"],
                              help="Show logs for specific service")
     logs_parser.add_argument("--tail", "-n", type=int, default=50, help="Number of lines to show (default: 50)")
     logs_parser.add_argument("--follow", "-f", action="store_true", help="Follow log output (live tail)")
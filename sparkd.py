@@ -4,7 +4,21 @@
 Minimal HTTP server:
   GET  /health
   GET  /status
+  GET  /jobs           (recent jobs)
+  GET  /jobs/<id>      (job status + result)
   POST /ingest  (SparkEventV1 JSON)
+  POST /ingest/batch  ({"events": [SparkEventV1, ...]} or a bare JSON array)
+  POST /process  (queue one bridge cycle; 202 + job id, or ?wait=1 to block)
+  POST /reflect  (queue three bridge cycles; same job semantics)
+
+Connections are HTTP/1.1 keep-alive so adapters can reuse one socket; a batch
+is validated per event and appended to the queue under one lock and one write.
+Each POST counts once against SPARKD_RATE_LIMIT_PER_MIN, and every ingested
+event (single or batched) counts against SPARKD_EVENT_RATE_LIMIT_PER_MIN.
+
+Requests are served on a bounded worker pool. Bridge cycles run as jobs on a
+separate single worker, so /ingest and /health stay responsive while a cycle
+is in progress.
 
 Stores events into the existing Spark queue (events.jsonl) so the rest of Spark
 can process them.
@@ -20,22 +34,23 @@ import re
 import secrets
 import time
 from collections import defaultdict, deque
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import BaseHTTPRequestHandler
 from pathlib import Path
 from threading import Lock
 from threading import Thread
-from urllib.parse import urlparse
+from urllib.parse import parse_qs, urlparse
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from lib.events import SparkEventV1, validate_event_dict
-from lib.queue import quick_capture, EventType
+from lib.queue import quick_capture, quick_capture_many, EventType
 from lib.orchestration import register_agent, recommend_agent, record_handoff, get_orchestrator
 from lib.bridge_cycle import read_bridge_heartbeat, run_bridge_cycle, write_bridge_heartbeat
 from lib.pattern_detection.worker import get_pattern_backlog
 from lib.validation_loop import get_validation_backlog
 from lib.diagnostics import setup_component_logging
+from lib.http_service import JobRunner, PooledHTTPServer
 from lib.ports import SPARKD_PORT
 
 PORT = SPARKD_PORT
@@ -47,10 +62,19 @@ _ALLOWED_POST_HOSTS = {
 }
 TOKEN = os.environ.get("SPARKD_TOKEN")
 MAX_BODY_BYTES = int(os.environ.get("SPARKD_MAX_BODY_BYTES", "262144"))
+MAX_BATCH_BODY_BYTES = int(os.environ.get("SPARKD_MAX_BATCH_BODY_BYTES", str(8 * 1024 * 1024)))
+MAX_BATCH_EVENTS = int(os.environ.get("SPARKD_MAX_BATCH_EVENTS", "1000"))
+KEEPALIVE_IDLE_TIMEOUT_S = float(os.environ.get("SPARKD_KEEPALIVE_IDLE_TIMEOUT_S", "30"))
+MAX_WORKERS = int(os.environ.get("SPARKD_MAX_WORKERS", "32"))
+ADMISSION_TIMEOUT_S = float(os.environ.get("SPARKD_ADMISSION_TIMEOUT_S", "2"))
+JOB_WAIT_TIMEOUT_S = float(os.environ.get("SPARKD_JOB_WAIT_TIMEOUT_S", "300"))
 INVALID_EVENTS_FILE = Path.home() / ".spark" / "invalid_events.jsonl"
 TUNEABLES_FILE = Path.home() / ".spark" / "tuneables.json"
 RATE_LIMIT_PER_MIN = int(os.environ.get("SPARKD_RATE_LIMIT_PER_MIN", "240"))
 RATE_LIMIT_WINDOW_S = int(os.environ.get("SPARKD_RATE_LIMIT_WINDOW_S", "60"))
+# Ingested events per client IP per window, across /ingest and /ingest/batch.
+# The request limit above counts a whole batch once; this one counts its events.
+EVENT_RATE_LIMIT_PER_MIN = int(os.environ.get("SPARKD_EVENT_RATE_LIMIT_PER_MIN", "2400"))
 INVALID_EVENTS_MAX_LINES = int(os.environ.get("SPARKD_INVALID_EVENTS_MAX_LINES", "2000"))
 INVALID_EVENTS_MAX_PAYLOAD_CHARS = int(os.environ.get("SPARKD_INVALID_EVENTS_MAX_PAYLOAD_CHARS", "4000"))
 _REDACT_PATTERNS = (
@@ -62,7 +86,10 @@ _REDACT_PATTERNS = (
 )
 
 _RATE_LIMIT_BUCKETS = defaultdict(deque)
+_EVENT_RATE_LIMIT_BUCKETS = defaultdict(deque)
 _RATE_LIMIT_LOCK = Lock()
+# One job worker: bridge cycles run one at a time, off the request workers.
+_JOBS = JobRunner(max_workers=1, thread_name_prefix="sparkd-job")
 OPENCLAW_RUNTIME_DEFAULTS = {
     "advisory_bridge_enabled": True,
     "emotion_updates_enabled": True,
@@ -219,9 +246,9 @@ def _redact_sensitive_text(text: str) -> str:
     return out
 
 
-def _allow_rate_limited_request(client_ip: str, now: float | None = None) -> tuple[bool, int]:
-    """Simple sliding-window limiter per client IP."""
-    if RATE_LIMIT_PER_MIN <= 0 or RATE_LIMIT_WINDOW_S <= 0:
+def _take_rate_budget(buckets, limit: int, client_ip: str, cost: int, now: float | None) -> tuple[bool, int]:
+    """Charge ``cost`` units to a per-IP sliding window; all or nothing."""
+    if limit <= 0 or RATE_LIMIT_WINDOW_S <= 0:
         return True, 0
 
     ts = float(now if now is not None else time.time())
@@ -229,18 +256,31 @@ def _allow_rate_limited_request(client_ip: str, now: float | None = None) -> tup
     key = str(client_ip or "unknown")
 
     with _RATE_LIMIT_LOCK:
-        bucket = _RATE_LIMIT_BUCKETS[key]
+        bucket = buckets[key]
         while bucket and bucket[0] <= cutoff:
             bucket.popleft()
 
-        if len(bucket) >= RATE_LIMIT_PER_MIN:
-            retry_after = int(max(1, RATE_LIMIT_WINDOW_S - (ts - bucket[0])))
+        over = len(bucket) + cost - limit
+        if over > 0:
+            # Wait until enough of the oldest charges leave the window.
+            oldest = bucket[min(over, len(bucket)) - 1] if bucket else ts
+            retry_after = int(max(1, RATE_LIMIT_WINDOW_S - (ts - oldest)))
             return False, retry_after
 
-        bucket.append(ts)
+        bucket.extend([ts] * cost)
         return True, 0
 
 
+def _allow_rate_limited_request(client_ip: str, now: float | None = None) -> tuple[bool, int]:
+    """Simple sliding-window limiter per client IP."""
+    return _take_rate_budget(_RATE_LIMIT_BUCKETS, RATE_LIMIT_PER_MIN, client_ip, 1, now)
+
+
+def _allow_rate_limited_events(client_ip: str, count: int, now: float | None = None) -> tuple[bool, int]:
+    """Per-IP sliding-window limit on ingested events (a batch costs one per event)."""
+    return _take_rate_budget(_EVENT_RATE_LIMIT_BUCKETS, EVENT_RATE_LIMIT_PER_MIN, client_ip, max(1, int(count)), now)
+
+
 def _trim_jsonl_tail(path: Path, max_lines: int) -> None:
     if max_lines <= 0 or not path.exists():
         return
@@ -561,10 +601,141 @@ def _dispatch_openclaw_runtime_bridge(evt: SparkEventV1, event_type: EventType)
         return
 
 
+def _parse_ingest_event(data):
+    """Validate one SparkEventV1 dict. Returns (event, None) or (None, error_payload).
+
+    Rejected payloads are quarantined.
+    """
+    ok, err = validate_event_dict(data, strict=True)
+    if not ok:
+        _quarantine_invalid(data, err)
+        return None, {"error": "invalid_event", "detail": err}
+    try:
+        return SparkEventV1.from_dict(data), None
+    except Exception as e:
+        _quarantine_invalid(data, f"parse_error:{type(e).__name__}")
+        return None, {"error": "invalid_event", "detail": str(e)[:200]}
+
+
+def _capture_kwargs(evt: SparkEventV1, et: EventType) -> dict:
+    """quick_capture keyword arguments for a validated event."""
+    # Try to propagate working-directory hints for project inference.
+    meta = (evt.payload or {}).get("meta") or {}
+    cwd_hint = meta.get("cwd") or meta.get("workdir") or meta.get("workspace")
+    return {
+        "event_type": et,
+        "session_id": evt.session_id,
+        "data": {
+            "source": evt.source,
+            "kind": evt.kind.value,
+            "payload": evt.payload,
+            "trace_id": evt.trace_id,
+            "v": evt.v,
+            "ts": evt.ts,
+            "cwd": cwd_hint,
+        },
+        "tool_name": evt.payload.get("tool_name"),
+        "tool_input": evt.payload.get("tool_input"),
+        "error": evt.payload.get("error"),
+    }
+
+
+def _ingest_batch(items) -> dict:
+    """Validate a list of event dicts and append the valid ones in one queue write."""
+    rejected = []
+    accepted = []
+    for idx, item in enumerate(items):
+        evt, err = _parse_ingest_event(item)
+        if evt is None:
+            rejected.append({"index": idx, **err})
+            continue
+        accepted.append((idx, evt, _resolve_queue_event_type(evt)))
+
+    flags = quick_capture_many([_capture_kwargs(evt, et) for _, evt, et in accepted]) if accepted else []
+    captured = 0
+    for (idx, evt, et), ok in zip(accepted, flags):
+        if not ok:
+            rejected.append({"index": idx, "error": "capture_failed"})
+            continue
+        captured += 1
+        _dispatch_openclaw_runtime_bridge(evt, et)
+    rejected.sort(key=lambda r: r["index"])
+    return {"ok": captured > 0 or not items, "accepted": captured, "rejected": rejected}
+
+
+def _process_job() -> dict:
+    stats = run_bridge_cycle()
+    write_bridge_heartbeat(stats)
+    return {
+        "processed": stats.get("pattern_processed", 0),
+        "learnings": stats.get("content_learned", 0),
+        "patterns": stats.get("pattern_processed", 0),
+        "memory": stats.get("memory", {}),
+        "validation": stats.get("validation", {}),
+        "errors": stats.get("errors", []),
+    }
+
+
+def _reflect_job() -> dict:
+    all_stats = []
+    for _ in range(3):  # Run 3 cycles for deeper analysis
+        stats = run_bridge_cycle()
+        all_stats.append(stats)
+        write_bridge_heartbeat(stats)
+
+    total_patterns = sum(s.get("pattern_processed", 0) for s in all_stats)
+    total_learnings = sum(s.get("content_learned", 0) for s in all_stats)
+    return {
+        "cycles": len(all_stats),
+        "meta_patterns": total_patterns,
+        "insights": total_learnings,
+        "message": f"Reflected across {len(all_stats)} cycles",
+    }
+
+
+_JOB_FUNCS = {"/process": ("process", _process_job), "/reflect": ("reflect", _reflect_job)}
+
+
+def _submit_job(handler: BaseHTTPRequestHandler, path: str):
+    """Queue a bridge-cycle job; answer 202 with its id, or block when ?wait=1."""
+    kind, fn = _JOB_FUNCS[path]
+    job = _JOBS.submit(kind, fn)
+    query = parse_qs(urlparse(handler.path).query)
+    if not _parse_bool((query.get("wait") or ["0"])[0], default=False):
+        return _json(handler, 202, {
+            "ok": True,
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "status_url": f"/jobs/{job['job_id']}",
+        })
+    job = _JOBS.wait(job["job_id"], timeout=JOB_WAIT_TIMEOUT_S) or job
+    if job["status"] == "error":
+        return _json(handler, 500, {"ok": False, "job_id": job["job_id"], "error": job["error"]})
+    if job["status"] != "done":
+        return _json(handler, 202, {"ok": True, "job_id": job["job_id"], "status": job["status"]})
+    return _json(handler, 200, {"ok": True, "job_id": job["job_id"], **(job["result"] or {})})
+
+
 class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections are dropped after this many seconds.
+    timeout = KEEPALIVE_IDLE_TIMEOUT_S
+    # Headers and body go out as separate writes; without TCP_NODELAY a reused
+    # connection stalls on delayed ACKs (~40ms per request).
+    disable_nagle_algorithm = True
+
     def log_message(self, fmt, *args):
         return
 
+    def _read_body(self, limit: int):
+        """Read the request body, or None if it exceeds limit (connection is then closed)."""
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        if length > limit:
+            self.close_connection = True
+            return None
+        self._body_read = True
+        return self.rfile.read(length) if length else b"{}"
+
     def do_GET(self):
         path = urlparse(self.path).path
         if path == "/health":
@@ -589,13 +760,31 @@ class Handler(BaseHTTPRequestHandler):
                     "validation_backlog": get_validation_backlog(),
                 },
                 "pipeline": pipeline_health,
+                "jobs": _JOBS.summary(),
             })
+        if path == "/jobs":
+            return _json(self, 200, {"ok": True, "jobs": _JOBS.list()})
+        if path.startswith("/jobs/"):
+            job = _JOBS.get(path[len("/jobs/"):])
+            if job is None:
+                return _json(self, 404, {"ok": False, "error": "unknown_job"})
+            return _json(self, 200, {"ok": True, **job})
         if path == "/agents":
             orch = get_orchestrator()
             return _json(self, 200, {"ok": True, "agents": orch.list_agents()})
         return _text(self, 404, "not found")
 
     def do_POST(self):
+        self._body_read = False
+        try:
+            return self._handle_post()
+        finally:
+            # A response sent without draining the body would desync the next
+            # request on a keep-alive connection.
+            if not self._body_read and int(self.headers.get("Content-Length", "0") or 0) > 0:
+                self.close_connection = True
+
+    def _handle_post(self):
         path = urlparse(self.path).path
 
         # Safety: only accept POSTs from localhost by default.
@@ -623,50 +812,13 @@ class Handler(BaseHTTPRequestHandler):
         if not _is_authorized(self):
             return _json(self, 401, {"ok": False, "error": "unauthorized"})
 
-        if path == "/process":
-            # Run a bridge cycle to process pending events
-            try:
-                stats = run_bridge_cycle()
-                write_bridge_heartbeat(stats)
-                return _json(self, 200, {
-                    "ok": True,
-                    "processed": stats.get("pattern_processed", 0),
-                    "learnings": stats.get("content_learned", 0),
-                    "patterns": stats.get("pattern_processed", 0),
-                    "memory": stats.get("memory", {}),
-                    "validation": stats.get("validation", {}),
-                    "errors": stats.get("errors", []),
-                })
-            except Exception as e:
-                return _json(self, 500, {"ok": False, "error": str(e)[:200]})
-
-        if path == "/reflect":
-            # Trigger deep reflection (run multiple cycles + analyze)
-            try:
-                all_stats = []
-                for _ in range(3):  # Run 3 cycles for deeper analysis
-                    stats = run_bridge_cycle()
-                    all_stats.append(stats)
-                    write_bridge_heartbeat(stats)
-
-                total_patterns = sum(s.get("pattern_processed", 0) for s in all_stats)
-                total_learnings = sum(s.get("content_learned", 0) for s in all_stats)
-
-                return _json(self, 200, {
-                    "ok": True,
-                    "cycles": len(all_stats),
-                    "meta_patterns": total_patterns,
-                    "insights": total_learnings,
-                    "message": f"Reflected across {len(all_stats)} cycles",
-                })
-            except Exception as e:
-                return _json(self, 500, {"ok": False, "error": str(e)[:200]})
+        if path in _JOB_FUNCS:
+            return _submit_job(self, path)
 
         if path == "/agent":
-            length = int(self.headers.get("Content-Length", "0") or 0)
-            if length > MAX_BODY_BYTES:
+            body = self._read_body(MAX_BODY_BYTES)
+            if body is None:
                 return _json(self, 413, {"ok": False, "error": "payload_too_large"})
-            body = self.rfile.read(length) if length else b"{}"
             try:
                 data = json.loads(body.decode("utf-8") or "{}")
                 agent_id = data.get("agent_id") or data.get("name", "").lower().replace(" ", "-")
@@ -681,10 +833,9 @@ class Handler(BaseHTTPRequestHandler):
                 return _json(self, 400, {"ok": False, "error": str(e)[:200]})
 
         if path == "/orchestration/recommend":
-            length = int(self.headers.get("Content-Length", "0") or 0)
-            if length > MAX_BODY_BYTES:
+            body = self._read_body(MAX_BODY_BYTES)
+            if body is None:
                 return _json(self, 413, {"ok": False, "error": "payload_too_large"})
-            body = self.rfile.read(length) if length else b"{}"
             try:
                 data = json.loads(body.decode("utf-8") or "{}")
                 agent_id, reason = recommend_agent(
@@ -696,10 +847,9 @@ class Handler(BaseHTTPRequestHandler):
                 return _json(self, 400, {"ok": False, "error": str(e)[:200]})
 
         if path == "/handoff":
-            length = int(self.headers.get("Content-Length", "0") or 0)
-            if length > MAX_BODY_BYTES:
+            body = self._read_body(MAX_BODY_BYTES)
+            if body is None:
                 return _json(self, 413, {"ok": False, "error": "payload_too_large"})
-            body = self.rfile.read(length) if length else b"{}"
             try:
                 data = json.loads(body.decode("utf-8") or "{}")
                 hid = record_handoff(
@@ -712,52 +862,58 @@ class Handler(BaseHTTPRequestHandler):
             except Exception as e:
                 return _json(self, 400, {"ok": False, "error": str(e)[:200]})
 
+        if path == "/ingest/batch":
+            body = self._read_body(MAX_BATCH_BODY_BYTES)
+            if body is None:
+                return _json(self, 413, {"ok": False, "error": "payload_too_large"})
+            try:
+                data = json.loads(body.decode("utf-8") or "[]")
+            except Exception as e:
+                _quarantine_invalid(body.decode("utf-8", errors="replace"), f"json_decode:{type(e).__name__}")
+                return _json(self, 400, {"ok": False, "error": "invalid_json", "detail": str(e)[:200]})
+            items = data.get("events") if isinstance(data, dict) else data
+            if not isinstance(items, list):
+                return _json(self, 400, {"ok": False, "error": "invalid_batch", "detail": "expected a list of events"})
+            max_events = MAX_BATCH_EVENTS
+            if EVENT_RATE_LIMIT_PER_MIN > 0:
+                max_events = min(max_events, EVENT_RATE_LIMIT_PER_MIN)
+            if len(items) > max_events:
+                return _json(self, 413, {"ok": False, "error": "too_many_events", "max_events": max_events})
+            allowed, retry_after = _allow_rate_limited_events(client_ip, len(items))
+            if not allowed:
+                return _json(self, 429, {
+                    "ok": False,
+                    "error": "rate_limited",
+                    "retry_after_s": retry_after,
+                })
+            return _json(self, 200, _ingest_batch(items))
+
         if path != "/ingest":
             return _text(self, 404, "not found")
 
-        length = int(self.headers.get("Content-Length", "0") or 0)
-        if length > MAX_BODY_BYTES:
+        body = self._read_body(MAX_BODY_BYTES)
+        if body is None:
             return _json(self, 413, {"ok": False, "error": "payload_too_large"})
-        body = self.rfile.read(length) if length else b"{}"
         try:
             data = json.loads(body.decode("utf-8") or "{}")
         except Exception as e:
             _quarantine_invalid(body.decode("utf-8", errors="replace"), f"json_decode:{type(e).__name__}")
             return _json(self, 400, {"ok": False, "error": "invalid_json", "detail": str(e)[:200]})
 
-        ok, err = validate_event_dict(data, strict=True)
-        if not ok:
-            _quarantine_invalid(data, err)
-            return _json(self, 400, {"ok": False, "error": "invalid_event", "detail": err})
+        evt, err = _parse_ingest_event(data)
+        if evt is None:
+            return _json(self, 400, {"ok": False, **err})
 
-        try:
-            evt = SparkEventV1.from_dict(data)
-        except Exception as e:
-            _quarantine_invalid(data, f"parse_error:{type(e).__name__}")
-            return _json(self, 400, {"ok": False, "error": "invalid_event", "detail": str(e)[:200]})
+        allowed, retry_after = _allow_rate_limited_events(client_ip, 1)
+        if not allowed:
+            return _json(self, 429, {
+                "ok": False,
+                "error": "rate_limited",
+                "retry_after_s": retry_after,
+            })
 
         et = _resolve_queue_event_type(evt)
-
-        # Try to propagate working-directory hints for project inference.
-        meta = (evt.payload or {}).get("meta") or {}
-        cwd_hint = meta.get("cwd") or meta.get("workdir") or meta.get("workspace")
-
-        ok = quick_capture(
-            event_type=et,
-            session_id=evt.session_id,
-            data={
-                "source": evt.source,
-                "kind": evt.kind.value,
-                "payload": evt.payload,
-                "trace_id": evt.trace_id,
-                "v": evt.v,
-                "ts": evt.ts,
-                "cwd": cwd_hint,
-            },
-            tool_name=evt.payload.get("tool_name"),
-            tool_input=evt.payload.get("tool_input"),
-            error=evt.payload.get("error"),
-        )
+        ok = quick_capture(**_capture_kwargs(evt, et))
 
         _dispatch_openclaw_runtime_bridge(evt, et)
 
@@ -771,7 +927,13 @@ def main():
         return
 
     print(f"sparkd listening on http://127.0.0.1:{PORT}")
-    server = HTTPServer(("127.0.0.1", PORT), Handler)
+    server = PooledHTTPServer(
+        ("127.0.0.1", PORT),
+        Handler,
+        max_workers=MAX_WORKERS,
+        admission_timeout_s=ADMISSION_TIMEOUT_S,
+        thread_name_prefix="sparkd-http",
+    )
     stop_event = False
 
     def _shutdown(signum=None, frame=None):
@@ -792,6 +954,7 @@ def main():
         server.serve_forever()
     finally:
         server.server_close()
+        _JOBS.shutdown()
 
 
 if __name__ == "__main__":
@@ -12,9 +12,11 @@ Covers:
   6. BM25 / lexical scoring helpers
   7. Effectiveness normalization
   8. Caching behaviour
+  9. Source fan-out (per-source budgets, ordering, telemetry)
 """
 
 import json
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -884,3 +886,129 @@ class TestAdviceOutcome:
         assert outcome.advice_id == "a2"
         assert outcome.was_followed is False
         assert outcome.was_helpful is False
+
+
+# ---------------------------------------------------------------------------
+# 17. Source fan-out
+# ---------------------------------------------------------------------------
+
+_FANOUT_METHODS = {
+    "banks": "_get_bank_advice",
+    "cognitive": "_get_cognitive_advice",
+    "chips": "_get_chip_advice",
+    "mind": "_get_mind_advice",
+    "tool": "_get_tool_specific_advice",
+    "opportunity": "_get_opportunity_advice",
+    "surprise": "_get_surprise_advice",
+    "skills": "_get_skill_advice",
+    "convo": "_get_convo_advice",
+    "engagement": "_get_engagement_advice",
+    "niche": "_get_niche_advice",
+    "replay": "_get_replay_counterfactual_advice",
+    "workflow": "_get_workflow_advice",
+}
+
+
+def _stub_sources(adv, delays=None, failing=()):
+    delays = delays or {}
+
+    def _make(name):
+        def _source(*_a, **_kw):
+            if name in failing:
+                raise RuntimeError(f"{name} down")
+            time.sleep(delays.get(name, 0.0))
+            return [_make_advice(text=f"{name} advice", source=name, insight_key=name)]
+        return _source
+
+    for name, method in _FANOUT_METHODS.items():
+        setattr(adv, method, _make(name))
+    adv._mind_retrieval_allowed = lambda **_kw: True
+
+
+def _collect(adv):
+    return adv._collect_source_advice(
+        tool_name="Edit",
+        context="edit main.py",
+        context_raw="Edit main.py",
+        semantic_context="Edit main.py",
+        task_context="",
+        include_mind=True,
+        trace_id="t-1",
+    )
+
+
+class TestSourceFanout:
+
+    def test_parallel_and_serial_assemble_in_source_order(self, monkeypatch, tmp_path):
+        adv = _build_advisor(monkeypatch, tmp_path)
+        # Later sources finish first; assembly order must not depend on timing.
+        _stub_sources(adv, delays={"banks": 0.05, "cognitive": 0.03, "chips": 0.01})
+        parallel = [a.source for a in _collect(adv)]
+        monkeypatch.setattr(advisor_mod, "SOURCE_FANOUT_ENABLED", False)
+        serial = [a.source for a in _collect(adv)]
+        expected = [n for n in SparkAdvisor._ADVICE_SOURCE_ORDER if n in _FANOUT_METHODS]
+        assert parallel == serial == expected
+
+    def test_slow_source_is_skipped_and_reported(self, monkeypatch, tmp_path):
+        adv = _build_advisor(monkeypatch, tmp_path)
+        monkeypatch.setattr(advisor_mod, "SOURCE_BUDGETS_MS", {"mind": 50})
+        _stub_sources(adv, delays={"mind": 0.6})
+
+        start = time.perf_counter()
+        sources = [a.source for a in _collect(adv)]
+        assert time.perf_counter() - start < 0.5
+        assert "mind" not in sources
+        assert sources[-1] == "workflow"
+
+        route = json.loads((tmp_path / "retrieval_route.jsonl").read_text(encoding="utf-8").splitlines()[-1])
+        assert route["route"] == "source_fanout"
+        assert route["skipped"] == ["mind"]
+        assert route["sources"]["mind"]["status"] == "timeout"
+        assert route["sources"]["banks"]["status"] == "ok"
+        assert set(route["sources"]) == set(_FANOUT_METHODS)
+
+        # Still running from the previous call: not resubmitted.
+        _collect(adv)
+        route = json.loads((tmp_path / "retrieval_route.jsonl").read_text(encoding="utf-8").splitlines()[-1])
+        assert route["sources"]["mind"]["status"] == "busy"
+
+    def test_failing_source_does_not_drop_others(self, monkeypatch, tmp_path):
+        adv = _build_advisor(monkeypatch, tmp_path)
+        _stub_sources(adv, failing={"mind"})
+        sources = [a.source for a in _collect(adv)]
+        assert "mind" not in sources
+        assert len(sources) == len(_FANOUT_METHODS) - 1
+
+    def test_only_learner_sources_stay_on_the_calling_thread(self, monkeypatch, tmp_path):
+        adv = _build_advisor(monkeypatch, tmp_path)
+        _stub_sources(adv)
+        threads = {}
+        for name, method in _FANOUT_METHODS.items():
+            inner = getattr(adv, method)
+
+            def _record(*a, _name=name, _inner=inner, **kw):
+                threads[_name] = threading.current_thread()
+                return _inner(*a, **kw)
+
+            setattr(adv, method, _record)
+        _collect(adv)
+        on_thread = {name for name, t in threads.items() if t is threading.current_thread()}
+        assert on_thread == {"cognitive", "tool"}
+        assert all(
+            t.name.startswith("spark_advice_src") for name, t in threads.items() if name not in on_thread
+        )
+
+    def test_slow_replay_degrades_to_skipped(self, monkeypatch, tmp_path):
+        adv = _build_advisor(monkeypatch, tmp_path)
+        monkeypatch.setattr(advisor_mod, "SOURCE_BUDGETS_MS", {"replay": 50})
+        _stub_sources(adv, delays={"replay": 0.6})
+
+        start = time.perf_counter()
+        sources = [a.source for a in _collect(adv)]
+        assert time.perf_counter() - start < 0.5
+        assert "replay" not in sources
+        assert sources[-1] == "workflow"
+
+        route = json.loads((tmp_path / "retrieval_route.jsonl").read_text(encoding="utf-8").splitlines()[-1])
+        assert route["skipped"] == ["replay"]
+        assert route["sources"]["replay"]["status"] == "timeout"
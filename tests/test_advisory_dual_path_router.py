@@ -312,8 +312,8 @@ def test_on_user_prompt_creates_baseline_and_prefetch_job(monkeypatch, tmp_path)
     status = packet_store.get_store_status()
     assert status["total_packets"] >= 1
     packet = None
-    for fp in packet_store.PACKET_DIR.glob("pkt_*.json"):
-        row = json.loads(fp.read_text(encoding="utf-8"))
+    for packet_id in packet_store._load_index()["packet_meta"]:
+        row = packet_store.get_packet(packet_id) or {}
         if row.get("source_mode") == "baseline_deterministic":
             packet = row
             break
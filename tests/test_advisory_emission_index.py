@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import time
+
+from lib import advisory_engine
+from lib.advisory_emission_index import EmissionIndex, emission_index_for, index_path_for
+from lib.meta_ralph import MetaRalph
+
+
+def _rows(row):
+    scope = str(row.get("scope_key") or "")
+    return [("advice", row["advice_id"], scope, float(row["ts"]))] if row.get("advice_id") else []
+
+
+def _append(path, *rows):
+    with path.open("a", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def test_sync_indexes_only_new_lines_and_matches_scope(tmp_path):
+    log = tmp_path / "dedupe.jsonl"
+    index = EmissionIndex(tmp_path / "dedupe.idx.sqlite")
+    _append(log, {"ts": 100.0, "advice_id": "a1", "scope_key": "tree-a"}, {"ts": 101.0, "advice_id": "a2"})
+    assert index.sync_jsonl(log, _rows, window=50) == 2
+    assert index.sync_jsonl(log, _rows, window=50) == 0  # nothing appended, nothing parsed
+
+    _append(log, {"ts": 105.0, "advice_id": "a1", "scope_key": "tree-b"})
+    assert index.sync_jsonl(log, _rows, window=50) == 1
+
+    assert index.latest("advice", "a1") == 105.0
+    assert index.latest("advice", "a1", "tree-a") == 100.0
+    assert index.latest("advice", "a1", "tree-c") == 0.0
+    assert index.latest("advice", "a2", "tree-c") == 101.0  # unscoped rows match any scope
+    assert index.latest_many("advice", ["a1", "a2", "nope"], "tree-b") == {"a1": 105.0, "a2": 101.0}
+
+
+def test_in_place_rewrite_is_resynced_from_tail_window(tmp_path):
+    log = tmp_path / "dedupe.jsonl"
+    index = EmissionIndex(tmp_path / "dedupe.idx.sqlite")
+    _append(log, *({"ts": 100.0 + i, "advice_id": f"old{i}"} for i in range(20)))
+    index.sync_jsonl(log, _rows, window=50)
+
+    # Compaction rewrites the same inode with different (here: longer) content,
+    # so the byte offset alone would land mid-line.
+    lines = [json.dumps({"ts": 200.0 + i, "advice_id": f"new-advice-{i}"}) for i in range(30)]
+    log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert index.sync_jsonl(log, _rows, window=10) == 10
+    assert index.latest("advice", "new-advice-29") == 229.0
+    assert index.latest("advice", "new-advice-19") == 0.0  # outside the resync window
+
+
+def test_partial_trailing_line_waits_for_its_newline(tmp_path):
+    log = tmp_path / "dedupe.jsonl"
+    index = EmissionIndex(tmp_path / "dedupe.idx.sqlite")
+    _append(log, {"ts": 10.0, "advice_id": "a1"})
+    with log.open("a", encoding="utf-8") as f:
+        f.write('{"ts": 11.0, "advice_id": "a2"')
+    assert index.sync_jsonl(log, _rows, window=50) == 1
+    with log.open("a", encoding="utf-8") as f:
+        f.write("}\n")
+    assert index.sync_jsonl(log, _rows, window=50) == 1
+    assert index.latest("advice", "a2") == 11.0
+
+
+def test_rows_age_out_relative_to_newest_write(tmp_path):
+    index = EmissionIndex(tmp_path / "idx.sqlite", max_age_s=60.0)
+    index.record([("advice", "old", "", 1000.0)])
+    index.record([("advice", "new", "", 1100.0)])
+    assert index.latest("advice", "old") == 0.0
+    assert index.latest("advice", "new") == 1100.0
+
+
+def test_pre_tool_lookups_see_appended_and_tracked_outcomes(monkeypatch, tmp_path):
+    data_dir = tmp_path / "meta_ralph"
+    for name, value in (
+        ("DATA_DIR", data_dir),
+        ("ROAST_HISTORY_FILE", data_dir / "roast_history.json"),
+        ("OUTCOME_TRACKING_FILE", data_dir / "outcome_tracking.json"),
+        ("LEARNINGS_STORE_FILE", data_dir / "learnings_store.json"),
+        ("SELF_ROAST_FILE", data_dir / "self_roast.json"),
+    ):
+        monkeypatch.setattr(MetaRalph, name, value)
+    monkeypatch.setattr(advisory_engine, "OUTCOME_TRACKING_FILE", data_dir / "outcome_tracking.json")
+    monkeypatch.setattr(advisory_engine, "GLOBAL_DEDUPE_LOG", tmp_path / "global.jsonl")
+
+    now = time.time()
+    advisory_engine._append_jsonl_capped(
+        advisory_engine.GLOBAL_DEDUPE_LOG,
+        {"ts": now - 5, "tool": "Edit", "advice_id": "a1", "text_sig": "sig1"},
+        max_lines=50,
+    )
+    hit = advisory_engine._global_recently_emitted_text_sig(text_sig="sig1", now_ts=now, cooldown_s=60.0)
+    assert hit is not None and 4.0 <= hit["age_s"] <= 6.0
+    assert index_path_for(advisory_engine.GLOBAL_DEDUPE_LOG).exists()
+
+    MetaRalph().track_outcome("a1", "good", insight_key="Insight:Tests")
+    by_insight, by_advice = advisory_engine._recent_outcome_update_ts(["insight:tests"], ["a1"])
+    assert by_insight["insight:tests"] >= now
+    assert by_advice["a1"] >= now
+    assert emission_index_for(data_dir / "outcome_tracking.json").latest("outcome_advice", "a1") >= now
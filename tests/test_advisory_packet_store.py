@@ -333,3 +333,105 @@ def test_relaxed_lookup_rejects_plane_only_match(monkeypatch, tmp_path):
         task_plane="build_delivery",
     )
     assert chosen is None
+
+
+def _legacy_packet(project, tool, intent, plane, text, advice_id):
+    packet = store.build_packet(
+        project_key=project,
+        session_context_key="ctx",
+        tool_name=tool,
+        intent_family=intent,
+        task_plane=plane,
+        advisory_text=text,
+        source_mode="deterministic",
+        advice_items=[{"advice_id": advice_id, "text": text}],
+        lineage={"sources": ["baseline"], "memory_absent_declared": False},
+        ttl_s=600,
+    )
+    return packet
+
+
+def test_packet_store_migrates_legacy_json_layout_once(monkeypatch, tmp_path):
+    _patch_store_paths(monkeypatch, tmp_path)
+    packet_dir = store.PACKET_DIR
+    packet_dir.mkdir(parents=True)
+    legacy = _legacy_packet("proj", "Edit", "auth_security", "build_delivery", "Check tokens.", "adv-legacy")
+    legacy["helpful_count"] = 3
+    (packet_dir / f"{legacy['packet_id']}.json").write_text(json.dumps(legacy), encoding="utf-8")
+    (packet_dir / "pkt_broken.json").write_text("{not json", encoding="utf-8")
+    exact_key = "proj|ctx|Edit|auth_security"
+    store.INDEX_FILE.write_text(
+        json.dumps({"by_exact": {exact_key: legacy["packet_id"], "stale|key": "pkt_gone"}, "packet_meta": {}}),
+        encoding="utf-8",
+    )
+
+    fetched = store.lookup_exact(
+        project_key="proj", session_context_key="ctx", tool_name="Edit", intent_family="auth_security"
+    )
+    assert fetched is not None and fetched["packet_id"] == legacy["packet_id"]
+    assert fetched["helpful_count"] == 3
+    index = store._load_index()
+    assert set(index["by_exact"]) == {exact_key}
+    assert index["packet_meta"][legacy["packet_id"]]["project_key"] == "proj"
+    assert store.get_store_status()["schema_version"] == store.INDEX_SCHEMA_VERSION
+
+    # A second store handle on the same database must not re-import.
+    (packet_dir / f"{legacy['packet_id']}.json").unlink()
+    store._PACKET_DBS.clear()
+    assert store.get_packet(legacy["packet_id"])["helpful_count"] == 3
+    assert store.record_packet_feedback_for_advice("adv-legacy", helpful=True)["ok"] is True
+
+
+def test_relaxed_candidates_match_full_scan_scoring(monkeypatch, tmp_path):
+    _patch_store_paths(monkeypatch, tmp_path)
+    import random
+
+    rng = random.Random(3)
+    tools, intents, planes = ["Edit", "Bash", "Read", "*"], ["auth", "deploy", "testing"], ["build", "ops"]
+    for i in range(60):
+        packet = _legacy_packet(
+            rng.choice(["proj", "other"]), rng.choice(tools), rng.choice(intents), rng.choice(planes), f"tip {i}", f"a{i}"
+        )
+        packet["packet_id"] = f"pkt_rel_{i}"
+        packet["fresh_until_ts"] = time.time() + (600 if rng.random() < 0.8 else -5)
+        packet["helpful_count"] = rng.randint(0, 4)
+        store.save_packet(packet)
+        if rng.random() < 0.1:
+            store.invalidate_packet(packet["packet_id"], reason="test")
+
+    meta = store._load_index()["packet_meta"]
+    now = time.time()
+    for tool in tools[:3]:
+        for intent in intents:
+            for plane in planes:
+                expected = sorted(
+                    (
+                        (scored[0], scored[1], pid)
+                        for pid, row in meta.items()
+                        for scored in [store._candidate_match_score(
+                            row, project="proj", tool_name=tool, intent_family=intent, task_plane=plane, now_value=now
+                        )]
+                        if scored
+                    ),
+                    reverse=True,
+                )
+                got = store.lookup_relaxed_candidates(
+                    project_key="proj", tool_name=tool, intent_family=intent, task_plane=plane,
+                    now_ts=now, max_candidates=30,
+                ) or []
+                assert [c["packet_id"] for c in got] == [pid for _, _, pid in expected[:30]]
+
+
+def test_packet_store_prunes_oldest_rows_and_aliases(monkeypatch, tmp_path):
+    _patch_store_paths(monkeypatch, tmp_path)
+    monkeypatch.setattr(store, "MAX_INDEX_PACKETS", 3)
+    ids = []
+    for i in range(5):
+        packet = _legacy_packet("proj", "Edit", f"intent_{i}", "build", f"tip {i}", f"a{i}")
+        ids.append(store.save_packet(packet))
+        time.sleep(0.002)
+    index = store._load_index()
+    assert set(index["packet_meta"]) == set(ids[2:])
+    assert set(index["by_exact"].values()) == set(ids[2:])
+    assert store.get_packet(ids[0]) is None
+    assert store.record_packet_feedback_for_advice("a0", helpful=True)["ok"] is False
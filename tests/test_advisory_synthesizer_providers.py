@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import lib.advisory_synthesizer as synth
+import lib.llm_dispatch as dispatch
+
+pytest.importorskip("httpx")
+
+
+class _StubLLM(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    peers: set = set()
+
+    def log_message(self, fmt, *args):
+        return
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", "0"))) or b"{}")
+        prompt = body["messages"][0]["content"]
+        type(self).peers.add(self.client_address[1])
+        if prompt.startswith("sleep:"):
+            time.sleep(float(prompt.split(":", 1)[1]))
+        if self.path == "/api/chat":
+            payload = {"message": {"content": f"ollama says {prompt}"}}
+        else:
+            payload = {"choices": [{"message": {"content": f"openai says {prompt}"}}]}
+        raw = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    _StubLLM.peers = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubLLM)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(synth, "OLLAMA_API", base)
+    monkeypatch.setattr(synth, "OPENAI_BASE_URL", f"{base}/v1")
+    monkeypatch.setattr(synth, "OPENAI_API_KEY", "sk-test")
+    synth.close_provider_clients()
+    yield base
+    synth.close_provider_clients()
+    server.shutdown()
+    server.server_close()
+
+
+def test_provider_calls_reuse_one_pooled_connection(stub_llm):
+    for i in range(5):
+        assert synth._query_provider("ollama", f"hi {i}") == f"ollama says hi {i}"
+    assert synth._query_provider("openai", "yo") == "openai says yo"
+    assert synth._query_provider("openai", "yo again") == "openai says yo again"
+    # One keep-alive connection per provider, not one per call.
+    assert len(_StubLLM.peers) == 2
+    assert synth._provider_client("ollama") is synth._provider_client("ollama")
+
+
+def test_per_call_timeouts_do_not_touch_module_state(stub_llm):
+    before = synth.AI_TIMEOUT_S
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        slow_short = pool.submit(synth._query_provider, "ollama", "sleep:0.5", timeout_s=0.1)
+        slow_long = pool.submit(synth._query_provider, "ollama", "sleep:0.3", timeout_s=5.0)
+        assert slow_short.result() is None
+        assert slow_long.result() == "ollama says sleep:0.3"
+    assert synth.AI_TIMEOUT_S == before
+
+
+def test_dispatch_runs_concurrent_areas_in_parallel(stub_llm):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: dispatch._dispatch_provider("ollama", "sleep:0.3", 5.0), range(4)))
+    elapsed = time.perf_counter() - started
+    assert results == ["ollama says sleep:0.3"] * 4
+    # Serialized dispatch would take >= 1.2s.
+    assert elapsed < 1.0
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+
+from lib.append_log import AppendLog, count_lines, tail_rows
+
+
+def _rows(start, stop, ts0=1000.0):
+    return [{"i": i, "ts": ts0 + i} for i in range(start, stop)]
+
+
+def test_counts_tails_and_since_span_segments(tmp_path):
+    log = AppendLog(tmp_path / "events.jsonl", segment_lines=10)
+    assert log.append_many(_rows(0, 35)) == 35
+    for row in _rows(35, 42):
+        assert log.append(row)
+
+    assert len(log.segments()) == 2  # the 35-row batch sealed as one segment + active
+    assert log.count() == 42
+    assert [r["i"] for r in log.tail(12)] == list(range(30, 42))
+    assert [r["i"] for r in log.since(1038.0)] == [38, 39, 40, 41]
+    assert [r["i"] for r in log.since(1000.0, limit=3)] == [39, 40, 41]
+    assert [r["i"] for r in log.iter_rows()] == list(range(42))
+
+
+def test_retention_drops_whole_segments(tmp_path):
+    log = AppendLog(tmp_path / "capped.jsonl", max_lines=20)  # seals every 5 lines
+    for row in _rows(0, 100):
+        log.append(row)
+    kept = [r["i"] for r in log.iter_rows()]
+    assert 20 <= len(kept) < 25
+    assert kept == list(range(100 - len(kept), 100))
+    assert log.count() == len(kept)
+
+
+def test_direct_appends_and_legacy_files_are_indexed(tmp_path):
+    path = tmp_path / "legacy.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in _rows(0, 5)) + '{"partial": ', encoding="utf-8")
+    assert count_lines(path) == 5  # readers never count a torn trailing line
+    assert [r["i"] for r in tail_rows(path, 2)] == [3, 4]
+    assert not (tmp_path / "legacy.jsonl.idx").exists()  # reads have no side effects
+
+    log = AppendLog(path)
+    log.append({"i": 5, "ts": 1005.0})
+    with path.open("a", encoding="utf-8") as f:  # someone else appends directly
+        f.write(json.dumps({"i": 6, "ts": 1006.0}) + "\n")
+    assert log.count() == 8  # 5 + terminated partial line + 2; the direct line is counted on the fly
+    log.append({"i": 7, "ts": 1007.0})
+    assert (tmp_path / "legacy.jsonl.idx").stat().st_size == 16 * 9
+    assert [r["i"] for r in log.since(1005.5)] == [6, 7]
+
+
+def test_rewritten_file_invalidates_index(tmp_path):
+    path = tmp_path / "rewritten.jsonl"
+    log = AppendLog(path)
+    log.append_many(_rows(0, 10))
+    path.write_text(json.dumps({"i": 99}) + "\n", encoding="utf-8")  # legacy in-place compaction
+    assert log.count() == 1
+    log.append({"i": 100})
+    assert [r["i"] for r in log.tail(5)] == [99, 100]
+
+
+def test_update_rewrites_rows_in_every_segment(tmp_path):
+    path = tmp_path / "links.jsonl"
+    log = AppendLog(path, segment_lines=10)
+    log.append_many(_rows(0, 10))
+    log.append_many(_rows(10, 14))
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"torn": ')  # a crashed writer's partial line survives the rewrite
+
+    assert log.update(lambda r: {**r, "even": True} if r["i"] % 2 == 0 else None) == 7
+    assert log.update(lambda r: None) == 0
+    rows = list(log.iter_rows())
+    assert [r["i"] for r in rows] == list(range(14))
+    assert [r["i"] for r in rows if r.get("even")] == list(range(0, 14, 2))
+    assert path.read_bytes().endswith(b'{"torn": ')
+    assert log.count() == 14
+    assert [r["i"] for r in log.since(1011.0)] == [11, 12, 13]  # indexes rebuilt with their timestamps
+    assert not list(tmp_path.rglob("*.tmp*"))
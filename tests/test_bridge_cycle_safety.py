@@ -20,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 def test_bridge_cycle_empty_events():
     """run_bridge_cycle should handle empty event list without crashing."""
-    with patch("lib.bridge_cycle.read_recent_events", return_value=[]):
+    with patch("lib.bridge_cycle.read_events_from_cursor", side_effect=lambda c, limit: ([], c)):
         with patch("lib.bridge_cycle.update_spark_context", return_value=(True, {}, None)):
             with patch("lib.bridge_cycle.process_recent_memory_events", return_value={"auto_saved": 0, "suggested": 0}):
                 from lib.bridge_cycle import run_bridge_cycle
@@ -35,7 +35,7 @@ def test_bridge_cycle_empty_events():
 
 def test_bridge_cycle_returns_expected_keys():
     """Stats dict should contain all expected keys."""
-    with patch("lib.bridge_cycle.read_recent_events", return_value=[]):
+    with patch("lib.bridge_cycle.read_events_from_cursor", side_effect=lambda c, limit: ([], c)):
         with patch("lib.bridge_cycle.update_spark_context", return_value=(True, {}, None)):
             with patch("lib.bridge_cycle.process_recent_memory_events", return_value={"auto_saved": 0, "suggested": 0}):
                 from lib.bridge_cycle import run_bridge_cycle
@@ -50,7 +50,7 @@ def test_bridge_cycle_returns_expected_keys():
 
 def test_bridge_cycle_survives_context_failure():
     """If context update fails, cycle should continue (fail-open)."""
-    with patch("lib.bridge_cycle.read_recent_events", return_value=[]):
+    with patch("lib.bridge_cycle.read_events_from_cursor", side_effect=lambda c, limit: ([], c)):
         with patch("lib.bridge_cycle.update_spark_context", side_effect=Exception("context boom")):
             with patch("lib.bridge_cycle.process_recent_memory_events", return_value={"auto_saved": 0, "suggested": 0}):
                 from lib.bridge_cycle import run_bridge_cycle
@@ -63,7 +63,7 @@ def test_bridge_cycle_survives_context_failure():
 
 def test_bridge_cycle_survives_memory_failure():
     """If memory capture fails, cycle should continue (fail-open)."""
-    with patch("lib.bridge_cycle.read_recent_events", return_value=[]):
+    with patch("lib.bridge_cycle.read_events_from_cursor", side_effect=lambda c, limit: ([], c)):
         with patch("lib.bridge_cycle.update_spark_context", return_value=(True, {}, None)):
             with patch("lib.bridge_cycle.process_recent_memory_events", side_effect=Exception("memory boom")):
                 from lib.bridge_cycle import run_bridge_cycle
@@ -79,7 +79,7 @@ def test_bridge_cycle_calls_batch_mode():
     mock_cognitive = MagicMock()
     mock_ralph = MagicMock()
 
-    with patch("lib.bridge_cycle.read_recent_events", return_value=[]):
+    with patch("lib.bridge_cycle.read_events_from_cursor", side_effect=lambda c, limit: ([], c)):
         with patch("lib.bridge_cycle.update_spark_context", return_value=(True, {}, None)):
             with patch("lib.bridge_cycle.process_recent_memory_events", return_value={"auto_saved": 0, "suggested": 0}):
                 # These are imported inside run_bridge_cycle via `from lib.cognitive_learner import ...`
@@ -4,6 +4,7 @@ import time
 from pathlib import Path
 
 import lib.queue as queue
+from lib.bridge_cycle import BRIDGE_CURSOR_NAME
 from lib.pipeline import ProcessingMetrics
 
 
@@ -74,9 +75,11 @@ def test_bridge_uses_pipeline_events_when_queue_empty(tmp_path, monkeypatch):
     assert bridge_events[0].session_id == "test"
 
 
-def test_bridge_falls_back_to_read_recent(tmp_path, monkeypatch):
-    """When pipeline_metrics is None, bridge falls back to read_recent_events."""
+def test_bridge_falls_back_to_its_queue_cursor(tmp_path, monkeypatch):
+    """When pipeline_metrics is None, bridge reads new events from its cursor."""
     _patch_queue_paths(tmp_path, monkeypatch)
+    monkeypatch.setattr(queue, "QUEUE_STATE_FILE", tmp_path / "queue" / "state.json")
+    monkeypatch.setattr(queue, "CURSORS_DIR", tmp_path / "queue" / "cursors")
     monkeypatch.setattr(queue, "MAX_EVENTS", 0)
     monkeypatch.setattr(queue, "MAX_QUEUE_BYTES", 0)
 
@@ -90,10 +93,15 @@ def test_bridge_falls_back_to_read_recent(tmp_path, monkeypatch):
 
     pipeline_metrics = None
 
-    # Simulate bridge_cycle fallback logic
-    if pipeline_metrics and getattr(pipeline_metrics, "processed_events", None):
-        bridge_events = pipeline_metrics.processed_events
-    else:
-        bridge_events = queue.read_recent_events(40)
-
-    assert len(bridge_events) == 3
+    def _bridge_events():
+        # Simulate bridge_cycle fallback logic
+        if pipeline_metrics and getattr(pipeline_metrics, "processed_events", None):
+            return pipeline_metrics.processed_events
+        cursor = queue.load_cursor(BRIDGE_CURSOR_NAME)
+        events, next_cursor = queue.read_events_from_cursor(cursor, limit=40)
+        queue.save_cursor(next_cursor)
+        return events
+
+    assert len(_bridge_events()) == 3
+    # The next cycle does not hand the same events to chips again.
+    assert _bridge_events() == []
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import random
+
+from lib.chips.loader import Chip, ChipObserver
+from lib.chips.router import ChipRouter
+
+
+def _chip(chip_id: str, patterns=(), observers=(), tools=(), events=()) -> Chip:
+    return Chip(
+        id=chip_id,
+        name=chip_id,
+        version="1.0.0",
+        description="test",
+        domains=[],
+        triggers=list(patterns),
+        observers=[ChipObserver(name=name, description="", triggers=list(trigs)) for name, trigs in observers],
+        learners=[],
+        outcomes_positive=[],
+        outcomes_negative=[],
+        outcomes_neutral=[],
+        questions=[],
+        trigger_patterns=list(patterns),
+        trigger_events=list(events),
+        trigger_tools=list(tools),
+    )
+
+
+def _signature(matches):
+    return [
+        (m.chip.id, m.observer.name if m.observer else None, m.trigger, round(m.confidence, 6), m.content_snippet)
+        for m in matches
+    ]
+
+
+def _route_both(event, chips):
+    compiled = ChipRouter().route_event(event, chips)
+    legacy = ChipRouter(use_automaton=False).route_event(event, chips)
+    return _signature(compiled), _signature(legacy)
+
+
+def test_compiled_matches_legacy_on_boundaries_and_overlaps():
+    chips = [
+        _chip(
+            "game",
+            patterns=["health", "hp", "game loop", "Physics ", "c++", "he"],
+            observers=[("combat", ["damage", "hit", "health"]), ("engine", ["physics", "loop"])],
+        ),
+        _chip(
+            "infra",
+            patterns=["deploy", "ci", "docker compose", "ploy"],
+            observers=[("release", ["deploy", "rollback"])],
+            tools=[{"name": "Bash", "context_contains": ["docker"]}],
+        ),
+        _chip("empty", patterns=["", "  "]),
+    ]
+    contents = [
+        "Edit game/health.py: health_bar damage hit-points physics",
+        "the physics engine runs the game loop; hp=10 shealth",
+        "redeploy via docker compose; ci pipeline in c++ and deployment",
+        "nothing relevant here",
+        "HEALTH HEALTH he she the HitBox hit",
+        "",
+    ]
+    for content in contents:
+        for tool in ("Edit", "Bash"):
+            event = {"event_type": "post_tool", "tool_name": tool, "input": {"command": content}}
+            compiled, legacy = _route_both(event, chips)
+            assert compiled == legacy, content
+
+
+def test_compiled_matches_legacy_on_random_corpus():
+    rng = random.Random(5)
+    vocab = ["api", "auth", "token", "cache", "redis", "queue", "retry", "test", "io", "db", "sql", "x_y", "a-b"]
+    chips = []
+    for i in range(12):
+        chips.append(_chip(
+            f"c{i}",
+            patterns=rng.sample(vocab, 3) + [" ".join(rng.sample(vocab, 2))],
+            observers=[(f"o{j}", rng.sample(vocab, 2)) for j in range(2)],
+        ))
+    for _ in range(200):
+        words = [rng.choice(vocab) + rng.choice(["", "", "s", "_1", "-"]) for _ in range(rng.randint(1, 12))]
+        sep = rng.choice([" ", "", "/", "."])
+        event = {"event_type": "post_tool", "tool_name": "Edit", "input": {"new_string": sep.join(words)}}
+        compiled, legacy = _route_both(event, chips)
+        assert compiled == legacy
+
+
+def test_automaton_rebuilds_only_when_chips_change():
+    router = ChipRouter()
+    chips = [_chip("a", patterns=["alpha"]), _chip("b", patterns=["beta"])]
+    event = {"event_type": "post_tool", "tool_name": "Edit", "input": {"new_string": "alpha beta"}}
+
+    router.route_event(event, chips)
+    router.route_event(event, chips)
+    router.route_event(event, chips[:1])
+    assert router.compile_count == 1
+
+    reloaded = [_chip("a", patterns=["gamma"]), chips[1]]
+    matches = router.route_event({**event, "input": {"new_string": "alpha gamma"}}, reloaded)
+    assert router.compile_count == 2
+    assert [(m.chip.id, m.trigger) for m in matches] == [("a", "gamma")]
@@ -9,12 +9,16 @@ Covers:
 6. CognitiveLearner learn methods with injection rejection
 7. Batch save mode (begin_batch, end_batch, flush)
 8. Insight deduplication (dedupe_struggles, signal normalization)
+9. Insight store (row-level upserts, cross-process merge, lazy rows, JSON export)
+10. Context retrieval term index (parity with the full scan, incremental upkeep)
 """
 
 from __future__ import annotations
 
 import json
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -24,6 +28,7 @@ from lib.cognitive_learner import (
     CognitiveCategory,
     CognitiveInsight,
     CognitiveLearner,
+    _InsightTermIndex,
     _is_auto_evidence_line,
     _is_injection_or_garbage,
     _is_low_signal_struggle_task,
@@ -759,3 +764,212 @@ class TestEdgeCases:
         )
         final = json.loads(learner.INSIGHTS_FILE.read_text(encoding="utf-8"))
         assert "wisdom:principle:from_other_process" in final
+
+
+# =========================================================================
+# 9. Insight store
+# =========================================================================
+
+class TestInsightStore:
+    def _principle(self, learner, text):
+        learner.learn_principle(text, ["evidence"])
+        return learner._generate_key(CognitiveCategory.WISDOM, f"principle:{text}")
+
+    def test_rows_are_decoded_lazily(self, learner):
+        key = self._principle(learner, "Prefer small reversible deploys over big-bang releases")
+        fresh = CognitiveLearner()
+        assert key in fresh.insights
+        assert fresh.insights.loaded_items() == []
+        assert fresh.insights[key].insight.startswith("Prefer small reversible")
+        assert len(fresh.insights.loaded_items()) == 1
+
+    def test_concurrent_updates_merge_per_key(self, learner):
+        key = self._principle(learner, "Validate schema migrations against a production snapshot")
+        other = CognitiveLearner()
+        other.apply_outcome(key, "good", "caught a bad migration")
+        learner.apply_outcome(key, "bad", "false alarm on staging")
+
+        merged = CognitiveLearner().insights[key]
+        assert merged.times_validated >= 1
+        assert merged.times_contradicted == 1
+        assert "caught a bad migration" in merged.evidence
+
+    def test_refresh_pulls_other_process_rows(self, learner):
+        other = CognitiveLearner()
+        key = self._principle(other, "Pin dependency versions in lockfiles for reproducible builds")
+        assert key not in learner.insights
+        assert learner.refresh() >= 1
+        assert key in learner.insights
+
+    def test_deletes_are_row_level(self, learner):
+        keep = self._principle(learner, "Keep feature flags short-lived and documented")
+        gone = self._principle(learner, "Remove dead code paths once flags are retired")
+        del learner.insights[gone]
+        learner._save_insights()
+        fresh = CognitiveLearner()
+        assert keep in fresh.insights
+        assert gone not in fresh.insights
+
+    def test_refresh_drops_rows_pruned_by_another_process(self, learner):
+        key = self._principle(learner, "Rotate credentials on a fixed schedule")
+        script = (
+            "import sys; from pathlib import Path\n"
+            "from lib.cognitive_learner import CognitiveLearner\n"
+            "CognitiveLearner.INSIGHTS_FILE = Path(sys.argv[1])\n"
+            "CognitiveLearner.LOCK_FILE = Path(sys.argv[2])\n"
+            "assert CognitiveLearner().prune_stale(max_age_days=0.0, min_effective=1.01) >= 1\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", script, str(learner.INSIGHTS_FILE), str(learner.LOCK_FILE)],
+            cwd=str(Path(__file__).resolve().parents[1]),
+            check=True,
+        )
+
+        assert learner.refresh() >= 1
+        assert key not in learner.insights
+        assert not learner.get_insights_for_context("rotate credentials")
+        # A later save from this process must not write the pruned row back.
+        self._principle(learner, "Page the owner before rolling back a release")
+        assert key not in CognitiveLearner().insights
+
+    def test_json_export_is_debounced(self, learner, monkeypatch):
+        monkeypatch.setattr(CognitiveLearner, "EXPORT_INTERVAL_S", 3600.0)
+        self._principle(learner, "Write the failing test before fixing a reported bug")
+        exported = json.loads(learner.INSIGHTS_FILE.read_text(encoding="utf-8"))
+        key = self._principle(learner, "Log the request id on every error path")
+        assert key not in json.loads(learner.INSIGHTS_FILE.read_text(encoding="utf-8"))
+        assert learner.export_json() is True
+        exported = json.loads(learner.INSIGHTS_FILE.read_text(encoding="utf-8"))
+        assert key in exported
+
+    def test_external_json_rewrite_is_imported(self, learner):
+        keep = self._principle(learner, "Prefer composition over deep inheritance trees")
+        purge = self._principle(learner, "Heavy Bash usage means the agent is productive")
+        learner.export_json()
+        data = json.loads(learner.INSIGHTS_FILE.read_text(encoding="utf-8"))
+        data.pop(purge)
+        learner.INSIGHTS_FILE.write_text(json.dumps(data), encoding="utf-8")
+
+        fresh = CognitiveLearner()
+        assert keep in fresh.insights
+        assert purge not in fresh.insights
+
+
+# ---------------------------------------------------------------------------
+# Context retrieval term index
+# ---------------------------------------------------------------------------
+
+_TOPICS = ["deploy", "migration", "caching", "testing", "logging", "auth", "queue", "schema"]
+_VERBS = ["validate", "rollback", "monitor", "document", "benchmark", "isolate"]
+
+
+def _fill(learner, n):
+    for i in range(n):
+        topic = _TOPICS[i % len(_TOPICS)]
+        verb = _VERBS[i % len(_VERBS)]
+        if i % 11 == 0:
+            text = f"Cycle summary: {topic} ran {i} times"
+        elif i % 13 == 0:
+            text = "ok"  # noise
+        else:
+            text = f"Always {verb} the {topic} changes before shipping release {i}"
+        learner.insights[f"k{i}"] = CognitiveInsight(
+            category=CognitiveCategory.WISDOM,
+            insight=text,
+            evidence=[],
+            confidence=0.5 + (i % 5) / 10,
+            context=f"{topic} work" if i % 3 else "",
+            times_validated=i % 4,
+        )
+
+
+def _both(learner, query, limit=10):
+    indexed = learner.get_insights_for_context(query, limit=limit, with_keys=True)
+    learner.TERM_INDEX_ENABLED = False
+    try:
+        scanned = learner.get_insights_for_context(query, limit=limit, with_keys=True)
+    finally:
+        del learner.TERM_INDEX_ENABLED
+    return [k for k, _ in indexed], [k for k, _ in scanned]
+
+
+class TestTermIndex:
+    QUERIES = [
+        "deploy",
+        "validate the deploy changes",
+        "rollback a schema migration",
+        "monitoring logging changes",
+        "caching work",
+        "auth",
+        "nothing relevant here",
+    ]
+
+    def test_matches_full_scan(self, learner):
+        _fill(learner, 120)
+        for query in self.QUERIES:
+            indexed, scanned = _both(learner, query, limit=50)
+            assert indexed == scanned, query
+        assert learner.term_index_stats()["built"] == 1
+
+    def test_follows_adds_deletes_and_in_place_edits(self, learner):
+        _fill(learner, 40)
+        learner.get_insights_for_context("deploy")
+
+        learner.insights["new"] = CognitiveInsight(
+            category=CognitiveCategory.WISDOM,
+            insight="Benchmark the kubernetes autoscaler before rollout",
+            evidence=[],
+            confidence=0.9,
+            context="",
+        )
+        assert "new" in [k for k, _ in learner.get_insights_for_context("kubernetes autoscaler", with_keys=True)]
+
+        learner.insights["k1"].insight = "Prefer terraform plans reviewed by a second engineer"
+        learner._save_insights()
+        assert "k1" in [k for k, _ in learner.get_insights_for_context("terraform plans", with_keys=True)]
+
+        del learner.insights["new"]
+        assert "new" not in [k for k, _ in learner.get_insights_for_context("kubernetes autoscaler", with_keys=True)]
+        for query in self.QUERIES:
+            indexed, scanned = _both(learner, query, limit=50)
+            assert indexed == scanned, query
+
+    def test_rows_pulled_by_refresh_are_indexed(self, learner):
+        learner.get_insights_for_context("anything")
+        other = CognitiveLearner()
+        other.learn_principle("Quarantine flaky integration tests behind a retry budget", ["evidence"])
+        learner.refresh()
+        hits = learner.get_insights_for_context("flaky integration tests")
+        assert any("Quarantine flaky" in i.insight for i in hits)
+
+    def test_direct_context_hits_match_substring_scan(self):
+        contexts = [
+            "bash", "bash_error recovery", "Edit deploy_auth.py", "when making assumptions about caching",
+            "ci", "credit card flow", "go", "auth work", "  padded context  ", "deploy",
+        ]
+        insights = {
+            f"c{i}": CognitiveInsight(
+                category=CognitiveCategory.WISDOM,
+                insight=f"Prefer explicit retries for flaky network calls {i}",
+                evidence=[],
+                confidence=0.7,
+                context=ctx,
+            )
+            for i, ctx in enumerate(contexts)
+        }
+        index = _InsightTermIndex(lambda text: False)
+        queries = ["edit", "bash", "run bash_error recovery now", "i", "g", "deploy_auth", "about cach", "ci", "d context "]
+
+        def scan():
+            live = {v.context.lower() for v in insights.values() if v.context}
+            return {q: {ic for ic in live if ic in q or q in ic} for q in queries}
+
+        for q, expected in scan().items():
+            index.sync(insights)
+            assert index._direct_contexts(q) == expected, q
+
+        del insights["c1"]
+        index.discard("c1")
+        for q, expected in scan().items():
+            assert index._direct_contexts(q) == expected, q
+        assert "bash_error" not in index._context_terms
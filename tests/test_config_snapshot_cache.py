@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+import lib.config_authority as ca
+import lib.tuneables_reload as tr
+
+
+def _write(path, payload, age_s=10.0):
+    """Write JSON and backdate its mtime past the racy window."""
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    ts = time.time() - age_s
+    os.utime(path, (ts, ts))
+
+
+def _stats_delta(before):
+    after = ca.get_cache_stats()
+    return {k: after[k] - before[k] for k in after}
+
+
+def test_repeat_resolves_are_served_from_cache_and_copies_are_private(tmp_path):
+    baseline, runtime = tmp_path / "baseline.json", tmp_path / "runtime.json"
+    _write(baseline, {"demo": {"limit": 3, "tags": ["a"]}})
+    _write(runtime, {"demo": {"limit": 5}})
+    kwargs = dict(baseline_path=baseline, runtime_path=runtime, include_schema_defaults=False)
+
+    before = ca.get_cache_stats()
+    first = ca.resolve_section("demo", **kwargs)
+    first.data["tags"].append("mutated")
+    second = ca.resolve_section("demo", **kwargs)
+    assert second.data == {"limit": 5, "tags": ["a"]}
+    assert second.sources == {"limit": "runtime", "tags": "baseline"}
+    delta = _stats_delta(before)
+    assert (delta["resolve_cache_misses"], delta["resolve_cache_hits"], delta["file_reads"]) == (1, 1, 2)
+
+    snap = ca.get_section_snapshot("demo", **kwargs)
+    assert snap.data["tags"] == ("a",)
+    with pytest.raises(TypeError):
+        snap.data["limit"] = 1  # type: ignore[index]
+
+
+def test_env_overrides_apply_per_call(tmp_path, monkeypatch):
+    runtime = tmp_path / "runtime.json"
+    _write(runtime, {"demo": {"limit": 5}})
+    kwargs = dict(baseline_path=tmp_path / "missing.json", runtime_path=runtime, include_schema_defaults=False)
+    overrides = {"limit": ca.env_int("SPARK_TEST_DEMO_LIMIT")}
+
+    assert ca.resolve_section("demo", env_overrides=overrides, **kwargs).data["limit"] == 5
+    monkeypatch.setenv("SPARK_TEST_DEMO_LIMIT", "9")
+    assert ca.resolve_section("demo", env_overrides=overrides, **kwargs).data["limit"] == 9
+    assert ca.get_section_snapshot("demo", env_overrides=overrides, **kwargs).data["limit"] == 9
+    assert ca.get_section_snapshot("demo", **kwargs).data["limit"] == 5
+
+
+def test_fresh_writes_are_never_served_stale(tmp_path):
+    runtime = tmp_path / "runtime.json"
+    kwargs = dict(baseline_path=tmp_path / "missing.json", runtime_path=runtime, include_schema_defaults=False)
+    for value in (1, 2, 3):  # same size, same coarse mtime tick
+        runtime.write_text(json.dumps({"demo": {"limit": value}}), encoding="utf-8")
+        assert ca.resolve_section("demo", **kwargs).data["limit"] == value
+
+
+def test_reload_shares_the_snapshot_and_invalidates_once(tmp_path, monkeypatch):
+    runtime = tmp_path / "tuneables.json"
+    _write(runtime, {"demo": {"limit": 1}}, age_s=20)
+    monkeypatch.setattr(tr, "TUNEABLES_FILE", runtime)
+    monkeypatch.setattr(tr, "_last_stamp", None)
+    monkeypatch.setattr(tr, "_last_data", {})
+    monkeypatch.setattr(tr, "_callbacks", {})
+    kwargs = dict(baseline_path=tmp_path / "missing.json", runtime_path=runtime, include_schema_defaults=False)
+    seen = []
+    tr.register_reload("demo", lambda section: seen.append(ca.resolve_section("demo", **kwargs).data["limit"]))
+
+    assert tr.check_and_reload() is True
+    assert tr.check_and_reload() is False
+    _write(runtime, {"demo": {"limit": 2}}, age_s=10)
+    before = ca.get_cache_stats()
+    assert tr.check_and_reload() is True
+    assert tr.check_and_reload() is False
+    assert ca.resolve_section("demo", **kwargs).data["limit"] == 2
+    assert seen == [1, 2]
+    delta = _stats_delta(before)
+    assert (delta["invalidations"], delta["file_reads"]) == (1, 1)
+
+
+def test_reload_applies_an_empty_file_and_skips_invalid_json(tmp_path, monkeypatch):
+    runtime = tmp_path / "tuneables.json"
+    _write(runtime, {"demo": {"limit": 1}}, age_s=30)
+    monkeypatch.setattr(tr, "TUNEABLES_FILE", runtime)
+    monkeypatch.setattr(tr, "_last_stamp", None)
+    monkeypatch.setattr(tr, "_last_data", {})
+    monkeypatch.setattr(tr, "_callbacks", {})
+    seen = []
+    tr.register_reload("demo", lambda section: seen.append(dict(section)))
+    assert tr.check_and_reload() is True
+
+    runtime.write_text('{"demo": {"lim', encoding="utf-8")  # partial write
+    assert tr.check_and_reload() is False
+    assert tr.get_section("demo") == {"limit": 1} and seen == [{"limit": 1}]
+
+    _write(runtime, {}, age_s=20)  # clearing the file reverts the overrides
+    assert tr.check_and_reload() is True
+    assert seen == [{"limit": 1}, {}]
+    assert ca.load_json_snapshot(runtime)[1:] == ({}, True)
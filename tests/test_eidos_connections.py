@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from lib.eidos.evidence_store import EvidenceStore, create_evidence_from_tool
+from lib.eidos.models import Budget, Episode, Step
+from lib.eidos.store import EidosStore
+
+
+def _steps(episode_id: str, n: int):
+    return [
+        Step(step_id=f"s{i}", episode_id=episode_id, intent=f"Read file {i}", decision="Inspect it")
+        for i in range(n)
+    ]
+
+
+def test_store_reuses_one_wal_connection_per_thread(tmp_path):
+    store = EidosStore(str(tmp_path / "eidos.db"))
+    assert store._db.journal_mode() == "wal"
+    assert store._db.connection() is store._db.connection()
+
+    other = []
+    t = threading.Thread(target=lambda: other.append(store._db.connection()))
+    t.start()
+    t.join()
+    assert other[0] is not store._db.connection()
+
+    store.close()
+    assert store.get_stats()["steps"] == 0  # reconnects lazily after close
+
+
+def test_save_steps_and_evidence_many_batch_in_one_transaction(tmp_path):
+    store = EidosStore(str(tmp_path / "eidos.db"))
+    ep = Episode(episode_id="", goal="Batch save", success_criteria="test", budget=Budget())
+    store.save_episode(ep)
+
+    ids = store.save_steps(_steps(ep.episode_id, 25))
+    assert ids == [f"s{i}" for i in range(25)]
+    saved = store.get_episode_steps(ep.episode_id)
+    assert len(saved) == 25 and all(s.trace_id for s in saved)
+
+    ev_store = EvidenceStore(str(tmp_path / "evidence.db"))
+    items = [create_evidence_from_tool(f"s{i}", "Bash", f"ok {i}" * (4000 if i == 0 else 1)) for i in range(5)]
+    for i, ev in enumerate(items):
+        ev.evidence_id = f"ev{i}"
+    assert ev_store.save_evidence_many(items, compress_threshold=1000) == [f"ev{i}" for i in range(5)]
+    assert ev_store.get("ev0").content == "ok 0" * 4000  # compressed on write, restored on read
+    assert ev_store.get_stats()["total_items"] == 5
+
+
+def test_failed_batch_rolls_back_and_readers_are_not_blocked_by_writer(tmp_path):
+    store = EidosStore(str(tmp_path / "eidos.db"))
+    with pytest.raises(RuntimeError):
+        with store._db.write() as conn:
+            conn.executemany(store._STEP_UPSERT_SQL, [store._step_params(s) for s in _steps("ep", 2)])
+            raise RuntimeError("boom")
+    assert store.get_stats()["steps"] == 0
+
+    writing = threading.Event()
+    release = threading.Event()
+
+    def _writer():
+        with store._db.write() as conn:
+            conn.executemany(store._STEP_UPSERT_SQL, [store._step_params(s) for s in _steps("ep", 10)])
+            writing.set()
+            release.wait(5)
+
+    t = threading.Thread(target=_writer)
+    t.start()
+    assert writing.wait(5)
+    reader = EidosStore(str(tmp_path / "eidos.db"))
+    assert reader.get_recent_steps(limit=50) == []  # sees the last commit, does not wait
+    release.set()
+    t.join()
+    assert len(reader.get_recent_steps(limit=50)) == 10
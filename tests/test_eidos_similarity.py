@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+
+from lib.eidos.distillation_engine import DistillationEngine
+from lib.eidos.models import Distillation, DistillationType
+from lib.eidos.similarity import build_index, minhash_signature, statement_tokens
+from lib.eidos.store import EidosStore
+
+_WORDS = (
+    "check token expiry before retrying auth calls cache invalidation breaks when keys rotate "
+    "run migrations first pin dependency versions avoid global state in tests prefer small diffs"
+).split()
+
+
+def _d(did, statement, dtype=DistillationType.HEURISTIC, confidence=0.5):
+    return Distillation(distillation_id=did, type=dtype, statement=statement, confidence=confidence)
+
+
+def _corpus(n, seed=7):
+    rng = random.Random(seed)
+    base = [rng.sample(_WORDS, 8) for _ in range(n // 4)]
+    out = []
+    for i in range(n):
+        words = list(base[i % len(base)])
+        for _ in range(rng.randint(0, 4)):  # mutate: near-duplicates and far variants
+            words[rng.randrange(len(words))] = rng.choice(_WORDS)
+        dtype = DistillationType.HEURISTIC if i % 3 else DistillationType.SHARP_EDGE
+        out.append(_d(f"d{i}", " ".join(words), dtype=dtype, confidence=rng.random()))
+    return out
+
+
+def _brute_force_groups(group):
+    used, groups = set(), []
+    for i, d1 in enumerate(group):
+        if i in used:
+            continue
+        members = [d1.distillation_id]
+        w1 = set(d1.statement.lower().split())
+        for j in range(i + 1, len(group)):
+            w2 = set(group[j].statement.lower().split())
+            if j not in used and w1 and w2 and len(w1 & w2) / len(w1 | w2) > 0.5:
+                members.append(group[j].distillation_id)
+                used.add(j)
+        used.add(i)
+        groups.append(members)
+    return groups
+
+
+def test_merge_matches_pairwise_scan():
+    corpus = _corpus(160)
+    confidence = {d.distillation_id: d.confidence for d in corpus}
+    expected = sorted(
+        max(g, key=confidence.get)
+        for dtype in (DistillationType.HEURISTIC, DistillationType.SHARP_EDGE)
+        for g in _brute_force_groups([d for d in corpus if d.type == dtype])
+    )
+    merged = DistillationEngine().merge_similar_distillations(_corpus(160))
+    assert sorted(d.distillation_id for d in merged) == expected
+    assert len(merged) < len(corpus)
+
+
+def test_signatures_are_stable_and_index_finds_near_duplicates():
+    a = statement_tokens("Run migrations before deploy")
+    assert minhash_signature(a) == minhash_signature(statement_tokens("run   MIGRATIONS before deploy"))
+    index = build_index([
+        ("a", "Run migrations before every deploy"),
+        ("b", "Run the migrations before deploy"),
+        ("c", "Vacuum the sqlite database weekly"),
+    ])
+    assert [k for k, _ in index.similar("run migrations before deploy")] in (["a", "b"], ["b", "a"])
+    assert "c" not in index.candidates("a")
+
+
+def test_store_collapses_duplicates_written_by_other_connections(tmp_path):
+    db = tmp_path / "eidos.db"
+    store = EidosStore(str(db))
+    store.save_distillation(_d("d1", "Pin dependency versions in CI"))
+    with sqlite3.connect(db) as conn:  # e.g. a maintenance script inserting directly
+        conn.execute(
+            "INSERT INTO distillations (distillation_id, type, statement) VALUES (?, ?, ?)",
+            ("ext", "sharp_edge", "Shell quoting breaks on spaces"),
+        )
+    assert store.save_distillation(_d("d2", "shell quoting  breaks on SPACES", DistillationType.SHARP_EDGE)) == "ext"
+    assert store.save_distillation(_d("d3", "Shell quoting breaks on spaces")) == "d3"  # other type
+
+    similar = store.find_similar_distillations("Pin the dependency versions in CI", DistillationType.HEURISTIC)
+    assert [d.distillation_id for d in similar] == ["d1"]
+    assert store.find_similar_distillations("Rotate signing keys", DistillationType.HEURISTIC) == []
+
+
+def test_existing_database_gets_bucket_keys_on_open(tmp_path):
+    db = tmp_path / "eidos.db"
+    EidosStore(str(db)).save_distillation(_d("old", "Vacuum the database weekly"))
+    with sqlite3.connect(db) as conn:  # back to the pre-LSH schema
+        for name in ("distillation_lsh", "distillation_lsh_pending"):
+            conn.execute(f"DROP TABLE {name}")
+        for name in ("trg_distillations_lsh_ai", "trg_distillations_lsh_au", "trg_distillations_lsh_ad"):
+            conn.execute(f"DROP TRIGGER {name}")
+
+    store = EidosStore(str(db))
+    assert store.save_distillation(_d("new", "vacuum the database weekly")) == "old"
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(DISTINCT distillation_id) FROM distillation_lsh").fetchone()[0] == 1
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+
+from lib.eidos.models import Distillation, DistillationType
+from lib.eidos.retriever import StructuralRetriever
+from lib.eidos.store import EidosStore
+
+
+def _d(did, statement, triggers=(), domains=(), dtype=DistillationType.HEURISTIC, confidence=0.6):
+    return Distillation(
+        distillation_id=did, type=dtype, statement=statement,
+        triggers=list(triggers), domains=list(domains), confidence=confidence,
+    )
+
+
+def _ids(items):
+    return sorted(d.distillation_id for d in items)
+
+
+def test_trigger_and_domain_lookups_match_whole_terms_and_prefixes(tmp_path):
+    store = EidosStore(str(tmp_path / "eidos.db"))
+    store.save_distillation(_d("d1", "Check token expiry first", triggers=["Auth", "token"], domains=["api"]))
+    store.save_distillation(_d("d2", "Rotate signing keys", triggers=["authentication"], domains=["security"]))
+    store.save_distillation(_d("d3", "Prefer OAuth device flow", triggers=["oauth", "th"]))
+
+    assert _ids(store.get_distillations_by_trigger("auth")) == ["d1", "d2"]  # no '%auth%' hit on oauth
+    assert _ids(store.get_distillations_by_trigger("AUTH", prefix=False)) == ["d1"]
+    assert _ids(store.get_distillations_by_trigger('h", "to')) == []  # no match across JSON elements
+    assert _ids(store.get_distillations_by_domain("sec")) == ["d2"]
+    assert store.get_distillations_by_trigger("  ") == []
+
+
+def test_index_follows_merges_updates_and_deletes(tmp_path):
+    store = EidosStore(str(tmp_path / "eidos.db"))
+    store.save_distillation(_d("d1", "Run migrations before deploy", triggers=["deploy"]))
+    merged_id = store.save_distillation(_d("d9", "RUN migrations before deploy", triggers=["migrate"]))
+    assert merged_id == "d1"
+    assert _ids(store.get_distillations_by_trigger("migrate")) == ["d1"]
+
+    with store._db.write() as conn:
+        conn.execute("UPDATE distillations SET triggers = ? WHERE distillation_id = 'd1'", (json.dumps(["release"]),))
+    assert store.get_distillations_by_trigger("deploy") == []
+    assert _ids(store.get_distillations_by_trigger("release")) == ["d1"]
+
+    with store._db.write() as conn:
+        conn.execute("DELETE FROM distillations WHERE distillation_id = 'd1'")
+        assert conn.execute("SELECT COUNT(*) FROM distillation_triggers").fetchone()[0] == 0
+    assert store.search_distillations("migrations") == []
+
+
+def test_existing_database_is_backfilled_on_open(tmp_path):
+    db = tmp_path / "eidos.db"
+    EidosStore(str(db)).close()
+    with sqlite3.connect(db) as conn:  # back to the pre-index schema
+        for name in ("distillation_triggers", "distillation_domains", "distillations_fts"):
+            conn.execute(f"DROP TABLE {name}")
+        for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.executemany(
+            "INSERT INTO distillations (distillation_id, type, statement, domains, triggers) VALUES (?, ?, ?, ?, ?)",
+            [
+                ("old1", "heuristic", "Vacuum the database weekly", '["sqlite"]', '["Vacuum", 3, ""]'),
+                ("old2", "sharp_edge", "Shell quoting breaks on spaces", "[]", '["bash"]'),
+            ],
+        )
+
+    store = EidosStore(str(db))
+    assert _ids(store.get_distillations_by_trigger("vacuum")) == ["old1"]
+    assert _ids(store.get_distillations_by_domain("sqlite")) == ["old1"]
+    assert _ids(store.get_distillations_by_trigger("bash")) == ["old2"]
+    assert _ids(store.search_distillations("why do spaces break quoting", types=[DistillationType.SHARP_EDGE])) == ["old2"]
+
+    EidosStore(str(db))  # reopening does not duplicate rows
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM distillation_triggers").fetchone()[0] == 2
+
+
+def test_concurrent_first_opens_backfill_fts_once(tmp_path):
+    db = tmp_path / "eidos.db"
+    store = EidosStore(str(db))
+    for i in range(50):
+        store.save_distillation(_d(f"d{i}", f"Distinct lesson number {i} about caching layer {i}"))
+    store.close()
+    with sqlite3.connect(db) as conn:
+        conn.execute("DROP TABLE distillations_fts")
+        for name in ("trg_distillations_fts_ai", "trg_distillations_fts_au", "trg_distillations_fts_ad"):
+            conn.execute(f"DROP TRIGGER {name}")
+
+    barrier = threading.Barrier(6)
+    errors = []
+
+    def _open():
+        barrier.wait()
+        try:
+            EidosStore(str(db)).close()
+        except Exception as exc:  # pragma: no cover - the failure being guarded against
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_open) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM distillations_fts").fetchone()[0] == 50
+
+
+def test_retriever_sees_full_text_matches_beyond_top_confidence_scan(tmp_path):
+    store = EidosStore(str(tmp_path / "eidos.db"))
+    for i in range(25):
+        store.save_distillation(_d(
+            f"hi{i}", f"Unrelated high confidence rule number {i} about caching layer {i}",
+            dtype=DistillationType.SHARP_EDGE, confidence=0.95,
+        ))
+    store.save_distillation(_d(
+        "low", "Docker volume permissions reset after container rebuild",
+        dtype=DistillationType.SHARP_EDGE, confidence=0.2,
+    ))
+    retriever = StructuralRetriever(store=store)
+    found = retriever._get_similar_failures("docker volume permissions look wrong after rebuild")
+    assert [d.distillation_id for d in found] == ["low"]
@@ -118,3 +118,19 @@ def test_record_exposures_redacts_secrets(tmp_path, monkeypatch):
     assert "sk-REDACTED" not in saved
     assert "[REDACTED" in saved
 
+
+
+def test_read_recent_exposures_right_after_segment_seal(tmp_path, monkeypatch):
+    exposures_file = tmp_path / "exposures.jsonl"
+    monkeypatch.setattr(et, "EXPOSURES_FILE", exposures_file)
+    monkeypatch.setattr(et, "LAST_EXPOSURE_FILE", tmp_path / "last_exposure.json")
+    monkeypatch.setattr(et, "EXPOSURES_SEGMENT_BYTES", 1)  # every append seals the active file
+
+    et.record_exposures(
+        source="unit_test",
+        items=[{"insight_key": f"ins:{i}", "category": "reasoning", "text": f"item {i}"} for i in range(3)],
+    )
+
+    assert not exposures_file.exists()
+    rows = et.read_recent_exposures(limit=10)
+    assert [r["insight_key"] for r in rows] == ["ins:2", "ins:1", "ins:0"]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_module():
+    root = Path(__file__).resolve().parents[1]
+    module_path = root / "benchmarks" / "hermetic_bench.py"
+    spec = importlib.util.spec_from_file_location("hermetic_bench", module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("failed to load hermetic_bench module")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _report(p50, p90, n=50, seed=42):
+    return {
+        "seed": seed,
+        "scale": 1.0,
+        "environment": {"platform": "linux", "machine": "x86_64", "python": "3.12"},
+        "suites": {"ingest": {"metrics": {"quick_capture": {"n": n, "p50_ms": p50, "p90_ms": p90}}}},
+    }
+
+
+def test_compare_flags_only_large_well_sampled_slowdowns():
+    mod = _load_module()
+    base = _report(2.0, 4.0)
+
+    slow = mod.compare_reports(_report(5.0, 4.2), base, threshold=0.5, min_delta_ms=0.5)
+    assert [(r["metric"], r["stat"]) for r in slow["regressions"]] == [("quick_capture", "p50_ms")]
+    assert slow["environment_mismatch"] == [] and not slow["seed_or_scale_mismatch"]
+
+    # Tiny absolute deltas and single-sample metrics never gate.
+    assert mod.compare_reports(_report(0.01, 0.02), _report(0.001, 0.002), 0.5, 0.5)["regressions"] == []
+    assert mod.compare_reports(_report(50.0, 50.0, n=1), _report(2.0, 2.0, n=1), 0.5, 0.5)["regressions"] == []
+    assert mod.compare_reports(_report(2.0, 4.0, seed=7), base, 0.5, 0.5)["seed_or_scale_mismatch"]
+
+
+def test_generators_are_deterministic_per_seed():
+    root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(root))
+    from benchmarks.generators.hook_events import generate_chip_specs, generate_hook_events
+
+    events = generate_hook_events(120, seed=3)
+    assert len(events) == 120
+    assert events == generate_hook_events(120, seed=3)
+    assert events != generate_hook_events(120, seed=4)
+    assert {e["event_type"] for e in events} >= {"user_prompt", "pre_tool", "post_tool"}
+    assert generate_chip_specs(5, seed=3) == generate_chip_specs(5, seed=3)
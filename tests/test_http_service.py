@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+from lib.http_service import JobRunner, PooledHTTPServer
+
+
+def test_job_runner_coalesces_queued_jobs_and_records_errors():
+    runner = JobRunner(max_workers=1, max_retained=3)
+    gate = threading.Event()
+    try:
+        first = runner.submit("cycle", lambda: gate.wait(5) and {"n": 1})
+        while runner.get(first["job_id"])["status"] == "queued":
+            pass
+        second = runner.submit("cycle", lambda: {"n": 2})
+        third = runner.submit("cycle", lambda: {"n": 3})
+        assert third["job_id"] == second["job_id"] and third["coalesced"]
+        failing = runner.submit("other", lambda: 1 / 0)
+
+        gate.set()
+        assert runner.wait(first["job_id"], timeout=5)["result"] == {"n": 1}
+        assert runner.wait(second["job_id"], timeout=5)["result"] == {"n": 2}
+        err = runner.wait(failing["job_id"], timeout=5)
+        assert err["status"] == "error" and "ZeroDivisionError" in err["error"]
+        assert runner.summary() == {"queued": 0, "running": 0, "done": 2, "error": 1}
+
+        runner.submit("later", lambda: None)
+        assert len(runner.list()) == 3
+        assert runner.get(first["job_id"]) is None
+    finally:
+        gate.set()
+        runner.shutdown(wait=True)
+
+
+def test_pooled_server_rejects_when_all_workers_are_busy():
+    release = threading.Event()
+
+    class _Slow(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):
+            return
+
+        def do_GET(self):
+            release.wait(5)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    server = PooledHTTPServer(("127.0.0.1", 0), _Slow, max_workers=1, admission_timeout_s=0.05)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    addr = server.server_address
+    try:
+        busy = socket.create_connection(addr, timeout=5)
+        busy.sendall(b"GET / HTTP/1.0\r\n\r\n")
+        while server.pool_stats()["in_flight"] < 1:
+            pass
+        extra = socket.create_connection(addr, timeout=5)
+        extra.sendall(b"GET / HTTP/1.0\r\n\r\n")
+        assert extra.recv(64).startswith(b"HTTP/1.1 503")
+        extra.close()
+
+        release.set()
+        assert busy.recv(64).startswith(b"HTTP/1.0 200")
+        busy.close()
+        assert server.pool_stats()["rejected_busy"] == 1
+    finally:
+        release.set()
+        server.shutdown()
+        server.server_close()
+
+
+class _Echo(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = 5
+
+    def log_message(self, fmt, *args):
+        return
+
+    def do_GET(self):
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_idle_keepalive_connections_do_not_hold_worker_slots():
+    from adapters._common import KeepAliveClient
+
+    server = PooledHTTPServer(("127.0.0.1", 0), _Echo, max_workers=1, admission_timeout_s=0.2, idle_timeout_s=1.0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = "http://127.0.0.1:%d" % server.server_address[1]
+    clients = [KeepAliveClient(base) for _ in range(4)]
+    try:
+        for i, client in enumerate(clients):
+            assert client.request("GET", f"/c{i}") == (200, f"/c{i}".encode())
+        # Every client is parked between requests and reuses its connection.
+        for i, client in enumerate(clients):
+            assert client.request("GET", f"/again{i}") == (200, f"/again{i}".encode())
+        assert all(c.connects == 1 for c in clients)
+        deadline = time.monotonic() + 5
+        while server.pool_stats()["idle_connections"] < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)  # the last response goes out just before its connection is parked
+        stats = server.pool_stats()
+        assert stats["rejected_busy"] == 0 and stats["idle_connections"] == 4
+
+        # Pipelined requests buffered behind the first one are still answered.
+        raw = socket.create_connection(server.server_address, timeout=5)
+        raw.sendall(b"GET /p1 HTTP/1.1\r\nHost: x\r\n\r\nGET /p2 HTTP/1.1\r\nHost: x\r\n\r\n")
+        data = b""
+        while data.count(b"HTTP/1.0 200") + data.count(b"HTTP/1.1 200") < 2 or not data.endswith(b"/p2"):
+            data += raw.recv(4096)
+        raw.close()
+
+        deadline = time.monotonic() + 5
+        while server.pool_stats()["idle_connections"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert server.pool_stats()["idle_connections"] == 0  # idle timeout closed them
+    finally:
+        for client in clients:
+            client.close()
+        server.shutdown()
+        server.server_close()
@@ -4,6 +4,7 @@ import contextlib
 import time
 
 from lib import advice_feedback
+from lib import append_log
 from lib import implicit_outcome_tracker
 from lib import outcome_log
 
@@ -33,7 +34,7 @@ def test_outcome_log_append_uses_fail_closed_lock(monkeypatch, tmp_path):
         calls.append(kwargs)
         yield
 
-    monkeypatch.setattr(outcome_log, "file_lock_for", _fake_lock)
+    monkeypatch.setattr(append_log, "file_lock_for", _fake_lock)
     monkeypatch.setattr(outcome_log, "OUTCOMES_FILE", tmp_path / "outcomes.jsonl")
     monkeypatch.setattr(outcome_log, "OUTCOMES_FILE_MAX", 100)
 
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+import lib.memory_ann as memory_ann
+import lib.memory_store as memory_store
+
+pytestmark = pytest.mark.skipif(memory_ann._np is None, reason="numpy unavailable")
+
+DIM = 16
+
+
+def _clustered_vectors(n: int, clusters: int = 8, seed: int = 7):
+    rng = random.Random(seed)
+    centers = [[rng.gauss(0.0, 1.0) for _ in range(DIM)] for _ in range(clusters)]
+    out = []
+    for i in range(n):
+        c = centers[i % clusters]
+        out.append([x + rng.gauss(0.0, 0.15) for x in c])
+    return out
+
+
+def _configure(tmp_path: Path, monkeypatch, vectors_by_text):
+    monkeypatch.setattr(memory_store, "DB_PATH", tmp_path / "memory_store.sqlite")
+    monkeypatch.setattr(memory_store, "_FTS_AVAILABLE", None)
+    monkeypatch.setattr(
+        memory_store,
+        "_embed_texts",
+        lambda texts: [vectors_by_text[t] for t in texts] if all(t in vectors_by_text for t in texts) else None,
+    )
+    monkeypatch.setattr(memory_ann, "ANN_ENABLED", True)
+    monkeypatch.setattr(memory_ann, "ANN_MIN_VECTORS", 100)
+
+
+def _store(n: int, vectors_by_text):
+    for i, vec in enumerate(_clustered_vectors(n)):
+        text = f"memory number {i} about topic {i % 8}"
+        vectors_by_text[text] = vec
+        memory_store.upsert_entry(
+            memory_id=f"m{i}",
+            content=text,
+            scope="global",
+            project_key=None,
+            category="context",
+            created_at=1000.0 + i,
+            source="test",
+        )
+
+
+def test_index_builds_at_threshold_and_assigns_incrementally(tmp_path, monkeypatch):
+    vectors = {}
+    _configure(tmp_path, monkeypatch, vectors)
+    _store(99, vectors)
+    assert memory_store.maintain_ann_index()["reason"] == "not_due"
+    assert memory_store.ann_status()["built"] is False
+
+    _store(140, vectors)  # ids m0..m98 are replaced, m99..m139 are new
+    status = memory_store.ann_status()
+    assert (status["built"], status["rebuild_due"], status["pending_vectors"]) == (False, True, 140)
+    memory_store.maintain_ann_index()
+    status = memory_store.ann_status()
+    assert status["built"] is True
+    assert status["indexed"] == 140
+    assert status["nlist"] >= 2
+
+    _store(160, vectors)  # new vectors are assigned on write once built
+    assert memory_store.ann_status()["indexed"] == 160
+
+
+def test_writes_only_flag_builds_and_count_without_scanning(tmp_path, monkeypatch):
+    vectors = {}
+    _configure(tmp_path, monkeypatch, vectors)
+    _store(1, vectors)  # seeds the pre-build count once
+
+    def _forbidden(*_args, **_kwargs):
+        raise AssertionError("upsert must not scan or train")
+
+    monkeypatch.setattr(memory_ann, "_dominant_dim", _forbidden)
+    monkeypatch.setattr(memory_ann, "_train", _forbidden)
+    _store(150, vectors)
+    status = memory_store.ann_status()
+    assert (status["built"], status["rebuild_due"], status["pending_vectors"]) == (False, True, 150)
+
+
+def test_ann_search_matches_exact_top_hit(tmp_path, monkeypatch):
+    vectors = {}
+    _configure(tmp_path, monkeypatch, vectors)
+    _store(400, vectors)
+    memory_store.maintain_ann_index()
+
+    conn = memory_store._connect()
+    try:
+        assert memory_ann.status(conn)["built"] is True
+        queries = _clustered_vectors(20, seed=99)
+        agree = 0
+        for q in queries:
+            exact = memory_ann.exact_search(conn, q, k=1)
+            approx = memory_ann.search(conn, q, k=1, nprobe=4)
+            agree += int(bool(approx) and approx[0][0] == exact[0][0])
+        assert agree >= 18
+    finally:
+        conn.close()
+
+
+def test_retrieve_adds_vector_only_candidates(tmp_path, monkeypatch):
+    vectors = {}
+    _configure(tmp_path, monkeypatch, vectors)
+    _store(50, vectors)
+    vectors["kubernetes"] = list(vectors["memory number 3 about topic 3"])
+
+    results = memory_store.retrieve("kubernetes", limit=3)
+    assert results
+    assert results[0]["entry_id"] == "m3"
+    assert results[0]["ann_similarity"] == pytest.approx(1.0, abs=1e-3)
+
+
+def test_purge_drops_ann_assignments(tmp_path, monkeypatch):
+    vectors = {}
+    _configure(tmp_path, monkeypatch, vectors)
+    _store(120, vectors)
+    memory_store.maintain_ann_index()
+    conn = memory_store._connect()
+    try:
+        conn.execute("UPDATE memories SET content = 'User was satisfied after: x' WHERE memory_id = 'm5'")
+        conn.commit()
+    finally:
+        conn.close()
+
+    memory_store.purge_telemetry_memories(dry_run=False)
+    assert memory_store.ann_status()["indexed"] == 119
+
+
+def test_retrain_runs_in_maintenance_and_empty_store_skips_embedding(tmp_path, monkeypatch):
+    vectors = {}
+    _configure(tmp_path, monkeypatch, vectors)
+    calls = []
+    embed = memory_store._embed_texts
+    monkeypatch.setattr(memory_store, "_embed_texts", lambda texts: calls.append(texts) or embed(texts))
+    assert memory_store.retrieve("kubernetes") == []
+    assert calls == []  # no rows: nothing to embed the query against
+
+    monkeypatch.setattr(memory_ann, "ANN_REBUILD_GROWTH", 1.5)
+    _store(100, vectors)
+    memory_store.maintain_ann_index()
+    assert memory_store.ann_status()["built_count"] == 100
+    _store(150, vectors)  # growth 1.5x flags a retrain; the writer does not run it
+    status = memory_store.ann_status()
+    assert (status["built_count"], status["rebuild_due"]) == (100, True)
+    memory_store.maintain_ann_index()
+    status = memory_store.ann_status()
+    assert (status["built_count"], status["indexed"], status["rebuild_due"]) == (150, 150, False)
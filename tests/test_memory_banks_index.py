@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+import random
+import re
+import time
+from pathlib import Path
+
+import lib.memory_banks as memory_banks
+import lib.memory_store as memory_store
+
+# No word is a substring of another except as a prefix, so prefix matching
+# over the index finds exactly what the old substring scan found.
+_WORDS = (
+    "deploy deployment rollback cache schema migration token retry timeout "
+    "parser lint format queue worker budget latency python tests fixture"
+).split()
+
+
+def _configure(tmp_path: Path, monkeypatch) -> None:
+    banks_dir = tmp_path / "banks"
+    monkeypatch.setattr(memory_banks, "BANK_DIR", banks_dir)
+    monkeypatch.setattr(memory_banks, "GLOBAL_FILE", banks_dir / "global_user.jsonl")
+    monkeypatch.setattr(memory_banks, "PROJECTS_DIR", banks_dir / "projects")
+    monkeypatch.setattr(memory_store, "retrieve", lambda *a, **k: [])
+    (banks_dir / "projects").mkdir(parents=True)
+
+
+def _row(i: int, text: str, project_key=None, age_s: float = 3600.0) -> dict:
+    return {
+        "entry_id": f"e{i}",
+        "created_at": time.time() - age_s + i * 0.01,  # appended in time order
+        "scope": "project" if project_key else "global",
+        "project_key": project_key,
+        "category": "context",
+        "text": text,
+    }
+
+
+def _write(path: Path, rows, mode: str = "a") -> None:
+    with path.open(mode, encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def _scan_retrieve(query: str, project_key, limit: int):
+    """The pre-index algorithm: substring-score the last 800 lines of each bank."""
+    q = query.lower().strip()
+    candidates = []
+    for path in ([memory_banks.PROJECTS_DIR / f"{project_key}.jsonl"] if project_key else []) + [memory_banks.GLOBAL_FILE]:
+        if path.exists():
+            lines = path.read_text(encoding="utf-8").splitlines()[-800:]
+            candidates.extend(json.loads(ln) for ln in reversed(lines))
+    q_words = [w for w in re.split(r"\W+", q) if len(w) > 2]
+    now = time.time()
+    scored = []
+    for it in candidates:
+        text = (it.get("text") or "").lower()
+        if not text or memory_banks._is_telemetry_memory(text):
+            continue
+        score = (2.0 if q in text else 0.0) + 0.25 * sum(1 for w in q_words[:8] if w in text)
+        if project_key and it.get("project_key") == project_key:
+            score += 0.4
+        score += min(0.4, 50000.0 / max(1.0, now - float(it.get("created_at") or 0.0)) / 100000.0)
+        if score > 0.25:
+            scored.append((score, it))
+    scored.sort(key=lambda t: t[0], reverse=True)
+    return [it["entry_id"] for _, it in scored[:limit]]
+
+
+def test_indexed_retrieve_matches_window_scan(tmp_path, monkeypatch):
+    _configure(tmp_path, monkeypatch)
+    rng = random.Random(11)
+    project_file = memory_banks.PROJECTS_DIR / "proj.jsonl"
+    _write(project_file, [_row(i, " ".join(rng.sample(_WORDS, 5)), "proj") for i in range(300)])
+    _write(memory_banks.GLOBAL_FILE, [_row(1000 + i, " ".join(rng.sample(_WORDS, 5))) for i in range(1200)])
+
+    for query in ("rollback deploy", "cache timeout", "python tests fixture", "worker", "unrelated words"):
+        for project_key in ("proj", None):
+            got = [it["entry_id"] for it in memory_banks.retrieve(query, project_key=project_key, limit=6)]
+            assert got == _scan_retrieve(query, project_key, 6), (query, project_key)
+
+    # Appends are picked up incrementally; rows past the window drop out.
+    _write(memory_banks.GLOBAL_FILE, [_row(5000, "fresh rollback note", age_s=0.0)])
+    assert memory_banks.retrieve("fresh rollback", limit=1)[0]["entry_id"] == "e5000"
+    _write(memory_banks.GLOBAL_FILE, [_row(6000 + i, "filler lint") for i in range(800)])
+    assert "e5000" not in [it["entry_id"] for it in memory_banks.retrieve("fresh rollback", limit=6)]
+
+
+def test_rewritten_bank_is_reindexed(tmp_path, monkeypatch):
+    _configure(tmp_path, monkeypatch)
+    _write(memory_banks.GLOBAL_FILE, [_row(1, "retry the parser"), _row(2, "pin the schema migration")])
+    assert [it["entry_id"] for it in memory_banks.retrieve("schema migration")] == ["e2"]
+
+    # e.g. purge_telemetry_entries rewriting the file in place
+    _write(memory_banks.GLOBAL_FILE, [_row(3, "squash schema migration before deploy")], mode="w")
+    assert [it["entry_id"] for it in memory_banks.retrieve("schema migration")] == ["e3"]
@@ -440,6 +440,51 @@ def test_insight_effectiveness_retest_after_cooldown(monkeypatch):
     assert score >= 0.5
 
 
+
+def test_insight_aggregates_track_outcomes_and_persist():
+    """Per-insight counters follow retrieval resets and survive a reload."""
+    import json
+
+    ralph = MetaRalph()
+    ralph.track_retrieval("a1", "advice", insight_key="k:agg", source="cognitive", trace_id="t1")
+    ralph.track_outcome("a1", "good", "ok", trace_id="t1")
+    ralph.track_retrieval("a2", "advice", insight_key="k:agg", source="cognitive", trace_id="t2")
+    ralph.track_outcome("a2", "bad", "nope", trace_id="t2-other")
+    ralph.track_outcome("tool:x", "good", "tool-level")  # no insight key
+
+    agg = ralph.get_insight_aggregate("k:agg")
+    assert (agg["weak_good"], agg["weak_bad"], agg["strict_good"], agg["strict_bad"]) == (1, 1, 1, 0)
+    assert agg["last_strict_at"]
+
+    # A new retrieval starts a fresh attempt and drops the old sample.
+    ralph.track_retrieval("a1", "advice", insight_key="k:agg", source="cognitive", trace_id="t3")
+    agg = ralph.get_insight_aggregate("k:agg")
+    assert (agg["weak_good"], agg["weak_bad"], agg["strict_good"]) == (0, 1, 0)
+    assert agg["last_strict_at"] is None
+    assert ralph.check_insight_aggregates()["ok"] is True
+
+    data = json.loads(MetaRalph.OUTCOME_TRACKING_FILE.read_text(encoding="utf-8"))
+    assert data["insight_aggregates"]["k:agg"]["weak_bad"] == 1
+    reloaded = MetaRalph()
+    assert reloaded.get_insight_aggregate("k:agg") == ralph.get_insight_aggregate("k:agg")
+    assert reloaded.get_insight_effectiveness("k:agg") == ralph.get_insight_effectiveness("k:agg")
+
+
+def test_insight_aggregate_check_detects_and_repairs_drift():
+    """In-place record edits bypass the counters; the check flags and repairs them."""
+    ralph = MetaRalph()
+    ralph.track_retrieval("d1", "advice", insight_key="k:drift", source="cognitive", trace_id="t1")
+    ralph.track_outcome("d1", "good", "ok", trace_id="t1")
+
+    ralph.outcome_records["d1"].outcome = "bad"
+    report = ralph.check_insight_aggregates()
+    assert report["ok"] is False
+    assert report["mismatches"][0]["insight_key"] == "k:drift"
+
+    assert ralph.check_insight_aggregates(repair=True)["repaired"] is True
+    assert ralph.check_insight_aggregates()["ok"] is True
+    assert ralph.get_insight_aggregate("k:drift")["weak_bad"] == 1
+
 def run_all_tests():
     """Run all tests and report results."""
     print("=" * 60)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import lib.advisor  # noqa: F401  registers the advice profiles
+import lib.advisory_gate  # noqa: F401
+import lib.bridge_cycle  # noqa: F401
+import lib.cognitive_learner  # noqa: F401
+import lib.memory_capture  # noqa: F401
+import lib.noise_patterns  # noqa: F401
+import lib.primitive_filter  # noqa: F401
+from lib import noise_classifier as nc
+
+# Texts from the benchmark generators plus one example per rule, with the
+# profiles each pre-engine filter flagged as noise.
+CORPUS = Path(__file__).resolve().parent / "fixtures" / "noise_corpus.jsonl"
+
+PROFILES = (
+    "insight", "primitive", "advisory_primitive", "bridge_insight", "capture",
+    "advice_inventory", "advice_struggle", "advice_transcript", "advice_metadata", "common",
+)
+
+
+def _corpus():
+    with CORPUS.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_verdicts_match_recorded_filters(profile):
+    rows = _corpus()
+    mismatched = [
+        row["text"][:80] for row in rows
+        if nc.classify(row["text"], profile).noise != (profile in row["noise"])
+    ]
+    assert not mismatched
+    assert any(profile in row["noise"] for row in rows)
+
+
+def test_verdicts_carry_first_matching_reason():
+    assert nc.classify("Sequence 'Read -> Edit' worked well", "insight").reason == "tool_sequence"
+    assert nc.classify("Cycle summary: Bash used 3 times (100% success).", "insight").reason == "cycle_telemetry"
+    assert nc.classify("", "insight") == nc.NoiseVerdict(True, "empty", "insight")
+    clean = nc.classify("Always pin dependency versions in CI because upgrades break builds", "insight")
+    assert not clean and clean.reason == ""
+
+    assert nc.classify("said it like this: ok", "advice").reason == "transcript_artifact"
+    assert nc.classify("[cognitive] I struggle with Bash_error tasks", "advice").reason == "low_signal_struggle"
+    assert nc.classify("Service inventory: code_style = x", "advice").reason == "inventory_style"
+
+
+def test_combined_matchers_keep_rule_order():
+    ruleset = nc.NoiseRuleSet("t", (
+        nc.check("long", lambda f: len(f["t"]) > 40),
+        nc.pattern("floating", r"b+c"),
+        nc.prefixes("prefix", ("ab",)),
+        nc.pattern("anchored", r"^x|^ab", when=lambda f: "z" in f["tl"]),
+        nc.contains("literal", ("zz", "q")),
+    ))
+    assert ruleset.evaluate("abbc").reason == "floating"
+    assert ruleset.evaluate("abz").reason == "prefix"
+    assert ruleset.evaluate("xz").reason == "anchored"
+    assert ruleset.evaluate("x").reason == ""
+    assert ruleset.evaluate("  yq").reason == "literal"
+    assert ruleset.evaluate("q" * 50).reason == "long"
+    assert nc._is_anchored(r"^a|\Ab", 0) and not nc._is_anchored(r"^a|b", 0)
+    assert not nc._is_anchored(r"(^a|b)", 0) and not nc._is_anchored(r"^a", 8)  # re.M
+
+
+def test_cache_is_keyed_by_profile_and_text():
+    nc.clear_cache()
+    text = "User wanted: tests"
+    assert nc.classify(text, "insight").noise
+    assert not nc.classify(text, "primitive").noise
+    assert nc.classify(text, "insight").noise
+    info = nc.cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (1, 2, 2)
+
+    nc.register("tmp_profile", (nc.contains("x", ("tests",)),))
+    try:
+        assert nc.cache_info()["size"] == 0  # re-registering drops stale verdicts
+        assert nc.classify(text, "tmp_profile").reason == "x"
+    finally:
+        nc._PROFILES.pop("tmp_profile", None)
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 
-from hooks import observe
+from hooks import observe_runtime as observe
 from lib.queue import EventType
 
 
@@ -102,3 +102,25 @@ def test_workflow_summary_state_and_report(tmp_path, monkeypatch):
     assert payload["tool_failures"] == 1
     assert payload["tool_successes"] == 1
     assert payload["recovery_tools"] == ["Bash"]
+
+
+def test_hook_settings_come_from_the_forwarded_env(monkeypatch):
+    monkeypatch.setenv("SPARK_EIDOS_ENABLED", "1")
+    monkeypatch.setenv("SPARK_OBSERVE_TELEMETRY", "0")
+    settings = observe.resolve_hook_settings({"SPARK_EIDOS_ENABLED": "0", "SPARK_HOOK_PAYLOAD_TEXT_LIMIT": "64"})
+    assert settings.eidos_enabled is False
+    assert settings.hook_payload_text_limit == 64
+    # Vars the client did not forward are unset for the call, not the server's.
+    assert settings.telemetry_enabled is True
+    assert observe.resolve_hook_settings().telemetry_enabled is False
+
+
+def test_hook_settings_follow_tuneables_edits(tmp_path, monkeypatch):
+    import lib.config_authority as config_authority
+
+    runtime = tmp_path / "tuneables.json"
+    monkeypatch.setattr(config_authority, "DEFAULT_RUNTIME_PATH", runtime)
+    runtime.write_text(json.dumps({"observe_hook": {"eidos_enabled": False}}), encoding="utf-8")
+    assert observe.resolve_hook_settings({}).eidos_enabled is False
+    runtime.write_text(json.dumps({"observe_hook": {"eidos_enabled": True}}), encoding="utf-8")
+    assert observe.resolve_hook_settings({}).eidos_enabled is True
@@ -0,0 +1,106 @@
+import json
+import socket
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from hooks import observe
+from hooks import observe_runtime
+from hooks import observe_server
+
+
+def test_forward_unix_missing_socket_is_unavailable(tmp_path):
+    with pytest.raises(observe.ServerUnavailable):
+        observe._forward_unix(b"{}", socket_path=tmp_path / "missing.sock")
+
+
+def test_forward_http_closed_port_is_unavailable():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    with pytest.raises(observe.ServerUnavailable):
+        observe._forward_http(b"{}", port=port)
+
+
+def test_run_hook_event_captures_output_and_exit_code(monkeypatch, capsys):
+    def _fake_handle(input_data, *, out, err, env=None):
+        out.write("advice for " + input_data["tool_name"])
+        err.write("[EIDOS] BLOCKED\n")
+        raise SystemExit(2)
+
+    monkeypatch.setattr(observe_runtime, "handle_hook_event", _fake_handle)
+    result = observe_runtime.run_hook_event({"tool_name": "Bash"})
+    assert result == {"stdout": "advice for Bash", "stderr": "[EIDOS] BLOCKED\n", "exit_code": 2}
+    # The process streams stay untouched, so concurrent hooks cannot interleave.
+    assert capsys.readouterr() == ("", "")
+
+
+def test_process_payload_unwraps_forwarded_env(monkeypatch):
+    seen = []
+
+    def _fake_run(input_data, env=None):
+        seen.append((input_data, env))
+        return {"stdout": "", "stderr": "", "exit_code": 0}
+
+    monkeypatch.setattr(observe_runtime, "run_hook_event", _fake_run)
+    monkeypatch.setenv("SPARK_EIDOS_ENABLED", "0")
+    monkeypatch.setenv("SPARK_MIND_TOKEN", "not-forwarded")
+    monkeypatch.delenv("SPARK_OBSERVE_TELEMETRY", raising=False)
+    observe_server.process_payload(observe.wrap_payload(b'{"hook_event_name": "Stop"}\n'))
+    observe_server.process_payload(b'{"hook_event_name": "Stop"}')
+    assert seen == [
+        ({"hook_event_name": "Stop"}, {"SPARK_EIDOS_ENABLED": "0"}),
+        ({"hook_event_name": "Stop"}, None),
+    ]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets unavailable")
+def test_unix_socket_round_trip(monkeypatch):
+    seen = []
+
+    def _fake_process(body):
+        seen.append(json.loads(body))
+        return {"stdout": "ok", "stderr": "", "exit_code": 0}
+
+    monkeypatch.setattr(observe_server, "process_payload", _fake_process)
+    sock_path = Path(tempfile.mkdtemp(prefix="spk")) / "o.sock"
+    server = observe_server._UnixServer(str(sock_path), observe_server.UnixHookHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        result = observe._forward_unix(b'{"hook_event_name": "PreToolUse"}', socket_path=sock_path)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert result["stdout"] == "ok"
+    assert seen == [{"hook_event_name": "PreToolUse"}]
+
+
+def test_http_hook_requires_header(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), observe_server.HTTPHookHandler)
+    port = server.server_address[1]
+    monkeypatch.setattr(observe_server, "_ALLOWED_HOSTS", {f"127.0.0.1:{port}"})
+    monkeypatch.setattr(
+        observe_server,
+        "process_payload",
+        lambda body: {"stdout": "", "stderr": "warm", "exit_code": 0},
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        import http.client
+
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+        conn.request("POST", "/hook", body=b"{}", headers={"Content-Type": "application/json"})
+        assert conn.getresponse().status == 403
+        conn.close()
+
+        result = observe._forward_http(b"{}", port=port)
+        assert result["stderr"] == "warm"
+    finally:
+        server.shutdown()
+        server.server_close()
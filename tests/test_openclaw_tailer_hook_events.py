@@ -75,10 +75,11 @@ def test_scan_hook_events_posts_and_advances_offset(tmp_path, monkeypatch):
 
     posted = []
 
-    def _fake_post(url, payload, token=None):
-        posted.append((url, payload, token))
+    def _fake_post_groups(url, groups, token=None):
+        posted.extend((url, evt, token) for group in groups for evt in group)
+        return len(groups), None
 
-    monkeypatch.setattr(tailer, "_post_json", _fake_post)
+    monkeypatch.setattr(tailer, "_post_line_groups", _fake_post_groups)
     state = tailer.SessionState(tmp_path / "state.json")
 
     # First pass registers hook spool in state.
@@ -82,10 +82,11 @@ def test_scan_hook_events_updates_telemetry(tmp_path, monkeypatch):
 
     posted = []
 
-    def _fake_post(url, payload, token=None):
-        posted.append((url, payload, token))
+    def _fake_post_groups(url, groups, token=None):
+        posted.extend((url, evt, token) for group in groups for evt in group)
+        return len(groups), None
 
-    monkeypatch.setattr(tailer, "_post_json", _fake_post)
+    monkeypatch.setattr(tailer, "_post_line_groups", _fake_post_groups)
     state = tailer.SessionState(tmp_path / "state.json")
     metrics = tailer._new_fidelity_metrics()
 
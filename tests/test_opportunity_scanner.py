@@ -636,7 +636,7 @@ def test_generate_llm_self_candidates_honors_forced_provider(monkeypatch):
             return ["minimax", "ollama"]
 
         @staticmethod
-        def _query_provider(provider, _prompt):
+        def _query_provider(provider, _prompt, **_kwargs):
             if provider != "minimax":
                 raise AssertionError("forced provider should prevent fallback calls")
             return '{"opportunities":[{"category":"verification_gap","priority":"high","confidence":0.8,"question":"What proof validates this change?","next_step":"Run one focused test.","rationale":"Need evidence."}]}'
@@ -673,7 +673,7 @@ def test_generate_llm_self_candidates_surfaces_empty_or_timeout(monkeypatch):
             return ["minimax"]
 
         @staticmethod
-        def _query_provider(_provider, _prompt):
+        def _query_provider(_provider, _prompt, **_kwargs):
             return None
 
     monkeypatch.setitem(__import__("sys").modules, "lib.advisory_synthesizer", _DummySynth)
@@ -709,7 +709,7 @@ def test_generate_llm_self_candidates_respects_cooldown(monkeypatch):
             return ["minimax"]
 
         @staticmethod
-        def _query_provider(_provider, _prompt):
+        def _query_provider(_provider, _prompt, **_kwargs):
             return '{"opportunities":[{"category":"verification_gap","priority":"high","confidence":0.8,"question":"What proof validates this change?","next_step":"Run one focused test.","rationale":"Need evidence."}]}'
 
     monkeypatch.setitem(__import__("sys").modules, "lib.advisory_synthesizer", _DummySynth)
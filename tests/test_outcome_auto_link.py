@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import lib.cognitive_learner as cognitive_learner
+from lib import outcome_log
+
+_WORDS = (
+    "deploy rollback cache schema migration token retry timeout parser lint "
+    "queue worker budget latency python fixture auth session config index"
+).split()
+
+
+def _text(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 9)))
+
+
+def _scan_best(outcome_text, insights, min_similarity):
+    """The old pairwise scan: first insight with the strictly best score wins."""
+    best, best_score = None, 0.0
+    for key, text in insights:
+        score = outcome_log._compute_similarity(outcome_text, text)
+        if score > best_score and score >= min_similarity:
+            best, best_score = key, score
+    return best, best_score
+
+
+def test_linker_matches_pairwise_scan():
+    rng = random.Random(5)
+    insights = [(f"i{n}", _text(rng)) for n in range(400)]
+    linker = outcome_log.InsightLinker(insights)
+    for _ in range(200):
+        text = _text(rng)
+        for threshold in (0.2, 0.25, 0.5):
+            best = linker.best_match(text, threshold)
+            key, score = _scan_best(text, insights, threshold)
+            assert (best[0], best[2]) == (key, score) if best else key is None
+
+
+def test_auto_link_writes_all_links_in_one_append(tmp_path, monkeypatch):
+    monkeypatch.setattr(outcome_log, "OUTCOMES_FILE", tmp_path / "outcomes.jsonl")
+    monkeypatch.setattr(outcome_log, "OUTCOME_LINKS_FILE", tmp_path / "outcome_links.jsonl")
+    insights = {
+        "k:cache": SimpleNamespace(insight="invalidate cache keys when the schema changes"),
+        "k:retry": SimpleNamespace(insight="retry flaky network calls with backoff"),
+    }
+    monkeypatch.setattr(cognitive_learner, "get_cognitive_learner", lambda: SimpleNamespace(insights=insights))
+    outcome_log.append_outcomes([
+        {"outcome_id": "o1", "text": "stale cache after schema changes", "created_at": 1.0},
+        {"outcome_id": "o2", "text": "network calls flaky, retry fixed it", "created_at": 2.0},
+        {"outcome_id": "o3", "text": "unrelated observation", "created_at": 3.0},
+    ])
+    appends = []
+    original = outcome_log.AppendLog.append_many
+    monkeypatch.setattr(
+        outcome_log.AppendLog, "append_many", lambda self, rows: appends.append(self.path) or original(self, rows)
+    )
+
+    stats = outcome_log.auto_link_outcomes(min_similarity=0.2)
+
+    assert (stats["linked"], stats["skipped"]) == (2, 1)
+    assert appends == [outcome_log.OUTCOME_LINKS_FILE]
+    links = {l["outcome_id"]: l["insight_key"] for l in outcome_log.get_outcome_links(limit=None)}
+    assert links == {"o1": "k:cache", "o2": "k:retry"}
+    assert outcome_log.link_outcomes_many([{"outcome_id": "o3"}]) == []
@@ -2,6 +2,7 @@ import json
 import threading
 import time
 
+from lib import append_log
 from lib import outcome_log
 
 
@@ -76,7 +77,7 @@ def test_append_outcome_lock_prevents_rotate_append_loss(tmp_path, monkeypatch):
     monkeypatch.setattr(outcome_log, "OUTCOMES_FILE", outcomes_file)
     monkeypatch.setattr(outcome_log, "OUTCOMES_FILE_MAX", 3)
 
-    # Seed large lines so the size heuristic reliably triggers rotation.
+    # Seed past the cap so the append seals a segment and runs retention.
     seed = [
         {"outcome_id": f"seed-{i}", "text": "x" * 360, "created_at": float(i)}
         for i in range(4)
@@ -85,9 +86,9 @@ def test_append_outcome_lock_prevents_rotate_append_loss(tmp_path, monkeypatch):
 
     start_late_append = threading.Event()
     late_done = threading.Event()
-    original_rotate = outcome_log._rotate_jsonl
+    original_seal = append_log.AppendLog._maybe_seal
 
-    def _rotate_with_interleave(path, max_lines):
+    def _seal_with_interleave(self):
         if not start_late_append.is_set():
             start_late_append.set()
 
@@ -100,15 +101,14 @@ def test_append_outcome_lock_prevents_rotate_append_loss(tmp_path, monkeypatch):
             t = threading.Thread(target=_late_writer, daemon=True)
             t.start()
             time.sleep(0.05)
-            original_rotate(path, max_lines)
-            return
-        original_rotate(path, max_lines)
+        original_seal(self)
 
-    monkeypatch.setattr(outcome_log, "_rotate_jsonl", _rotate_with_interleave)
+    monkeypatch.setattr(append_log.AppendLog, "_maybe_seal", _seal_with_interleave)
 
     outcome_log.append_outcome({"outcome_id": "main", "text": "main_marker", "created_at": time.time()})
     assert late_done.wait(timeout=2.0)
 
     rows = outcome_log.read_outcomes(limit=None)
     ids = {str(r.get("outcome_id") or "") for r in rows}
-    assert "late" in ids
+    assert "late" in ids and "main" in ids
+    assert len(rows) >= outcome_log.OUTCOMES_FILE_MAX
@@ -3,7 +3,7 @@ import time
 from types import SimpleNamespace
 
 from lib import prediction_loop as pl
-from lib.queue import EventType, SparkEvent
+from lib.queue import EventType, QueueCursor, SparkEvent
 
 
 def _read_jsonl(path):
@@ -66,10 +66,16 @@ def test_collect_outcomes_captures_post_tool_success(monkeypatch):
         )
     ]
 
-    monkeypatch.setattr(pl, "count_events", lambda: len(events))
-    monkeypatch.setattr(pl, "read_events", lambda limit, offset: events[offset : offset + limit])
-    monkeypatch.setattr(pl, "_load_state", lambda: {"offset": 0, "matched_ids": []})
-    monkeypatch.setattr(pl, "_save_state", lambda _state: None)
+    cursor = QueueCursor(name="prediction", generation="g1")
+    monkeypatch.setattr(pl, "_load_state", lambda: {"matched_ids": []})
+    monkeypatch.setattr(pl, "load_cursor", lambda _name: cursor)
+    monkeypatch.setattr(
+        pl,
+        "read_events_from_cursor",
+        lambda c, limit: (events[:limit], QueueCursor(name=c.name, generation=c.generation, offset=100)),
+    )
+    saved = []
+    monkeypatch.setattr(pl, "save_cursor", saved.append)
 
     captured = {"rows": []}
 
@@ -88,6 +94,7 @@ def test_collect_outcomes_captures_post_tool_success(monkeypatch):
     assert row["polarity"] == "pos"
     assert row["tool"] == "Bash"
     assert "success" in row["text"]
+    assert [c.offset for c in saved] == [100]
 
 
 def test_process_prediction_cycle_runs_auto_link_when_due(monkeypatch):
@@ -48,3 +48,139 @@ def test_rotate_if_needed(tmp_path, monkeypatch):
     rotated = queue.rotate_if_needed()
     assert rotated is True
     assert queue.count_events() == queue.MAX_EVENTS // 2
+
+
+def _patch_cursor_paths(tmp_path: Path, monkeypatch) -> None:
+    _patch_queue_paths(tmp_path, monkeypatch)
+    monkeypatch.setattr(queue, "QUEUE_STATE_FILE", tmp_path / "queue" / "state.json")
+    monkeypatch.setattr(queue, "CURSORS_DIR", tmp_path / "queue" / "cursors")
+    monkeypatch.setattr(queue, "OVERFLOW_FILE", tmp_path / "queue" / "events.overflow.jsonl")
+
+
+def _append(start: int, n: int, newline: str = "\n") -> None:
+    queue.QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+    with queue.EVENTS_FILE.open("ab") as f:
+        for i in range(start, start + n):
+            event = queue.SparkEvent(
+                event_type=queue.EventType.USER_PROMPT,
+                session_id="s1",
+                timestamp=time.time(),
+                data={"i": i},
+            )
+            f.write((json.dumps(event.to_dict()) + newline).encode("utf-8"))
+
+
+def _read(name: str, limit: int = 100) -> list:
+    cursor = queue.load_cursor(name)
+    events, cursor = queue.read_events_from_cursor(cursor, limit=limit)
+    queue.save_cursor(cursor)
+    return [e.data["i"] for e in events]
+
+
+def test_cursor_reads_only_new_events(tmp_path, monkeypatch):
+    _patch_cursor_paths(tmp_path, monkeypatch)
+    _append(0, 5)
+    assert _read("c", limit=3) == [0, 1, 2]
+    assert _read("c") == [3, 4]
+    assert _read("c") == []
+
+    _append(5, 2)
+    with queue.EVENTS_FILE.open("a", encoding="utf-8") as f:
+        f.write('{"partial": ')  # writer mid-append
+    assert queue.count_events_after_cursor(queue.load_cursor("c")) == 2
+    assert _read("c") == [5, 6]
+    assert _read("other") == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_cursor_from_line_offset_skips_that_many_events(tmp_path, monkeypatch):
+    _patch_cursor_paths(tmp_path, monkeypatch)
+    _append(0, 5)
+    assert queue.consume_processed(1) == 1
+
+    queue.save_cursor(queue.cursor_from_line_offset("migrated", 2))
+    assert _read("migrated") == [3, 4]
+    queue.save_cursor(queue.cursor_from_line_offset("past_end", 50))
+    _append(5, 1)
+    assert _read("past_end") == [5]
+
+
+def test_cursor_survives_consume_and_compaction(tmp_path, monkeypatch):
+    _patch_cursor_paths(tmp_path, monkeypatch)
+    _append(0, 10)
+    assert _read("c", limit=6) == [0, 1, 2, 3, 4, 5]
+
+    # Consumed events are skipped by cursors that lag behind the head.
+    assert queue.consume_processed(3) == 3
+    assert _read("lagging", limit=2) == [3, 4]
+
+    monkeypatch.setattr(queue, "QUEUE_COMPACT_HEAD_BYTES", 1)
+    generation = queue._load_queue_state()["generation"]
+    assert queue.consume_processed(5) == 5
+    state = queue._load_queue_state()
+    assert state["head_bytes"] == 0 and state["base_bytes"] > 0
+    assert state["generation"] == generation
+
+    _append(10, 1)
+    assert _read("c") == [8, 9, 10]
+    assert _read("lagging") == [8, 9, 10]
+
+
+def test_cursor_follows_rotation_by_generation(tmp_path, monkeypatch):
+    _patch_cursor_paths(tmp_path, monkeypatch)
+    monkeypatch.setattr(queue, "MAX_EVENTS", 100)
+    monkeypatch.setattr(queue, "_last_count_check", 0.0)
+    _append(0, 120)
+    assert len(_read("c", limit=70)) == 70
+    assert len(_read("behind", limit=10)) == 10
+    generation = queue._load_queue_state()["generation"]
+
+    assert queue.rotate_if_needed() is True  # keeps events 70..119
+    assert queue._load_queue_state()["generation"] != generation
+
+    _append(120, 2)
+    assert _read("c") == list(range(70, 122))
+    # A cursor in the dropped range restarts at the head of the new file.
+    assert _read("behind")[:2] == [70, 71]
+
+
+def test_crlf_queue_offsets_match_the_file(tmp_path, monkeypatch):
+    _patch_cursor_paths(tmp_path, monkeypatch)
+    monkeypatch.setattr(queue, "MAX_EVENTS", 100)
+    monkeypatch.setattr(queue, "_last_count_check", 0.0)
+    _append(0, 120, newline="\r\n")
+
+    queue.save_cursor(queue.cursor_from_line_offset("migrated", 3))
+    assert _read("migrated", limit=2) == [3, 4]
+    assert len(_read("c", limit=75)) == 75
+
+    before = queue.EVENTS_FILE.read_bytes()
+    assert queue.rotate_if_needed() is True  # keeps events 70..119 as written
+    after = queue.EVENTS_FILE.read_bytes()
+    assert before.endswith(after) and after.count(b"\r\n") == 50
+
+    # The cursor maps onto the exact start of its next line, not near it.
+    state = queue._load_queue_state()
+    pos = queue._cursor_logical_offset(queue.load_cursor("c"), state, state["generation"])
+    assert json.loads(after[pos:].split(b"\n", 1)[0])["data"]["i"] == 75
+    _append(120, 1)
+    assert _read("c") == list(range(75, 121))
+    assert _read("migrated", limit=3) == [70, 71, 72]
+
+
+def test_busy_lock_never_writes_state_or_compacts(tmp_path, monkeypatch):
+    _patch_cursor_paths(tmp_path, monkeypatch)
+    _append(0, 4)
+    queue.LOCK_FILE.touch()  # another process holds the queue lock
+    try:
+        # No generation yet: readers must not mint one without the lock.
+        assert _read("c") == []
+        assert "generation" not in queue._load_queue_state()
+
+        monkeypatch.setattr(queue, "QUEUE_COMPACT_HEAD_BYTES", 1)
+        assert queue.consume_processed(2) == 2
+        assert queue._load_queue_state().get("base_bytes", 0) == 0
+    finally:
+        queue.LOCK_FILE.unlink()
+
+    assert _read("c") == [2, 3]
+    assert queue._load_queue_state()["generation"]
@@ -54,3 +54,70 @@ def test_empty_result_rescue_can_be_disabled(monkeypatch):
 
     results = retriever.retrieve("auth token memory issue", _make_insights(), limit=3)
     assert results == []
+
+
+def _exact_search(rows, query, limit):
+    import math
+
+    qn = math.sqrt(sum(x * x for x in query)) or 1.0
+    out = []
+    for key, vec in rows.items():
+        vn = math.sqrt(sum(x * x for x in vec)) or 1.0
+        out.append((key, sum(a * b for a, b in zip(query, vec)) / (qn * vn)))
+    out.sort(key=lambda t: t[1], reverse=True)
+    return out[:limit]
+
+
+def _check_index_patches_rows_in_place(tmp_path):
+    index = semantic_retriever_module.SemanticIndex(path=tmp_path / "vec.sqlite")
+    rows = {
+        "a": [1.0, 0.0, 0.0],
+        "b": [0.0, 1.0, 0.0],
+        "c": [0.5, 0.5, 0.0],
+        "d": [0.0, 0.0, 2.0],
+    }
+    for key, vec in rows.items():
+        index.upsert(key, vec)
+    matrix = index._load_cache()
+
+    query = [1.0, 0.2, 0.1]
+    got = index.search(query, limit=3)
+    want = _exact_search(rows, query, 3)
+    assert [k for k, _ in got] == [k for k, _ in want]
+    assert all(abs(g[1] - w[1]) < 1e-5 for g, w in zip(got, want))
+
+    rows["b"] = [0.9, 0.1, 0.0]
+    index.upsert("b", rows["b"])
+    rows.pop("a")
+    assert index.prune_stale(set(rows)) == 1
+    # Local writes patch the cached matrix instead of rebuilding it.
+    assert index._load_cache() is matrix
+    assert len(matrix) == 3
+    assert index.get("a") is None
+    got = index.search(query, limit=3)
+    assert [k for k, _ in got] == [k for k, _ in _exact_search(rows, query, 3)]
+
+    # Rows written by another process are picked up on TTL refresh.
+    other = semantic_retriever_module.SemanticIndex(path=tmp_path / "vec.sqlite")
+    other.upsert("e", [1.0, 0.2, 0.1])
+    index._cache_ts = 0.0
+    assert index.search(query, limit=1)[0][0] == "e"
+    assert index._load_cache() is matrix
+
+
+def test_semantic_index_matrix_patches_rows_in_place(tmp_path):
+    _check_index_patches_rows_in_place(tmp_path)
+
+
+def test_semantic_index_pure_python_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(semantic_retriever_module, "_np", None)
+    _check_index_patches_rows_in_place(tmp_path)
+
+
+def test_semantic_index_handles_mixed_dimensions(tmp_path):
+    index = semantic_retriever_module.SemanticIndex(path=tmp_path / "vec.sqlite")
+    index.upsert("short", [1.0, 0.0])
+    index.upsert("long", [1.0, 0.0, 0.0, 0.0])
+    keys = [k for k, _ in index.search([1.0, 0.0, 0.0, 0.0], limit=5)]
+    assert sorted(keys) == ["long", "short"]
+    assert index.get("long") == [1.0, 0.0, 0.0, 0.0]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import lib.eidos.integration as integration
+import lib.session_state as session_state
+from lib.session_state import SessionStateStore
+
+
+def test_entries_are_per_key_and_expire(tmp_path, monkeypatch):
+    state = SessionStateStore(tmp_path / "state.sqlite")
+    assert state.put("ns", "s1", {"step": 1}, ttl_s=60)
+    assert state.put("ns", "s2", {"step": 2}, ttl_s=0.01)
+    assert state.put("other", "s1", "kept")
+    time.sleep(0.02)
+
+    assert state.get("ns", "s1") == {"step": 1}
+    assert state.get("ns", "s2", "gone") == "gone"
+    assert state.items("ns") == {"s1": {"step": 1}}
+    assert state.purge_expired() == 1
+    assert state.get("other", "s1") == "kept"
+
+
+def test_pop_hands_a_value_to_exactly_one_caller(tmp_path):
+    state = SessionStateStore(tmp_path / "state.sqlite")
+    state.put("pred", "s:Edit", {"expected": "success"}, ttl_s=60)
+    results = []
+    barrier = threading.Barrier(8)
+
+    def _consume():
+        barrier.wait()
+        results.append(state.pop("pred", "s:Edit"))
+
+    threads = [threading.Thread(target=_consume) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert [r for r in results if r] == [{"expected": "success"}]
+
+
+def test_concurrent_sessions_do_not_overwrite_each_other(tmp_path):
+    path = tmp_path / "state.sqlite"
+
+    def _session(i):
+        store = SessionStateStore(path)  # separate connections, like separate hook processes
+        for n in range(20):
+            store.put("eidos_step", f"session-{i}", {"n": n}, ttl_s=60)
+
+    threads = [threading.Thread(target=_session, args=(i,)) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert SessionStateStore(path).items("eidos_step") == {f"session-{i}": {"n": 19} for i in range(6)}
+
+
+def test_eidos_integration_state_round_trip_and_legacy_import(tmp_path, monkeypatch):
+    legacy = tmp_path / "eidos_active_episodes.json"
+    legacy.write_text(json.dumps({"old-session": "ep-old"}), encoding="utf-8")
+    monkeypatch.setattr(integration, "ACTIVE_EPISODES_FILE", legacy)
+    monkeypatch.setattr(session_state, "SESSION_STATE_FILE", tmp_path / "session_state.sqlite")
+
+    assert integration._get_active_episode_id("old-session") == "ep-old"
+    integration._set_active_episode("s1", "ep-1")
+    assert integration._get_active_episode_id("s1") == "ep-1"
+    integration._set_active_episode("s1", None)
+    assert integration._get_active_episode_id("s1") is None
+
+    integration._save_active_step("s1", {"step_id": "st-1", "timestamp": time.time()})
+    assert integration._load_active_step("s1")["step_id"] == "st-1"
+    integration._save_active_step("s1", None)
+    assert integration._load_active_step("s1") is None
+
+    integration._save_pending_goal("s2", "Fix the login redirect")
+    assert integration._consume_pending_goal("s2") == "Fix the login redirect"
+    assert integration._consume_pending_goal("s2") == ""
@@ -8,7 +8,7 @@ After the cleanup:
 import inspect
 from pathlib import Path
 
-HOOK_PATH = Path(__file__).parent.parent / "hooks" / "observe.py"
+HOOK_PATH = Path(__file__).parent.parent / "hooks" / "observe_runtime.py"
 
 
 def test_hook_does_not_call_aggregator():
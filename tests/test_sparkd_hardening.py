@@ -25,6 +25,20 @@ def test_rate_limiter_enforces_window(monkeypatch):
     assert retry == 0
 
 
+def test_event_rate_limit_charges_each_batched_event(monkeypatch):
+    monkeypatch.setattr(sparkd, "EVENT_RATE_LIMIT_PER_MIN", 10)
+    monkeypatch.setattr(sparkd, "RATE_LIMIT_WINDOW_S", 60)
+    sparkd._EVENT_RATE_LIMIT_BUCKETS.clear()
+
+    assert sparkd._allow_rate_limited_events("127.0.0.1", 6, now=100.0) == (True, 0)
+    assert sparkd._allow_rate_limited_events("127.0.0.1", 3, now=110.0) == (True, 0)
+    ok, retry = sparkd._allow_rate_limited_events("127.0.0.1", 4, now=120.0)
+    assert ok is False
+    assert retry == 40  # the first batch has to leave the window
+    assert sparkd._allow_rate_limited_events("127.0.0.1", 1, now=120.0) == (True, 0)
+    assert sparkd._allow_rate_limited_events("127.0.0.1", 6, now=161.0) == (True, 0)
+
+
 def test_invalid_quarantine_is_bounded(monkeypatch, tmp_path):
     quarantine = tmp_path / "invalid_events.jsonl"
     monkeypatch.setattr(sparkd, "INVALID_EVENTS_FILE", quarantine)
@@ -62,3 +76,131 @@ def test_invalid_quarantine_redacts_sensitive_tokens(monkeypatch, tmp_path):
     assert "ABCDEFGH12345678" not in body
     assert "ZXY987654321TOKEN" not in body
     assert "[REDACTED]" in body
+
+
+def test_ingest_batch_appends_valid_events_over_one_keepalive_connection(monkeypatch, tmp_path):
+    import threading
+
+    import lib.queue as queue
+    from adapters._common import SparkdClient
+    from lib.http_service import PooledHTTPServer
+
+    queue_dir = tmp_path / "queue"
+    monkeypatch.setattr(queue, "QUEUE_DIR", queue_dir)
+    monkeypatch.setattr(queue, "EVENTS_FILE", queue_dir / "events.jsonl")
+    monkeypatch.setattr(queue, "LOCK_FILE", queue_dir / ".queue.lock")
+    monkeypatch.setattr(queue, "OVERFLOW_FILE", queue_dir / "events.overflow.jsonl")
+    monkeypatch.setattr(queue, "QUEUE_STATE_FILE", queue_dir / "state.json")
+    monkeypatch.setattr(sparkd, "INVALID_EVENTS_FILE", tmp_path / "invalid_events.jsonl")
+    monkeypatch.setattr(sparkd, "TOKEN", "t0ken")
+    monkeypatch.setattr(sparkd, "RATE_LIMIT_PER_MIN", 0)
+
+    server = PooledHTTPServer(("127.0.0.1", 0), sparkd.Handler, max_workers=4)
+    port = server.server_address[1]
+    monkeypatch.setattr(sparkd, "_ALLOWED_POST_HOSTS", {f"127.0.0.1:{port}"})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        def _evt(i):
+            return {
+                "v": 1, "source": "test", "kind": "message", "ts": 1000.0 + i,
+                "session_id": "s-batch", "payload": {"role": "user", "text": f"hello {i}"}, "trace_id": f"t{i}",
+            }
+
+        client = SparkdClient(f"http://127.0.0.1:{port}", "t0ken", batch_size=3)
+        events = [_evt(i) for i in range(5)] + [{"v": 1, "source": "test"}]
+        assert client.send_events(events) == 6
+        assert client.rejected == 1
+        client.send_event(_evt(99))
+        assert client.http.connects == 1
+        assert client.http.requests == 3
+
+        rows = [json.loads(line) for line in queue.EVENTS_FILE.read_text(encoding="utf-8").splitlines()]
+        assert [r["data"]["trace_id"] for r in rows] == ["t0", "t1", "t2", "t3", "t4", "t99"]
+        assert all(r["event_type"] == "user_prompt" for r in rows)
+        assert "missing_kind" in (tmp_path / "invalid_events.jsonl").read_text(encoding="utf-8")
+
+        # Unauthorized request with an unread body closes the connection instead of desyncing it.
+        bad = SparkdClient(f"http://127.0.0.1:{port}", "wrong")
+        assert bad.send_events([_evt(7)]) == 0
+        assert bad.last_error is not None and bad.last_error.status == 401
+        client.close()
+        bad.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_process_runs_as_job_while_ingest_stays_responsive(monkeypatch, tmp_path):
+    import threading
+    import time
+
+    import lib.queue as queue
+    from adapters._common import KeepAliveClient, SparkdClient
+    from lib.http_service import JobRunner, PooledHTTPServer
+
+    queue_dir = tmp_path / "queue"
+    monkeypatch.setattr(queue, "QUEUE_DIR", queue_dir)
+    monkeypatch.setattr(queue, "EVENTS_FILE", queue_dir / "events.jsonl")
+    monkeypatch.setattr(queue, "LOCK_FILE", queue_dir / ".queue.lock")
+    monkeypatch.setattr(queue, "OVERFLOW_FILE", queue_dir / "events.overflow.jsonl")
+    monkeypatch.setattr(queue, "QUEUE_STATE_FILE", queue_dir / "state.json")
+    monkeypatch.setattr(sparkd, "TOKEN", "t0ken")
+    monkeypatch.setattr(sparkd, "RATE_LIMIT_PER_MIN", 0)
+    monkeypatch.setattr(sparkd, "_JOBS", JobRunner(max_workers=1))
+
+    release = threading.Event()
+    cycles = []
+
+    def _slow_cycle():
+        cycles.append(time.time())
+        release.wait(5)
+        return {"pattern_processed": 4, "content_learned": 2, "errors": []}
+
+    monkeypatch.setattr(sparkd, "run_bridge_cycle", _slow_cycle)
+    monkeypatch.setattr(sparkd, "write_bridge_heartbeat", lambda stats: None)
+
+    server = PooledHTTPServer(("127.0.0.1", 0), sparkd.Handler, max_workers=4)
+    port = server.server_address[1]
+    monkeypatch.setattr(sparkd, "_ALLOWED_POST_HOSTS", {f"127.0.0.1:{port}"})
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    http = KeepAliveClient(f"http://127.0.0.1:{port}", headers={"Authorization": "Bearer t0ken"})
+    try:
+        status, body = http.request("POST", "/process", b"")
+        assert status == 202
+        job_id = json.loads(body)["job_id"]
+        # A second /process while the first is queued or running never blocks the caller.
+        status, body = http.request("POST", "/reflect", b"")
+        assert status == 202
+        reflect_id = json.loads(body)["job_id"]
+
+        deadline = time.time() + 5
+        while not cycles and time.time() < deadline:
+            time.sleep(0.01)
+        started = time.perf_counter()
+        client = SparkdClient(f"http://127.0.0.1:{port}", "t0ken")
+        assert client.send_event({
+            "v": 1, "source": "test", "kind": "message", "ts": 1.0,
+            "session_id": "s", "payload": {"role": "user", "text": "hi"}, "trace_id": "t1",
+        })
+        assert http.request("GET", "/health")[0] == 200
+        assert time.perf_counter() - started < 1.0
+        assert json.loads(http.request("GET", f"/jobs/{job_id}")[1])["status"] == "running"
+        assert json.loads(http.request("GET", f"/jobs/{reflect_id}")[1])["status"] == "queued"
+
+        release.set()
+        job = sparkd._JOBS.wait(reflect_id, timeout=5)
+        assert job["status"] == "done" and job["result"]["cycles"] == 3
+        status, body = http.request("GET", f"/jobs/{job_id}")
+        assert status == 200 and json.loads(body)["result"]["processed"] == 4
+        assert http.request("GET", "/jobs/nope")[0] == 404
+
+        status, body = http.request("POST", "/process?wait=1", b"")
+        assert status == 200 and json.loads(body)["learnings"] == 2
+        client.close()
+    finally:
+        release.set()
+        http.close()
+        server.shutdown()
+        server.server_close()
+        sparkd._JOBS.shutdown()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import sqlite3
+from types import SimpleNamespace
+
+import lib.advisory_synthesizer as synth
+from lib.synthesis_cache import SynthesisCache
+
+
+def _hammer(path: str, worker: int) -> None:
+    cache = SynthesisCache(path, timeout_s=10.0)
+    for i in range(40):
+        key = f"k{(worker * 7 + i) % 25}"
+        if cache.get(key, ttl_s=60) is None:
+            cache.put(key, f"result {key}", ttl_s=60, max_entries=20)
+
+
+def test_ttl_and_lru_eviction(tmp_path):
+    cache = SynthesisCache(tmp_path / "c.sqlite")
+    cache.put("a", "A", ttl_s=100, max_entries=2, now=1000.0)
+    cache.put("b", "B", ttl_s=100, max_entries=2, now=1001.0)
+    assert cache.get("a", ttl_s=100, now=1002.0) == "A"  # touch a -> b is now LRU
+    cache.put("c", "C", ttl_s=100, max_entries=2, now=1003.0)
+    assert cache.get("b", ttl_s=100, now=1004.0) is None
+    assert cache.get("a", ttl_s=100, now=1004.0) == "A"
+    assert cache.get("c", ttl_s=100, now=1200.0) is None  # expired
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 2, 1)
+
+
+def test_lookups_do_not_take_the_write_lock(tmp_path):
+    path = tmp_path / "c.sqlite"
+    cache = SynthesisCache(path, timeout_s=0.2, flush_interval_s=3600)
+    cache.put("a", "A", ttl_s=100, max_entries=10, now=1000.0)
+
+    writer = sqlite3.connect(str(path), isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")  # another process mid-write
+    try:
+        assert cache.get("a", ttl_s=100, now=1005.0) == "A"
+        assert cache.get("zz", ttl_s=100, now=1005.0) is None
+    finally:
+        writer.execute("ROLLBACK")
+
+    assert writer.execute("SELECT used_ts FROM synth_cache WHERE key = 'a'").fetchone()[0] == 1000.0
+    cache.flush()
+    assert writer.execute("SELECT used_ts FROM synth_cache WHERE key = 'a'").fetchone()[0] == 1005.0
+    assert dict(writer.execute("SELECT name, value FROM cache_stats")) == {"hits": 1, "misses": 1}
+    writer.close()
+
+
+def test_cache_is_shared_and_safe_across_processes(tmp_path):
+    path = str(tmp_path / "shared.sqlite")
+    procs = [mp.get_context("spawn").Process(target=_hammer, args=(path, w)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(60)
+        assert p.exitcode == 0
+
+    stats = SynthesisCache(path).stats()
+    assert stats["hits"] + stats["misses"] == 160
+    assert stats["hits"] > 0
+    assert stats["entries"] <= 20
+    assert stats["process"]["hits"] == 0  # this process did no lookups
+
+
+def test_synthesize_reuses_results_from_a_previous_process(monkeypatch, tmp_path):
+    monkeypatch.setattr(synth, "SYNTH_CACHE_FILE", tmp_path / "synth_cache.sqlite")
+    monkeypatch.setattr(synth, "_SYNTH_CACHES", {})
+    monkeypatch.setattr(synth, "_refresh_synth_config", lambda force=False: None)
+    calls = []
+
+    def _programmatic(items, phase, intent, tool):
+        calls.append(tool)
+        return f"Check {tool} carefully."
+
+    monkeypatch.setattr(synth, "synthesize_programmatic", _programmatic)
+    items = [SimpleNamespace(advice_id="adv-1"), SimpleNamespace(advice_id="adv-2")]
+
+    assert synth.synthesize(items, tool_name="Edit", force_mode="programmatic") == "Check Edit carefully."
+    monkeypatch.setattr(synth, "_SYNTH_CACHES", {})  # fresh process, same file
+    assert synth.synthesize(items, tool_name="Edit", force_mode="programmatic") == "Check Edit carefully."
+    assert calls == ["Edit"]
+
+    cache = synth._synth_cache().stats()
+    assert (cache["hits"], cache["misses"], cache["entries"]) == (1, 1, 1)
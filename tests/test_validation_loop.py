@@ -13,6 +13,8 @@ def _setup_env(tmp_path, monkeypatch):
     monkeypatch.setattr(q, "QUEUE_DIR", tmp_path / "queue")
     monkeypatch.setattr(q, "EVENTS_FILE", tmp_path / "queue" / "events.jsonl")
     monkeypatch.setattr(q, "LOCK_FILE", tmp_path / "queue" / ".queue.lock")
+    monkeypatch.setattr(q, "QUEUE_STATE_FILE", tmp_path / "queue" / "state.json")
+    monkeypatch.setattr(q, "CURSORS_DIR", tmp_path / "queue" / "cursors")
 
     # Cognitive insights storage
     from lib import cognitive_learner as cl
@@ -117,5 +119,39 @@ def test_validation_no_match(tmp_path, monkeypatch):
     assert ins.times_contradicted == 0
 
 
+def test_legacy_line_offset_seeds_the_cursor(tmp_path, monkeypatch):
+    import json
+
+    q, cl, vl = _setup_env(tmp_path, monkeypatch)
+    for i in range(3):
+        q.quick_capture(
+            q.EventType.USER_PROMPT,
+            session_id="s4",
+            data={"payload": {"role": "user", "text": f"message {i}"}},
+        )
+    vl.STATE_FILE.write_text(json.dumps({"offset": 2}), encoding="utf-8")
+
+    assert vl.get_validation_backlog() == 1
+    assert vl.process_validation_events(limit=10)["processed"] == 1
+    assert vl.process_validation_events(limit=10)["processed"] == 0
+    assert "offset" not in json.loads(vl.STATE_FILE.read_text(encoding="utf-8"))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def test_outcome_link_flags_persist_in_sealed_segments(tmp_path, monkeypatch):
+    import lib.outcome_log as ol
+    import lib.validation_loop as vl
+
+    monkeypatch.setattr(ol, "OUTCOME_LINKS_FILE", tmp_path / "outcome_links.jsonl")
+    monkeypatch.setattr(ol, "OUTCOME_LINKS_FILE_MAX", 40)  # seals every 10 links
+    links = [{"link_id": f"l{i}", "insight_key": "k", "created_at": 1000.0 + i} for i in range(15)]
+    ol._links_log().append_many(links[:10])
+    ol._links_log().append_many(links[10:])
+    assert len(ol._links_log().segments()) == 2
+
+    vl._update_outcome_links([{**links[2], "validated": True}, {**links[12], "validated": True}])
+    flagged = [row["link_id"] for row in ol._links_log().iter_rows() if row.get("validated")]
+    assert flagged == ["l2", "l12"]